@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from httpx import TimeoutException
 from llama_index.core.llms import LLM
 from llama_index.core.prompts import PromptTemplate
@@ -30,6 +32,33 @@ class LLMAgent:
         retry=retry_if_exception_type((TimeoutException,)),
     )
     def query(self, prompt: PromptTemplate, **kwargs) -> str:
+        return self.query_once(prompt, **kwargs)
+
+    def query_once(self, prompt: PromptTemplate, **kwargs) -> str:
+        """
+        재시도 없이 1회 호출. 워커를 대기시키지 않고 실행 원장의 백오프 재시도에 맡길 때 사용한다.
+        """
         formatted = prompt.format(**kwargs)
         response = self.llm.complete(formatted)
         return response.text.strip()
+
+    def query_many_once(
+        self,
+        prompt: PromptTemplate,
+        text_variable: str,
+        texts: list[str],
+        max_workers: int,
+    ) -> list[str]:
+        """
+        texts 각각을 같은 프롬프트로 동시에 1회씩 호출 (map-reduce 요약의 map 단계). 결과는 texts 순서를 유지한다.
+        하나라도 실패하면 예외를 그대로 전파한다.
+        """
+        if len(texts) <= 1 or max_workers <= 1:
+            return [self.query_once(prompt, **{text_variable: text}) for text in texts]
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(texts)), thread_name_prefix="llm-map"
+        ) as executor:
+            return list(
+                executor.map(lambda text: self.query_once(prompt, **{text_variable: text}), texts)
+            )
@@ -21,6 +21,11 @@ class OllamaConfig(BaseModel):
         }
     )
 
+    @property
+    def num_predict(self) -> int:
+        """응답 최대 토큰 수 (extra에 없으면 0)"""
+        return int(self.extra.get("num_predict", 0))
+
     def create_llm(self) -> LLM:
         return Ollama(
             base_url=self.base_url,
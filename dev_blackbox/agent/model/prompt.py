@@ -77,3 +77,23 @@ JIRA_ISSUE_SUMMARY_PROMPT = PromptTemplate(
 """,
     prompt_type=PromptType.SUMMARY,
 )
+
+PARTIAL_SUMMARY_REDUCE_PROMPT = PromptTemplate(
+    """\
+당신은 {platform} 활동 데이터를 기반으로 업무 일지를 작성하는 개발자입니다.
+하루 동안의 데이터가 많아 여러 부분으로 나누어 작성한 부분 업무 일지들을 하나의 업무 일지로 합치세요.
+
+## 규칙
+- 부분 업무 일지의 출력 형식(제목 구조, 항목 형식)을 그대로 유지하세요.
+- 같은 제목(레포지토리, 이슈 타입, 채널 등)의 항목은 하나로 합치고, 중복된 내용은 한 번만 작성하세요.
+- 부분 업무 일지에 없는 내용을 추가하지 마세요.
+- 한국어로 작성하세요.
+- 서두, 인사말, 맺음말, 부가 설명 없이 오직 업무 일지 내용만 출력하세요.
+
+## 부분 업무 일지
+{partial_summaries}
+
+## 업무 일지
+""",
+    prompt_type=PromptType.SUMMARY,
+)
@@ -1,28 +1,102 @@
+import asyncio
+import hashlib
 import logging
-from datetime import date
+from datetime import date, datetime, timedelta
+from typing import Any, Callable
 from zoneinfo import ZoneInfo
 
 import httpx
+import redis
 
-from dev_blackbox.client.model.github_api_model import GithubEventModelList, GithubCommitModel
+from dev_blackbox.client.github_rate_limiter import GitHubRateLimiter
+from dev_blackbox.client.model.github_api_model import (
+    GithubCommitModel,
+    GithubCommitRef,
+    GithubCompareModel,
+    GithubEventModel,
+    GithubEventModelList,
+    GithubPullRequestDetailModel,
+    GithubPullRequestRef,
+    GithubSearchCommitModel,
+)
+from dev_blackbox.core.cache import CacheService
+from dev_blackbox.core.config import get_settings
+from dev_blackbox.core.const import CacheKey, CacheTTL
+from dev_blackbox.core.exception import GitHubClientException
+from dev_blackbox.core.http_client import get_http_client
+from dev_blackbox.core.pipeline_metric import record_wait, track_api_call
 
 logger = logging.getLogger(__name__)
 
+_GRAPHQL_ENDPOINT = "https://api.github.com/graphql"
+_SEARCH_COMMITS_ENDPOINT = "https://api.github.com/search/commits"
+_GRAPHQL_COMMIT_FIELDS = """
+    oid
+    id
+    message
+    additions
+    deletions
+    url
+    author { name email date }
+    committer { name email date }
+"""
+
 
 class GitHubClient:
     LIMIT_EVENTS_PAGE = 4
     LIMIT_EVENTS_TOLERANCE = 5
+    LIMIT_COMPARE_PAGE = 10
+    COMPARE_PER_PAGE = 100
+    # GraphQL 쿼리 1회에 조회할 객체 수 (쿼리 복잡도 제한 이내)
+    GRAPHQL_BATCH_SIZE = 30
+    GRAPHQL_COMMITS_PER_PAGE = 100
+    LIMIT_GRAPHQL_COMMITS_PAGE = 5
+    # 검색 API는 최대 1000개까지만 결과를 반환한다
+    LIMIT_SEARCH_COMMITS_PAGE = 10
+    SEARCH_PER_PAGE = 100
 
-    def __init__(self, token: str):
+    def __init__(
+        self,
+        token: str,
+        http_client: httpx.Client | None = None,
+        cache_service: CacheService | None = None,
+        rate_limiter: GitHubRateLimiter | None = None,
+    ):
         self._token = token
+        # 사용자/호출 간 커넥션 풀을 공유 (요청마다 새 커넥션을 맺지 않도록)
+        self._http_client = http_client or get_http_client()
+        self._cache_service = cache_service or CacheService()
+        # 토큰마다 볼 수 있는 이벤트가 다르므로 ETag 캐시는 토큰 단위로 나눈다 (키에 토큰 원문을 남기지 않음)
+        self._token_hash = get_token_hash(token)
+        # rate limit은 토큰 단위로 부과되므로 같은 토큰을 쓰는 워커/인스턴스가 남은 요청 수를 공유
+        self._rate_limiter = rate_limiter or GitHubRateLimiter(scope=self._token_hash)
+        # GraphQL은 REST와 별도의 rate limit(point)을 사용
+        self._graphql_rate_limiter = GitHubRateLimiter(
+            scope=f"{self._token_hash}:graphql", cache_client=self._rate_limiter.cache_client
+        )
+        # 검색 API도 별도의 rate limit(분당 30회)을 사용
+        self._search_rate_limiter = GitHubRateLimiter(
+            scope=f"{self._token_hash}:search", cache_client=self._rate_limiter.cache_client
+        )
         self._headers = {
             "Authorization": f"token {token}",
             "Accept": "application/vnd.github.v3+json",
         }
 
     @classmethod
-    def create(cls, token: str):
-        return cls(token=token)
+    def create(
+        cls,
+        token: str,
+        http_client: httpx.Client | None = None,
+        cache_service: CacheService | None = None,
+        rate_limiter: GitHubRateLimiter | None = None,
+    ):
+        return cls(
+            token=token,
+            http_client=http_client,
+            cache_service=cache_service,
+            rate_limiter=rate_limiter,
+        )
 
     def fetch_events(
         self, username: str, page: int = 1, per_page: int = 30
@@ -30,21 +104,66 @@ class GitHubClient:
         """
         https://docs.github.com/ko/rest/activity/events?apiVersion=2022-11-28#list-events-for-the-authenticated-user
 
-        이벤트 조회
+        이벤트 조회.
+        이전 응답의 ETag로 조건부 요청을 보내고, 304 Not Modified(rate limit 미차감)면 캐시한 응답을 사용한다.
         """
-        endpoint = f"https://api.github.com/users/{username}/events"
-        params = {
-            "page": page,
-            "per_page": per_page,
-        }
+        try:
+            return self._fetch_events_page(
+                endpoint=f"https://api.github.com/users/{username}/events",
+                cache_key=CacheKey.GITHUB_EVENTS_PAGE.format(
+                    token_hash=self._token_hash, username=username, page=page, per_page=per_page
+                ),
+                page=page,
+                per_page=per_page,
+            )
+        except httpx.HTTPError:
+            logger.warning(f"Failed to fetch events for {username}.")
+            raise
 
+    def fetch_org_events(
+        self, username: str, org: str, page: int = 1, per_page: int = 30
+    ) -> GithubEventModelList:
+        """
+        https://docs.github.com/ko/rest/activity/events?apiVersion=2022-11-28#list-organization-events-for-the-authenticated-user
+
+        org 이벤트 조회. username은 토큰 소유자여야 하며, 토큰 소유자가 볼 수 있는 org 레포(private 포함)의
+        모든 구성원 이벤트를 반환한다. fetch_events()와 같이 ETag로 조건부 요청을 보낸다.
+        """
+        try:
+            return self._fetch_events_page(
+                endpoint=f"https://api.github.com/users/{username}/events/orgs/{org}",
+                cache_key=CacheKey.GITHUB_ORG_EVENTS_PAGE.format(
+                    token_hash=self._token_hash, org=org, page=page, per_page=per_page
+                ),
+                page=page,
+                per_page=per_page,
+            )
+        except httpx.HTTPError:
+            logger.warning(f"Failed to fetch org events for {org}.")
+            raise
+
+    def fetch_org_member_logins(self, org: str) -> set[str]:
+        """
+        https://docs.github.com/ko/rest/orgs/members?apiVersion=2022-11-28#list-organization-members
+
+        org 구성원 login 목록 (소문자). 토큰 소유자가 org 구성원이면 비공개 구성원도 포함된다.
+        """
+        endpoint = f"https://api.github.com/orgs/{org}/members"
+        logins: set[str] = set()
+        page = 1
         try:
-            with httpx.Client() as client:
-                response = client.get(endpoint, headers=self._headers, params=params)
+            while True:
+                response = self._get(
+                    endpoint, headers=self._headers, params={"page": page, "per_page": 100}
+                )
                 response.raise_for_status()
-                return GithubEventModelList.model_validate({"events": response.json()})
+                members = response.json()
+                logins.update(m["login"].lower() for m in members)
+                if len(members) < 100:
+                    return logins
+                page += 1
         except httpx.HTTPError:
-            logger.warning(f"Failed to fetch events for {username}.")
+            logger.warning(f"Failed to fetch members of {org}.")
             raise
 
     def fetch_events_by_date(
@@ -52,51 +171,680 @@ class GitHubClient:
         username: str,
         target_date: date,
         tz_info: ZoneInfo,
+        since_event_id: str | None = None,
     ) -> GithubEventModelList:
+        """
+        target_date에 해당하는 이벤트 조회.
+        since_event_id(이미 저장된 가장 최신 이벤트 ID)가 주어지면 해당 이벤트에 도달하는 즉시 조회를 중단한다.
+        이벤트 피드는 최신순이므로 그 이후의 이벤트는 모두 이미 수집된 이벤트이다.
+        """
+        return self.fetch_events_by_date_range(
+            username=username,
+            start_date=target_date,
+            end_date=target_date,
+            tz_info=tz_info,
+            since_event_id=since_event_id,
+        )
+
+    def fetch_events_by_date_range(
+        self,
+        username: str,
+        start_date: date,
+        end_date: date,
+        tz_info: ZoneInfo,
+        since_event_id: str | None = None,
+    ) -> GithubEventModelList:
+        """
+        start_date ~ end_date(양 끝 포함)에 해당하는 이벤트를 한 번의 페이지 순회로 조회.
+        """
+        events, _ = self._fetch_events_pages(
+            lambda page: self.fetch_events(username, page=page, per_page=100),
+            start_date=start_date,
+            end_date=end_date,
+            tz_info=tz_info,
+            since_event_id=since_event_id,
+        )
+        return GithubEventModelList(events=events)
+
+    def fetch_org_events_by_date(
+        self,
+        username: str,
+        org: str,
+        target_date: date,
+        tz_info: ZoneInfo,
+    ) -> tuple[GithubEventModelList, bool]:
+        """
+        target_date에 해당하는 org 이벤트 조회. (이벤트, target_date 이전 이벤트까지 도달했는지)를 반환한다.
+        이벤트 피드는 최대 300개까지만 조회되므로, 이전 이벤트에 도달하지 못했으면 target_date의 이벤트가 누락되었을 수 있다.
+        """
+        events, is_complete = self._fetch_events_pages(
+            lambda page: self.fetch_org_events(username, org, page=page, per_page=100),
+            start_date=target_date,
+            end_date=target_date,
+            tz_info=tz_info,
+        )
+        return GithubEventModelList(events=events), is_complete
+
+    def _fetch_events_page(
+        self, endpoint: str, cache_key: str, page: int, per_page: int
+    ) -> GithubEventModelList:
+        params = {
+            "page": page,
+            "per_page": per_page,
+        }
+        cached = self._get_cache(cache_key)
+        headers = self._headers
+        if cached is not None:
+            headers = {**self._headers, "If-None-Match": cached["etag"]}
+
+        response = self._get(endpoint, headers=headers, params=params)
+        if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            return GithubEventModelList.model_validate({"events": cached["body"]})
+
+        response.raise_for_status()
+        body = response.json()
+        if etag := response.headers.get("ETag"):
+            self._set_cache(cache_key, {"etag": etag, "body": body}, CacheTTL.HOURS_24)
+        return GithubEventModelList.model_validate({"events": body})
+
+    def _fetch_events_pages(
+        self,
+        fetch_page: Callable[[int], GithubEventModelList],
+        start_date: date,
+        end_date: date,
+        tz_info: ZoneInfo,
+        since_event_id: str | None = None,
+    ) -> tuple[list[GithubEventModel], bool]:
+        """
+        최신순 이벤트 피드를 페이지 순서대로 조회하며 기간 내 이벤트를 고른다.
+        (기간 내 이벤트, 기간 이전 이벤트 또는 since_event_id에 도달했는지)를 반환한다.
+        """
         result = []
         page = 1
         tolerance = 0
 
         while True:
-            github_events = self.fetch_events(username, page=page, per_page=100)
+            github_events = fetch_page(page)
             if not github_events.events:
                 break
 
-            for event in github_events.events:
-                event_date = event.get_created_date(tz_info)
-
-                if event_date == target_date:
-                    result.append(event)
-                elif event_date < target_date:
-                    tolerance += 1
-
-                # 과거 이벤트를 한참 뒤에 처리하는 경우도 가끔 있어서 tolerance 기준을 좀 느슨하게 잡음
-                if tolerance > self.LIMIT_EVENTS_TOLERANCE:
-                    return GithubEventModelList(events=result)
+            page_events, tolerance, is_done = _filter_events_page(
+                github_events.events,
+                start_date=start_date,
+                end_date=end_date,
+                tz_info=tz_info,
+                since_event_id=since_event_id,
+                tolerance=tolerance,
+                tolerance_limit=self.LIMIT_EVENTS_TOLERANCE,
+            )
+            result.extend(page_events)
+            if is_done:
+                return result, True
 
             page += 1
             # 일정 페이징 요청 제한
             if page >= self.LIMIT_EVENTS_PAGE:
                 logger.warning(
-                    f"Reached maximum page {page} for date {target_date} in github events."
+                    f"Reached maximum page {page} for date {start_date} ~ {end_date} in github events."
                 )
                 break
 
-        return GithubEventModelList(events=result)
+        return result, tolerance > 0
 
     def fetch_commit(self, repository_url: str, sha: str) -> GithubCommitModel:
         """
         https://docs.github.com/ko/rest/commits/commits?apiVersion=2022-11-28#get-a-commit
 
-        커밋 조회
+        커밋 조회.
+        SHA로 조회한 커밋은 바뀌지 않으므로 응답을 캐시하고, 캐시에 있으면 API를 호출하지 않는다.
         """
+        cache_key = CacheKey.GITHUB_COMMIT.format(repository_url=repository_url, sha=sha)
+        cached = self._get_cache(cache_key)
+        if cached is not None:
+            return GithubCommitModel.model_validate(cached)
+
         endpoint = repository_url + f"/commits/{sha}"
 
         try:
-            with httpx.Client() as client:
-                response = client.get(endpoint, headers=self._headers)
+            response = self._get(endpoint, headers=self._headers)
+            response.raise_for_status()
+            body = response.json()
+            commit = GithubCommitModel.model_validate(body)
+        except httpx.HTTPError:
+            logger.warning(f"Failed to fetch commit {sha} in {repository_url}.")
+            raise
+
+        self._set_cache(cache_key, body, CacheTTL.DAYS_30)
+        return commit
+
+    def fetch_compare(self, repository_url: str, base: str, head: str) -> GithubCompareModel:
+        """
+        https://docs.github.com/ko/rest/commits/commits?apiVersion=2022-11-28#compare-two-commits
+
+        base...head 사이의 모든 커밋과 변경 파일 조회.
+        커밋이 페이지 크기보다 많으면 페이지를 이어서 조회한다. (변경 파일은 첫 페이지에만 포함)
+        두 SHA 사이의 비교 결과는 바뀌지 않으므로 fetch_commit()과 같이 캐시한다.
+        """
+        cache_key = CacheKey.GITHUB_COMPARE.format(
+            repository_url=repository_url, base=base, head=head
+        )
+        cached = self._get_cache(cache_key)
+        if cached is not None:
+            return GithubCompareModel.model_validate(cached)
+
+        endpoint = repository_url + f"/compare/{base}...{head}"
+        body: dict = {}
+        commits: list[dict] = []
+        page = 1
+
+        try:
+            while True:
+                params = {"page": page, "per_page": self.COMPARE_PER_PAGE}
+                response = self._get(endpoint, headers=self._headers, params=params)
+                response.raise_for_status()
+                page_body = response.json()
+                if page == 1:
+                    body = page_body
+                commits.extend(page_body["commits"])
+
+                if len(commits) >= body["total_commits"] or not page_body["commits"]:
+                    break
+                page += 1
+                if page > self.LIMIT_COMPARE_PAGE:
+                    logger.warning(
+                        f"Reached maximum page {page} for compare {base}...{head} in {repository_url}."
+                    )
+                    break
+        except httpx.HTTPError:
+            logger.warning(f"Failed to fetch compare {base}...{head} in {repository_url}.")
+            raise
+
+        compare = GithubCompareModel.model_validate({**body, "commits": commits})
+        self._set_cache(cache_key, compare.model_dump(mode="json"), CacheTTL.DAYS_30)
+        return compare
+
+    def search_commits_by_date(
+        self,
+        username: str,
+        target_date: date,
+        tz_info: ZoneInfo,
+    ) -> list[GithubSearchCommitModel]:
+        """
+        https://docs.github.com/ko/rest/search/search?apiVersion=2022-11-28#search-commits
+
+        target_date(tz_info 기준)에 username이 작성한(author-date) 커밋 검색. 커밋 작성 시각 최신순으로 반환한다.
+        이벤트 피드와 달리 날짜로 바로 조회하므로 대부분 1~2번의 요청으로 끝난다.
+        검색 인덱스는 레포 기본 브랜치의 커밋만 포함하고, fork 레포의 같은 커밋은 처음 조회된 커밋만 남긴다.
+        """
+        start = datetime(target_date.year, target_date.month, target_date.day, tzinfo=tz_info)
+        end = start + timedelta(days=1) - timedelta(seconds=1)
+        params = {
+            "q": f"author:{username} author-date:{start.isoformat()}..{end.isoformat()}",
+            "sort": "author-date",
+            "order": "desc",
+            "per_page": self.SEARCH_PER_PAGE,
+        }
+        result: dict[str, GithubSearchCommitModel] = {}
+        page = 1
+
+        try:
+            while True:
+                response = self._get(
+                    _SEARCH_COMMITS_ENDPOINT,
+                    headers=self._headers,
+                    params={**params, "page": page},
+                    rate_limiter=self._search_rate_limiter,
+                )
                 response.raise_for_status()
-                return GithubCommitModel.model_validate(response.json())
+                body = response.json()
+                if body.get("incomplete_results"):
+                    logger.warning("GitHub commit search timed out. Results may be incomplete.")
+                for item in body["items"]:
+                    commit = GithubSearchCommitModel.model_validate(item)
+                    result.setdefault(commit.sha, commit)
+
+                if len(body["items"]) < self.SEARCH_PER_PAGE:
+                    break
+                if page * self.SEARCH_PER_PAGE >= body["total_count"]:
+                    break
+                page += 1
+                if page > self.LIMIT_SEARCH_COMMITS_PAGE:
+                    logger.warning(
+                        f"Reached maximum page {page} for commit search of {username} on {target_date}."
+                    )
+                    break
+        except httpx.HTTPError:
+            logger.warning(f"Failed to search commits for {username}.")
+            raise
+
+        return list(result.values())
+
+    def fetch_commits_by_graphql(
+        self, commit_refs: list[GithubCommitRef]
+    ) -> dict[GithubCommitRef, GithubCommitModel]:
+        """
+        https://docs.github.com/ko/graphql/reference/objects#commit
+
+        여러 레포의 커밋을 GRAPHQL_BATCH_SIZE개씩 한 번의 쿼리로 조회.
+        REST와 달리 변경 파일 목록/patch는 없고 메시지와 통계(additions/deletions)만 포함한다.
+        조회되지 않은 커밋(삭제/권한 없음)은 결과에서 빠진다.
+        """
+        result: dict[GithubCommitRef, GithubCommitModel] = {}
+        refs = list(dict.fromkeys(commit_refs))
+        for start in range(0, len(refs), self.GRAPHQL_BATCH_SIZE):
+            batch = refs[start : start + self.GRAPHQL_BATCH_SIZE]
+            declarations, fields, variables = [], [], {}
+            for i, ref in enumerate(batch):
+                owner, name = ref.repository_name.split("/", 1)
+                declarations.append(f"$o{i}: String!, $n{i}: String!, $s{i}: GitObjectID!")
+                fields.append(
+                    f"c{i}: repository(owner: $o{i}, name: $n{i}) "
+                    f"{{ object(oid: $s{i}) {{ ... on Commit {{ {_GRAPHQL_COMMIT_FIELDS} }} }} }}"
+                )
+                variables.update({f"o{i}": owner, f"n{i}": name, f"s{i}": ref.sha})
+
+            data = self._graphql(
+                f"query({', '.join(declarations)}) {{ {' '.join(fields)} }}", variables
+            )
+            for i, ref in enumerate(batch):
+                node = (data.get(f"c{i}") or {}).get("object")
+                if node:
+                    result[ref] = _to_commit_model(ref.repository_name, node)
+        return result
+
+    def fetch_pull_requests_by_graphql(
+        self, pull_request_refs: list[GithubPullRequestRef]
+    ) -> dict[GithubPullRequestRef, GithubPullRequestDetailModel]:
+        """
+        https://docs.github.com/ko/graphql/reference/objects#pullrequest
+
+        여러 PR의 상세 정보(제목/본문/base·head ref)와 커밋 목록을 GRAPHQL_BATCH_SIZE개씩 한 번의 쿼리로 조회.
+        커밋이 한 페이지보다 많은 PR은 cursor로 이어서 조회한다. 조회되지 않은 PR은 결과에서 빠진다.
+        """
+        result: dict[GithubPullRequestRef, GithubPullRequestDetailModel] = {}
+        refs = list(dict.fromkeys(pull_request_refs))
+        for start in range(0, len(refs), self.GRAPHQL_BATCH_SIZE):
+            batch = refs[start : start + self.GRAPHQL_BATCH_SIZE]
+            declarations, fields, variables = [], [], {}
+            for i, ref in enumerate(batch):
+                owner, name = ref.repository_name.split("/", 1)
+                declarations.append(f"$o{i}: String!, $n{i}: String!, $p{i}: Int!")
+                fields.append(
+                    f"p{i}: repository(owner: $o{i}, name: $n{i}) "
+                    f"{{ pullRequest(number: $p{i}) {{ {self._pull_request_fields()} }} }}"
+                )
+                variables.update({f"o{i}": owner, f"n{i}": name, f"p{i}": ref.number})
+
+            data = self._graphql(
+                f"query({', '.join(declarations)}) {{ {' '.join(fields)} }}", variables
+            )
+            for i, ref in enumerate(batch):
+                node = (data.get(f"p{i}") or {}).get("pullRequest")
+                if node:
+                    result[ref] = self._to_pull_request_detail_model(ref, node)
+        return result
+
+    def _pull_request_fields(self, after_variable: str | None = None) -> str:
+        after = f", after: ${after_variable}" if after_variable else ""
+        return f"""
+            number
+            title
+            body
+            url
+            state
+            merged
+            baseRefName
+            headRefName
+            commits(first: {self.GRAPHQL_COMMITS_PER_PAGE}{after}) {{
+                pageInfo {{ hasNextPage endCursor }}
+                nodes {{ commit {{ {_GRAPHQL_COMMIT_FIELDS} }} }}
+            }}
+        """
+
+    def _to_pull_request_detail_model(
+        self, ref: GithubPullRequestRef, node: dict
+    ) -> GithubPullRequestDetailModel:
+        commit_nodes = [n["commit"] for n in node["commits"]["nodes"]]
+        page_info = node["commits"]["pageInfo"]
+        page = 1
+        while page_info["hasNextPage"]:
+            if page >= self.LIMIT_GRAPHQL_COMMITS_PAGE:
+                logger.warning(
+                    f"Reached maximum page {page} for commits of PR #{ref.number} in {ref.repository_name}."
+                )
+                break
+            owner, name = ref.repository_name.split("/", 1)
+            data = self._graphql(
+                "query($o: String!, $n: String!, $p: Int!, $after: String!) "
+                f"{{ repository(owner: $o, name: $n) "
+                f"{{ pullRequest(number: $p) {{ {self._pull_request_fields('after')} }} }} }}",
+                {"o": owner, "n": name, "p": ref.number, "after": page_info["endCursor"]},
+            )
+            commits = data["repository"]["pullRequest"]["commits"]
+            commit_nodes.extend(n["commit"] for n in commits["nodes"])
+            page_info = commits["pageInfo"]
+            page += 1
+
+        return GithubPullRequestDetailModel(
+            number=node["number"],
+            title=node["title"],
+            body=node["body"],
+            url=node["url"],
+            state=node["state"],
+            merged=node["merged"],
+            base_ref=node["baseRefName"],
+            head_ref=node["headRefName"],
+            commits=[_to_commit_model(ref.repository_name, n) for n in commit_nodes],
+        )
+
+    def _graphql(self, query: str, variables: dict[str, Any]) -> dict:
+        try:
+            response = self._send(
+                lambda: self._http_client.post(
+                    _GRAPHQL_ENDPOINT,
+                    headers=self._headers,
+                    json={"query": query, "variables": variables},
+                ),
+                self._graphql_rate_limiter,
+            )
+            response.raise_for_status()
+        except httpx.HTTPError:
+            logger.warning("Failed to query github graphql.")
+            raise
+
+        body = response.json()
+        # 일부 객체 조회 실패(NOT_FOUND 등)는 errors와 함께 나머지 data가 반환된다
+        if body.get("errors"):
+            logger.warning(f"GitHub graphql returned errors: {body['errors']}")
+        if body.get("data") is None:
+            raise GitHubClientException(f"GitHub graphql returned no data: {body.get('errors')}")
+        return body["data"]
+
+    def _get(
+        self,
+        endpoint: str,
+        headers: dict[str, str],
+        params: dict | None = None,
+        rate_limiter: GitHubRateLimiter | None = None,
+    ) -> httpx.Response:
+        return self._send(
+            lambda: self._http_client.get(endpoint, headers=headers, params=params),
+            rate_limiter or self._rate_limiter,
+        )
+
+    def _send(
+        self,
+        request: Callable[[], httpx.Response],
+        rate_limiter: GitHubRateLimiter,
+    ) -> httpx.Response:
+        """rate limit에 걸리면 실패하지 않고 대기 후 github_rate_limit_max_retries까지 재시도한다."""
+        max_retries = get_settings().collect_task.github_rate_limit_max_retries
+        for attempt in range(max_retries + 1):
+            rate_limiter.acquire()
+            with track_api_call():
+                response = request()
+            retry_after = rate_limiter.update(response)
+            if retry_after is None:
+                return response
+            logger.warning(
+                f"GitHub rate limit exceeded. Retry after {retry_after:.0f}s. (attempt: {attempt + 1})"
+            )
+        return response
+
+    def _get_cache(self, key: str) -> Any | None:
+        return _get_cache(self._cache_service, key)
+
+    def _set_cache(self, key: str, value: Any, ttl: CacheTTL):
+        _set_cache(self._cache_service, key, value, ttl)
+
+
+class AsyncGitHubClient:
+    """
+    GitHubClient의 asyncio 버전.
+    실행 단위로 공유하는 httpx.AsyncClient(커넥션 풀)와 동시 요청 수 제한(semaphore)을 주입받는다.
+    이벤트 페이지 ETag 캐시와 커밋 캐시는 GitHubClient와 같은 키를 사용하며, 이벤트 루프를 막지 않도록 캐시 조회/저장은 스레드에서 실행한다.
+    """
+
+    LIMIT_EVENTS_PAGE = GitHubClient.LIMIT_EVENTS_PAGE
+    LIMIT_EVENTS_TOLERANCE = GitHubClient.LIMIT_EVENTS_TOLERANCE
+
+    def __init__(
+        self,
+        token: str,
+        http_client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        cache_service: CacheService | None = None,
+        rate_limiter: GitHubRateLimiter | None = None,
+    ):
+        self._http_client = http_client
+        self._semaphore = semaphore
+        self._cache_service = cache_service or CacheService()
+        self._token_hash = get_token_hash(token)
+        self._rate_limiter = rate_limiter or GitHubRateLimiter(scope=self._token_hash)
+        self._headers = {
+            "Authorization": f"token {token}",
+            "Accept": "application/vnd.github.v3+json",
+        }
+
+    @classmethod
+    def create(
+        cls,
+        token: str,
+        http_client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        cache_service: CacheService | None = None,
+        rate_limiter: GitHubRateLimiter | None = None,
+    ) -> "AsyncGitHubClient":
+        return cls(
+            token=token,
+            http_client=http_client,
+            semaphore=semaphore,
+            cache_service=cache_service,
+            rate_limiter=rate_limiter,
+        )
+
+    async def fetch_events(
+        self, username: str, page: int = 1, per_page: int = 30
+    ) -> GithubEventModelList:
+        """GitHubClient.fetch_events()와 같이 ETag로 조건부 요청을 보내고, 304면 캐시한 응답을 사용한다."""
+        endpoint = f"https://api.github.com/users/{username}/events"
+        params = {
+            "page": page,
+            "per_page": per_page,
+        }
+        cache_key = CacheKey.GITHUB_EVENTS_PAGE.format(
+            token_hash=self._token_hash, username=username, page=page, per_page=per_page
+        )
+        cached = await asyncio.to_thread(_get_cache, self._cache_service, cache_key)
+        headers = self._headers
+        if cached is not None:
+            headers = {**self._headers, "If-None-Match": cached["etag"]}
+
+        try:
+            response = await self._get(endpoint, headers=headers, params=params)
+            if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+                return GithubEventModelList.model_validate({"events": cached["body"]})
+            response.raise_for_status()
+            body = response.json()
+        except httpx.HTTPError:
+            logger.warning(f"Failed to fetch events for {username}.")
+            raise
+
+        if etag := response.headers.get("ETag"):
+            await asyncio.to_thread(
+                _set_cache,
+                self._cache_service,
+                cache_key,
+                {"etag": etag, "body": body},
+                CacheTTL.HOURS_24,
+            )
+        return GithubEventModelList.model_validate({"events": body})
+
+    async def fetch_events_by_date(
+        self,
+        username: str,
+        target_date: date,
+        tz_info: ZoneInfo,
+        since_event_id: str | None = None,
+    ) -> GithubEventModelList:
+        """GitHubClient.fetch_events_by_date()와 동일하게 동작. 페이지는 순서대로 조회한다."""
+        result = []
+        page = 1
+        tolerance = 0
+
+        while True:
+            github_events = await self.fetch_events(username, page=page, per_page=100)
+            if not github_events.events:
+                break
+
+            page_events, tolerance, is_done = _filter_events_page(
+                github_events.events,
+                start_date=target_date,
+                end_date=target_date,
+                tz_info=tz_info,
+                since_event_id=since_event_id,
+                tolerance=tolerance,
+                tolerance_limit=self.LIMIT_EVENTS_TOLERANCE,
+            )
+            result.extend(page_events)
+            if is_done:
+                return GithubEventModelList(events=result)
+
+            page += 1
+            if page >= self.LIMIT_EVENTS_PAGE:
+                logger.warning(
+                    f"Reached maximum page {page} for date {target_date} in github events."
+                )
+                break
+
+        return GithubEventModelList(events=result)
+
+    async def fetch_commit(self, repository_url: str, sha: str) -> GithubCommitModel:
+        """GitHubClient.fetch_commit()과 같이 캐시에 있으면 API를 호출하지 않는다."""
+        cache_key = CacheKey.GITHUB_COMMIT.format(repository_url=repository_url, sha=sha)
+        cached = await asyncio.to_thread(_get_cache, self._cache_service, cache_key)
+        if cached is not None:
+            return GithubCommitModel.model_validate(cached)
+
+        endpoint = repository_url + f"/commits/{sha}"
+
+        try:
+            response = await self._get(endpoint, headers=self._headers)
+            response.raise_for_status()
+            body = response.json()
+            commit = GithubCommitModel.model_validate(body)
         except httpx.HTTPError:
             logger.warning(f"Failed to fetch commit {sha} in {repository_url}.")
             raise
+
+        await asyncio.to_thread(_set_cache, self._cache_service, cache_key, body, CacheTTL.DAYS_30)
+        return commit
+
+    async def _get(
+        self, endpoint: str, headers: dict[str, str], params: dict | None = None
+    ) -> httpx.Response:
+        """
+        GitHubClient._get()과 동일하게 rate limit 대기 후 재시도한다.
+        Redis 조회는 스레드에서 실행하고, 대기는 semaphore를 점유하지 않은 채 이벤트 루프에서 한다.
+        """
+        max_retries = get_settings().collect_task.github_rate_limit_max_retries
+        for attempt in range(max_retries + 1):
+            wait_seconds = await asyncio.to_thread(self._rate_limiter.reserve)
+            if wait_seconds > 0:
+                await asyncio.sleep(wait_seconds)
+                record_wait(wait_seconds)
+            async with self._semaphore:
+                with track_api_call():
+                    response = await self._http_client.get(endpoint, headers=headers, params=params)
+            retry_after = await asyncio.to_thread(self._rate_limiter.update, response)
+            if retry_after is None:
+                return response
+            logger.warning(
+                f"GitHub rate limit exceeded. Retry after {retry_after:.0f}s. (attempt: {attempt + 1})"
+            )
+        return response
+
+
+def _to_commit_model(repository_name: str, node: dict) -> GithubCommitModel:
+    """GraphQL Commit 노드를 REST 커밋 모델 형태로 변환 (변경 파일 목록은 없음)"""
+    api_url = f"https://api.github.com/repos/{repository_name}/commits/{node['oid']}"
+    return GithubCommitModel.model_validate(
+        {
+            "sha": node["oid"],
+            "node_id": node["id"],
+            "commit": {
+                "author": node.get("author") or {},
+                "committer": node.get("committer") or {},
+                "message": node["message"],
+                "url": f"https://api.github.com/repos/{repository_name}/git/commits/{node['oid']}",
+            },
+            "url": api_url,
+            "html_url": node["url"],
+            "comments_url": f"{api_url}/comments",
+            "stats": {
+                "total": node["additions"] + node["deletions"],
+                "additions": node["additions"],
+                "deletions": node["deletions"],
+            },
+            "files": [],
+        }
+    )
+
+
+def _get_cache(cache_service: CacheService, key: str) -> Any | None:
+    # 캐시는 API 호출을 줄이기 위한 용도이므로 Redis 장애 시 캐시 없이 조회
+    try:
+        return cache_service.get(key)
+    except redis.RedisError:
+        logger.warning(f"Failed to get github response cache. (key: {key})")
+        return None
+
+
+def _set_cache(cache_service: CacheService, key: str, value: Any, ttl: CacheTTL):
+    try:
+        cache_service.set(key, value, ex=ttl)
+    except redis.RedisError:
+        logger.warning(f"Failed to set github response cache. (key: {key})")
+
+
+def get_token_hash(token: str) -> str:
+    """캐시/rate limit 키에 토큰 원문을 남기지 않도록 사용하는 토큰 식별자"""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+
+
+def _filter_events_page(
+    events: list[GithubEventModel],
+    start_date: date,
+    end_date: date,
+    tz_info: ZoneInfo,
+    since_event_id: str | None,
+    tolerance: int,
+    tolerance_limit: int,
+) -> tuple[list[GithubEventModel], int, bool]:
+    """
+    이벤트 피드 한 페이지에서 기간 내 이벤트를 고른다.
+    (기간 내 이벤트, 누적 tolerance, 조회 중단 여부)를 반환한다.
+    """
+    result = []
+    for event in events:
+        if since_event_id is not None and _is_collected_event(event.id, since_event_id):
+            return result, tolerance, True
+
+        event_date = event.get_created_date(tz_info)
+
+        if start_date <= event_date <= end_date:
+            result.append(event)
+        elif event_date < start_date:
+            tolerance += 1
+
+        # 과거 이벤트를 한참 뒤에 처리하는 경우도 가끔 있어서 tolerance 기준을 좀 느슨하게 잡음
+        if tolerance > tolerance_limit:
+            return result, tolerance, True
+    return result, tolerance, False
+
+
+def _is_collected_event(event_id: str, since_event_id: str) -> bool:
+    # GitHub 이벤트 ID는 단조 증가하는 숫자 문자열
+    if event_id.isdigit() and since_event_id.isdigit():
+        return int(event_id) <= int(since_event_id)
+    return event_id == since_event_id
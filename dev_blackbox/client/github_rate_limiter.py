@@ -0,0 +1,159 @@
+"""
+GitHub API rate limit 관리.
+
+응답의 X-RateLimit-Remaining/X-RateLimit-Reset 헤더로 scope(토큰)별 남은 요청 수를 Redis Hash에 기록하여
+워커/인스턴스 간에 공유한다. 남은 요청 수가 reserve 이하이면 reset 시각까지 요청 간격을 고르게 벌리고,
+소진되었거나 secondary rate limit(Retry-After)에 걸리면 대기하고,
+대기 시간이 github_rate_limit_max_wait_seconds를 넘으면 워커를 붙잡지 않고 예외를 던져 실행 원장 재시도에 맡긴다.
+"""
+
+import logging
+import time
+
+import httpx
+import redis
+from redis import Redis
+from redis.client import Pipeline
+
+from dev_blackbox.core.cache import get_redis_client
+from dev_blackbox.core.config import get_settings
+from dev_blackbox.core.const import CacheKey
+from dev_blackbox.core.exception import GitHubRateLimitExceededException
+from dev_blackbox.core.pipeline_metric import record_wait
+
+logger = logging.getLogger(__name__)
+
+# secondary rate limit 응답에 대기 시간 헤더가 없으면 최소 1분 대기 (GitHub 문서 권장)
+_SECONDARY_RATE_LIMIT_WAIT_SECONDS = 60
+# 기록은 reset(또는 대기 종료) 이후 이 시간이 지나면 만료
+_STATE_EXPIRE_MARGIN_SECONDS = 60
+
+
+class GitHubRateLimiter:
+
+    def __init__(
+        self,
+        scope: str,
+        cache_client: Redis | None = None,
+    ):
+        config = get_settings().collect_task
+        self.key = CacheKey.GITHUB_RATE_LIMIT.format(scope=scope)
+        self.reserve_requests = config.github_rate_limit_reserve
+        self.max_wait_seconds = config.github_rate_limit_max_wait_seconds
+        self.cache_client = cache_client or get_redis_client()
+
+    def acquire(self) -> None:
+        """요청 전에 호출. 필요하면 대기한다. 최대 대기 시간을 넘으면 GitHubRateLimitExceededException."""
+        wait_seconds = self.reserve()
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+            record_wait(wait_seconds)
+
+    def reserve(self) -> float:
+        """
+        공유하는 남은 요청 수를 1 차감하고, 요청 전에 기다려야 하는 시간(초)을 반환한다.
+        남은 요청이 있으면 분산된 대기 시간을 그대로 돌려주고,
+        소진(또는 Retry-After 차단)되어 기다려야 하는 시간이 max_wait_seconds를 넘을 때만 예약하지 않고 GitHubRateLimitExceededException.
+        """
+        try:
+            wait_seconds = self._reserve_request(time.time())
+        except redis.RedisError:
+            # rate limit 기록은 요청 속도 조절 용도이므로 Redis 장애 시 대기 없이 요청
+            logger.warning(f"Failed to get github rate limit. (key: {self.key})")
+            return 0
+
+        if wait_seconds <= 0:
+            return 0
+        logger.info(f"Waiting {wait_seconds:.1f}s for github rate limit. (key: {self.key})")
+        return wait_seconds
+
+    def update(self, response: httpx.Response) -> float | None:
+        """
+        응답 헤더로 남은 요청 수를 갱신한다.
+        rate limit에 걸린 응답이면 다시 요청하기까지 기다려야 하는 시간(초)을, 아니면 None을 반환한다.
+        """
+        now = time.time()
+        state: dict[str, float] = {}
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset_at = response.headers.get("X-RateLimit-Reset")
+        if remaining is not None and reset_at is not None:
+            state["remaining"] = int(remaining)
+            state["reset_at"] = int(reset_at)
+
+        retry_after = self._get_retry_after(response, now)
+        if retry_after is not None:
+            state["blocked_until"] = now + retry_after
+        if not state:
+            return retry_after
+
+        expire_at = max(state.get("reset_at", now), state.get("blocked_until", now))
+        try:
+            pipeline = self.cache_client.pipeline()
+            pipeline.hset(self.key, mapping=state)
+            pipeline.expire(self.key, int(expire_at - now) + _STATE_EXPIRE_MARGIN_SECONDS)
+            pipeline.execute()
+        except redis.RedisError:
+            logger.warning(f"Failed to set github rate limit. (key: {self.key})")
+        return retry_after
+
+    def _reserve_request(self, now: float) -> float:
+        """
+        남은 요청 수 차감과 다음 요청 가능 시각(next_allowed_at) 갱신을 WATCH 트랜잭션으로 묶는다.
+        남은 요청 수가 reserve 이하이면 예약마다 next_allowed_at을 한 간격씩 뒤로 밀어,
+        여러 워커가 같은 대기 시간을 받아 한꺼번에 요청하지 않고 reset까지 고르게 분산되게 한다. (slack_rate_limiter의 GCRA와 같은 방식)
+        남은 요청이 없거나 대기해야 하는 상태에서 대기 시간이 max_wait_seconds를 넘으면 예약하지 않고 GitHubRateLimitExceededException.
+        """
+
+        def reserve(pipeline: Pipeline) -> float:
+            remaining, reset_at, blocked_until, next_allowed_at = (
+                pipeline.hmget(  # pyright: ignore [reportGeneralTypeIssues]
+                    self.key, ["remaining", "reset_at", "blocked_until", "next_allowed_at"]
+                )
+            )
+            blocked_wait_seconds = max(float(blocked_until) - now, 0.0) if blocked_until else 0.0
+            if blocked_wait_seconds > self.max_wait_seconds:
+                raise GitHubRateLimitExceededException(self.key, blocked_wait_seconds)
+            if remaining is None or reset_at is None or float(reset_at) <= now:
+                return blocked_wait_seconds
+
+            reset_at = float(reset_at)
+            if int(remaining) <= 0:
+                # 소진되었으면 reset까지 기다린다. reset 이후 첫 응답이 남은 요청 수를 다시 채운다.
+                wait_seconds = max(reset_at - now, blocked_wait_seconds)
+                if wait_seconds > self.max_wait_seconds:
+                    raise GitHubRateLimitExceededException(self.key, wait_seconds)
+                return wait_seconds
+
+            start = now + blocked_wait_seconds
+            pipeline.multi()
+            # 다른 워커가 응답을 받기 전에도 남은 요청 수를 함께 차감하도록
+            pipeline.hincrby(self.key, "remaining", -1)
+            if int(remaining) <= self.reserve_requests:
+                # 남은 요청을 reset까지 고르게 분산: 이번 요청 이후 남은 시간을 남은 요청 수로 나눈 만큼 다음 요청을 미룬다
+                if next_allowed_at is not None:
+                    start = max(start, float(next_allowed_at))
+                interval = max(reset_at - start, 0.0) / int(remaining)
+                pipeline.hset(self.key, "next_allowed_at", start + interval)
+            return start - now
+
+        return self.cache_client.transaction(reserve, self.key, value_from_callable=True)
+
+    @staticmethod
+    def _get_retry_after(response: httpx.Response, now: float) -> float | None:
+        """
+        https://docs.github.com/ko/rest/using-the-rest-api/rate-limits-for-the-rest-api#exceeding-the-rate-limit
+        """
+        if response.status_code not in (httpx.codes.FORBIDDEN, httpx.codes.TOO_MANY_REQUESTS):
+            return None
+        if retry_after := response.headers.get("Retry-After"):
+            return float(retry_after)
+        reset_at = response.headers.get("X-RateLimit-Reset")
+        if response.headers.get("X-RateLimit-Remaining") == "0" and reset_at is not None:
+            return max(0.0, int(reset_at) - now)
+        # 권한 없음 등 rate limit이 아닌 403은 그대로 실패 처리
+        if (
+            response.status_code == httpx.codes.FORBIDDEN
+            and "rate limit" not in response.text.lower()
+        ):
+            return None
+        return _SECONDARY_RATE_LIMIT_WAIT_SECONDS
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from functools import lru_cache
 
@@ -5,6 +6,7 @@ from jira import JIRA, Issue, User
 from jira.client import ResultList
 
 from dev_blackbox.client.model.jira_api_model import IssueJQL
+from dev_blackbox.core.pipeline_metric import track_api_call
 
 logger = logging.getLogger(__name__)
 
@@ -37,18 +39,45 @@ class JiraClient:
         logger.info(
             f"Fetching issues by jql: {jql}, start_at: {start_at}, max_results: {max_results}"
         )
-        return self.jira.search_issues(
-            jql.build(),
-            expand="changelog",
-            startAt=start_at,
-            maxResults=max_results,
-        )
+        with track_api_call():
+            return self.jira.search_issues(
+                jql.build(),
+                expand="changelog",
+                startAt=start_at,
+                maxResults=max_results,
+            )
 
     def fetch_issue(self, issue_key: str) -> Issue:
         logger.info(f"Fetching issue: {issue_key}")
         return self.jira.issue(issue_key)
 
 
+class AsyncJiraClient:
+    """
+    JiraClient의 asyncio 래퍼.
+    jira 라이브러리는 동기 전용이므로 호출을 asyncio.to_thread()로 위임하고, 동시 호출 수를 semaphore로 제한한다.
+    """
+
+    def __init__(self, jira_client: JiraClient, semaphore: asyncio.Semaphore):
+        self.jira_client = jira_client
+        self._semaphore = semaphore
+
+    @classmethod
+    def create(cls, jira_client: JiraClient, semaphore: asyncio.Semaphore) -> "AsyncJiraClient":
+        return cls(jira_client, semaphore)
+
+    async def fetch_search_issues(
+        self,
+        jql: IssueJQL,
+        start_at: int = 0,
+        max_results: int = 50,
+    ) -> ResultList[Issue]:
+        async with self._semaphore:
+            return await asyncio.to_thread(
+                self.jira_client.fetch_search_issues, jql, start_at, max_results
+            )
+
+
 @lru_cache(maxsize=10)
 def get_jira_client(server: str, username: str, api_token: str) -> JiraClient:
     return JiraClient.create(server, username, api_token)
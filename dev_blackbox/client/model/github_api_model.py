@@ -1,6 +1,6 @@
-from datetime import date
+from datetime import UTC, date, datetime
 from functools import cached_property
-from typing import Literal
+from typing import Literal, NamedTuple
 from zoneinfo import ZoneInfo
 
 from pydantic import BaseModel
@@ -12,8 +12,16 @@ class GithubEventModel(BaseModel):
     id: str
     actor: GitHubActorModel
     repo: GithubRepositoryModel
-    type: Literal["PushEvent", "PullRequestEvent", "CreateEvent", "DeleteEvent"] | str
-    payload: GithubPushEventPayloadModel | GithubPullRequestEventPayload | dict
+    # CommitEvent는 GitHub 이벤트 타입이 아니라 커밋 검색으로 수집한 커밋을 저장하기 위한 내부 타입
+    type: (
+        Literal["PushEvent", "PullRequestEvent", "CreateEvent", "DeleteEvent", "CommitEvent"] | str
+    )
+    payload: (
+        GithubPushEventPayloadModel
+        | GithubPullRequestEventPayload
+        | GithubCommitEventPayload
+        | dict
+    )
     public: bool
     created_at: str
     org: dict | None = None
@@ -22,12 +30,21 @@ class GithubEventModel(BaseModel):
         return get_date_from_iso_format(self.created_at, tz_info=tz_info)
 
     @cached_property
-    def typed_payload(self) -> GithubPushEventPayloadModel | GithubPullRequestEventPayload | dict:
+    def typed_payload(
+        self,
+    ) -> (
+        GithubPushEventPayloadModel
+        | GithubPullRequestEventPayload
+        | GithubCommitEventPayload
+        | dict
+    ):
         match self.type:
             case "PushEvent":
                 return GithubPushEventPayloadModel.model_validate(self.payload)
             case "PullRequestEvent":
                 return GithubPullRequestEventPayload.model_validate(self.payload)
+            case "CommitEvent":
+                return GithubCommitEventPayload.model_validate(self.payload)
             case _:
                 return self.payload
 
@@ -79,6 +96,11 @@ class GithubPushEventPayloadModel(BaseModel):
     head: str
     before: str
 
+    @property
+    def is_new_ref(self) -> bool:
+        """브랜치/태그 생성 push는 before가 0으로 채워진 SHA이므로 비교할 기준 커밋이 없다."""
+        return set(self.before) == {"0"}
+
 
 class GithubRepositoryModel(BaseModel):
     id: int
@@ -112,6 +134,10 @@ class GithubPullRequestEventPayload(BaseModel):
     pull_request: GithubPullRequestModel
 
 
+class GithubCommitEventPayload(BaseModel):
+    sha: str
+
+
 class GithubCommitInfoModel(BaseModel):
     author: dict
     committer: dict
@@ -136,6 +162,19 @@ class GithubCommitFileModel(BaseModel):
     raw_url: str
     patch: str | None = None
 
+    @property
+    def stats_text(self) -> str:
+        return f"{self.status}: {self.filename} +{self.additions}/-{self.deletions}"
+
+    @property
+    def truncated_patch(self) -> str | None:
+        if not self.patch:
+            return None
+        patch = self.patch[:_MAX_PATCH_LENGTH]
+        if len(self.patch) > _MAX_PATCH_LENGTH:
+            patch += "\n... (truncated)"
+        return patch
+
 
 _MAX_PATCH_LENGTH = 500
 
@@ -162,13 +201,147 @@ class GithubCommitModel(BaseModel):
         detail = ""
 
         for f in self.files:
-            detail += f"{f.status}: {f.filename} +{f.additions}/-{f.deletions}"
-            if f.patch:
-                patch = f.patch[:_MAX_PATCH_LENGTH]
-                if len(f.patch) > _MAX_PATCH_LENGTH:
-                    patch += "\n... (truncated)"
-                detail += f"\n\n{patch}"
+            detail += f.stats_text
+            if f.truncated_patch:
+                detail += f"\n\n{f.truncated_patch}"
 
             detail += "\n\n"
 
         return f"{self.commit_summary_text}\n\n{detail}"
+
+    @cached_property
+    def commit_file_stats_text(self) -> str:
+        return "\n".join(f.stats_text for f in self.files)
+
+
+class GithubCompareCommitModel(BaseModel):
+    sha: str
+    node_id: str
+    commit: GithubCommitInfoModel
+    url: str
+    html_url: str
+    comments_url: str
+
+
+class GithubCompareModel(BaseModel):
+    """https://docs.github.com/ko/rest/commits/commits?apiVersion=2022-11-28#compare-two-commits"""
+
+    html_url: str
+    status: str  # "ahead" | "behind" | "diverged" | "identical"
+    total_commits: int
+    commits: list[GithubCompareCommitModel]
+    # 변경 파일은 첫 페이지에만 포함된다
+    files: list[GithubCommitFileModel] = []
+
+    def to_push_commit_model(self, head_sha: str) -> GithubCommitModel:
+        """
+        push에 포함된 모든 커밋을 하나의 커밋 모델로 합친다.
+        커밋 메시지는 커밋 순서대로 이어 붙이고, 변경 파일/통계는 before...head 전체 diff 기준이다.
+        """
+        head = next((c for c in self.commits if c.sha == head_sha), self.commits[-1])
+        additions = sum(f.additions for f in self.files)
+        deletions = sum(f.deletions for f in self.files)
+        return GithubCommitModel(
+            sha=head.sha,
+            node_id=head.node_id,
+            commit=head.commit.model_copy(
+                update={"message": "\n".join(f"- {c.commit.message}" for c in self.commits)}
+            ),
+            url=head.url,
+            html_url=self.html_url,
+            comments_url=head.comments_url,
+            stats=GithubCommitStatsModel(
+                total=sum(f.changes for f in self.files),
+                additions=additions,
+                deletions=deletions,
+            ),
+            files=self.files,
+        )
+
+
+class GithubSearchCommitRepositoryModel(BaseModel):
+    id: int
+    full_name: str  # owner/repo
+    url: str
+    private: bool = False
+
+
+class GithubSearchCommitModel(BaseModel):
+    """https://docs.github.com/ko/rest/search/search?apiVersion=2022-11-28#search-commits"""
+
+    sha: str
+    commit: GithubCommitInfoModel
+    # 커밋 author 이메일과 연결된 GitHub 사용자 (연결된 계정이 없으면 null)
+    author: dict | None = None
+    repository: GithubSearchCommitRepositoryModel
+
+    def to_event_model(self) -> GithubEventModel:
+        """이벤트 피드의 이벤트와 같이 저장/요약할 수 있도록 CommitEvent로 변환. 생성 시각은 커밋 작성 시각이다."""
+        if self.author is None:
+            raise ValueError(f"Commit {self.sha} has no GitHub author.")
+        authored_at = datetime.fromisoformat(self.commit.author["date"]).astimezone(UTC)
+        return GithubEventModel(
+            id=f"commit-{self.sha}",
+            actor=GitHubActorModel(
+                id=self.author["id"],
+                url=self.author["url"],
+                login=self.author["login"],
+                avatar_url=self.author["avatar_url"],
+                gravatar_id=self.author.get("gravatar_id") or "",
+                display_login=self.author["login"],
+            ),
+            repo=GithubRepositoryModel(
+                id=self.repository.id,
+                name=self.repository.full_name,
+                url=self.repository.url,
+            ),
+            type="CommitEvent",
+            payload=GithubCommitEventPayload(sha=self.sha),
+            public=not self.repository.private,
+            created_at=authored_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        )
+
+
+class GithubCommitRef(NamedTuple):
+    repository_name: str  # owner/repo
+    sha: str
+
+
+class GithubPullRequestRef(NamedTuple):
+    repository_name: str  # owner/repo
+    number: int
+
+
+class GithubPullRequestDetailModel(BaseModel):
+    """GraphQL로 조회한 PR 상세 정보와 PR의 커밋 목록"""
+
+    number: int
+    title: str
+    body: str | None = None
+    url: str
+    state: str  # "OPEN" | "CLOSED" | "MERGED"
+    merged: bool
+    base_ref: str
+    head_ref: str
+    # 변경 파일은 포함하지 않는다 (stats만 있음)
+    commits: list[GithubCommitModel]
+
+    def to_commit_model(self) -> GithubCommitModel | None:
+        """PR의 커밋을 하나의 커밋 모델로 합친다. 커밋 메시지는 순서대로 이어 붙이고 통계는 합산한다."""
+        if not self.commits:
+            return None
+        head = self.commits[-1]
+        additions = sum(c.stats.additions for c in self.commits)
+        deletions = sum(c.stats.deletions for c in self.commits)
+        return head.model_copy(
+            update={
+                "commit": head.commit.model_copy(
+                    update={"message": "\n".join(f"- {c.commit.message}" for c in self.commits)}
+                ),
+                "html_url": self.url,
+                "stats": GithubCommitStatsModel(
+                    total=additions + deletions, additions=additions, deletions=deletions
+                ),
+                "files": [],
+            }
+        )
@@ -139,6 +139,7 @@ class JiraIssueModel(BaseModel):
     priority: str | None = None
     labels: list[str] = []
     assignee_display_name: str | None = None
+    updated: str | None = None  # ISO 형식, 이슈 마지막 업데이트 시각
     comments: list[JiraCommentModel] = []
     changelog_histories: list[JiraChangelogHistoryModel] = []
 
@@ -185,6 +186,7 @@ class JiraIssueModel(BaseModel):
             issue_type=(fields.get("issuetype") or {}).get("name", ""),
             priority=(fields.get("priority") or {}).get("name"),
             assignee_display_name=(fields.get("assignee") or {}).get("displayName"),
+            updated=fields.get("updated"),
             comments=comments,
             changelog_histories=histories,
         )
@@ -209,6 +211,19 @@ class JiraIssueModel(BaseModel):
         """
         return [c for c in self.comments if c.get_created_date(tz_info) == target_date]
 
+    def get_activity_dates(self, tz_info: ZoneInfo) -> set[date]:
+        """
+        changelog/코멘트가 발생한 날짜 목록
+        """
+        return {h.get_created_date(tz_info) for h in self.changelog_histories} | {
+            c.get_created_date(tz_info) for c in self.comments
+        }
+
+    def get_updated_date(self, tz_info: ZoneInfo) -> date | None:
+        if not self.updated:
+            return None
+        return get_date_from_iso_format(self.updated, tz_info=tz_info)
+
     @cached_property
     def _base_info_text(self) -> str:
         """
@@ -1,32 +1,67 @@
+import asyncio
 import logging
 from datetime import date, timedelta
 from functools import lru_cache
-from typing import Any
+from typing import Any, Awaitable, Callable, TypeVar
 from zoneinfo import ZoneInfo
 
+import redis
+from pydantic import BaseModel
+
 from slack_sdk import WebClient
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web import SlackResponse
+from slack_sdk.web.async_client import AsyncSlackResponse, AsyncWebClient
 
 from dev_blackbox.client.model.slack_api_model import SlackChannelModel, SlackMessageModel
+from dev_blackbox.client.slack_rate_limiter import SlackRateLimiter
+from dev_blackbox.core.cache import CacheService
+from dev_blackbox.core.config import get_settings
+from dev_blackbox.core.const import CacheKey
 from dev_blackbox.core.exception import SlackClientException
+from dev_blackbox.core.pipeline_metric import record_wait, track_api_call
 from dev_blackbox.util.datetime_util import get_daily_timestamp_range
+from dev_blackbox.util.distributed_lock import distributed_lock
+from dev_blackbox.util.fingerprint_util import build_fingerprint
 
 logger = logging.getLogger(__name__)
 
+# 429 응답에 Retry-After 헤더가 없으면 기본 대기 시간
+_DEFAULT_RETRY_AFTER_SECONDS = 30
+# 캐시를 채우는 워커가 조회를 끝낼 때까지 다른 워커가 기다리는 최대 시간 (락 만료 시간과 같게)
+_CACHE_FILL_LOCK_TIMEOUT_SECONDS = 300
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
 
 class SlackClient:
 
-    def __init__(self, bot_token: str):
+    def __init__(
+        self,
+        bot_token: str,
+        rate_limiter: SlackRateLimiter | None = None,
+        cache_service: CacheService | None = None,
+    ):
         self.client = WebClient(token=bot_token)
+        self._token_hash = get_bot_token_hash(bot_token)
+        # rate limit은 워크스페이스 + 앱(봇 토큰) 단위로 부과되므로 같은 봇 토큰을 쓰는 워커/인스턴스가 속도를 공유
+        self._rate_limiter = rate_limiter or SlackRateLimiter(scope=self._token_hash)
+        self._cache_service = cache_service or CacheService()
 
     @classmethod
-    def create(cls, bot_token: str) -> "SlackClient":
+    def create(
+        cls,
+        bot_token: str,
+        rate_limiter: SlackRateLimiter | None = None,
+        cache_service: CacheService | None = None,
+    ) -> "SlackClient":
         logger.debug("Creating SlackClient")
-        return cls(bot_token)
+        return cls(bot_token, rate_limiter, cache_service)
 
     def fetch_users(self, filter_bot: bool = True) -> list[dict[str, Any]]:
         logger.debug("Fetching users")
 
-        response = self.client.users_list()
+        response = self._call("users.list", lambda: self.client.users_list())
         if not response.get("ok"):
             raise SlackClientException(f"Failed to fetch users: {response}")
 
@@ -39,27 +74,31 @@ class SlackClient:
 
     def fetch_channels(self) -> list[SlackChannelModel]:
         """
-        봇이 참여한 채널 목록 조회
+        봇이 참여한 채널 목록 조회.
+        같은 봇 토큰(워크스페이스)을 쓰는 사용자들이 나누어 쓰도록 캐시한다.
         """
+        return _get_or_fetch_cached(
+            self._cache_service,
+            CacheKey.SLACK_CHANNELS.format(token_hash=self._token_hash),
+            self._fetch_channels,
+            SlackChannelModel,
+        )
+
+    def _fetch_channels(self) -> list[SlackChannelModel]:
         channels: list[SlackChannelModel] = []
         cursor = None
 
         while True:
-            response = self.client.conversations_list(
-                types="public_channel,private_channel",
-                exclude_archived=True,
-                limit=200,
-                cursor=cursor,
+            response = self._call(
+                "conversations.list",
+                lambda: self.client.conversations_list(
+                    types="public_channel,private_channel",
+                    exclude_archived=True,
+                    limit=200,
+                    cursor=cursor,
+                ),
             )
-            for ch in response.get("channels", []):
-                if ch.get("is_member", False):
-                    channels.append(
-                        SlackChannelModel(
-                            id=ch["id"],
-                            name=ch["name"],
-                            is_private=ch.get("is_private", False),
-                        )
-                    )
+            channels.extend(_parse_channels(response))
 
             cursor = response.get("response_metadata", {}).get("next_cursor")
             if not cursor:
@@ -79,47 +118,74 @@ class SlackClient:
         특정 채널에서 메시지 조회.
         lookback_days > 0이면 oldest를 target_date - lookback_days로 확장하여
         과거 스레드 부모 메시지도 포함.
+
+        채널 히스토리는 사용자와 무관하므로 (봇 토큰, 채널, 조회 기간) 단위로 캐시하여
+        같은 봇 토큰을 쓰는 사용자들은 한 번 조회한 히스토리를 각자의 member_id로 필터링해서 사용한다.
         """
-        oldest, latest = get_daily_timestamp_range(target_date, tz_info)
-        if lookback_days > 0:
-            oldest, _ = get_daily_timestamp_range(
-                target_date - timedelta(days=lookback_days), tz_info
-            )
+        oldest, latest = _get_history_timestamp_range(target_date, tz_info, lookback_days)
+        return _get_or_fetch_cached(
+            self._cache_service,
+            CacheKey.SLACK_CHANNEL_HISTORY.format(
+                token_hash=self._token_hash, channel_id=channel_id, oldest=oldest, latest=latest
+            ),
+            lambda: self._fetch_messages(channel_id, oldest, latest),
+            SlackMessageModel,
+        )
 
+    def _fetch_messages(
+        self, channel_id: str, oldest: float, latest: float
+    ) -> list[SlackMessageModel]:
         messages: list[SlackMessageModel] = []
         cursor = None
 
         while True:
-            response = self.client.conversations_history(
-                channel=channel_id,
-                oldest=str(oldest),
-                latest=str(latest),
-                limit=200,
-                cursor=cursor,
+            response = self._call(
+                "conversations.history",
+                lambda: self.client.conversations_history(
+                    channel=channel_id,
+                    oldest=str(oldest),
+                    latest=str(latest),
+                    limit=200,
+                    cursor=cursor,
+                ),
             )
             logger.debug(f"Fetched {len(response.get('messages', []))} messages")
+            messages.extend(_parse_messages(response))
 
-            for msg in response.get("messages", []):
-                if msg.get("subtype") is None:
-                    messages.append(
-                        SlackMessageModel(
-                            ts=msg["ts"],
-                            user=msg.get("user", ""),
-                            text=msg.get("text", ""),
-                            thread_ts=msg.get("thread_ts"),
-                            latest_reply=msg.get("latest_reply"),
-                        )
-                    )
-
-            if not response.get("has_more", False):
-                break
-            cursor = response.get("response_metadata", {}).get("next_cursor")
+            cursor = _get_next_cursor(response)
             if not cursor:
                 break
 
         logger.info(f"Fetched {len(messages)} messages")
         return messages
 
+    def fetch_messages_by_range(
+        self, channel_id: str, oldest: float, latest: float
+    ) -> list[SlackMessageModel]:
+        """
+        oldest 이후 ~ latest 이전 채널 메시지 조회 (캐시하지 않음).
+        메시지 로그 동기화에서 직전 커서 이후 메시지만 조회할 때 사용한다.
+        """
+        return self._fetch_messages(channel_id, oldest, latest)
+
+    def fetch_thread_parent(self, channel_id: str, thread_ts: str) -> SlackMessageModel | None:
+        """
+        스레드 부모 메시지만 조회 (답글 수와 무관하게 요청 1번).
+        부모의 latest_reply로 마지막 답글 시각을 확인할 때 사용하며, 삭제된 스레드면 None.
+        """
+        try:
+            response = self._call(
+                "conversations.replies",
+                lambda: self.client.conversations_replies(
+                    channel=channel_id, ts=thread_ts, limit=1
+                ),
+            )
+        except SlackApiError as e:
+            if e.response.get("error") == "thread_not_found":
+                return None
+            raise
+        return next((m for m in _parse_messages(response) if m.ts == thread_ts), None)
+
     def fetch_thread_replies(
         self,
         channel_id: str,
@@ -130,42 +196,429 @@ class SlackClient:
     ) -> list[SlackMessageModel]:
         """스레드 답글 조회 (target_date 범위만)"""
         oldest, latest = get_daily_timestamp_range(target_date, tz_info)
+        return self.fetch_thread_replies_by_range(
+            channel_id=channel_id,
+            thread_ts=thread_ts,
+            oldest=oldest,
+            latest=latest,
+            include_parent=include_parent,
+        )
+
+    def fetch_thread_replies_by_range(
+        self,
+        channel_id: str,
+        thread_ts: str,
+        oldest: float,
+        latest: float,
+        include_parent: bool = False,
+    ) -> list[SlackMessageModel]:
+        """
+        스레드 답글 조회 (oldest ~ latest timestamp 범위만).
+        fetch_messages_by_date()와 같이 (봇 토큰, 채널, 스레드, 조회 기간) 단위로 캐시한다.
+        """
+        replies = _get_or_fetch_cached(
+            self._cache_service,
+            CacheKey.SLACK_THREAD_REPLIES.format(
+                token_hash=self._token_hash,
+                channel_id=channel_id,
+                thread_ts=thread_ts,
+                oldest=oldest,
+                latest=latest,
+            ),
+            lambda: self._fetch_replies(channel_id, thread_ts, oldest, latest),
+            SlackMessageModel,
+        )
+        return _exclude_parent(replies, thread_ts, include_parent)
+
+    def _fetch_replies(
+        self, channel_id: str, thread_ts: str, oldest: float, latest: float
+    ) -> list[SlackMessageModel]:
+        """부모 메시지를 포함한 스레드 답글 조회"""
         replies: list[SlackMessageModel] = []
         cursor = None
 
         while True:
-            response = self.client.conversations_replies(
-                channel=channel_id,
-                ts=thread_ts,
-                oldest=str(oldest),
-                latest=str(latest),
-                limit=100,
-                cursor=cursor,
+            response = self._call(
+                "conversations.replies",
+                lambda: self.client.conversations_replies(
+                    channel=channel_id,
+                    ts=thread_ts,
+                    oldest=str(oldest),
+                    latest=str(latest),
+                    limit=100,
+                    cursor=cursor,
+                ),
             )
             logger.debug(f"Fetched {len(response.get('messages', []))} replies")
+            replies.extend(_parse_replies(response))
 
-            for msg in response.get("messages", []):
-                if not include_parent and msg.get("ts") == thread_ts:
-                    continue
-                if msg.get("subtype") is None:
-                    replies.append(
-                        SlackMessageModel(
-                            ts=msg["ts"],
-                            user=msg.get("user", ""),
-                            text=msg.get("text", ""),
-                            thread_ts=msg.get("thread_ts"),
-                        )
-                    )
-
-            if not response.get("has_more", False):
+            cursor = _get_next_cursor(response)
+            if not cursor:
                 break
+
+        logger.info(f"Fetched {len(replies)} replies")
+        return replies
+
+    def _call(self, method: str, request: Callable[[], SlackResponse]) -> SlackResponse:
+        """
+        method의 tier 속도에 맞춰 대기한 뒤 요청한다.
+        429 응답이면 Retry-After 동안 같은 봇 토큰의 method 요청을 모두 멈추고 slack_rate_limit_max_retries까지 재시도한다.
+        """
+        max_retries = get_settings().collect_task.slack_rate_limit_max_retries
+        attempt = 0
+        while True:
+            self._rate_limiter.acquire(method)
+            try:
+                with track_api_call():
+                    return request()
+            except SlackApiError as e:
+                retry_after = _get_retry_after(e.response)
+                if retry_after is None or attempt >= max_retries:
+                    raise
+                logger.warning(
+                    f"Slack rate limit exceeded on {method}. Retry after {retry_after:.0f}s. (attempt: {attempt + 1})"
+                )
+                self._rate_limiter.block(method, retry_after)
+                attempt += 1
+
+
+class AsyncSlackClient:
+    """
+    SlackClient의 asyncio 버전 (slack_sdk AsyncWebClient).
+    동시 요청 수 제한(semaphore)은 실행 단위로 공유하도록 주입받는다.
+    """
+
+    def __init__(
+        self,
+        bot_token: str,
+        semaphore: asyncio.Semaphore,
+        rate_limiter: SlackRateLimiter | None = None,
+        cache_service: CacheService | None = None,
+    ):
+        self.client = AsyncWebClient(token=bot_token)
+        self._semaphore = semaphore
+        self._token_hash = get_bot_token_hash(bot_token)
+        self._rate_limiter = rate_limiter or SlackRateLimiter(scope=self._token_hash)
+        self._cache_service = cache_service or CacheService()
+
+    @classmethod
+    def create(
+        cls,
+        bot_token: str,
+        semaphore: asyncio.Semaphore,
+        rate_limiter: SlackRateLimiter | None = None,
+        cache_service: CacheService | None = None,
+    ) -> "AsyncSlackClient":
+        return cls(bot_token, semaphore, rate_limiter, cache_service)
+
+    async def fetch_channels(self) -> list[SlackChannelModel]:
+        """봇이 참여한 채널 목록 조회 (SlackClient와 캐시를 공유)"""
+        return await self._get_or_fetch_cached(
+            CacheKey.SLACK_CHANNELS.format(token_hash=self._token_hash),
+            self._fetch_channels,
+            SlackChannelModel,
+        )
+
+    async def _fetch_channels(self) -> list[SlackChannelModel]:
+        channels: list[SlackChannelModel] = []
+        cursor = None
+
+        while True:
+            response = await self._call(
+                "conversations.list",
+                lambda: self.client.conversations_list(
+                    types="public_channel,private_channel",
+                    exclude_archived=True,
+                    limit=200,
+                    cursor=cursor,
+                ),
+            )
+            channels.extend(_parse_channels(response))
+
             cursor = response.get("response_metadata", {}).get("next_cursor")
             if not cursor:
                 break
 
+        logger.info(f"Fetched {len(channels)} channels")
+        return channels
+
+    async def fetch_messages_by_date(
+        self,
+        channel_id: str,
+        target_date: date,
+        tz_info: ZoneInfo,
+        lookback_days: int = 0,
+    ) -> list[SlackMessageModel]:
+        """채널 메시지 조회 (SlackClient와 캐시를 공유)"""
+        oldest, latest = _get_history_timestamp_range(target_date, tz_info, lookback_days)
+        return await self._get_or_fetch_cached(
+            CacheKey.SLACK_CHANNEL_HISTORY.format(
+                token_hash=self._token_hash, channel_id=channel_id, oldest=oldest, latest=latest
+            ),
+            lambda: self._fetch_messages(channel_id, oldest, latest),
+            SlackMessageModel,
+        )
+
+    async def _fetch_messages(
+        self, channel_id: str, oldest: float, latest: float
+    ) -> list[SlackMessageModel]:
+        messages: list[SlackMessageModel] = []
+        cursor = None
+
+        while True:
+            response = await self._call(
+                "conversations.history",
+                lambda: self.client.conversations_history(
+                    channel=channel_id,
+                    oldest=str(oldest),
+                    latest=str(latest),
+                    limit=200,
+                    cursor=cursor,
+                ),
+            )
+            messages.extend(_parse_messages(response))
+
+            cursor = _get_next_cursor(response)
+            if not cursor:
+                break
+
+        logger.info(f"Fetched {len(messages)} messages")
+        return messages
+
+    async def fetch_thread_replies(
+        self,
+        channel_id: str,
+        thread_ts: str,
+        target_date: date,
+        tz_info: ZoneInfo,
+        include_parent: bool = False,
+    ) -> list[SlackMessageModel]:
+        """스레드 답글 조회 (target_date 범위만, SlackClient와 캐시를 공유)"""
+        oldest, latest = get_daily_timestamp_range(target_date, tz_info)
+        replies = await self._get_or_fetch_cached(
+            CacheKey.SLACK_THREAD_REPLIES.format(
+                token_hash=self._token_hash,
+                channel_id=channel_id,
+                thread_ts=thread_ts,
+                oldest=oldest,
+                latest=latest,
+            ),
+            lambda: self._fetch_replies(channel_id, thread_ts, oldest, latest),
+            SlackMessageModel,
+        )
+        return _exclude_parent(replies, thread_ts, include_parent)
+
+    async def _fetch_replies(
+        self, channel_id: str, thread_ts: str, oldest: float, latest: float
+    ) -> list[SlackMessageModel]:
+        """부모 메시지를 포함한 스레드 답글 조회"""
+        replies: list[SlackMessageModel] = []
+        cursor = None
+
+        while True:
+            response = await self._call(
+                "conversations.replies",
+                lambda: self.client.conversations_replies(
+                    channel=channel_id,
+                    ts=thread_ts,
+                    oldest=str(oldest),
+                    latest=str(latest),
+                    limit=100,
+                    cursor=cursor,
+                ),
+            )
+            replies.extend(_parse_replies(response))
+
+            cursor = _get_next_cursor(response)
+            if not cursor:
+                break
+
         logger.info(f"Fetched {len(replies)} replies")
         return replies
 
+    async def _get_or_fetch_cached(
+        self,
+        cache_key: str,
+        fetch: Callable[[], Awaitable[list[_ModelT]]],
+        model: type[_ModelT],
+    ) -> list[_ModelT]:
+        """
+        SlackClient와 같은 캐시를 사용한다.
+        이벤트 루프를 막지 않도록 캐시 조회/저장만 스레드에서 실행하고, 캐시를 채우는 동안 락으로 기다리지 않는다.
+        """
+        cached = await asyncio.to_thread(_get_cached_models, self._cache_service, cache_key, model)
+        if cached is not None:
+            return cached
+        result = await fetch()
+        await asyncio.to_thread(_set_cached_models, self._cache_service, cache_key, result)
+        return result
+
+    async def _call(
+        self, method: str, request: Callable[[], Awaitable[AsyncSlackResponse]]
+    ) -> AsyncSlackResponse:
+        """
+        SlackClient._call()과 동일하게 rate limit 대기 후 재시도한다.
+        Redis 조회는 스레드에서 실행하고, 대기는 semaphore를 점유하지 않은 채 이벤트 루프에서 한다.
+        """
+        max_retries = get_settings().collect_task.slack_rate_limit_max_retries
+        attempt = 0
+        while True:
+            wait_seconds = await asyncio.to_thread(self._rate_limiter.reserve, method)
+            if wait_seconds > 0:
+                await asyncio.sleep(wait_seconds)
+                record_wait(wait_seconds)
+            try:
+                async with self._semaphore:
+                    with track_api_call():
+                        return await request()
+            except SlackApiError as e:
+                retry_after = _get_retry_after(e.response)
+                if retry_after is None or attempt >= max_retries:
+                    raise
+                logger.warning(
+                    f"Slack rate limit exceeded on {method}. Retry after {retry_after:.0f}s. (attempt: {attempt + 1})"
+                )
+                await asyncio.to_thread(self._rate_limiter.block, method, retry_after)
+                attempt += 1
+
+
+def get_bot_token_hash(bot_token: str) -> str:
+    """캐시/rate limit 키에 봇 토큰 원문을 남기지 않도록 사용하는 토큰 식별자"""
+    return build_fingerprint(bot_token)[:16]
+
+
+def _get_or_fetch_cached(
+    cache_service: CacheService,
+    cache_key: str,
+    fetch: Callable[[], list[_ModelT]],
+    model: type[_ModelT],
+) -> list[_ModelT]:
+    """
+    캐시가 없으면 락을 잡은 한 워커만 조회하여 캐시를 채우고, 나머지 워커는 락이 풀린 뒤 캐시를 사용한다.
+    락을 기다리다 시간이 지나거나 Redis 장애 시에는 캐시 없이 직접 조회한다.
+    """
+    cached = _get_cached_models(cache_service, cache_key, model)
+    if cached is not None:
+        return cached
+
+    with distributed_lock(
+        cache_key,
+        timeout=_CACHE_FILL_LOCK_TIMEOUT_SECONDS,
+        blocking_timeout=_CACHE_FILL_LOCK_TIMEOUT_SECONDS,
+    ) as acquired:
+        if acquired:
+            # 락을 기다리는 동안 다른 워커가 채운 캐시
+            cached = _get_cached_models(cache_service, cache_key, model)
+            if cached is not None:
+                return cached
+        result = fetch()
+        _set_cached_models(cache_service, cache_key, result)
+        return result
+
+
+def _get_cached_models(
+    cache_service: CacheService, cache_key: str, model: type[_ModelT]
+) -> list[_ModelT] | None:
+    # 캐시는 API 호출을 줄이기 위한 용도이므로 Redis 장애 시 캐시 없이 조회
+    try:
+        cached = cache_service.get(cache_key)
+    except redis.RedisError:
+        logger.warning(f"Failed to get slack response cache. (key: {cache_key})")
+        return None
+    if cached is None:
+        return None
+    return [model.model_validate(c) for c in cached]
+
+
+def _set_cached_models(cache_service: CacheService, cache_key: str, models: list[BaseModel]):
+    ttl = get_settings().collect_task.slack_history_cache_ttl_seconds
+    try:
+        cache_service.set(cache_key, [m.model_dump(mode="json") for m in models], ex=ttl)
+    except redis.RedisError:
+        logger.warning(f"Failed to set slack response cache. (key: {cache_key})")
+
+
+def _get_retry_after(response: Any) -> float | None:
+    """
+    https://docs.slack.dev/apis/web-api/rate-limits
+
+    rate limit(429) 응답이면 다시 요청하기까지 기다려야 하는 시간(초), 아니면 None
+    """
+    if response.status_code != 429:
+        return None
+    for name, value in response.headers.items():
+        if name.lower() == "retry-after":
+            return float(value)
+    return _DEFAULT_RETRY_AFTER_SECONDS
+
+
+def _get_history_timestamp_range(
+    target_date: date,
+    tz_info: ZoneInfo,
+    lookback_days: int,
+) -> tuple[float, float]:
+    """
+    lookback_days > 0이면 oldest를 target_date - lookback_days로 확장하여
+    과거 스레드 부모 메시지도 포함.
+    """
+    oldest, latest = get_daily_timestamp_range(target_date, tz_info)
+    if lookback_days > 0:
+        oldest, _ = get_daily_timestamp_range(target_date - timedelta(days=lookback_days), tz_info)
+    return oldest, latest
+
+
+def _get_next_cursor(response: Any) -> str | None:
+    if not response.get("has_more", False):
+        return None
+    return response.get("response_metadata", {}).get("next_cursor") or None
+
+
+def _parse_channels(response: Any) -> list[SlackChannelModel]:
+    return [
+        SlackChannelModel(
+            id=ch["id"],
+            name=ch["name"],
+            is_private=ch.get("is_private", False),
+        )
+        for ch in response.get("channels", [])
+        if ch.get("is_member", False)
+    ]
+
+
+def _parse_messages(response: Any) -> list[SlackMessageModel]:
+    return [
+        SlackMessageModel(
+            ts=msg["ts"],
+            user=msg.get("user", ""),
+            text=msg.get("text", ""),
+            thread_ts=msg.get("thread_ts"),
+            latest_reply=msg.get("latest_reply"),
+        )
+        for msg in response.get("messages", [])
+        if msg.get("subtype") is None
+    ]
+
+
+def _parse_replies(response: Any) -> list[SlackMessageModel]:
+    return [
+        SlackMessageModel(
+            ts=msg["ts"],
+            user=msg.get("user", ""),
+            text=msg.get("text", ""),
+            thread_ts=msg.get("thread_ts"),
+        )
+        for msg in response.get("messages", [])
+        if msg.get("subtype") is None
+    ]
+
+
+def _exclude_parent(
+    replies: list[SlackMessageModel], thread_ts: str, include_parent: bool
+) -> list[SlackMessageModel]:
+    if include_parent:
+        return replies
+    return [r for r in replies if r.ts != thread_ts]
+
 
 @lru_cache(maxsize=10)
 def get_slack_client(bot_token: str) -> SlackClient:
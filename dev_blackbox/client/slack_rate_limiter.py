@@ -0,0 +1,125 @@
+"""
+Slack Web API rate limit 관리.
+
+Slack은 메서드별 tier(분당 허용 요청 수)로 워크스페이스 + 앱(봇 토큰) 단위 rate limit을 부과한다.
+scope(봇 토큰)와 메서드별 token bucket 상태를 Redis Hash에 두어 같은 봇 토큰을 쓰는 워커/인스턴스가 허용 속도를 나누어 쓰고,
+429 응답의 Retry-After 동안은 같은 메서드의 모든 요청을 멈춘다.
+대기 시간이 slack_rate_limit_max_wait_seconds를 넘으면 슬롯을 예약하지 않고 예외를 던져 실행 원장 재시도에 맡긴다.
+"""
+
+import logging
+import time
+
+import redis
+from redis import Redis
+from redis.client import Pipeline
+
+from dev_blackbox.core.cache import get_redis_client
+from dev_blackbox.core.config import get_settings
+from dev_blackbox.core.const import CacheKey
+from dev_blackbox.core.exception import SlackRateLimitExceededException
+from dev_blackbox.core.pipeline_metric import record_wait
+
+logger = logging.getLogger(__name__)
+
+# https://docs.slack.dev/apis/web-api/rate-limits
+_TIER_REQUESTS_PER_MINUTE = {1: 1, 2: 20, 3: 50, 4: 100}
+SLACK_METHOD_TIERS = {
+    "users.list": 2,
+    "conversations.list": 2,
+    "conversations.history": 3,
+    "conversations.replies": 3,
+}
+# tier를 모르는 메서드는 보수적으로 Tier 2로 취급
+_DEFAULT_TIER = 2
+# 기록은 다음 요청 가능 시각(또는 대기 종료) 이후 이 시간이 지나면 만료
+_STATE_EXPIRE_MARGIN_SECONDS = 60
+
+
+class SlackRateLimiter:
+
+    def __init__(
+        self,
+        scope: str,
+        cache_client: Redis | None = None,
+    ):
+        config = get_settings().collect_task
+        self.scope = scope
+        self.burst = max(1, config.slack_rate_limit_burst)
+        self.max_wait_seconds = config.slack_rate_limit_max_wait_seconds
+        self.cache_client = cache_client or get_redis_client()
+
+    def acquire(self, method: str) -> None:
+        """요청 전에 호출. 필요하면 대기한다. 최대 대기 시간을 넘으면 SlackRateLimitExceededException."""
+        wait_seconds = self.reserve(method)
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+            record_wait(wait_seconds)
+
+    def reserve(self, method: str) -> float:
+        """
+        method의 bucket에서 요청 1개를 예약하고, 요청 전에 기다려야 하는 시간(초)을 반환한다.
+        예약한 슬롯보다 먼저 보내면 다른 워커의 간격이 깨지므로 대기 시간을 줄이지 않고,
+        max_wait_seconds를 넘으면 예약하지 않고 SlackRateLimitExceededException.
+        """
+        key = self._get_key(method)
+        try:
+            wait_seconds = self._reserve_request(key, self._get_interval(method), time.time())
+        except redis.RedisError:
+            # rate limit 기록은 요청 속도 조절 용도이므로 Redis 장애 시 대기 없이 요청 (429는 block()으로 처리)
+            logger.warning(f"Failed to get slack rate limit. (key: {key})")
+            return 0
+
+        if wait_seconds <= 0:
+            return 0
+        if wait_seconds > self.max_wait_seconds:
+            raise SlackRateLimitExceededException(key, wait_seconds)
+        logger.debug(f"Waiting {wait_seconds:.2f}s for slack rate limit. (key: {key})")
+        return wait_seconds
+
+    def block(self, method: str, retry_after: float) -> None:
+        """429 응답을 받으면 호출. retry_after 동안 같은 scope/method의 모든 요청을 멈춘다."""
+        key = self._get_key(method)
+        now = time.time()
+        try:
+            pipeline = self.cache_client.pipeline()
+            pipeline.hset(key, "blocked_until", now + retry_after)
+            pipeline.expire(key, int(retry_after) + _STATE_EXPIRE_MARGIN_SECONDS)
+            pipeline.execute()
+        except redis.RedisError:
+            logger.warning(f"Failed to set slack rate limit. (key: {key})")
+
+    def _reserve_request(self, key: str, interval: float, now: float) -> float:
+        """
+        GCRA(Generic Cell Rate Algorithm)로 구현한 token bucket.
+        tat(다음 요청의 이론상 도착 시각)만 저장하며, burst개까지는 연속으로 보내고 이후에는 interval 간격으로 보낸다.
+        여러 워커가 동시에 예약해도 요청 시각이 겹치지 않도록 WATCH 트랜잭션으로 갱신한다.
+        대기 시간이 max_wait_seconds를 넘으면 요청하지 않으므로 tat를 갱신하지 않는다.
+        """
+        burst_tolerance = interval * (self.burst - 1)
+
+        def reserve(pipeline: Pipeline) -> float:
+            tat, blocked = pipeline.hmget(  # pyright: ignore [reportGeneralTypeIssues]
+                key, ["tat", "blocked_until"]
+            )
+            blocked_until = float(blocked) if blocked is not None else now
+            start = max(float(tat) if tat is not None else now, blocked_until, now)
+            next_tat = start + interval
+            wait_seconds = max(start - burst_tolerance - now, blocked_until - now, 0.0)
+            if wait_seconds > self.max_wait_seconds:
+                return wait_seconds
+
+            pipeline.multi()
+            pipeline.hset(key, "tat", next_tat)
+            pipeline.expire(key, int(next_tat - now) + _STATE_EXPIRE_MARGIN_SECONDS)
+            return wait_seconds
+
+        return self.cache_client.transaction(reserve, key, value_from_callable=True)
+
+    def _get_key(self, method: str) -> str:
+        return CacheKey.SLACK_RATE_LIMIT.format(scope=self.scope, method=method)
+
+    @staticmethod
+    def _get_interval(method: str) -> float:
+        tier = SLACK_METHOD_TIERS.get(method, _DEFAULT_TIER)
+        return 60 / _TIER_REQUESTS_PER_MINUTE[tier]
@@ -0,0 +1,30 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from starlette import status
+
+from dev_blackbox.controller.admin.dto.pipeline_metric_dto import (
+    PipelineMetricParam,
+    PipelineStageAggregateResponseDto,
+)
+from dev_blackbox.controller.config.security_config import CurrentAdminUser
+from dev_blackbox.core.database import get_db
+from dev_blackbox.service.pipeline_metric_service import PipelineMetricService
+
+router = APIRouter(prefix="/admin-api/v1/pipeline-metrics", tags=["Admin Pipeline Metric"])
+
+
+@router.get(
+    "",
+    status_code=status.HTTP_200_OK,
+    response_model=list[PipelineStageAggregateResponseDto],
+)
+async def get_pipeline_stage_aggregates(
+    current_admin_user: CurrentAdminUser,
+    param: Annotated[PipelineMetricParam, Query()],
+    db: Session = Depends(get_db),
+):
+    service = PipelineMetricService(db)
+    aggregates = service.get_stage_aggregates(param.last_runs)
+    return [PipelineStageAggregateResponseDto.from_model(a) for a in aggregates]
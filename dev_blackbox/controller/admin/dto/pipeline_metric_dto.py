@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel, Field
+
+from dev_blackbox.core.enum import PipelineMetricStageEnum, PlatformEnum
+
+if TYPE_CHECKING:
+    from dev_blackbox.service.model.pipeline_metric_model import PipelineStageAggregate
+
+
+class PipelineMetricParam(BaseModel):
+    last_runs: int = Field(default=7, ge=1, le=90, description="집계할 최근 수집 날짜 수")
+
+
+class PipelineStageAggregateResponseDto(BaseModel):
+    platform: PlatformEnum
+    stage: PipelineMetricStageEnum
+    sample_count: int
+    p50_ms: float
+    p95_ms: float
+    avg_api_call_count: float
+    avg_input_size: float | None
+    avg_output_size: float | None
+
+    @classmethod
+    def from_model(cls, model: PipelineStageAggregate) -> PipelineStageAggregateResponseDto:
+        return cls(
+            platform=model.platform,
+            stage=model.stage,
+            sample_count=model.sample_count,
+            p50_ms=model.p50_ms,
+            p95_ms=model.p95_ms,
+            avg_api_call_count=model.avg_api_call_count,
+            avg_input_size=model.avg_input_size,
+            avg_output_size=model.avg_output_size,
+        )
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 from dev_blackbox.controller.api.dto.github_event_dto import GitHubEventResponseDto
 from dev_blackbox.controller.api.dto.jira_event_dto import JiraEventResponseDto
@@ -64,6 +64,21 @@ class WorkLogManualSyncReqeustDto(BaseModel):
     target_date: date = Field(..., description="수동 수집 대상 날짜 (YYYY-MM-DD)")
 
 
+class WorkLogBackfillRequestDto(BaseModel):
+    MAX_BACKFILL_DAYS: ClassVar[int] = 31
+
+    start_date: date = Field(..., description="백필 시작 날짜 (YYYY-MM-DD)")
+    end_date: date = Field(..., description="백필 종료 날짜, 포함 (YYYY-MM-DD)")
+
+    @model_validator(mode="after")
+    def _validate_date_range(self) -> WorkLogBackfillRequestDto:
+        if self.start_date > self.end_date:
+            raise ValueError("start_date must be less than or equal to end_date.")
+        if (self.end_date - self.start_date).days + 1 > self.MAX_BACKFILL_DAYS:
+            raise ValueError(f"Backfill range must be within {self.MAX_BACKFILL_DAYS} days.")
+        return self
+
+
 class PlatformWorkLogDetailResponseDto(BaseModel):
     id: int
     target_date: date = Field(..., description="요약 대상 날짜 (YYYY-MM-DD)")
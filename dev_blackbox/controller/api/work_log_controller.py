@@ -11,6 +11,7 @@ from dev_blackbox.controller.api.dto.work_log_dto import (
     DailyWorkLogResponseDto,
     PlatformWorkLogDetailResponseDto,
     PlatformWorkLogResponseDto,
+    WorkLogBackfillRequestDto,
     WorkLogManualSyncReqeustDto,
     UserContentCreateOrUpdateRequestDto,
 )
@@ -19,7 +20,10 @@ from dev_blackbox.controller.config.security_config import AuthToken, CurrentUse
 from dev_blackbox.core.database import get_db
 from dev_blackbox.core.enum import PlatformEnum
 from dev_blackbox.service.work_log_service import WorkLogService
-from dev_blackbox.task.collect_task import collect_events_and_summarize_work_log_by_user_task
+from dev_blackbox.task.collect_task import (
+    backfill_events_and_summarize_work_log_by_user_task,
+    collect_events_and_summarize_work_log_by_user_task,
+)
 from dev_blackbox.util.idempotent_request import idempotent_request, save_idempotent_response
 
 router = APIRouter(prefix="/api/v1/work-logs", tags=["WorkLog"])
@@ -155,3 +159,33 @@ async def sync_work_logs(
         response_data=response.model_dump(mode="json"),
     )
     return response
+
+
+@router.post(
+    "/backfill",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=BackgroundTaskResponseDto,
+)
+async def backfill_work_logs(
+    request_dto: WorkLogBackfillRequestDto,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    token: AuthToken,
+    current_user: CurrentUser,
+    idempotency_key: str = Depends(idempotent_request),
+):
+    background_tasks.add_task(
+        backfill_events_and_summarize_work_log_by_user_task,
+        current_user.id,
+        request_dto.start_date,
+        request_dto.end_date,
+    )
+    response = BackgroundTaskResponseDto(
+        message=f"{request_dto.start_date} ~ {request_dto.end_date}에 대해 백필 작업이 시작 되었습니다."
+    )
+    save_idempotent_response(
+        request=request,
+        idempotency_key=idempotency_key,
+        response_data=response.model_dump(mode="json"),
+    )
+    return response
@@ -1,4 +1,5 @@
 import multiprocessing
+from datetime import datetime, UTC
 
 from apscheduler.executors.pool import ThreadPoolExecutor, ProcessPoolExecutor
 from apscheduler.jobstores.redis import RedisJobStore
@@ -6,7 +7,13 @@ from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 from dev_blackbox.core.config import get_settings
-from dev_blackbox.task.collect_task import collect_events_and_summarize_work_log_task
+from dev_blackbox.task.cluster_task import heartbeat_instance_task
+from dev_blackbox.task.collect_task import (
+    COLLECT_TRIGGER_MINUTE,
+    collect_events_and_summarize_work_log_task,
+    retry_pipeline_steps_task,
+    summarize_queued_jobs_task,
+)
 from dev_blackbox.task.health_task import health_check_task
 from dev_blackbox.task.jira_task import sync_jira_users_task
 from dev_blackbox.task.slack_task import sync_slack_users_task
@@ -48,9 +55,27 @@ scheduler = BackgroundScheduler(
 )
 
 scheduler.add_job(health_check_task, "interval", minutes=5)
+scheduler.add_job(
+    heartbeat_instance_task,
+    "interval",
+    seconds=30,
+    next_run_time=datetime.now(UTC),  # 기동 즉시 인스턴스 등록
+)
 scheduler.add_job(
     collect_events_and_summarize_work_log_task,
-    CronTrigger(hour=0, minute=0),  # 09:00 KST
+    # 매시 10분, 현지 시각이 local_trigger_hour를 지났고 어제 날짜를 아직 처리하지 않은 타임존 사용자만 처리
+    CronTrigger(minute=COLLECT_TRIGGER_MINUTE),
+    max_instances=3,  # 이전 타임존 그룹 처리가 끝나지 않아도 다음 그룹이 밀리지 않도록
+)
+scheduler.add_job(
+    retry_pipeline_steps_task,
+    "interval",
+    minutes=5,  # 실행 원장에서 재시도 시각이 도래한 스텝만 처리
+)
+scheduler.add_job(
+    summarize_queued_jobs_task,
+    "interval",
+    minutes=1,  # 파이프라인 모드에서 모든 인스턴스가 공유 큐의 요약 작업을 나누어 소비
 )
 scheduler.add_job(
     sync_jira_users_task,
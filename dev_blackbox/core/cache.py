@@ -66,6 +66,38 @@ class CacheService:
         return self.cache_client.delete(key)
 
 
+class QueueService:
+    """
+    Redis List 기반 FIFO 큐. 값은 CacheService와 동일하게 pickle로 직렬화한다.
+    """
+
+    def __init__(
+        self,
+        cache_client: Redis | None = None,
+    ):
+        self.cache_client = cache_client or get_redis_client()
+
+    def push(self, key: str, value: Any, ex: int = CacheTTL.DEFAULT):
+        pipeline = self.cache_client.pipeline()
+        pipeline.rpush(key, pickle.dumps(value))
+        pipeline.expire(key, int(ex))
+        return pipeline.execute()
+
+    def pop(self, key: str, timeout: int = 1) -> Any | None:
+        """timeout(초) 동안 값을 기다리고, 없으면 None 반환"""
+        item = self.cache_client.blpop([key], timeout=timeout)
+        if item is None:
+            return None
+        _, data = item  # pyright: ignore [reportGeneralTypeIssues]
+        return pickle.loads(data)
+
+    def size(self, key: str) -> int:
+        return int(self.cache_client.llen(key))  # pyright: ignore [reportArgumentType]
+
+    def delete(self, key: str):
+        return self.cache_client.delete(key)
+
+
 class LockService:
 
     def __init__(
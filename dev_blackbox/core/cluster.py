@@ -0,0 +1,45 @@
+import logging
+import os
+import socket
+import time
+import uuid
+from functools import lru_cache
+
+from redis import Redis
+
+from dev_blackbox.core.cache import get_redis_client
+from dev_blackbox.core.const import ClusterKey
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache
+def get_instance_id() -> str:
+    """프로세스 단위 인스턴스 식별자"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class InstanceRegistry:
+    """
+    Redis Sorted Set(score=마지막 heartbeat 시각) 기반 인스턴스 멤버십 관리.
+    ttl_seconds 동안 heartbeat가 없는 인스턴스는 죽은 것으로 간주한다.
+    """
+
+    def __init__(
+        self,
+        cache_client: Redis | None = None,
+    ):
+        self.cache_client = cache_client or get_redis_client()
+
+    def heartbeat(self, instance_id: str) -> None:
+        self.cache_client.zadd(ClusterKey.INSTANCES, {instance_id: time.time()})
+
+    def unregister(self, instance_id: str) -> None:
+        self.cache_client.zrem(ClusterKey.INSTANCES, instance_id)
+
+    def get_live_instances(self, ttl_seconds: int) -> list[str]:
+        self.cache_client.zremrangebyscore(ClusterKey.INSTANCES, "-inf", time.time() - ttl_seconds)
+        members: list[bytes] = self.cache_client.zrange(  # pyright: ignore [reportAssignmentType]
+            ClusterKey.INSTANCES, 0, -1
+        )
+        return sorted(m.decode("utf-8") if isinstance(m, bytes) else m for m in members)
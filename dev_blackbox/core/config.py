@@ -55,6 +55,74 @@ class LoggingConfig(BaseModel):
     date_format: str = "%Y-%m-%d %H:%M:%S"
 
 
+class HttpClientConfig(BaseModel):
+    connect_timeout_seconds: float = 5.0
+    timeout_seconds: float = 30.0  # 읽기/쓰기/커넥션 풀 대기 타임아웃
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry_seconds: float = 30.0  # 유휴 커넥션 유지 시간
+    http2_enabled: bool = True  # h2 패키지가 설치되어 있을 때만 적용
+
+
+class CollectTaskConfig(BaseModel):
+    # 사용자별 수집/요약 동시 실행 수 (DB 세션을 잡는 플랫폼 수집은 프로세스 전체에서 DB pool_size + max_overflow - 5개까지만 동시 실행)
+    max_workers: int = 4
+    # 사용자 타임존 기준 수집 시작 시각 (매시 정각 직후 실행되는 스케줄에서 판별)
+    local_trigger_hour: int = 0
+    pipeline_enabled: bool = False  # 수집/요약을 Redis 큐 기반 2단계 파이프라인으로 분리
+    summary_workers: int = 2  # 파이프라인 모드에서 LLM 요약 워커 수
+    # 파이프라인 모드의 (사용자, 날짜) 요약 그룹 기록 유지 시간. 요약 워커가 중단되어 그룹이 닫히지 않으면
+    # 이 시간 뒤 만료되어 재시도 태스크가 다시 처리한다 (큐 대기 시간을 포함한 요약 시간보다 길게)
+    summary_group_ttl_seconds: int = 3600
+    sharding_enabled: bool = False  # 살아있는 인스턴스들에 사용자를 샤딩하여 분산 실행
+    instance_ttl_seconds: int = 90  # heartbeat가 끊긴 인스턴스를 제외하기까지의 시간
+    # 샤드 락 만료 시간 (실행 중 자동 갱신, 인스턴스 장애 시 락이 풀리는 시간)
+    shard_lock_timeout: int = 120
+    retry_max_attempts: int = 5  # 실행 원장 스텝별 최대 시도 횟수
+    retry_base_delay_seconds: int = 300  # 재시도 지수 백오프 기본 대기 시간
+    retry_max_delay_seconds: int = 21600  # 재시도 지수 백오프 최대 대기 시간
+    retry_batch_size: int = 100  # 재시도 태스크 1회 실행 시 조회할 최대 스텝 수
+    # PENDING/RUNNING 상태가 이 시간 이상 갱신되지 않으면 중단된 스텝으로 보고 재시도 (배치 실행 시간보다 길게)
+    step_stale_seconds: int = 3600
+    # 사용자 1명의 PushEvent 커밋 동시 조회 수 (GitHub secondary rate limit을 고려해 작게 유지)
+    github_commit_concurrency: int = 4
+    # 토큰별 남은 요청 수가 이 이하면 reset 시각까지 요청 간격을 고르게 벌린다
+    github_rate_limit_reserve: int = 100
+    github_rate_limit_max_retries: int = 3  # rate limit 응답(403/429) 시 대기 후 재시도 횟수
+    # 남은 요청이 소진되어 reset까지 이 시간보다 더 기다려야 하면 대기하지 않고 실패 처리하여 실행 원장 재시도에 맡긴다
+    github_rate_limit_max_wait_seconds: int = 300
+    # push의 head 커밋만 조회하는 대신 compare API(before...head)로 push의 모든 커밋/변경 파일을 조회
+    github_compare_enabled: bool = False
+    # github_org와 github_org_collector를 모두 설정하면 실행마다 org 이벤트 피드를 한 번 조회하여 actor로 사용자별 이벤트를 나눈다 (org 모드)
+    # org 구성원은 사용자별 이벤트 피드를 조회하지 않으므로 org 밖(개인 레포, 다른 org)의 활동은 수집하지 않는다
+    github_org: str | None = None
+    # org 피드를 조회할 토큰의 소유자 (등록된 GitHub username, org의 private 레포를 볼 수 있는 구성원이어야 함)
+    github_org_collector: str | None = None
+    # events: 이벤트 피드에서 PushEvent의 커밋을 조회 / search: 커밋 검색(author-date)으로 target_date의 커밋을 조회하고
+    # PR 등 나머지 이벤트는 이벤트 피드에서 조회 (검색 인덱스는 레포 기본 브랜치의 커밋만 포함)
+    github_collect_strategy: Literal["events", "search"] = "events"
+    # PushEvent 커밋/PullRequestEvent 상세를 GraphQL로 묶어서 조회 (변경 파일 목록 없이 메시지/통계만 수집)
+    github_graphql_enabled: bool = False
+    # Slack 메서드 tier 속도에 더해 연속으로 보낼 수 있는 요청 수 (봇 토큰 + 메서드 단위로 워커/인스턴스가 공유)
+    slack_rate_limit_burst: int = 3
+    slack_rate_limit_max_retries: int = 3  # 429 응답 시 Retry-After만큼 대기 후 재시도 횟수
+    # rate limit 1회 대기 최대 시간. 더 기다려야 하면 슬롯을 예약하지 않고 실패 처리하여 실행 원장 재시도에 맡긴다
+    slack_rate_limit_max_wait_seconds: int = 600
+    # 같은 봇 토큰을 쓰는 사용자들이 채널 목록/히스토리/스레드 답글을 한 번만 조회하도록 공유하는 캐시 유지 시간
+    slack_history_cache_ttl_seconds: int = 3600
+    # 채널 메시지를 워크스페이스 단위 로그(slack_message_log)로 저장하고, 채널별 커서 이후 메시지만 조회 (15일 재조회 대신)
+    slack_message_log_enabled: bool = False
+    # asyncio 이벤트 루프로 전체 사용자를 동시에 수집 (요약은 summary_workers 스레드에서 실행)
+    async_collect_enabled: bool = False
+    github_concurrency: int = 100  # 비동기 수집 시 GitHub 동시 요청 수
+    slack_concurrency: int = 10  # 비동기 수집 시 Slack 동시 요청 수
+    jira_concurrency: int = 8  # 비동기 수집 시 Jira 동시 요청 수 (스레드로 위임)
+    # 요약 입력이 chunk 예산을 넘으면 레포/이슈/채널 경계로 나누어 요약한 뒤 합친다 (map-reduce)
+    summary_map_reduce_enabled: bool = False
+    summary_chunk_tokens: int = 16000  # map-reduce 요약 시 chunk당 최대 입력 토큰 수
+    summary_map_workers: int = 2  # chunk 동시 요약 수 (Ollama OLLAMA_NUM_PARALLEL 이하)
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=os.path.join(_PROJECT_ROOT, ".env"),
@@ -69,6 +137,8 @@ class Settings(BaseSettings):
     encryption: EncryptionSecrets
     auth: AuthSecrets
     logging: LoggingConfig = LoggingConfig()
+    http_client: HttpClientConfig = HttpClientConfig()
+    collect_task: CollectTaskConfig = CollectTaskConfig()
 
     @property
     def is_prod(self) -> bool:
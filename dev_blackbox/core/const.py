@@ -10,14 +10,52 @@ class CacheTTL(IntEnum):
     SECONDS_30 = 30
     MINUTES_15 = 900
     IDEMPOTENT_REQUEST = 300
+    HOURS_24 = 86400
+    DAYS_30 = 2592000
 
 
 class CacheKey(StrEnum):
     WORK_LOG_PLATFORM = "work-logs-platforms:users:{user_id}:target_date:{target_date}"
     WORK_LOG_USER_CONTENT = "work-logs-user-content:users:{user_id}:target_date:{target_date}"
+    GITHUB_EVENTS_PAGE = (
+        "github-events-pages:tokens:{token_hash}:users:{username}:page:{page}:per_page:{per_page}"
+    )
+    GITHUB_ORG_EVENTS_PAGE = (
+        "github-org-events-pages:tokens:{token_hash}:orgs:{org}:page:{page}:per_page:{per_page}"
+    )
+    GITHUB_COMMIT = "github-commits:{repository_url}:sha:{sha}"
+    GITHUB_COMPARE = "github-compares:{repository_url}:base:{base}:head:{head}"
+    GITHUB_RATE_LIMIT = "github-rate-limit:scopes:{scope}"
+    SLACK_RATE_LIMIT = "slack-rate-limit:scopes:{scope}:methods:{method}"
+    SLACK_CHANNELS = "slack-channels:bots:{token_hash}"
+    SLACK_CHANNEL_HISTORY = (
+        "slack-channel-histories:bots:{token_hash}:channels:{channel_id}"
+        ":oldest:{oldest}:latest:{latest}"
+    )
+    SLACK_THREAD_REPLIES = (
+        "slack-thread-replies:bots:{token_hash}:channels:{channel_id}:threads:{thread_ts}"
+        ":oldest:{oldest}:latest:{latest}"
+    )
 
 
 class LockKey(StrEnum):
     SYNC_JIRA_USERS_TASK = "sync_jira_users_task"
     SYNC_SLACK_USERS_TASK = "sync_slack_users_task"
+    SYNC_SLACK_MESSAGE_LOG = "sync_slack_message_log"
     COLLECT_EVENTS_AND_SUMMARIZE_WORK_LOG_TASK = "collect_events_and_summarize_work_log_task"
+    RETRY_PIPELINE_STEPS_TASK = "retry_pipeline_steps_task"
+
+
+class QueueKey(StrEnum):
+    SUMMARY_JOB = "queue:summary-jobs"
+    SUMMARY_JOB_GROUP = "queue:summary-job-groups:users:{user_id}:target_date:{target_date}"
+    SUMMARY_JOB_GROUP_RESULTS = (
+        "queue:summary-job-groups:users:{user_id}:target_date:{target_date}:results"
+    )
+
+
+class ClusterKey(StrEnum):
+    INSTANCES = "cluster:instances"
+    COLLECT_RUN_MEMBERS = "cluster:collect-run:{run_key}:members"
+    COLLECT_RUN_SHARD_DONE = "cluster:collect-run:{run_key}:shard:{shard}:done"
+    COLLECT_BUCKET_DONE = "cluster:collect-bucket:{timezone}:{target_date}:done"
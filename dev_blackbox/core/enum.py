@@ -15,3 +15,24 @@ class PlatformEnum(StrEnum):
     @classmethod
     def platforms(cls) -> list[PlatformEnum]:
         return [member for member in cls if member != PlatformEnum.USER_CONTENT]
+
+
+class PipelineStageEnum(StrEnum):
+    COLLECT = "COLLECT"
+    SUMMARIZE = "SUMMARIZE"
+
+
+class PipelineStepStatusEnum(StrEnum):
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+
+
+class PipelineMetricStageEnum(StrEnum):
+    FETCH = "FETCH"
+    WAIT = "WAIT"
+    PERSIST = "PERSIST"
+    TEXT = "TEXT"
+    LLM = "LLM"
+    SAVE = "SAVE"
@@ -121,6 +121,30 @@ class SlackClientException(ServiceException):
         super().__init__(message)
 
 
+class SlackRateLimitExceededException(SlackClientException):
+
+    def __init__(self, key: str, wait_seconds: float):
+        self.wait_seconds = wait_seconds
+        super().__init__(
+            f"Slack rate limit wait {wait_seconds:.0f}s exceeds max wait. (key: {key})"
+        )
+
+
+class GitHubClientException(ServiceException):
+
+    def __init__(self, message: str = "GitHub API error occurred"):
+        super().__init__(message)
+
+
+class GitHubRateLimitExceededException(GitHubClientException):
+
+    def __init__(self, key: str, wait_seconds: float):
+        self.wait_seconds = wait_seconds
+        super().__init__(
+            f"GitHub rate limit wait {wait_seconds:.0f}s exceeds max wait. (key: {key})"
+        )
+
+
 class NoSlackChannelsFound(ServiceException):
 
     def __init__(self):
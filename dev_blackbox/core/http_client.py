@@ -0,0 +1,76 @@
+"""
+외부 API 호출용 공유 HTTP 클라이언트.
+
+요청마다 httpx.Client를 만들면 매번 TCP/TLS 핸드셰이크를 다시 하므로, 프로세스 단위로 커넥션 풀을 공유한다.
+h2 패키지가 설치되어 있으면 HTTP/2로 하나의 커넥션에서 여러 요청을 다중화한다.
+"""
+
+import importlib.util
+import logging
+from functools import lru_cache
+
+import httpx
+
+from dev_blackbox.core.config import HttpClientConfig, get_settings
+
+logger = logging.getLogger(__name__)
+
+
+def is_http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def get_http_timeout(config: HttpClientConfig) -> httpx.Timeout:
+    return httpx.Timeout(config.timeout_seconds, connect=config.connect_timeout_seconds)
+
+
+def get_http_limits(config: HttpClientConfig, max_connections: int | None = None) -> httpx.Limits:
+    """max_connections가 주어지면(동시 요청 수 제한) 그만큼의 커넥션을 모두 유지한다."""
+    if max_connections is None:
+        max_connections = config.max_connections
+        max_keepalive_connections = min(config.max_keepalive_connections, max_connections)
+    else:
+        max_keepalive_connections = max_connections
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=config.keepalive_expiry_seconds,
+    )
+
+
+def use_http2(config: HttpClientConfig) -> bool:
+    return config.http2_enabled and is_http2_available()
+
+
+@lru_cache
+def get_http_client() -> httpx.Client:
+    """
+    https://www.python-httpx.org/advanced/clients/
+
+    스레드 간 공유 가능한 동기 클라이언트. 스케줄러 종료 시 close_http_client()로 닫는다.
+    """
+    config = get_settings().http_client
+    http2 = use_http2(config)
+    logger.info(f"Create shared http client. (http2: {http2})")
+    return httpx.Client(
+        http2=http2,
+        timeout=get_http_timeout(config),
+        limits=get_http_limits(config),
+    )
+
+
+def create_async_http_client(max_connections: int | None = None) -> httpx.AsyncClient:
+    """비동기 수집 실행 단위로 사용하는 클라이언트. 같은 타임아웃/HTTP2 설정을 따른다."""
+    config = get_settings().http_client
+    return httpx.AsyncClient(
+        http2=use_http2(config),
+        timeout=get_http_timeout(config),
+        limits=get_http_limits(config, max_connections),
+    )
+
+
+def close_http_client() -> None:
+    if get_http_client.cache_info().currsize == 0:
+        return
+    get_http_client().close()
+    get_http_client.cache_clear()
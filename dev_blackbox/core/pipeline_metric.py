@@ -0,0 +1,152 @@
+"""
+수집/요약 파이프라인 단계별 계측.
+
+metric_scope()로 (사용자, 날짜, 플랫폼) 단위 수집기를 현재 컨텍스트에 등록하고,
+measure_stage()로 감싼 블록의 소요 시간/입출력 크기를 단계별로 누적한다.
+클라이언트는 track_api_call()로 외부 API 호출 횟수/시간을, rate limit 대기는 record_wait()로 기록하며
+어느 단계 안에서 발생하든 FETCH/WAIT 단계로 분리되어 집계된다.
+수집기가 등록되지 않은 컨텍스트에서는 모두 아무 동작도 하지 않는다.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import date
+
+from dev_blackbox.core.enum import PipelineMetricStageEnum, PlatformEnum
+
+
+@dataclass
+class StageMetric:
+    stage: PipelineMetricStageEnum
+    duration_seconds: float = 0.0
+    api_call_count: int = 0
+    input_size: int | None = None
+    output_size: int | None = None
+
+    def add_size(self, input_size: int | None, output_size: int | None):
+        if input_size is not None:
+            self.input_size = (self.input_size or 0) + input_size
+        if output_size is not None:
+            self.output_size = (self.output_size or 0) + output_size
+
+
+@dataclass
+class StageMeasurement:
+    """measure_stage() 블록 안에서 입출력 크기를 기록하기 위한 값"""
+
+    input_size: int | None = None
+    output_size: int | None = None
+
+
+@dataclass
+class PipelineMetricCollector:
+    user_id: int
+    target_date: date
+    platform: PlatformEnum
+    metrics: dict[PipelineMetricStageEnum, StageMetric] = field(default_factory=dict)
+    # 현재 측정 중인 블록의 API 호출 시간/횟수, 대기 시간 (단계 소요 시간에서 분리)
+    api_seconds: float = 0.0
+    api_call_count: int = 0
+    wait_seconds: float = 0.0
+    excluded_seconds: float = 0.0
+
+    def add(
+        self,
+        stage: PipelineMetricStageEnum,
+        duration_seconds: float,
+        api_call_count: int = 0,
+        input_size: int | None = None,
+        output_size: int | None = None,
+    ):
+        metric = self.metrics.setdefault(stage, StageMetric(stage=stage))
+        metric.duration_seconds += duration_seconds
+        metric.api_call_count += api_call_count
+        metric.add_size(input_size, output_size)
+
+
+_current_collector: ContextVar[PipelineMetricCollector | None] = ContextVar(
+    "pipeline_metric_collector", default=None
+)
+
+
+@contextmanager
+def metric_scope(
+    user_id: int,
+    target_date: date,
+    platform: PlatformEnum,
+) -> Iterator[PipelineMetricCollector]:
+    collector = PipelineMetricCollector(user_id=user_id, target_date=target_date, platform=platform)
+    token = _current_collector.set(collector)
+    try:
+        yield collector
+    finally:
+        _current_collector.reset(token)
+
+
+@contextmanager
+def measure_stage(stage: PipelineMetricStageEnum) -> Iterator[StageMeasurement]:
+    measurement = StageMeasurement()
+    collector = _current_collector.get()
+    if collector is None:
+        yield measurement
+        return
+
+    # 중첩 측정: 바깥 블록의 누적값을 보관하고, 안쪽 블록 소요 시간 전체를 바깥 단계에서 제외
+    outer = (
+        collector.api_seconds,
+        collector.api_call_count,
+        collector.wait_seconds,
+        collector.excluded_seconds,
+    )
+    collector.api_seconds, collector.api_call_count = 0.0, 0
+    collector.wait_seconds, collector.excluded_seconds = 0.0, 0.0
+    started_at = time.perf_counter()
+    try:
+        yield measurement
+    finally:
+        elapsed = time.perf_counter() - started_at
+        if collector.api_call_count:
+            collector.add(
+                PipelineMetricStageEnum.FETCH,
+                collector.api_seconds,
+                api_call_count=collector.api_call_count,
+            )
+        if collector.wait_seconds:
+            collector.add(PipelineMetricStageEnum.WAIT, collector.wait_seconds)
+        collector.add(
+            stage,
+            max(
+                0.0,
+                elapsed
+                - collector.api_seconds
+                - collector.wait_seconds
+                - collector.excluded_seconds,
+            ),
+            input_size=measurement.input_size,
+            output_size=measurement.output_size,
+        )
+        collector.api_seconds, collector.api_call_count = outer[0], outer[1]
+        collector.wait_seconds, collector.excluded_seconds = outer[2], outer[3] + elapsed
+
+
+@contextmanager
+def track_api_call() -> Iterator[None]:
+    """외부 API 호출 1회의 시간/횟수 기록"""
+    collector = _current_collector.get()
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        if collector is not None:
+            collector.api_seconds += time.perf_counter() - started_at
+            collector.api_call_count += 1
+
+
+def record_wait(seconds: float):
+    """rate limit 등 의도적인 대기 시간 기록"""
+    collector = _current_collector.get()
+    if collector is not None:
+        collector.wait_seconds += seconds
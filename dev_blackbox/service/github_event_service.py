@@ -1,33 +1,46 @@
+import contextvars
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from zoneinfo import ZoneInfo
 
+import httpx
 from sqlalchemy.orm import Session
 
 from dev_blackbox.client.github_client import GitHubClient
 from dev_blackbox.client.model.github_api_model import (
+    GithubCommitEventPayload,
     GithubCommitModel,
+    GithubCommitRef,
     GithubEventModel,
+    GithubPullRequestEventPayload,
+    GithubPullRequestRef,
     GithubPushEventPayloadModel,
 )
+from dev_blackbox.core.config import get_settings
 from dev_blackbox.core.encrypt import get_encrypt_service
 from dev_blackbox.core.exception import (
+    GitHubClientException,
     UserNotFoundException,
+    GitHubUserSecretNotFoundException,
     GitHubUserSecretNotSetException,
 )
+from dev_blackbox.service.model.collect_target_model import GitHubCollectTarget
 from dev_blackbox.storage.rds.entity import User
 from dev_blackbox.storage.rds.entity.github_event import GitHubEvent
+from dev_blackbox.storage.rds.entity.github_user_secret import GitHubUserSecret
 from dev_blackbox.storage.rds.repository import (
     GitHubEventRepository,
     UserRepository,
     GitHubUserSecretRepository,
 )
-from dev_blackbox.util.datetime_util import get_yesterday
+from dev_blackbox.util.datetime_util import get_date_range, get_yesterday
 
 logger = logging.getLogger(__name__)
 
 
 class GitHubEventService:
-    SUMMARY_EVENT_TYPES = ["PushEvent"]
+    SUMMARY_EVENT_TYPES = ["PushEvent", "PullRequestEvent", "CommitEvent"]
 
     def __init__(self, session: Session):
         self.session = session
@@ -64,7 +77,14 @@ class GitHubEventService:
         self,
         user_id: int,
         target_date: date | None = None,
+        full_refresh: bool = False,
     ) -> list[GitHubEvent]:
+        """
+        target_date의 GitHub 이벤트를 수집하여 저장하고, 해당 날짜의 전체 이벤트를 반환한다.
+
+        기본적으로 이미 저장된 가장 최신 이벤트 ID를 워터마크로 삼아 그보다 새로운 이벤트만 조회/저장한다.
+        full_refresh=True이면 기존 이벤트를 삭제하고 처음부터 다시 수집한다.
+        """
         user = self.user_repository.find_by_id(user_id)
         if user is None:
             raise UserNotFoundException(user_id)
@@ -73,73 +93,502 @@ class GitHubEventService:
         if target_date is None:
             target_date = get_yesterday(user.tz_info)
 
-        # 기존 데이터 삭제 후 갱신하도록
-        self.github_event_repository.delete_by_user_id_and_target_date(user_id, target_date)
+        if full_refresh:
+            # 기존 데이터 삭제 후 갱신하도록
+            self.github_event_repository.delete_by_user_id_and_target_date(user_id, target_date)
+            stored_events = []
+        else:
+            stored_events = self.github_event_repository.find_all_by_user_id_and_target_date(
+                user_id, target_date
+            )
 
-        # 없으면 에러
-        github_user_secret = self.github_user_secret_repository.find_by_user_id(user_id=user.id)
-        if github_user_secret is None:
-            raise GitHubUserSecretNotSetException(user_id)
+        github_user_secret = self._get_github_user_secret_or_throw(user.id)
+        github_client = self._create_github_client(github_user_secret)
 
-        # 복호화 하고
-        decrypted_token = self.encrypt_service.decrypt(github_user_secret.personal_access_token)
-        github_client = GitHubClient.create(token=decrypted_token)
-
-        # 조회 하고
-        events = []
+        # 워터마크 이후 이벤트만 조회 하고
         github_events = self.fetch_github_events(
             github_client=github_client,
             user=user,
             github_username=github_user_secret.username,
             target_date=target_date,
+            since_event_id=self._get_latest_event_id(stored_events),
         )
-        # 저장 ㄱㄱ
-        for github_event in github_events:
-            github_commit = self.fetch_github_commit_by_event(github_client, github_event)
-            events.append(
-                GitHubEvent.create(
-                    user_id=user.id,
-                    github_user_secret_id=github_user_secret.id,
-                    target_date=target_date,
-                    event=github_event,
-                    commit=github_commit,
-                ),
+        # 새 이벤트만 저장 ㄱㄱ (커밋 정보 없이 저장된 이벤트는 커밋을 다시 조회해서 채운다)
+        events = self._create_new_events(
+            github_client, user, github_user_secret, github_events, stored_events
+        )
+        logger.info(
+            f"Saved {len(events)} new events, {len(stored_events)} already stored. (user_id: {user.id}, target_date: {target_date})"
+        )
+        return stored_events + self.github_event_repository.save_all(events)
+
+    def save_github_events_by_date_range(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+    ) -> dict[date, list[GitHubEvent]]:
+        """
+        start_date ~ end_date 기간의 GitHub 이벤트를 이벤트 피드 한 번 순회로 수집하여 이벤트 생성일 기준 target_date로 나누어 저장한다.
+        날짜별 전체 이벤트(기존 저장분 포함)를 반환한다.
+        """
+        user = self.user_repository.find_by_id(user_id)
+        if user is None:
+            raise UserNotFoundException(user_id)
+
+        github_user_secret = self._get_github_user_secret_or_throw(user.id)
+        github_client = self._create_github_client(github_user_secret)
+
+        target_dates = get_date_range(start_date, end_date)
+        stored_events_by_date = {
+            d: self.github_event_repository.find_all_by_user_id_and_target_date(user_id, d)
+            for d in target_dates
+        }
+        stored_events = [e for events in stored_events_by_date.values() for e in events]
+
+        # 기간 중간에 비어있는 날짜가 있을 수 있어 워터마크 없이 전체 기간을 조회하고 저장된 이벤트만 거른다
+        github_events = self.fetch_github_events_by_date_range(
+            github_client=github_client,
+            user=user,
+            github_username=github_user_secret.username,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        events = self.github_event_repository.save_all(
+            self._create_new_events(
+                github_client, user, github_user_secret, github_events, stored_events
             )
+        )
+        logger.info(
+            f"Saved {len(events)} new events, {len(stored_events)} already stored. (user_id: {user.id}, target_date: {start_date} ~ {end_date})"
+        )
+
+        result = {d: list(stored_events) for d, stored_events in stored_events_by_date.items()}
+        for event in events:
+            result[event.target_date].append(event)
+        return result
+
+    def save_org_github_events(
+        self,
+        org: str,
+        collector_username: str,
+        user_ids: list[int],
+        target_date: date,
+        tz_info: ZoneInfo,
+    ) -> list[int]:
+        """
+        org 이벤트 피드를 한 번 조회하여 actor.login이 등록된 GitHub username인 이벤트를 사용자별로 나누어 저장한다.
+        사용자 수와 관계없이 이벤트 피드는 한 번, 커밋은 이벤트마다 한 번만 조회한다.
+        피드는 collector_username(org의 private 레포를 볼 수 있는 구성원)의 토큰으로 조회하고, user_ids 중 org 구성원만 대상으로 한다.
+
+        수집을 완료한 사용자(org 구성원) ID 목록을 반환한다. 피드가 target_date 이전 이벤트까지 도달하지 못하면(피드 최대 300개)
+        누락이 있을 수 있으므로 저장하지 않고 빈 리스트를 반환하며, 호출자는 사용자별로 수집한다.
+        """
+        collector = self.github_user_secret_repository.find_by_username(collector_username)
+        if collector is None:
+            raise GitHubUserSecretNotFoundException(collector_username)
+
+        github_client = self._create_github_client(collector)
+        member_logins = github_client.fetch_org_member_logins(org)
+        secrets = [
+            s
+            for s in self.github_user_secret_repository.find_all_by_user_ids(user_ids)
+            if s.username.lower() in member_logins
+        ]
+        if not secrets:
+            return []
+
+        github_events, is_complete = github_client.fetch_org_events_by_date(
+            username=collector.username,
+            org=org,
+            target_date=target_date,
+            tz_info=tz_info,
+        )
+        if not is_complete:
+            logger.warning(
+                f"Org events feed did not reach {target_date}. Collect by user instead. (org: {org})"
+            )
+            return []
+
+        secret_by_login = {s.username.lower(): s for s in secrets}
+        stored_event_ids = self.github_event_repository.find_all_event_ids_by_event_ids(
+            [e.id for e in github_events.events]
+        )
+        new_events = [
+            e
+            for e in github_events.events
+            if e.actor.login.lower() in secret_by_login and e.id not in stored_event_ids
+        ]
+        github_commits = self._fetch_github_commits(github_client, new_events)
+        events = [
+            GitHubEvent.create(
+                user_id=secret_by_login[github_event.actor.login.lower()].user_id,
+                github_user_secret_id=secret_by_login[github_event.actor.login.lower()].id,
+                target_date=github_event.get_created_date(tz_info),
+                event=github_event,
+                commit=github_commit,
+            )
+            for github_event, github_commit in zip(new_events, github_commits)
+        ]
+        self.github_event_repository.save_all(events)
+        logger.info(
+            f"Saved {len(events)} new org events for {len(secrets)} users. (org: {org}, target_date: {target_date})"
+        )
+        return [s.user_id for s in secrets]
+
+    def get_collect_target(self, user_id: int, target_date: date) -> GitHubCollectTarget:
+        """
+        비동기 수집용: 세션 밖에서 API를 호출할 수 있도록 수집에 필요한 값(토큰, 워터마크)만 조회한다.
+        """
+        user = self.user_repository.find_by_id(user_id)
+        if user is None:
+            raise UserNotFoundException(user_id)
+
+        github_user_secret = self._get_github_user_secret_or_throw(user.id)
+        stored_events = self.github_event_repository.find_all_by_user_id_and_target_date(
+            user_id, target_date
+        )
+        return GitHubCollectTarget(
+            user_id=user.id,
+            target_date=target_date,
+            tz_info=user.tz_info,
+            github_user_secret_id=github_user_secret.id,
+            username=github_user_secret.username,
+            token=self.encrypt_service.decrypt(github_user_secret.personal_access_token),
+            since_event_id=self._get_latest_event_id(stored_events),
+            # 커밋 정보 없이 저장된 이벤트는 커밋을 다시 조회하도록 제외
+            stored_event_ids={e.event_id for e in stored_events if not e.is_commit_missing},
+        )
+
+    def save_fetched_github_events(
+        self,
+        target: GitHubCollectTarget,
+        github_events: list[GithubEventModel],
+        commits: dict[str, GithubCommitModel],
+    ) -> list[GitHubEvent]:
+        """
+        비동기 수집 결과 저장. commits는 이벤트 ID별 커밋 정보이다.
+        조회 이후 다른 실행이 저장한 이벤트는 건너뛰고, 커밋 정보 없이 저장된 이벤트는 조회한 커밋 정보로 채운다.
+        """
+        stored_events_by_id = {
+            e.event_id: e
+            for e in self.github_event_repository.find_all_by_user_id_and_target_date(
+                target.user_id, target.target_date
+            )
+        }
+        events = []
+        for github_event in github_events:
+            commit = commits.get(github_event.id)
+            stored_event = stored_events_by_id.get(github_event.id)
+            if stored_event is None:
+                events.append(
+                    GitHubEvent.create(
+                        user_id=target.user_id,
+                        github_user_secret_id=target.github_user_secret_id,
+                        target_date=github_event.get_created_date(target.tz_info),
+                        event=github_event,
+                        commit=commit,
+                    )
+                )
+            elif stored_event.is_commit_missing:
+                if commit is not None:
+                    stored_event.update_commit(commit)
+                else:
+                    stored_event.record_commit_fetch_failure()
+        logger.info(
+            f"Saved {len(events)} new events. (user_id: {target.user_id}, target_date: {target.target_date})"
+        )
         return self.github_event_repository.save_all(events)
 
+    def _get_github_user_secret_or_throw(self, user_id: int) -> GitHubUserSecret:
+        github_user_secret = self.github_user_secret_repository.find_by_user_id(user_id=user_id)
+        if github_user_secret is None:
+            raise GitHubUserSecretNotSetException(user_id)
+        return github_user_secret
+
+    def _create_github_client(self, github_user_secret: GitHubUserSecret) -> GitHubClient:
+        decrypted_token = self.encrypt_service.decrypt(github_user_secret.personal_access_token)
+        return GitHubClient.create(token=decrypted_token)
+
+    def _create_new_events(
+        self,
+        github_client: GitHubClient,
+        user: User,
+        github_user_secret: GitHubUserSecret,
+        github_events: list[GithubEventModel],
+        stored_events: list[GitHubEvent],
+    ) -> list[GitHubEvent]:
+        """
+        저장되지 않은 이벤트만 커밋 정보와 함께 엔티티로 생성. target_date는 이벤트 생성일(사용자 타임존) 기준.
+        커밋 정보 없이 저장된 이벤트는 커밋을 다시 조회하여 기존 엔티티에 채운다.
+        """
+        stored_events_by_id = {e.event_id: e for e in stored_events}
+        fetch_events = [
+            e
+            for e in github_events
+            if e.id not in stored_events_by_id or stored_events_by_id[e.id].is_commit_missing
+        ]
+        github_commits = self._fetch_github_commits(github_client, fetch_events)
+
+        events = []
+        for github_event, github_commit in zip(fetch_events, github_commits):
+            stored_event = stored_events_by_id.get(github_event.id)
+            if stored_event is None:
+                events.append(
+                    GitHubEvent.create(
+                        user_id=user.id,
+                        github_user_secret_id=github_user_secret.id,
+                        target_date=github_event.get_created_date(user.tz_info),
+                        event=github_event,
+                        commit=github_commit,
+                    )
+                )
+            elif github_commit is not None:
+                stored_event.update_commit(github_commit)
+            else:
+                stored_event.record_commit_fetch_failure()
+        return events
+
+    @staticmethod
+    def _get_latest_event_id(events: list[GitHubEvent]) -> str | None:
+        """
+        워터마크로 쓸 가장 최신 이벤트 ID.
+        커밋 정보 없이 저장된 이벤트가 있으면 다시 조회되도록 그 중 가장 오래된 이벤트 이전까지만 워터마크로 삼는다.
+        커밋 조회가 COMMIT_FETCH_MAX_ATTEMPTS번 실패한 이벤트는 제외하므로 워터마크가 계속 멈춰 있지 않는다.
+        """
+        event_ids = [e.event_id for e in events if e.event_id.isdigit()]
+        missing_event_ids = [
+            int(e.event_id) for e in events if e.is_commit_missing and e.event_id.isdigit()
+        ]
+        if missing_event_ids:
+            oldest_missing_event_id = min(missing_event_ids)
+            event_ids = [i for i in event_ids if int(i) < oldest_missing_event_id]
+        if not event_ids:
+            return None
+        return max(event_ids, key=int)
+
     def fetch_github_events(
         self,
         github_client: GitHubClient,
         user: User,
         github_username: str,
         target_date: date,
+        since_event_id: str | None = None,
     ) -> list[GithubEventModel]:
-        """GitHub API를 통해 특정 사용자의 이벤트 조회. 모든 이벤트 타입을 반환한다."""
+        """
+        GitHub API를 통해 특정 사용자의 이벤트 조회. 모든 이벤트 타입을 반환한다.
+        github_collect_strategy가 search이면 PushEvent 대신 커밋 검색으로 조회한 target_date의 커밋(CommitEvent)을 반환한다.
+        """
         github_events = github_client.fetch_events_by_date(
             username=github_username,
             target_date=target_date,
             tz_info=user.tz_info,
+            since_event_id=since_event_id,
         )
         events = github_events.events
+        if get_settings().collect_task.github_collect_strategy == "search":
+            try:
+                commit_events = self.fetch_github_commit_events_by_search(
+                    github_client, user, github_username, target_date
+                )
+            except httpx.HTTPError:
+                logger.warning(
+                    f"Failed to search commits for {github_username}. Use push events instead. (user_id: {user.id})"
+                )
+            else:
+                # PR 등 커밋 검색으로 조회할 수 없는 이벤트만 이벤트 피드에서 사용
+                events = [e for e in events if e.type != "PushEvent"] + commit_events
         if not events:
             logger.warning(f"No events found for {github_username}. (user_id: {user.id})")
 
         logger.info(f"Collected {len(events)} events for {github_username}. (user_id: {user.id})")
         return events
 
+    def fetch_github_commit_events_by_search(
+        self,
+        github_client: GitHubClient,
+        user: User,
+        github_username: str,
+        target_date: date,
+    ) -> list[GithubEventModel]:
+        """커밋 검색으로 target_date에 작성한 커밋을 조회하여 CommitEvent로 반환한다."""
+        commits = github_client.search_commits_by_date(
+            username=github_username,
+            target_date=target_date,
+            tz_info=user.tz_info,
+        )
+        logger.info(
+            f"Searched {len(commits)} commits for {github_username} on {target_date}. (user_id: {user.id})"
+        )
+        return [c.to_event_model() for c in commits if c.author is not None]
+
+    def fetch_github_events_by_date_range(
+        self,
+        github_client: GitHubClient,
+        user: User,
+        github_username: str,
+        start_date: date,
+        end_date: date,
+    ) -> list[GithubEventModel]:
+        """GitHub API를 통해 특정 사용자의 기간 이벤트 조회. 모든 이벤트 타입을 반환한다."""
+        github_events = github_client.fetch_events_by_date_range(
+            username=github_username,
+            start_date=start_date,
+            end_date=end_date,
+            tz_info=user.tz_info,
+        )
+        events = github_events.events
+        if not events:
+            logger.warning(f"No events found for {github_username}. (user_id: {user.id})")
+
+        logger.info(
+            f"Collected {len(events)} events for {github_username} in {start_date} ~ {end_date}. (user_id: {user.id})"
+        )
+        return events
+
+    def _fetch_github_commits(
+        self,
+        github_client: GitHubClient,
+        github_events: list[GithubEventModel],
+    ) -> list[GithubCommitModel | None]:
+        if get_settings().collect_task.github_graphql_enabled:
+            try:
+                return self.fetch_github_commits_by_graphql(github_client, github_events)
+            except httpx.HTTPError, GitHubClientException:
+                logger.warning("Failed to fetch commits by graphql. Fall back to REST API.")
+        return self.fetch_github_commits_by_events(github_client, github_events)
+
+    def fetch_github_commits_by_graphql(
+        self,
+        github_client: GitHubClient,
+        github_events: list[GithubEventModel],
+    ) -> list[GithubCommitModel | None]:
+        """
+        PushEvent의 head 커밋, CommitEvent의 커밋과 PullRequestEvent의 PR 커밋(합친 정보)을 GraphQL로 묶어서 조회.
+        결과는 github_events 순서를 유지하고, 다른 이벤트 타입이나 조회되지 않은 객체는 None.
+        """
+        refs: list[GithubCommitRef | GithubPullRequestRef | None] = []
+        for github_event in github_events:
+            payload = github_event.typed_payload
+            if isinstance(payload, GithubPushEventPayloadModel):
+                refs.append(GithubCommitRef(github_event.repo.name, payload.head))
+            elif isinstance(payload, GithubCommitEventPayload):
+                refs.append(GithubCommitRef(github_event.repo.name, payload.sha))
+            elif isinstance(payload, GithubPullRequestEventPayload):
+                refs.append(GithubPullRequestRef(github_event.repo.name, payload.number))
+            else:
+                refs.append(None)
+
+        commit_refs = [r for r in refs if isinstance(r, GithubCommitRef)]
+        pull_request_refs = [r for r in refs if isinstance(r, GithubPullRequestRef)]
+        commits = github_client.fetch_commits_by_graphql(commit_refs) if commit_refs else {}
+        pull_requests = (
+            github_client.fetch_pull_requests_by_graphql(pull_request_refs)
+            if pull_request_refs
+            else {}
+        )
+        logger.info(
+            f"Collected {len(commits)} commits, {len(pull_requests)} pull requests by graphql."
+        )
+
+        result: list[GithubCommitModel | None] = []
+        for ref in refs:
+            if isinstance(ref, GithubCommitRef):
+                result.append(commits.get(ref))
+            elif isinstance(ref, GithubPullRequestRef) and ref in pull_requests:
+                result.append(pull_requests[ref].to_commit_model())
+            else:
+                result.append(None)
+        return result
+
+    def fetch_github_commits_by_events(
+        self,
+        github_client: GitHubClient,
+        github_events: list[GithubEventModel],
+    ) -> list[GithubCommitModel | None]:
+        """
+        이벤트별 커밋 정보를 github_commit_concurrency개씩 동시에 조회. 결과는 github_events 순서를 유지한다.
+        커밋 조회에 실패한 이벤트는 커밋 정보 없이(None) 저장되도록 하여 나머지 이벤트 수집은 계속한다.
+        """
+        max_workers = get_settings().collect_task.github_commit_concurrency
+        if len(github_events) <= 1 or max_workers <= 1:
+            return [self._fetch_github_commit_or_none(github_client, e) for e in github_events]
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(github_events)), thread_name_prefix="github-commit"
+        ) as executor:
+            # 단계별 계측(track_api_call)이 워커 스레드에서도 집계되도록 컨텍스트를 복사해서 실행
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._fetch_github_commit_or_none,
+                    github_client,
+                    github_event,
+                )
+                for github_event in github_events
+            ]
+            return [future.result() for future in futures]
+
+    def _fetch_github_commit_or_none(
+        self,
+        github_client: GitHubClient,
+        github_event: GithubEventModel,
+    ) -> GithubCommitModel | None:
+        try:
+            return self.fetch_github_commit_by_event(github_client, github_event)
+        except httpx.HTTPError:
+            logger.warning(
+                f"Failed to fetch commit for {github_event.id}. Save the event without commit info."
+            )
+            return None
+
     def fetch_github_commit_by_event(
         self,
         github_client: GitHubClient,
         github_event: GithubEventModel,
     ) -> GithubCommitModel | None:
-        """GitHub API를 통해 PushEvent의 커밋 정보 조회. 다른 이벤트 타입은 None 반환."""
+        """
+        GitHub API를 통해 PushEvent/CommitEvent의 커밋 정보 조회. 다른 이벤트 타입은 None 반환.
+        github_compare_enabled이면 compare API로 push의 모든 커밋을 하나의 커밋 모델로 합쳐서 반환한다.
+        """
+        if isinstance(github_event.typed_payload, GithubCommitEventPayload):
+            return github_client.fetch_commit(
+                repository_url=github_event.repo.url,
+                sha=github_event.typed_payload.sha,
+            )
         if not isinstance(github_event.typed_payload, GithubPushEventPayloadModel):
             return None
 
         payload = github_event.typed_payload
-        commit = github_client.fetch_commit(
-            repository_url=github_event.repo.url,
-            sha=payload.head,
-        )
+        if get_settings().collect_task.github_compare_enabled and not payload.is_new_ref:
+            commit = self._fetch_github_push_commit(github_client, github_event.repo.url, payload)
+        else:
+            commit = github_client.fetch_commit(
+                repository_url=github_event.repo.url,
+                sha=payload.head,
+            )
         logger.info(f"Collected commit info for {github_event.id}.")
         return commit
+
+    def _fetch_github_push_commit(
+        self,
+        github_client: GitHubClient,
+        repository_url: str,
+        payload: GithubPushEventPayloadModel,
+    ) -> GithubCommitModel:
+        try:
+            compare = github_client.fetch_compare(
+                repository_url=repository_url,
+                base=payload.before,
+                head=payload.head,
+            )
+        except httpx.HTTPStatusError:
+            # force push 등으로 before 커밋이 없으면 비교할 수 없으므로 head 커밋만 조회
+            logger.warning(
+                f"Failed to compare {payload.before}...{payload.head}. Fetch head commit only."
+            )
+            compare = None
+
+        if compare is None or not compare.commits:
+            return github_client.fetch_commit(repository_url=repository_url, sha=payload.head)
+        return compare.to_push_commit_model(payload.head)
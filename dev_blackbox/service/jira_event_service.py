@@ -1,5 +1,6 @@
 import logging
 from datetime import date, timedelta
+from zoneinfo import ZoneInfo
 
 from sqlalchemy.orm import Session
 
@@ -14,18 +15,21 @@ from dev_blackbox.core.exception import (
     JiraUserProjectNotAssignedException,
 )
 from dev_blackbox.service.jira_secret_service import JiraSecretService
+from dev_blackbox.service.model.collect_target_model import JiraCollectTarget
 from dev_blackbox.storage.rds.entity import User
 from dev_blackbox.storage.rds.entity.jira_event import JiraEvent
+from dev_blackbox.storage.rds.entity.jira_user import JiraUser
 from dev_blackbox.storage.rds.repository import (
     UserRepository,
     JiraEventRepository,
 )
-from dev_blackbox.util.datetime_util import get_yesterday
+from dev_blackbox.util.datetime_util import get_date_range, get_yesterday
 
 logger = logging.getLogger(__name__)
 
 
 class JiraEventService:
+    SEARCH_PAGE_SIZE = 50
 
     def __init__(self, session: Session):
         self.session = session
@@ -51,34 +55,42 @@ class JiraEventService:
         user = self._get_user_or_throw(user_id)
         # target_date가 없으면 유저 타임존 기준 어제 날짜로 설정
         target_date = target_date or get_yesterday(user.tz_info)
-        jira_user = user.jira_user
-        if not jira_user:
-            raise JiraUserNotAssignedException(user_id)
-        if not jira_user.has_project():
-            raise JiraUserProjectNotAssignedException(user_id)
+        target = self.get_collect_target(user_id, target_date)
         logger.info(f"Collecting events for user_id={user_id}, target_date={target_date}")
 
-        # 기존 데이터 삭제 후 갱신
-        self.jira_event_repository.delete_by_user_id_and_target_date(user_id, target_date)
+        # Jira API 호출 (페이지네이션 하지 않음, 하루 50개 이상 이슈 업데이트 되는 경우는 드물다고 가정)
+        result = target.jira_client.fetch_search_issues(jql=target.jql)
+        issues = [JiraIssueModel.from_raw(issue.raw) for issue in result]
+        return self.save_fetched_jira_events(user_id, target_date, issues)
 
-        # JQL 빌드: target_date 하루 범위
-        next_date = target_date + timedelta(days=1)
+    def get_collect_target(self, user_id: int, target_date: date) -> JiraCollectTarget:
+        """target_date 하루 범위 JQL과 Jira 클라이언트 조회. 세션 밖에서 API를 호출할 수 있도록 엔티티를 반환하지 않는다."""
+        user = self._get_user_or_throw(user_id)
+        jira_user = self._get_jira_user_or_throw(user)
         jql = IssueJQL(
             project=jira_user.project,
             assignee_account_id=jira_user.account_id,
             include_statuses=JiraStatusGroup.IN_FLIGHT_AND_RESOLVED,
             updated_after=target_date.isoformat(),
-            updated_before=next_date.isoformat(),
+            updated_before=(target_date + timedelta(days=1)).isoformat(),
+        )
+        return JiraCollectTarget(
+            user_id=user.id,
+            target_date=target_date,
+            jql=jql,
+            jira_client=self.jira_secret_service.get_jira_client(jira_user.jira_secret),
         )
 
-        jira_client = self.jira_secret_service.get_jira_client(jira_user.jira_secret)
-        issues: list[JiraIssueModel] = []
-
-        # Jira API 호출 (페이지네이션 하지 않음, 하루 50개 이상 이슈 업데이트 되는 경우는 드물다고 가정)
-        result = jira_client.fetch_search_issues(jql=jql)
-        for issue in result:
-            issue_model = JiraIssueModel.from_raw(issue.raw)
-            issues.append(issue_model)
+    def save_fetched_jira_events(
+        self,
+        user_id: int,
+        target_date: date,
+        issues: list[JiraIssueModel],
+    ) -> list[JiraEvent]:
+        """조회한 이슈로 target_date의 이벤트를 갱신 (기존 데이터 삭제 후 저장)"""
+        user = self._get_user_or_throw(user_id)
+        jira_user = self._get_jira_user_or_throw(user)
+        self.jira_event_repository.delete_by_user_id_and_target_date(user_id, target_date)
 
         logger.info(
             f"Collected {len(issues)} issues for user_id={user_id}, target_date={target_date}"
@@ -86,32 +98,127 @@ class JiraEventService:
         if not issues:
             return []
 
-        events = []
-        for issue_model in issues:
-            # changelog를 target_date 기준으로 필터링하여 저장
-            filtered_changelog = issue_model.filter_changelog_by_date(target_date, user.tz_info)
-            changelog_data = (
-                [h.model_dump(mode="json") for h in filtered_changelog]
-                if filtered_changelog
-                else None
-            )
+        events = self._create_jira_events(user, jira_user, [target_date], issues)
+        return self.jira_event_repository.save_all(events)
+
+    def save_jira_events_by_date_range(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+    ) -> dict[date, list[JiraEvent]]:
+        """
+        start_date ~ end_date 기간에 업데이트된 이슈를 한 번의 JQL 조회로 수집하여,
+        changelog/코멘트가 발생한 날짜별 target_date row로 나누어 저장한다.
+        """
+        user = self._get_user_or_throw(user_id)
+        jira_user = self._get_jira_user_or_throw(user)
+        logger.info(
+            f"Collecting events for user_id={user_id}, target_date={start_date} ~ {end_date}"
+        )
 
-            events.append(
-                JiraEvent.create(
-                    user_id=user_id,
-                    jira_user_id=jira_user.id,
-                    target_date=target_date,
-                    issue_id=issue_model.id,
-                    issue_key=issue_model.key,
-                    issue=issue_model.model_dump(mode="json"),
-                    changelog=changelog_data,
-                )
+        # 기존 데이터 삭제 후 갱신
+        target_dates = get_date_range(start_date, end_date)
+        for target_date in target_dates:
+            self.jira_event_repository.delete_by_user_id_and_target_date(user_id, target_date)
+
+        jql = IssueJQL(
+            project=jira_user.project,
+            assignee_account_id=jira_user.account_id,
+            include_statuses=JiraStatusGroup.IN_FLIGHT_AND_RESOLVED,
+            updated_after=start_date.isoformat(),
+            updated_before=(end_date + timedelta(days=1)).isoformat(),
+        )
+
+        jira_client = self.jira_secret_service.get_jira_client(jira_user.jira_secret)
+        issues: list[JiraIssueModel] = []
+
+        # 기간 조회는 이슈가 많을 수 있어 페이지네이션
+        start_at = 0
+        while True:
+            result = jira_client.fetch_search_issues(
+                jql=jql, start_at=start_at, max_results=self.SEARCH_PAGE_SIZE
             )
+            issues.extend(JiraIssueModel.from_raw(issue.raw) for issue in result)
+            if len(result) < self.SEARCH_PAGE_SIZE:
+                break
+            start_at += self.SEARCH_PAGE_SIZE
 
-        return self.jira_event_repository.save_all(events)
+        logger.info(
+            f"Collected {len(issues)} issues for user_id={user_id}, target_date={start_date} ~ {end_date}"
+        )
+
+        events = self._create_jira_events(user, jira_user, target_dates, issues)
+        result_by_date: dict[date, list[JiraEvent]] = {d: [] for d in target_dates}
+        for event in self.jira_event_repository.save_all(events):
+            result_by_date[event.target_date].append(event)
+        return result_by_date
+
+    def _create_jira_events(
+        self,
+        user: User,
+        jira_user: JiraUser,
+        target_dates: list[date],
+        issues: list[JiraIssueModel],
+    ) -> list[JiraEvent]:
+        """하루/기간 수집 모두 같은 기준으로 이슈별 target_date를 정해서 이벤트를 생성"""
+        return [
+            self._create_jira_event(user, jira_user, target_date, issue_model)
+            for issue_model in issues
+            for target_date in self._get_issue_target_dates(issue_model, user.tz_info, target_dates)
+        ]
+
+    @staticmethod
+    def _get_issue_target_dates(
+        issue_model: JiraIssueModel,
+        tz_info: ZoneInfo,
+        target_dates: list[date],
+    ) -> list[date]:
+        """
+        이슈를 저장할 target_date 목록. 조회 기간(target_dates) 중 changelog/코멘트가 발생한 날짜로 나눈다.
+        기간 안에 changelog/코멘트가 없으면(이력이 남지 않는 업데이트, JQL 날짜와 사용자 타임존 차이 등)
+        이슈 업데이트 날짜를 조회 기간 안으로 맞춘 하루에 저장한다.
+        """
+        activity_dates = issue_model.get_activity_dates(tz_info)
+        dates = [d for d in target_dates if d in activity_dates]
+        if dates:
+            return dates
+
+        updated_date = issue_model.get_updated_date(tz_info) or target_dates[-1]
+        return [min(max(updated_date, target_dates[0]), target_dates[-1])]
+
+    def _create_jira_event(
+        self,
+        user: User,
+        jira_user: JiraUser,
+        target_date: date,
+        issue_model: JiraIssueModel,
+    ) -> JiraEvent:
+        # changelog를 target_date 기준으로 필터링하여 저장
+        filtered_changelog = issue_model.filter_changelog_by_date(target_date, user.tz_info)
+        changelog_data = (
+            [h.model_dump(mode="json") for h in filtered_changelog] if filtered_changelog else None
+        )
+        return JiraEvent.create(
+            user_id=user.id,
+            jira_user_id=jira_user.id,
+            target_date=target_date,
+            issue_id=issue_model.id,
+            issue_key=issue_model.key,
+            issue=issue_model.model_dump(mode="json"),
+            changelog=changelog_data,
+        )
 
     def _get_user_or_throw(self, user_id: int) -> User:
         user = self.user_repository.find_by_id(user_id)
         if user is None:
             raise UserNotFoundException(user_id)
         return user
+
+    def _get_jira_user_or_throw(self, user: User) -> JiraUser:
+        jira_user = user.jira_user
+        if not jira_user:
+            raise JiraUserNotAssignedException(user.id)
+        if not jira_user.has_project():
+            raise JiraUserProjectNotAssignedException(user.id)
+        return jira_user
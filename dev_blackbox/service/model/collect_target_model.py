@@ -0,0 +1,39 @@
+from datetime import date
+from typing import NamedTuple
+from zoneinfo import ZoneInfo
+
+from dev_blackbox.client.jira_client import JiraClient
+from dev_blackbox.client.model.jira_api_model import IssueJQL
+from dev_blackbox.client.model.slack_api_model import SlackChannelModel, SlackMessageModel
+
+
+class GitHubCollectTarget(NamedTuple):
+    user_id: int
+    target_date: date
+    tz_info: ZoneInfo
+    github_user_secret_id: int
+    username: str
+    token: str
+    since_event_id: str | None
+    stored_event_ids: set[str]
+
+
+class JiraCollectTarget(NamedTuple):
+    user_id: int
+    target_date: date
+    jql: IssueJQL
+    jira_client: JiraClient
+
+
+class SlackCollectTarget(NamedTuple):
+    user_id: int
+    target_date: date
+    tz_info: ZoneInfo
+    member_id: str
+    bot_token: str
+
+
+class SlackChannelMessage(NamedTuple):
+    channel: SlackChannelModel
+    message: SlackMessageModel
+    thread_ts: str | None
@@ -0,0 +1,14 @@
+from typing import NamedTuple
+
+from dev_blackbox.core.enum import PipelineMetricStageEnum, PlatformEnum
+
+
+class PipelineStageAggregate(NamedTuple):
+    platform: PlatformEnum
+    stage: PipelineMetricStageEnum
+    sample_count: int
+    p50_ms: float
+    p95_ms: float
+    avg_api_call_count: float
+    avg_input_size: float | None
+    avg_output_size: float | None
@@ -1,5 +1,6 @@
 from typing import NamedTuple
 
+from dev_blackbox.core.enum import PlatformEnum
 from dev_blackbox.storage.rds.entity.github_event import GitHubEvent
 from dev_blackbox.storage.rds.entity.jira_event import JiraEvent
 from dev_blackbox.storage.rds.entity.platform_work_log import PlatformWorkLog
@@ -11,3 +12,13 @@ class PlatformWorkLogsWithSources(NamedTuple):
     github_events: list[GitHubEvent]
     jira_events: list[JiraEvent]
     slack_messages: list[SlackMessage]
+
+
+class PlatformWorkLogDraft(NamedTuple):
+    """저장 전 플랫폼 업무 일지 (사용자 단위 일괄 저장용)"""
+
+    platform: PlatformEnum
+    content: str
+    model_name: str
+    prompt: str
+    input_fingerprint: str | None = None
@@ -0,0 +1,51 @@
+from sqlalchemy.orm import Session
+
+from dev_blackbox.core.pipeline_metric import PipelineMetricCollector
+from dev_blackbox.service.model.pipeline_metric_model import PipelineStageAggregate
+from dev_blackbox.storage.rds.entity.pipeline_metric import PipelineMetric
+from dev_blackbox.storage.rds.repository import PipelineMetricRepository
+
+
+class PipelineMetricService:
+
+    def __init__(self, session: Session):
+        self.session = session
+        self.pipeline_metric_repository = PipelineMetricRepository(session)
+
+    def save_metrics(self, collector: PipelineMetricCollector) -> list[PipelineMetric]:
+        """계측 범위(사용자, 날짜, 플랫폼) 하나의 단계별 측정값 저장"""
+        metrics = [
+            PipelineMetric.create(
+                user_id=collector.user_id,
+                target_date=collector.target_date,
+                platform=collector.platform,
+                stage=metric.stage,
+                duration_ms=round(metric.duration_seconds * 1000),
+                api_call_count=metric.api_call_count,
+                input_size=metric.input_size,
+                output_size=metric.output_size,
+            )
+            for metric in collector.metrics.values()
+        ]
+        if not metrics:
+            return []
+        return self.pipeline_metric_repository.save_all(metrics)
+
+    def get_stage_aggregates(self, last_runs: int) -> list[PipelineStageAggregate]:
+        return [
+            PipelineStageAggregate(
+                platform=row.platform,
+                stage=row.stage,
+                sample_count=row.sample_count,
+                p50_ms=float(row.p50_ms),
+                p95_ms=float(row.p95_ms),
+                avg_api_call_count=float(row.avg_api_call_count),
+                avg_input_size=(
+                    float(row.avg_input_size) if row.avg_input_size is not None else None
+                ),
+                avg_output_size=(
+                    float(row.avg_output_size) if row.avg_output_size is not None else None
+                ),
+            )
+            for row in self.pipeline_metric_repository.find_stage_aggregates(last_runs)
+        ]
@@ -0,0 +1,147 @@
+import logging
+from datetime import date, datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from dev_blackbox.core.enum import PipelineStageEnum, PlatformEnum
+from dev_blackbox.storage.rds.entity.pipeline_run_step import PipelineRunStep
+from dev_blackbox.storage.rds.repository import PipelineRunStepRepository
+
+logger = logging.getLogger(__name__)
+
+
+class PipelineRunService:
+    """
+    (사용자, 날짜, 플랫폼, 단계) 단위 실행 원장.
+    재실행 시 완료된 단계는 건너뛰고, 실패한 단계는 백오프 후 재시도 태스크가 다시 실행한다.
+    """
+
+    ERROR_MAX_LENGTH = 2000
+
+    def __init__(self, session: Session):
+        self.session = session
+        self.pipeline_run_step_repository = PipelineRunStepRepository(session)
+
+    def get_steps(self, user_id: int, target_date: date) -> list[PipelineRunStep]:
+        return self.pipeline_run_step_repository.find_all_by_user_id_and_target_date(
+            user_id, target_date
+        )
+
+    def get_succeeded_stages(
+        self,
+        user_id: int,
+        target_date: date,
+        platform: PlatformEnum,
+    ) -> set[PipelineStageEnum]:
+        return {
+            step.stage
+            for step in self.get_steps(user_id, target_date)
+            if step.platform == platform and step.is_succeeded
+        }
+
+    def get_retryable_steps(
+        self,
+        now: datetime,
+        stale_seconds: int,
+        limit: int = 100,
+    ) -> list[PipelineRunStep]:
+        return self.pipeline_run_step_repository.find_all_retryable(
+            now=now,
+            stale_before=now - timedelta(seconds=stale_seconds),
+            limit=limit,
+        )
+
+    def plan_steps(
+        self,
+        user_id: int,
+        target_date: date,
+        platforms: list[PlatformEnum],
+    ) -> None:
+        """
+        실행 예정 스텝을 PENDING으로 기록. 완료된 스텝은 유지한다.
+        실행 도중 프로세스가 중단되면 남은 PENDING 스텝을 재시도 태스크가 이어서 실행한다.
+        """
+        for platform in platforms:
+            step = self._get_or_create_step(
+                user_id, target_date, platform, PipelineStageEnum.COLLECT
+            )
+            if not step.is_succeeded:
+                step.mark_pending()
+
+    def mark_pending(
+        self,
+        user_id: int,
+        target_date: date,
+        platform: PlatformEnum,
+        stage: PipelineStageEnum,
+    ) -> PipelineRunStep:
+        return self._get_or_create_step(user_id, target_date, platform, stage).mark_pending()
+
+    def mark_running(
+        self,
+        user_id: int,
+        target_date: date,
+        platform: PlatformEnum,
+        stage: PipelineStageEnum,
+    ) -> PipelineRunStep:
+        return self._get_or_create_step(user_id, target_date, platform, stage).mark_running()
+
+    def mark_succeeded(
+        self,
+        user_id: int,
+        target_date: date,
+        platform: PlatformEnum,
+        stage: PipelineStageEnum,
+    ) -> PipelineRunStep:
+        return self._get_or_create_step(user_id, target_date, platform, stage).mark_succeeded()
+
+    def mark_failed(
+        self,
+        user_id: int,
+        target_date: date,
+        platform: PlatformEnum,
+        stage: PipelineStageEnum,
+        error: str,
+        now: datetime,
+        max_attempts: int,
+        base_delay_seconds: int,
+        max_delay_seconds: int,
+    ) -> PipelineRunStep:
+        """실패 기록. 재시도 횟수가 남아 있으면 지수 백오프로 next_retry_at을 설정한다."""
+        step = self._get_or_create_step(user_id, target_date, platform, stage)
+        attempts = step.attempts + 1
+        next_retry_at = None
+        if attempts < max_attempts:
+            delay_seconds = min(base_delay_seconds * 2 ** (attempts - 1), max_delay_seconds)
+            next_retry_at = now + timedelta(seconds=delay_seconds)
+        else:
+            logger.warning(
+                f"재시도 횟수 소진: user_id={user_id}, target_date={target_date}, "
+                f"platform={platform}, stage={stage}, attempts={attempts}"
+            )
+        return step.mark_failed(error[: self.ERROR_MAX_LENGTH], next_retry_at)
+
+    def reset_steps(self, user_id: int, target_date: date) -> None:
+        """수동 동기화/백필처럼 처음부터 다시 실행해야 하는 경우 원장 초기화"""
+        self.pipeline_run_step_repository.delete_by_user_id_and_target_date(user_id, target_date)
+
+    def _get_or_create_step(
+        self,
+        user_id: int,
+        target_date: date,
+        platform: PlatformEnum,
+        stage: PipelineStageEnum,
+    ) -> PipelineRunStep:
+        step = self.pipeline_run_step_repository.find_by_user_id_and_target_date_and_platform_and_stage(
+            user_id, target_date, platform, stage
+        )
+        if step is None:
+            step = self.pipeline_run_step_repository.save(
+                PipelineRunStep.create(
+                    user_id=user_id,
+                    target_date=target_date,
+                    platform=platform,
+                    stage=stage,
+                )
+            )
+        return step
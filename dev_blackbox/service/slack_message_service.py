@@ -4,21 +4,34 @@ from datetime import date
 
 from sqlalchemy.orm import Session
 
-from dev_blackbox.client.model.slack_api_model import SlackMessageModel
+from dev_blackbox.client.model.slack_api_model import SlackChannelModel, SlackMessageModel
+from dev_blackbox.client.slack_client import SlackClient
+from dev_blackbox.core.config import get_settings
 from dev_blackbox.core.exception import (
     UserNotFoundException,
     SlackUserNotAssignedException,
     NoSlackChannelsFound,
 )
+from dev_blackbox.service.model.collect_target_model import (
+    SlackChannelMessage,
+    SlackCollectTarget,
+)
 from dev_blackbox.service.slack_secret_service import SlackSecretService
 from dev_blackbox.storage.rds.entity import User
+from dev_blackbox.storage.rds.entity.slack_channel_cursor import SlackChannelCursor
 from dev_blackbox.storage.rds.entity.slack_message import SlackMessage
+from dev_blackbox.storage.rds.entity.slack_message_log import SlackMessageLog
+from dev_blackbox.storage.rds.entity.slack_user import SlackUser
 from dev_blackbox.storage.rds.repository import (
     UserRepository,
     SlackMessageRepository,
+    SlackMessageLogRepository,
+    SlackChannelCursorRepository,
 )
 from dev_blackbox.util.datetime_util import (
     get_daily_timestamp_range,
+    get_date_from_timestamp,
+    get_date_range,
     get_yesterday,
     is_timestamp_in_range,
 )
@@ -27,11 +40,17 @@ logger = logging.getLogger(__name__)
 
 
 class SlackMessageService:
+    # 과거 스레드 부모 메시지 포함을 위해서 과거도 같이 조회 하도록 (15일 정도면...??)
+    THREAD_LOOKBACK_DAYS = 15
+    # 같은 워크스페이스 사용자들이 연달아 수집할 때 채널 로그를 다시 동기화하지 않는 간격
+    LOG_SYNC_INTERVAL_SECONDS = 600
 
     def __init__(self, session: Session):
         self.session = session
         self.user_repository = UserRepository(session)
         self.slack_message_repository = SlackMessageRepository(session)
+        self.slack_message_log_repository = SlackMessageLogRepository(session)
+        self.slack_channel_cursor_repository = SlackChannelCursorRepository(session)
         self.slack_secret_service = SlackSecretService(session)
 
     def get_slack_messages(
@@ -65,15 +84,29 @@ class SlackMessageService:
             raise NoSlackChannelsFound()
 
         target_oldest, target_latest = get_daily_timestamp_range(target_date, user.tz_info)
+        cursors = (
+            self._get_channel_cursors(slack_user.slack_secret_id)
+            if get_settings().collect_task.slack_message_log_enabled
+            else {}
+        )
         new_messages: list[SlackMessage] = []
 
         for channel in channels:
-            messages = slack_client.fetch_messages_by_date(
-                channel_id=channel.id,
-                target_date=target_date,
-                tz_info=user.tz_info,
-                lookback_days=15,  # 과거 스레드 부모 메시지 포함을 위해서 과거도 같이 조회 하도록 (15일 정도면...??)
-            )
+            cursor = cursors.get(channel.id)
+            if cursor is not None and cursor.covers(
+                _to_slack_ts(target_oldest), _to_slack_ts(target_latest)
+            ):
+                # 메시지 로그에 target_date 구간이 모두 있으면 API 대신 로그에서 조회
+                messages = self._get_logged_messages(
+                    slack_user.slack_secret_id, channel.id, target_oldest, target_latest
+                )
+            else:
+                messages = slack_client.fetch_messages_by_date(
+                    channel_id=channel.id,
+                    target_date=target_date,
+                    tz_info=user.tz_info,
+                    lookback_days=self.THREAD_LOOKBACK_DAYS,
+                )
 
             # 유저 메시지 중 스레드 없는 메시지 / 스레드 있는 메시지 구분
             messages_no_thread = self._filter_message_no_thread(
@@ -88,17 +121,7 @@ class SlackMessageService:
 
             for msg in messages_no_thread:
                 new_messages.append(
-                    SlackMessage.create(
-                        user_id=user_id,
-                        slack_user_id=slack_user.id,
-                        target_date=target_date,
-                        channel_id=channel.id,
-                        channel_name=channel.name,
-                        message_ts=msg.ts,
-                        message_text=msg.text,
-                        message=msg.model_dump(mode="json"),
-                        thread_ts=None,
-                    )
+                    self._create_slack_message(user_id, slack_user, target_date, channel, msg, None)
                 )
 
             # 스레드 답글: 사용자의 답글만 개별 row로 저장
@@ -113,33 +136,339 @@ class SlackMessageService:
 
                 for reply in user_replies:
                     new_messages.append(
-                        SlackMessage.create(
-                            user_id=user_id,
-                            slack_user_id=slack_user.id,
-                            target_date=target_date,
-                            channel_id=channel.id,
-                            channel_name=channel.name,
-                            message_ts=reply.ts,
-                            message_text=reply.text,
-                            message=reply.model_dump(mode="json"),
-                            thread_ts=thread_ts,
+                        self._create_slack_message(
+                            user_id, slack_user, target_date, channel, reply, thread_ts
                         )
                     )
-                time.sleep(2)  # rate limit
-            time.sleep(2)  # rate limit
         logger.info(
             f"Collected {len(new_messages)} Slack messages for user_id={user_id}, target_date={target_date}"
         )
         return self.slack_message_repository.save_all(new_messages)
 
+    def get_slack_secret_id(self, user_id: int) -> int:
+        user = self._get_user_or_throw(user_id)
+        slack_user = user.slack_user
+        if not slack_user:
+            raise SlackUserNotAssignedException(user_id)
+        return slack_user.slack_secret_id
+
+    def sync_slack_message_log(self, user_id: int) -> None:
+        """
+        사용자의 워크스페이스 채널별 메시지 로그를 커서(high-water mark) 이후 메시지로 갱신한다.
+        처음 동기화하는 채널은 THREAD_LOOKBACK_DAYS 전부터 조회하여 로그를 채운다.
+
+        스레드의 latest_reply는 커서 이후 history 응답의 부모 메시지와 저장된 로그에서 가져오고,
+        동기화마다 모든 스레드를 다시 조회하지 않도록 latest_reply가 커서보다 최신인 스레드만 conversations.replies로 부모를 다시 조회한다.
+        로그는 워크스페이스 사용자들이 공유하므로 호출하는 쪽에서 워크스페이스 단위 락 안에서 실행하고 바로 커밋해야 한다.
+        """
+        user = self._get_user_or_throw(user_id)
+        slack_user = user.slack_user
+        if not slack_user:
+            raise SlackUserNotAssignedException(user_id)
+
+        slack_secret_id = slack_user.slack_secret_id
+        slack_client = self.slack_secret_service.get_slack_client(slack_user.slack_secret)
+        channels = slack_client.fetch_channels()
+        if not channels:
+            raise NoSlackChannelsFound()
+
+        cursors = self._get_channel_cursors(slack_secret_id)
+        now = time.time()
+        for channel in channels:
+            cursor = cursors.get(channel.id)
+            if (
+                cursor is not None
+                and now - float(cursor.latest_ts) < self.LOG_SYNC_INTERVAL_SECONDS
+            ):
+                continue
+            self._sync_channel_message_log(slack_client, slack_secret_id, channel, cursor, now)
+
+    def save_slack_messages_by_date_range(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+    ) -> dict[date, list[SlackMessage]]:
+        """
+        start_date ~ end_date 기간의 Slack 메시지를 채널별 히스토리/스레드 답글 한 번 조회로 수집하여,
+        메시지 ts 기준 target_date row로 나누어 저장한다.
+        """
+        user = self._get_user_or_throw(user_id)
+        slack_user = user.slack_user
+        if not slack_user:
+            raise SlackUserNotAssignedException(user_id)
+        logger.info(
+            f"Collecting Slack messages for user_id={user_id}, target_date={start_date} ~ {end_date}"
+        )
+
+        # 기존 데이터 삭제 후 갱신
+        target_dates = get_date_range(start_date, end_date)
+        for target_date in target_dates:
+            self.slack_message_repository.delete_by_user_id_and_target_date(user_id, target_date)
+
+        slack_client = self.slack_secret_service.get_slack_client(slack_user.slack_secret)
+        channels = slack_client.fetch_channels()
+        if not channels:
+            raise NoSlackChannelsFound()
+
+        range_oldest, _ = get_daily_timestamp_range(start_date, user.tz_info)
+        _, range_latest = get_daily_timestamp_range(end_date, user.tz_info)
+        new_messages: list[SlackMessage] = []
+
+        for channel in channels:
+            # 기간 전체 + 과거 스레드 부모 메시지 포함을 위한 15일을 한 번에 조회
+            messages = slack_client.fetch_messages_by_date(
+                channel_id=channel.id,
+                target_date=end_date,
+                tz_info=user.tz_info,
+                lookback_days=(end_date - start_date).days + 15,
+            )
+
+            messages_no_thread = self._filter_message_no_thread(
+                messages, slack_user.member_id, range_oldest, range_latest
+            )
+            messages_with_thread = self._filter_message_with_thread(
+                messages, range_oldest, range_latest
+            )
+            thread_ts_set = {m.thread_ts for m in messages_with_thread if m.thread_ts is not None}
+
+            for msg in messages_no_thread:
+                new_messages.append(
+                    self._create_slack_message(
+                        user_id,
+                        slack_user,
+                        get_date_from_timestamp(msg.ts, user.tz_info),
+                        channel,
+                        msg,
+                        None,
+                    )
+                )
+
+            # 스레드 답글: 기간 내 답글을 한 번에 조회하고 답글 ts 기준 날짜로 나눈다
+            for thread_ts in thread_ts_set:
+                thread_replies = slack_client.fetch_thread_replies_by_range(
+                    channel_id=channel.id,
+                    thread_ts=thread_ts,
+                    oldest=range_oldest,
+                    latest=range_latest,
+                )
+                for reply in thread_replies:
+                    if reply.user != slack_user.member_id:
+                        continue
+                    new_messages.append(
+                        self._create_slack_message(
+                            user_id,
+                            slack_user,
+                            get_date_from_timestamp(reply.ts, user.tz_info),
+                            channel,
+                            reply,
+                            thread_ts,
+                        )
+                    )
+        logger.info(
+            f"Collected {len(new_messages)} Slack messages for user_id={user_id}, target_date={start_date} ~ {end_date}"
+        )
+
+        result: dict[date, list[SlackMessage]] = {d: [] for d in target_dates}
+        for message in self.slack_message_repository.save_all(new_messages):
+            result[message.target_date].append(message)
+        return result
+
+    def get_collect_target(self, user_id: int, target_date: date) -> SlackCollectTarget:
+        """비동기 수집용: 세션 밖에서 API를 호출할 수 있도록 수집에 필요한 값(봇 토큰, 멤버 ID)만 조회한다."""
+        user = self._get_user_or_throw(user_id)
+        slack_user = user.slack_user
+        if not slack_user:
+            raise SlackUserNotAssignedException(user_id)
+        return SlackCollectTarget(
+            user_id=user.id,
+            target_date=target_date,
+            tz_info=user.tz_info,
+            member_id=slack_user.member_id,
+            bot_token=self.slack_secret_service.get_bot_token(slack_user.slack_secret),
+        )
+
+    def save_fetched_slack_messages(
+        self,
+        user_id: int,
+        target_date: date,
+        channel_messages: list[SlackChannelMessage],
+    ) -> list[SlackMessage]:
+        """조회한 메시지로 target_date의 메시지를 갱신 (기존 데이터 삭제 후 저장)"""
+        user = self._get_user_or_throw(user_id)
+        slack_user = user.slack_user
+        if not slack_user:
+            raise SlackUserNotAssignedException(user_id)
+
+        self.slack_message_repository.delete_by_user_id_and_target_date(user_id, target_date)
+        new_messages = [
+            self._create_slack_message(
+                user_id, slack_user, target_date, m.channel, m.message, m.thread_ts
+            )
+            for m in channel_messages
+        ]
+        logger.info(
+            f"Collected {len(new_messages)} Slack messages for user_id={user_id}, target_date={target_date}"
+        )
+        return self.slack_message_repository.save_all(new_messages)
+
+    @classmethod
+    def split_target_messages(
+        cls,
+        messages: list[SlackMessageModel],
+        slack_member_id: str,
+        target_oldest: float,
+        target_latest: float,
+    ) -> tuple[list[SlackMessageModel], set[str]]:
+        """채널 메시지 중 (사용자의 스레드 없는 메시지, 답글을 조회할 스레드 ts)"""
+        messages_no_thread = cls._filter_message_no_thread(
+            messages, slack_member_id, target_oldest, target_latest
+        )
+        messages_with_thread = cls._filter_message_with_thread(
+            messages, target_oldest, target_latest
+        )
+        thread_ts_set = {m.thread_ts for m in messages_with_thread if m.thread_ts is not None}
+        return messages_no_thread, thread_ts_set
+
+    def _sync_channel_message_log(
+        self,
+        slack_client: SlackClient,
+        slack_secret_id: int,
+        channel: SlackChannelModel,
+        cursor: SlackChannelCursor | None,
+        now: float,
+    ) -> None:
+        oldest = (
+            float(cursor.latest_ts)
+            if cursor is not None
+            else now - self.THREAD_LOOKBACK_DAYS * 24 * 60 * 60
+        )
+        messages = slack_client.fetch_messages_by_range(channel.id, oldest, now)
+
+        # 이번에 조회한 부모는 history 응답의 latest_reply가 최신이므로 다시 조회하지 않고,
+        # 저장된 로그 중 latest_reply가 커서 이후인(아직 반영하지 못한 답글이 있는) 스레드만 부모를 다시 조회
+        if cursor is not None:
+            fetched_ts = {m.ts for m in messages}
+            updated_threads = (
+                self.slack_message_log_repository.find_all_threads_by_channel_and_active_since(
+                    slack_secret_id, channel.id, cursor.latest_ts
+                )
+            )
+            for thread in updated_threads:
+                if thread.message_ts in fetched_ts:
+                    continue
+                parent = slack_client.fetch_thread_parent(channel.id, thread.message_ts)
+                if parent is not None:
+                    messages.append(parent)
+
+        self._save_message_logs(slack_secret_id, channel.id, messages)
+        if cursor is None:
+            self.slack_channel_cursor_repository.save(
+                SlackChannelCursor.create(
+                    slack_secret_id=slack_secret_id,
+                    channel_id=channel.id,
+                    oldest_ts=_to_slack_ts(oldest),
+                    latest_ts=_to_slack_ts(now),
+                )
+            )
+        else:
+            cursor.advance(_to_slack_ts(now))
+        logger.info(f"Synced {len(messages)} Slack messages to log. (channel_id: {channel.id})")
+
+    def _save_message_logs(
+        self,
+        slack_secret_id: int,
+        channel_id: str,
+        messages: list[SlackMessageModel],
+    ) -> None:
+        """새 메시지는 추가하고, 이미 있는 메시지는 본문/스레드 정보(latest_reply)를 갱신"""
+        if not messages:
+            return
+        stored = {
+            log.message_ts: log
+            for log in self.slack_message_log_repository.find_all_by_channel_and_message_ts_in(
+                slack_secret_id, channel_id, [m.ts for m in messages]
+            )
+        }
+        new_logs: dict[str, SlackMessageLog] = {}
+        for message in messages:
+            log = stored.get(message.ts) or new_logs.get(message.ts)
+            if log is not None:
+                log.update(message.text, message.thread_ts, message.latest_reply)
+                continue
+            new_logs[message.ts] = SlackMessageLog.create(
+                slack_secret_id=slack_secret_id,
+                channel_id=channel_id,
+                message_ts=message.ts,
+                member_id=message.user,
+                message_text=message.text,
+                thread_ts=message.thread_ts,
+                latest_reply=message.latest_reply,
+            )
+        self.slack_message_log_repository.save_all(list(new_logs.values()))
+
+    def _get_channel_cursors(self, slack_secret_id: int) -> dict[str, SlackChannelCursor]:
+        return {
+            cursor.channel_id: cursor
+            for cursor in self.slack_channel_cursor_repository.find_all_by_slack_secret_id(
+                slack_secret_id
+            )
+        }
+
+    def _get_logged_messages(
+        self,
+        slack_secret_id: int,
+        channel_id: str,
+        target_oldest: float,
+        target_latest: float,
+    ) -> list[SlackMessageModel]:
+        """target_date에 작성된 메시지와 target_date에 답글이 달린 스레드 부모 메시지 (저장된 latest_reply 기준)"""
+        logs = self.slack_message_log_repository.find_all_by_channel_and_activity_range(
+            slack_secret_id,
+            channel_id,
+            _to_slack_ts(target_oldest),
+            _to_slack_ts(target_latest),
+        )
+        return [
+            SlackMessageModel(
+                ts=log.message_ts,
+                user=log.member_id,
+                text=log.message_text,
+                thread_ts=log.thread_ts,
+                latest_reply=log.latest_reply,
+            )
+            for log in logs
+        ]
+
+    def _create_slack_message(
+        self,
+        user_id: int,
+        slack_user: SlackUser,
+        target_date: date,
+        channel: SlackChannelModel,
+        message: SlackMessageModel,
+        thread_ts: str | None,
+    ) -> SlackMessage:
+        return SlackMessage.create(
+            user_id=user_id,
+            slack_user_id=slack_user.id,
+            target_date=target_date,
+            channel_id=channel.id,
+            channel_name=channel.name,
+            message_ts=message.ts,
+            message_text=message.text,
+            message=message.model_dump(mode="json"),
+            thread_ts=thread_ts,
+        )
+
     def _get_user_or_throw(self, user_id: int) -> User:
         user = self.user_repository.find_by_id(user_id)
         if user is None:
             raise UserNotFoundException(user_id)
         return user
 
+    @staticmethod
     def _filter_message_no_thread(
-        self,
         messages: list[SlackMessageModel],
         slack_member_id: str,
         target_oldest: float,
@@ -153,8 +482,8 @@ class SlackMessageService:
             and is_timestamp_in_range(m.ts, target_oldest, target_latest)
         ]
 
+    @staticmethod
     def _filter_message_with_thread(
-        self,
         messages: list[SlackMessageModel],
         target_oldest: float,
         target_latest: float,
@@ -171,3 +500,8 @@ class SlackMessageService:
                 )
             )
         ]
+
+
+def _to_slack_ts(timestamp: float) -> str:
+    """Unix timestamp를 Slack ts 형식(초.마이크로초 6자리)으로 변환 (메시지 로그의 ts 문자열 비교용)"""
+    return f"{timestamp:.6f}"
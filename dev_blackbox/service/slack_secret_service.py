@@ -36,5 +36,7 @@ class SlackSecretService:
         secret.delete()
 
     def get_slack_client(self, secret: SlackSecret) -> SlackClient:
-        decrypted_bot_token = self.encrypt_service.decrypt(secret.bot_token)
-        return get_slack_client(bot_token=decrypted_bot_token)
+        return get_slack_client(bot_token=self.get_bot_token(secret))
+
+    def get_bot_token(self, secret: SlackSecret) -> str:
+        return self.encrypt_service.decrypt(secret.bot_token)
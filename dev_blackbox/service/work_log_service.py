@@ -6,7 +6,10 @@ from dev_blackbox.core.cache import cache_evict, cacheable, cache_put
 from dev_blackbox.core.const import CacheKey, CacheTTL
 from dev_blackbox.core.enum import PlatformEnum
 from dev_blackbox.core.exception import UserContentNotFoundException
-from dev_blackbox.service.model.platform_work_log_model import PlatformWorkLogsWithSources
+from dev_blackbox.service.model.platform_work_log_model import (
+    PlatformWorkLogDraft,
+    PlatformWorkLogsWithSources,
+)
 from dev_blackbox.service.query.common_query import OrderDirection
 from dev_blackbox.service.query.github_event_query import GitHubEventOrderField
 from dev_blackbox.service.query.jira_event_query import JiraEventOrderField
@@ -76,6 +79,7 @@ class WorkLogService:
         model_name: str,
         prompt: str,
         embedding: list[float] | None = None,
+        input_fingerprint: str | None = None,
     ) -> PlatformWorkLog:
         # 기존 요약 삭제 후 새로 저장
         self.platform_work_log_repository.delete_by_user_id_and_target_date_and_platform(
@@ -91,9 +95,72 @@ class WorkLogService:
             model_name=model_name,
             prompt=prompt,
             embedding=embedding,
+            input_fingerprint=input_fingerprint,
         )
         return self.platform_work_log_repository.save(platform_work_log)
 
+    def is_platform_work_log_up_to_date(
+        self,
+        user_id: int,
+        target_date: date,
+        platform: PlatformEnum,
+        input_fingerprint: str,
+    ) -> bool:
+        """동일한 입력(지문)으로 생성된 요약이 이미 저장되어 있는지 여부"""
+        work_log = self.platform_work_log_repository.find_by_user_id_and_target_date_and_platform(
+            user_id=user_id,
+            target_date=target_date,
+            platform=platform,
+        )
+        return work_log is not None and work_log.input_fingerprint == input_fingerprint
+
+    def get_input_fingerprints(
+        self,
+        user_id: int,
+        target_date: date,
+        platforms: list[PlatformEnum],
+    ) -> dict[PlatformEnum, str | None]:
+        """플랫폼별 저장된 요약의 입력 지문 (요약이 없는 플랫폼은 포함하지 않음)"""
+        work_logs = (
+            self.platform_work_log_repository.find_all_by_user_id_and_target_date_and_platforms(
+                user_id, target_date, platforms
+            )
+        )
+        return {PlatformEnum(w.platform): w.input_fingerprint for w in work_logs}
+
+    @cache_evict(key=CacheKey.WORK_LOG_PLATFORM)
+    def save_work_logs(
+        self,
+        user_id: int,
+        target_date: date,
+        work_logs: list[PlatformWorkLogDraft],
+    ) -> DailyWorkLog:
+        """
+        플랫폼 업무 일지들을 한 번에 교체하고 일일 업무 일지까지 같은 트랜잭션에서 저장한다.
+        이번 실행에서 요약하지 않은 플랫폼의 업무 일지는 그대로 두고 일일 업무 일지에 합친다.
+        """
+        if work_logs:
+            self.platform_work_log_repository.delete_by_user_id_and_target_date_and_platforms(
+                user_id=user_id,
+                target_date=target_date,
+                platforms=[w.platform for w in work_logs],
+            )
+            self.platform_work_log_repository.save_all(
+                [
+                    PlatformWorkLog.create(
+                        user_id=user_id,
+                        target_date=target_date,
+                        platform=w.platform,
+                        content=w.content,
+                        model_name=w.model_name,
+                        prompt=w.prompt,
+                        input_fingerprint=w.input_fingerprint,
+                    )
+                    for w in work_logs
+                ]
+            )
+        return self.save_daily_work_log(user_id, target_date)
+
     def get_platform_work_logs(
         self,
         user_id: int,
@@ -4,8 +4,12 @@ from dev_blackbox.storage.rds.entity.github_user_secret import GitHubUserSecret
 from dev_blackbox.storage.rds.entity.jira_event import JiraEvent
 from dev_blackbox.storage.rds.entity.jira_secret import JiraSecret
 from dev_blackbox.storage.rds.entity.jira_user import JiraUser
+from dev_blackbox.storage.rds.entity.pipeline_metric import PipelineMetric
+from dev_blackbox.storage.rds.entity.pipeline_run_step import PipelineRunStep
 from dev_blackbox.storage.rds.entity.platform_work_log import PlatformWorkLog
+from dev_blackbox.storage.rds.entity.slack_channel_cursor import SlackChannelCursor
 from dev_blackbox.storage.rds.entity.slack_message import SlackMessage
+from dev_blackbox.storage.rds.entity.slack_message_log import SlackMessageLog
 from dev_blackbox.storage.rds.entity.slack_secret import SlackSecret
 from dev_blackbox.storage.rds.entity.slack_user import SlackUser
 from dev_blackbox.storage.rds.entity.user import User
@@ -17,8 +21,12 @@ __all__ = [
     "JiraEvent",
     "JiraSecret",
     "JiraUser",
+    "PipelineMetric",
+    "PipelineRunStep",
     "PlatformWorkLog",
+    "SlackChannelCursor",
     "SlackMessage",
+    "SlackMessageLog",
     "SlackSecret",
     "SlackUser",
     "User",
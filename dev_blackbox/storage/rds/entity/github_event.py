@@ -12,12 +12,16 @@ from dev_blackbox.storage.rds.entity.base import Base
 class GitHubEvent(Base):
     __tablename__ = "github_event"
 
+    # 커밋 조회가 이 횟수만큼 실패하면 (삭제된 커밋/저장소 등) 커밋 정보 없이 수집을 마친 것으로 본다
+    COMMIT_FETCH_MAX_ATTEMPTS = 3
+
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     event_id: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
     event_type: Mapped[str] = mapped_column(String(50), nullable=False)
     target_date: Mapped[date] = mapped_column(Date, nullable=False)
     event: Mapped[dict] = mapped_column(JSONB, nullable=False)
     commit: Mapped[dict] = mapped_column(JSONB, nullable=True)
+    commit_fetch_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
 
     user_id: Mapped[int] = mapped_column(
         BigInteger,
@@ -42,7 +46,7 @@ class GitHubEvent(Base):
         event: GithubEventModel,
         commit: GithubCommitModel | None,
     ) -> "GitHubEvent":
-        return cls(
+        github_event = cls(
             user_id=user_id,
             github_user_secret_id=github_user_secret_id,
             target_date=target_date,
@@ -50,8 +54,34 @@ class GitHubEvent(Base):
             event_type=event.type,
             event=event.model_dump(mode="json"),
             commit=commit.model_dump(mode="json") if commit else None,
+            commit_fetch_attempts=0,
+        )
+        if commit is None:
+            github_event.record_commit_fetch_failure()
+        return github_event
+
+    @property
+    def is_commit_missing(self) -> bool:
+        """
+        커밋 정보가 있어야 하는 이벤트(PushEvent/CommitEvent)가 커밋 조회 실패로 커밋 정보 없이 저장되어 다시 조회해야 하는지.
+        COMMIT_FETCH_MAX_ATTEMPTS번 실패한 이벤트는 더 이상 다시 조회하지 않는다. (워터마크를 계속 붙잡지 않도록)
+        """
+        return (
+            self.event_type in ("PushEvent", "CommitEvent")
+            and self.commit is None
+            and self.commit_fetch_attempts < self.COMMIT_FETCH_MAX_ATTEMPTS
         )
 
+    def record_commit_fetch_failure(self) -> "GitHubEvent":
+        if self.is_commit_missing:
+            self.commit_fetch_attempts += 1
+        return self
+
+    def update_commit(self, commit: GithubCommitModel) -> "GitHubEvent":
+        self.commit = commit.model_dump(mode="json")
+        self.__dict__.pop("commit_model", None)
+        return self
+
     @cached_property
     def event_model(self) -> GithubEventModel:
         return GithubEventModel.model_validate(self.event)
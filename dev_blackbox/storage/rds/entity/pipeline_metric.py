@@ -0,0 +1,52 @@
+from datetime import date
+
+from sqlalchemy import BigInteger, Date, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from dev_blackbox.core.enum import PipelineMetricStageEnum, PlatformEnum
+from dev_blackbox.storage.rds.entity.base import Base
+
+
+class PipelineMetric(Base):
+    __tablename__ = "pipeline_metric"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    target_date: Mapped[date] = mapped_column(Date, nullable=False)
+    platform: Mapped[PlatformEnum] = mapped_column(String(20), nullable=False)
+    stage: Mapped[PipelineMetricStageEnum] = mapped_column(String(20), nullable=False)
+    duration_ms: Mapped[int] = mapped_column(Integer, nullable=False)
+    api_call_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    input_size: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    output_size: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    user_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("users.id", ondelete="RESTRICT"),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<PipelineMetric(user_id={self.user_id}, target_date={self.target_date}, platform={self.platform}, stage={self.stage}, duration_ms={self.duration_ms})>"
+
+    @classmethod
+    def create(
+        cls,
+        user_id: int,
+        target_date: date,
+        platform: PlatformEnum,
+        stage: PipelineMetricStageEnum,
+        duration_ms: int,
+        api_call_count: int = 0,
+        input_size: int | None = None,
+        output_size: int | None = None,
+    ) -> "PipelineMetric":
+        return cls(
+            user_id=user_id,
+            target_date=target_date,
+            platform=platform,
+            stage=stage,
+            duration_ms=duration_ms,
+            api_call_count=api_call_count,
+            input_size=input_size,
+            output_size=output_size,
+        )
@@ -0,0 +1,72 @@
+from datetime import date, datetime
+
+from sqlalchemy import BigInteger, Date, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from dev_blackbox.core.enum import PipelineStageEnum, PipelineStepStatusEnum, PlatformEnum
+from dev_blackbox.storage.rds.entity.base import Base
+
+
+class PipelineRunStep(Base):
+    __tablename__ = "pipeline_run_step"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    target_date: Mapped[date] = mapped_column(Date, nullable=False)
+    platform: Mapped[PlatformEnum] = mapped_column(String(20), nullable=False)
+    stage: Mapped[PipelineStageEnum] = mapped_column(String(20), nullable=False)
+    status: Mapped[PipelineStepStatusEnum] = mapped_column(String(20), nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    next_retry_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    user_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("users.id", ondelete="RESTRICT"),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<PipelineRunStep(user_id={self.user_id}, target_date={self.target_date}, platform={self.platform}, stage={self.stage}, status={self.status})>"
+
+    @classmethod
+    def create(
+        cls,
+        user_id: int,
+        target_date: date,
+        platform: PlatformEnum,
+        stage: PipelineStageEnum,
+        status: PipelineStepStatusEnum = PipelineStepStatusEnum.PENDING,
+    ) -> "PipelineRunStep":
+        return cls(
+            user_id=user_id,
+            target_date=target_date,
+            platform=platform,
+            stage=stage,
+            status=status,
+            attempts=0,
+        )
+
+    @property
+    def is_succeeded(self) -> bool:
+        return self.status == PipelineStepStatusEnum.SUCCEEDED
+
+    def mark_pending(self) -> "PipelineRunStep":
+        self.status = PipelineStepStatusEnum.PENDING
+        return self
+
+    def mark_running(self) -> "PipelineRunStep":
+        self.status = PipelineStepStatusEnum.RUNNING
+        return self
+
+    def mark_succeeded(self) -> "PipelineRunStep":
+        self.status = PipelineStepStatusEnum.SUCCEEDED
+        self.error = None
+        self.next_retry_at = None
+        return self
+
+    def mark_failed(self, error: str, next_retry_at: datetime | None) -> "PipelineRunStep":
+        self.status = PipelineStepStatusEnum.FAILED
+        self.attempts += 1
+        self.error = error
+        self.next_retry_at = next_retry_at
+        return self
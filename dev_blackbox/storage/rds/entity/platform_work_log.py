@@ -18,6 +18,7 @@ class PlatformWorkLog(Base):
     embedding: Mapped[list[float] | None] = mapped_column(Vector(1024), nullable=True)
     model_name: Mapped[str] = mapped_column(String(100), nullable=False)
     prompt: Mapped[str] = mapped_column(Text, nullable=False)
+    input_fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
     user_id: Mapped[int] = mapped_column(
         BigInteger,
@@ -38,6 +39,7 @@ class PlatformWorkLog(Base):
         model_name: str,
         prompt: str,
         embedding: list[float] | None = None,
+        input_fingerprint: str | None = None,
     ) -> "PlatformWorkLog":
         return cls(
             user_id=user_id,
@@ -47,6 +49,7 @@ class PlatformWorkLog(Base):
             model_name=model_name,
             prompt=prompt,
             embedding=embedding,
+            input_fingerprint=input_fingerprint,
         )
 
     @property
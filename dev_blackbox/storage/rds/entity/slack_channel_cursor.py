@@ -0,0 +1,54 @@
+from sqlalchemy import BigInteger, ForeignKey, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from dev_blackbox.storage.rds.entity.base import Base
+
+
+class SlackChannelCursor(Base):
+    """채널 메시지 로그(slack_message_log)가 담고 있는 timestamp 구간 (oldest_ts ~ latest_ts)"""
+
+    __tablename__ = "slack_channel_cursor"
+    __table_args__ = (
+        UniqueConstraint(
+            "slack_secret_id", "channel_id", name="uq_slack_channel_cursor_secret_channel"
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    channel_id: Mapped[str] = mapped_column(String(100), nullable=False)
+    # 로그 수집 시작 시점: 이보다 과거 날짜는 로그로 수집할 수 없다
+    oldest_ts: Mapped[str] = mapped_column(String(100), nullable=False)
+    # high-water mark: 다음 동기화는 이 시점 이후 메시지만 조회한다
+    latest_ts: Mapped[str] = mapped_column(String(100), nullable=False)
+
+    slack_secret_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("slack_secret.id", ondelete="RESTRICT"),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<SlackChannelCursor(channel_id={self.channel_id}, latest_ts={self.latest_ts})>"
+
+    @classmethod
+    def create(
+        cls,
+        slack_secret_id: int,
+        channel_id: str,
+        oldest_ts: str,
+        latest_ts: str,
+    ) -> "SlackChannelCursor":
+        return cls(
+            slack_secret_id=slack_secret_id,
+            channel_id=channel_id,
+            oldest_ts=oldest_ts,
+            latest_ts=latest_ts,
+        )
+
+    def covers(self, oldest_ts: str, latest_ts: str) -> bool:
+        """oldest_ts ~ latest_ts 구간의 메시지가 모두 로그에 있는지"""
+        return self.oldest_ts <= oldest_ts and latest_ts <= self.latest_ts
+
+    def advance(self, latest_ts: str) -> "SlackChannelCursor":
+        self.latest_ts = max(self.latest_ts, latest_ts)
+        return self
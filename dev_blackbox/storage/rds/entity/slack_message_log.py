@@ -0,0 +1,67 @@
+from sqlalchemy import BigInteger, ForeignKey, String, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from dev_blackbox.storage.rds.entity.base import Base
+
+
+class SlackMessageLog(Base):
+    """워크스페이스(slack_secret) 단위로 공유하는 채널 메시지 로그 (채널 히스토리 증분 조회용)"""
+
+    __tablename__ = "slack_message_log"
+    __table_args__ = (
+        UniqueConstraint(
+            "slack_secret_id",
+            "channel_id",
+            "message_ts",
+            name="uq_slack_message_log_secret_channel_ts",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    channel_id: Mapped[str] = mapped_column(String(100), nullable=False)
+    message_ts: Mapped[str] = mapped_column(String(100), nullable=False)
+    thread_ts: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    latest_reply: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    member_id: Mapped[str] = mapped_column(String(128), nullable=False)
+    message_text: Mapped[str] = mapped_column(Text, nullable=False, default="")
+
+    slack_secret_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("slack_secret.id", ondelete="RESTRICT"),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<SlackMessageLog(channel_id={self.channel_id}, message_ts={self.message_ts})>"
+
+    @classmethod
+    def create(
+        cls,
+        slack_secret_id: int,
+        channel_id: str,
+        message_ts: str,
+        member_id: str,
+        message_text: str,
+        thread_ts: str | None = None,
+        latest_reply: str | None = None,
+    ) -> "SlackMessageLog":
+        return cls(
+            slack_secret_id=slack_secret_id,
+            channel_id=channel_id,
+            message_ts=message_ts,
+            member_id=member_id,
+            message_text=message_text,
+            thread_ts=thread_ts,
+            latest_reply=latest_reply,
+        )
+
+    def update(
+        self,
+        message_text: str,
+        thread_ts: str | None,
+        latest_reply: str | None,
+    ) -> "SlackMessageLog":
+        self.message_text = message_text
+        self.thread_ts = thread_ts
+        self.latest_reply = latest_reply
+        return self
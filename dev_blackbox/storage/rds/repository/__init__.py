@@ -8,9 +8,21 @@ from dev_blackbox.storage.rds.repository.github_user_secret_repository import (
 from dev_blackbox.storage.rds.repository.jira_event_repository import JiraEventRepository
 from dev_blackbox.storage.rds.repository.jira_secret_repository import JiraSecretRepository
 from dev_blackbox.storage.rds.repository.jira_user_repository import JiraUserRepository
+from dev_blackbox.storage.rds.repository.pipeline_metric_repository import (
+    PipelineMetricRepository,
+)
+from dev_blackbox.storage.rds.repository.pipeline_run_step_repository import (
+    PipelineRunStepRepository,
+)
 from dev_blackbox.storage.rds.repository.platform_work_log_repository import (
     PlatformWorkLogRepository,
 )
+from dev_blackbox.storage.rds.repository.slack_channel_cursor_repository import (
+    SlackChannelCursorRepository,
+)
+from dev_blackbox.storage.rds.repository.slack_message_log_repository import (
+    SlackMessageLogRepository,
+)
 from dev_blackbox.storage.rds.repository.slack_message_repository import SlackMessageRepository
 from dev_blackbox.storage.rds.repository.slack_secret_repository import SlackSecretRepository
 from dev_blackbox.storage.rds.repository.slack_user_repository import SlackUserRepository
@@ -23,7 +35,11 @@ __all__ = [
     "JiraEventRepository",
     "JiraSecretRepository",
     "JiraUserRepository",
+    "PipelineMetricRepository",
+    "PipelineRunStepRepository",
     "PlatformWorkLogRepository",
+    "SlackChannelCursorRepository",
+    "SlackMessageLogRepository",
     "SlackMessageRepository",
     "SlackSecretRepository",
     "SlackUserRepository",
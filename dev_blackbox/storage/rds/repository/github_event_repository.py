@@ -77,3 +77,9 @@ class GitHubEventRepository:
     def exists_by_event_id(self, event_id: str) -> bool:
         stmt = select(GitHubEvent.id).where(GitHubEvent.event_id == event_id)
         return self.session.scalar(stmt) is not None
+
+    def find_all_event_ids_by_event_ids(self, event_ids: list[str]) -> set[str]:
+        if not event_ids:
+            return set()
+        stmt = select(GitHubEvent.event_id).where(GitHubEvent.event_id.in_(event_ids))
+        return set(self.session.scalars(stmt).all())
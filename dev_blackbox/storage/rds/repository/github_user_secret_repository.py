@@ -1,6 +1,6 @@
 from datetime import date
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from dev_blackbox.storage.rds.entity.github_user_secret import GitHubUserSecret
@@ -20,6 +20,23 @@ class GitHubUserSecretRepository:
         stmt = select(GitHubUserSecret).where(GitHubUserSecret.user_id == user_id)
         return self.session.scalar(stmt)
 
+    def find_by_username(self, username: str) -> GitHubUserSecret | None:
+        stmt = (
+            select(GitHubUserSecret)
+            .where(func.lower(GitHubUserSecret.username) == username.lower())
+            .order_by(GitHubUserSecret.user_id.asc())
+            .limit(1)
+        )
+        return self.session.scalar(stmt)
+
+    def find_all_by_user_ids(self, user_ids: list[int]) -> list[GitHubUserSecret]:
+        stmt = (
+            select(GitHubUserSecret)
+            .where(GitHubUserSecret.user_id.in_(user_ids))
+            .order_by(GitHubUserSecret.user_id.asc())
+        )
+        return list(self.session.scalars(stmt).all())
+
     def delete(self, secret: GitHubUserSecret) -> None:
         self.session.delete(secret)
         self.session.flush()
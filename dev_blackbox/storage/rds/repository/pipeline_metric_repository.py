@@ -0,0 +1,56 @@
+from sqlalchemy import Row, func, select
+from sqlalchemy.orm import Session
+
+from dev_blackbox.storage.rds.entity.pipeline_metric import PipelineMetric
+
+
+class PipelineMetricRepository:
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def save_all(self, pipeline_metrics: list[PipelineMetric]) -> list[PipelineMetric]:
+        self.session.add_all(pipeline_metrics)
+        self.session.flush()
+        return pipeline_metrics
+
+    def find_all_by_user_id(self, user_id: int) -> list[PipelineMetric]:
+        stmt = (
+            select(PipelineMetric)
+            .where(PipelineMetric.user_id == user_id)
+            .order_by(PipelineMetric.id.asc())
+        )
+        return list(self.session.scalars(stmt).all())
+
+    def find_stage_aggregates(self, last_runs: int) -> list[Row]:
+        """
+        최근 last_runs개 수집 날짜(target_date) 기준 플랫폼/단계별 집계
+        (platform, stage, sample_count, p50_ms, p95_ms, avg_api_call_count, avg_input_size, avg_output_size)
+        """
+        recent_dates = (
+            select(PipelineMetric.target_date)
+            .distinct()
+            .order_by(PipelineMetric.target_date.desc())
+            .limit(last_runs)
+            .scalar_subquery()
+        )
+        stmt = (
+            select(
+                PipelineMetric.platform,
+                PipelineMetric.stage,
+                func.count().label("sample_count"),
+                func.percentile_cont(0.5)
+                .within_group(PipelineMetric.duration_ms.asc())
+                .label("p50_ms"),
+                func.percentile_cont(0.95)
+                .within_group(PipelineMetric.duration_ms.asc())
+                .label("p95_ms"),
+                func.avg(PipelineMetric.api_call_count).label("avg_api_call_count"),
+                func.avg(PipelineMetric.input_size).label("avg_input_size"),
+                func.avg(PipelineMetric.output_size).label("avg_output_size"),
+            )
+            .where(PipelineMetric.target_date.in_(recent_dates))
+            .group_by(PipelineMetric.platform, PipelineMetric.stage)
+            .order_by(PipelineMetric.platform.asc(), PipelineMetric.stage.asc())
+        )
+        return list(self.session.execute(stmt).all())
@@ -0,0 +1,93 @@
+from datetime import date, datetime
+
+from sqlalchemy import and_, delete, or_, select
+from sqlalchemy.orm import Session
+
+from dev_blackbox.core.enum import PipelineStageEnum, PipelineStepStatusEnum, PlatformEnum
+from dev_blackbox.storage.rds.entity.pipeline_run_step import PipelineRunStep
+
+
+class PipelineRunStepRepository:
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def save(self, pipeline_run_step: PipelineRunStep) -> PipelineRunStep:
+        self.session.add(pipeline_run_step)
+        self.session.flush()
+        return pipeline_run_step
+
+    def save_all(self, pipeline_run_steps: list[PipelineRunStep]) -> list[PipelineRunStep]:
+        self.session.add_all(pipeline_run_steps)
+        self.session.flush()
+        return pipeline_run_steps
+
+    def find_by_user_id_and_target_date_and_platform_and_stage(
+        self,
+        user_id: int,
+        target_date: date,
+        platform: PlatformEnum,
+        stage: PipelineStageEnum,
+    ) -> PipelineRunStep | None:
+        stmt = select(PipelineRunStep).where(
+            PipelineRunStep.user_id == user_id,
+            PipelineRunStep.target_date == target_date,
+            PipelineRunStep.platform == platform,
+            PipelineRunStep.stage == stage,
+        )
+        return self.session.scalar(stmt)
+
+    def find_all_by_user_id_and_target_date(
+        self,
+        user_id: int,
+        target_date: date,
+    ) -> list[PipelineRunStep]:
+        stmt = (
+            select(PipelineRunStep)
+            .where(
+                PipelineRunStep.user_id == user_id,
+                PipelineRunStep.target_date == target_date,
+            )
+            .order_by(PipelineRunStep.id.asc())
+        )
+        return list(self.session.scalars(stmt).all())
+
+    def find_all_retryable(
+        self,
+        now: datetime,
+        stale_before: datetime,
+        limit: int,
+    ) -> list[PipelineRunStep]:
+        """
+        재시도 대상 스텝 조회
+        - FAILED: next_retry_at이 도래한 스텝 (재시도 횟수 소진 시 next_retry_at은 NULL)
+        - PENDING/RUNNING: stale_before 이전부터 갱신되지 않은 스텝 (프로세스 중단으로 남은 스텝)
+        """
+        stmt = (
+            select(PipelineRunStep)
+            .where(
+                or_(
+                    and_(
+                        PipelineRunStep.status == PipelineStepStatusEnum.FAILED,
+                        PipelineRunStep.next_retry_at <= now,
+                    ),
+                    and_(
+                        PipelineRunStep.status.in_(
+                            [PipelineStepStatusEnum.PENDING, PipelineStepStatusEnum.RUNNING]
+                        ),
+                        PipelineRunStep.updated_at < stale_before,
+                    ),
+                )
+            )
+            .order_by(PipelineRunStep.id.asc())
+            .limit(limit)
+        )
+        return list(self.session.scalars(stmt).all())
+
+    def delete_by_user_id_and_target_date(self, user_id: int, target_date: date) -> None:
+        stmt = delete(PipelineRunStep).where(
+            PipelineRunStep.user_id == user_id,
+            PipelineRunStep.target_date == target_date,
+        )
+        self.session.execute(stmt)
+        self.session.flush()
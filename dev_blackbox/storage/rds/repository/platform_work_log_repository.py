@@ -17,6 +17,11 @@ class PlatformWorkLogRepository:
         self.session.flush()
         return platform_work_log
 
+    def save_all(self, platform_work_logs: list[PlatformWorkLog]) -> list[PlatformWorkLog]:
+        self.session.add_all(platform_work_logs)
+        self.session.flush()
+        return platform_work_logs
+
     def find_by_user_id_and_target_date_and_platform(
         self, user_id: int, target_date: date, platform: PlatformEnum
     ) -> PlatformWorkLog | None:
@@ -57,3 +62,17 @@ class PlatformWorkLogRepository:
         )
         self.session.execute(stmt)
         self.session.flush()
+
+    def delete_by_user_id_and_target_date_and_platforms(
+        self,
+        user_id: int,
+        target_date: date,
+        platforms: list[PlatformEnum],
+    ) -> None:
+        stmt = delete(PlatformWorkLog).where(
+            PlatformWorkLog.user_id == user_id,
+            PlatformWorkLog.target_date == target_date,
+            PlatformWorkLog.platform.in_(platforms),
+        )
+        self.session.execute(stmt)
+        self.session.flush()
@@ -0,0 +1,21 @@
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from dev_blackbox.storage.rds.entity.slack_channel_cursor import SlackChannelCursor
+
+
+class SlackChannelCursorRepository:
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def save(self, slack_channel_cursor: SlackChannelCursor) -> SlackChannelCursor:
+        self.session.add(slack_channel_cursor)
+        self.session.flush()
+        return slack_channel_cursor
+
+    def find_all_by_slack_secret_id(self, slack_secret_id: int) -> list[SlackChannelCursor]:
+        stmt = select(SlackChannelCursor).where(
+            SlackChannelCursor.slack_secret_id == slack_secret_id,
+        )
+        return list(self.session.scalars(stmt).all())
@@ -0,0 +1,77 @@
+from sqlalchemy import and_, or_, select
+from sqlalchemy.orm import Session
+
+from dev_blackbox.storage.rds.entity.slack_message_log import SlackMessageLog
+
+
+class SlackMessageLogRepository:
+    """
+    Slack ts는 "초(10자리).마이크로초(6자리)" 고정 형식이므로 timestamp 구간 비교는 문자열 비교로 한다.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def save_all(self, slack_message_logs: list[SlackMessageLog]) -> list[SlackMessageLog]:
+        self.session.add_all(slack_message_logs)
+        self.session.flush()
+        return slack_message_logs
+
+    def find_all_by_channel_and_message_ts_in(
+        self,
+        slack_secret_id: int,
+        channel_id: str,
+        message_ts_list: list[str],
+    ) -> list[SlackMessageLog]:
+        stmt = select(SlackMessageLog).where(
+            SlackMessageLog.slack_secret_id == slack_secret_id,
+            SlackMessageLog.channel_id == channel_id,
+            SlackMessageLog.message_ts.in_(message_ts_list),
+        )
+        return list(self.session.scalars(stmt).all())
+
+    def find_all_by_channel_and_activity_range(
+        self,
+        slack_secret_id: int,
+        channel_id: str,
+        oldest_ts: str,
+        latest_ts: str,
+    ) -> list[SlackMessageLog]:
+        """oldest_ts ~ latest_ts 구간에 작성된 메시지 + 마지막 답글이 구간 안에 있는 스레드 부모 메시지"""
+        stmt = (
+            select(SlackMessageLog)
+            .where(
+                SlackMessageLog.slack_secret_id == slack_secret_id,
+                SlackMessageLog.channel_id == channel_id,
+                or_(
+                    and_(
+                        SlackMessageLog.message_ts >= oldest_ts,
+                        SlackMessageLog.message_ts < latest_ts,
+                    ),
+                    and_(
+                        SlackMessageLog.latest_reply >= oldest_ts,
+                        SlackMessageLog.latest_reply < latest_ts,
+                    ),
+                ),
+            )
+            .order_by(SlackMessageLog.message_ts.asc())
+        )
+        return list(self.session.scalars(stmt).all())
+
+    def find_all_threads_by_channel_and_active_since(
+        self,
+        slack_secret_id: int,
+        channel_id: str,
+        since_ts: str,
+    ) -> list[SlackMessageLog]:
+        """since_ts 이후 작성되었거나 답글이 달린 스레드 부모 메시지"""
+        stmt = select(SlackMessageLog).where(
+            SlackMessageLog.slack_secret_id == slack_secret_id,
+            SlackMessageLog.channel_id == channel_id,
+            SlackMessageLog.thread_ts == SlackMessageLog.message_ts,
+            or_(
+                SlackMessageLog.message_ts >= since_ts,
+                SlackMessageLog.latest_reply >= since_ts,
+            ),
+        )
+        return list(self.session.scalars(stmt).all())
@@ -0,0 +1,257 @@
+"""
+asyncio 기반 플랫폼 수집.
+
+세션이 await 구간에 걸쳐 DB 커넥션을 점유하지 않도록, 수집 대상 조회와 저장은 asyncio.to_thread()로 각각 짧은 세션에서 실행하고
+외부 API 호출만 이벤트 루프에서 플랫폼별 동시 요청 수 제한(semaphore) 아래 실행한다.
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import date
+
+import httpx
+
+from dev_blackbox.client.github_client import AsyncGitHubClient
+from dev_blackbox.client.jira_client import AsyncJiraClient
+from dev_blackbox.client.model.github_api_model import (
+    GithubCommitModel,
+    GithubEventModel,
+    GithubPushEventPayloadModel,
+)
+from dev_blackbox.client.model.jira_api_model import JiraIssueModel
+from dev_blackbox.client.slack_client import AsyncSlackClient
+from dev_blackbox.core.database import get_db_session
+from dev_blackbox.core.enum import PipelineMetricStageEnum, PlatformEnum
+from dev_blackbox.core.exception import NoSlackChannelsFound
+from dev_blackbox.core.http_client import create_async_http_client
+from dev_blackbox.core.pipeline_metric import measure_stage
+from dev_blackbox.service.github_event_service import GitHubEventService
+from dev_blackbox.service.jira_event_service import JiraEventService
+from dev_blackbox.service.model.collect_target_model import (
+    GitHubCollectTarget,
+    JiraCollectTarget,
+    SlackChannelMessage,
+    SlackCollectTarget,
+)
+from dev_blackbox.service.slack_message_service import SlackMessageService
+from dev_blackbox.util.datetime_util import get_daily_timestamp_range
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AsyncCollectContext:
+    """실행 단위로 공유하는 HTTP 커넥션 풀과 플랫폼별 동시 요청 수 제한"""
+
+    http_client: httpx.AsyncClient
+    github_semaphore: asyncio.Semaphore
+    slack_semaphore: asyncio.Semaphore
+    jira_semaphore: asyncio.Semaphore
+
+
+@asynccontextmanager
+async def async_collect_context(
+    github_concurrency: int,
+    slack_concurrency: int,
+    jira_concurrency: int,
+) -> AsyncIterator[AsyncCollectContext]:
+    async with create_async_http_client(max_connections=github_concurrency) as http_client:
+        yield AsyncCollectContext(
+            http_client=http_client,
+            github_semaphore=asyncio.Semaphore(max(1, github_concurrency)),
+            slack_semaphore=asyncio.Semaphore(max(1, slack_concurrency)),
+            jira_semaphore=asyncio.Semaphore(max(1, jira_concurrency)),
+        )
+
+
+async def collect_platform_events_async(
+    user_id: int,
+    target_date: date,
+    platform: PlatformEnum,
+    context: AsyncCollectContext,
+) -> None:
+    match platform:
+        case PlatformEnum.GITHUB:
+            await collect_github_events_async(user_id, target_date, context)
+        case PlatformEnum.JIRA:
+            await collect_jira_events_async(user_id, target_date, context)
+        case PlatformEnum.SLACK:
+            await collect_slack_events_async(user_id, target_date, context)
+        case _:
+            raise ValueError(f"Unsupported platform: {platform}")
+
+
+###############################
+# GitHub
+###############################
+async def collect_github_events_async(
+    user_id: int,
+    target_date: date,
+    context: AsyncCollectContext,
+) -> None:
+    target = await asyncio.to_thread(_get_github_collect_target, user_id, target_date)
+    github_client = AsyncGitHubClient.create(
+        token=target.token,
+        http_client=context.http_client,
+        semaphore=context.github_semaphore,
+    )
+
+    with measure_stage(PipelineMetricStageEnum.FETCH):
+        # 워터마크 이후 이벤트만 조회하고, 새 PushEvent의 커밋은 동시에 조회
+        github_events = await github_client.fetch_events_by_date(
+            username=target.username,
+            target_date=target_date,
+            tz_info=target.tz_info,
+            since_event_id=target.since_event_id,
+        )
+        new_events = [e for e in github_events.events if e.id not in target.stored_event_ids]
+        commits = await asyncio.gather(*(_fetch_commit(github_client, e) for e in new_events))
+
+    logger.info(f"Collected {len(new_events)} new events. (user_id: {user_id})")
+    await asyncio.to_thread(
+        _save_github_events,
+        target,
+        new_events,
+        {e.id: commit for e, commit in zip(new_events, commits) if commit is not None},
+    )
+
+
+async def _fetch_commit(
+    github_client: AsyncGitHubClient,
+    github_event: GithubEventModel,
+) -> GithubCommitModel | None:
+    if not isinstance(github_event.typed_payload, GithubPushEventPayloadModel):
+        return None
+    try:
+        return await github_client.fetch_commit(
+            repository_url=github_event.repo.url,
+            sha=github_event.typed_payload.head,
+        )
+    except httpx.HTTPError:
+        # GitHubEventService.fetch_github_commits_by_events()와 동일하게 커밋 정보 없이 저장
+        logger.warning(
+            f"Failed to fetch commit for {github_event.id}. Save the event without commit info."
+        )
+        return None
+
+
+def _get_github_collect_target(user_id: int, target_date: date) -> GitHubCollectTarget:
+    with get_db_session() as session:
+        return GitHubEventService(session).get_collect_target(user_id, target_date)
+
+
+def _save_github_events(
+    target: GitHubCollectTarget,
+    github_events: list[GithubEventModel],
+    commits: dict[str, GithubCommitModel],
+) -> None:
+    with measure_stage(PipelineMetricStageEnum.PERSIST), get_db_session() as session:
+        GitHubEventService(session).save_fetched_github_events(target, github_events, commits)
+
+
+###############################
+# Jira
+###############################
+async def collect_jira_events_async(
+    user_id: int,
+    target_date: date,
+    context: AsyncCollectContext,
+) -> None:
+    target = await asyncio.to_thread(_get_jira_collect_target, user_id, target_date)
+    jira_client = AsyncJiraClient.create(target.jira_client, context.jira_semaphore)
+
+    with measure_stage(PipelineMetricStageEnum.FETCH):
+        # 페이지네이션 하지 않음 (JiraEventService.save_jira_events()와 동일)
+        result = await jira_client.fetch_search_issues(jql=target.jql)
+    issues = [JiraIssueModel.from_raw(issue.raw) for issue in result]
+
+    await asyncio.to_thread(_save_jira_events, user_id, target_date, issues)
+
+
+def _get_jira_collect_target(user_id: int, target_date: date) -> JiraCollectTarget:
+    with get_db_session() as session:
+        return JiraEventService(session).get_collect_target(user_id, target_date)
+
+
+def _save_jira_events(user_id: int, target_date: date, issues: list[JiraIssueModel]) -> None:
+    with measure_stage(PipelineMetricStageEnum.PERSIST), get_db_session() as session:
+        JiraEventService(session).save_fetched_jira_events(user_id, target_date, issues)
+
+
+###############################
+# Slack
+###############################
+async def collect_slack_events_async(
+    user_id: int,
+    target_date: date,
+    context: AsyncCollectContext,
+) -> None:
+    target = await asyncio.to_thread(_get_slack_collect_target, user_id, target_date)
+    slack_client = AsyncSlackClient.create(target.bot_token, context.slack_semaphore)
+
+    with measure_stage(PipelineMetricStageEnum.FETCH):
+        channel_messages = await _fetch_slack_channel_messages(target, slack_client)
+
+    await asyncio.to_thread(_save_slack_messages, user_id, target_date, channel_messages)
+
+
+async def _fetch_slack_channel_messages(
+    target: SlackCollectTarget,
+    slack_client: AsyncSlackClient,
+) -> list[SlackChannelMessage]:
+    """
+    SlackMessageService.save_slack_messages()와 같은 순서로 조회한다.
+    사용자 단위로는 채널/스레드를 순서대로 조회하고(간격은 AsyncSlackClient의 rate limiter가 조절), 동시성은 사용자 사이에서 얻는다.
+    """
+    channels = await slack_client.fetch_channels()
+    if not channels:
+        raise NoSlackChannelsFound()
+
+    target_oldest, target_latest = get_daily_timestamp_range(target.target_date, target.tz_info)
+    result: list[SlackChannelMessage] = []
+
+    for channel in channels:
+        messages = await slack_client.fetch_messages_by_date(
+            channel_id=channel.id,
+            target_date=target.target_date,
+            tz_info=target.tz_info,
+            lookback_days=SlackMessageService.THREAD_LOOKBACK_DAYS,
+        )
+        messages_no_thread, thread_ts_set = SlackMessageService.split_target_messages(
+            messages, target.member_id, target_oldest, target_latest
+        )
+        result.extend(SlackChannelMessage(channel, m, None) for m in messages_no_thread)
+
+        # 스레드 답글: 사용자의 답글만 개별 row로 저장
+        for thread_ts in thread_ts_set:
+            thread_replies = await slack_client.fetch_thread_replies(
+                channel_id=channel.id,
+                thread_ts=thread_ts,
+                target_date=target.target_date,
+                tz_info=target.tz_info,
+            )
+            result.extend(
+                SlackChannelMessage(channel, r, thread_ts)
+                for r in thread_replies
+                if r.user == target.member_id
+            )
+    return result
+
+
+def _get_slack_collect_target(user_id: int, target_date: date) -> SlackCollectTarget:
+    with get_db_session() as session:
+        return SlackMessageService(session).get_collect_target(user_id, target_date)
+
+
+def _save_slack_messages(
+    user_id: int,
+    target_date: date,
+    channel_messages: list[SlackChannelMessage],
+) -> None:
+    with measure_stage(PipelineMetricStageEnum.PERSIST), get_db_session() as session:
+        SlackMessageService(session).save_fetched_slack_messages(
+            user_id, target_date, channel_messages
+        )
@@ -0,0 +1,16 @@
+import logging
+
+from dev_blackbox.core.cluster import InstanceRegistry, get_instance_id
+
+logger = logging.getLogger(__name__)
+
+
+def heartbeat_instance_task():
+    InstanceRegistry().heartbeat(get_instance_id())
+
+
+def unregister_instance_task():
+    try:
+        InstanceRegistry().unregister(get_instance_id())
+    except Exception as e:
+        logger.warning(f"Failed to unregister instance {get_instance_id()}: {e}")
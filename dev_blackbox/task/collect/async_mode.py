@@ -0,0 +1,170 @@
+"""
+비동기 실행 모드: 전체 사용자의 수집을 하나의 이벤트 루프에서 동시에 실행한다.
+"""
+
+import asyncio
+import contextvars
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+from dev_blackbox.core.config import get_settings
+from dev_blackbox.core.enum import PipelineStageEnum, PlatformEnum
+from dev_blackbox.core.pipeline_metric import metric_scope
+from dev_blackbox.task.async_collector import (
+    AsyncCollectContext,
+    async_collect_context,
+    collect_platform_events_async,
+)
+from dev_blackbox.task.collect.db_slot import get_db_slot_count
+from dev_blackbox.task.collect.metric import save_metrics
+from dev_blackbox.task.collect.run_ledger import (
+    get_succeeded_stages,
+    mark_step_running,
+    mark_steps_by_dates,
+)
+from dev_blackbox.task.collect.summarizer import summarize_stored_platform
+from dev_blackbox.task.collect.work_log import (
+    create_work_log_batch,
+    get_user_lock_key,
+    get_user_platforms,
+    save_work_log_batch,
+)
+from dev_blackbox.task.context.user_context import UserContext
+from dev_blackbox.task.context.work_log_batch import WorkLogBatch
+from dev_blackbox.util.datetime_util import get_yesterday
+from dev_blackbox.util.distributed_lock import distributed_lock
+
+logger = logging.getLogger(__name__)
+
+
+def collect_events_and_summarize_users_async(users: list[UserContext]):
+    """
+    전체 사용자의 수집을 하나의 이벤트 루프에서 동시에 실행한다.
+    대부분의 시간이 네트워크 대기인 수집은 스레드 대신 코루틴으로 처리하고 플랫폼별 동시 요청 수만 제한한다.
+    수집이 끝난 플랫폼부터 요약 워커 스레드 풀(LLM)에 넘겨 수집과 요약이 겹쳐 실행된다.
+    """
+    config = get_settings().collect_task
+    summary_workers = max(1, config.summary_workers)
+    started_at = time.perf_counter()
+
+    with ThreadPoolExecutor(
+        max_workers=summary_workers, thread_name_prefix="summarize"
+    ) as summary_executor:
+        failed_user_ids = asyncio.run(_collect_users_async(users, summary_executor))
+
+    logger.info(
+        f"전체 사용자 요약 완료 (async): users={len(users)}, summary_workers={summary_workers}, "
+        f"failed_user_ids={failed_user_ids}, wall_clock={time.perf_counter() - started_at:.1f}s"
+    )
+
+
+async def _collect_users_async(
+    users: list[UserContext],
+    summary_executor: ThreadPoolExecutor,
+) -> list[int]:
+    config = get_settings().collect_task
+    # asyncio.to_thread()로 실행하는 DB 조회/저장이 커넥션 풀보다 많이 동시에 실행되지 않도록 기본 executor 크기를 제한
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=get_db_slot_count(), thread_name_prefix="collect-db")
+    )
+    async with async_collect_context(
+        github_concurrency=config.github_concurrency,
+        slack_concurrency=config.slack_concurrency,
+        jira_concurrency=config.jira_concurrency,
+    ) as context:
+        results = await asyncio.gather(
+            *(_collect_user_async(user, context, summary_executor) for user in users),
+            return_exceptions=True,
+        )
+
+    failed_user_ids = []
+    for user, result in zip(users, results):
+        if isinstance(result, BaseException):
+            logger.error(f"사용자 수집/요약 실패: user_id={user.id}, error={result}")
+            failed_user_ids.append(user.id)
+    return failed_user_ids
+
+
+async def _collect_user_async(
+    user: UserContext,
+    context: AsyncCollectContext,
+    summary_executor: ThreadPoolExecutor,
+):
+    target_date = get_yesterday(user.tz_info)
+    # 재시도 태스크와 같은 사용자 락 사용 (non-blocking 획득이라 이벤트 루프를 오래 막지 않는다)
+    lock_key = get_user_lock_key(user.id, target_date)
+    with distributed_lock(lock_key, timeout=300, auto_renewal=True) as acquired:
+        if not acquired:
+            logger.info(f"다른 작업이 처리 중: user_id={user.id}, target_date={target_date}")
+            return
+
+        batch = await asyncio.to_thread(create_work_log_batch, user, target_date)
+        await asyncio.gather(
+            *(
+                _collect_and_summarize_platform_async(
+                    user, target_date, platform, context, summary_executor, batch
+                )
+                for platform in get_user_platforms(user)
+            )
+        )
+        await asyncio.to_thread(save_work_log_batch, user, target_date, batch)
+    logger.info(f"요약 완료: user_id={user.id}, target_date={target_date}")
+
+
+async def _collect_and_summarize_platform_async(
+    user: UserContext,
+    target_date: date,
+    platform: PlatformEnum,
+    context: AsyncCollectContext,
+    summary_executor: ThreadPoolExecutor,
+    batch: WorkLogBatch,
+):
+    try:
+        with metric_scope(user.id, target_date, platform) as collector:
+            try:
+                await _run_platform_steps_async(
+                    user, target_date, platform, context, summary_executor, batch
+                )
+            finally:
+                await asyncio.to_thread(save_metrics, collector)
+    except Exception as e:
+        logger.exception(
+            f"{platform} 데이터 수집/요약 실패: user_id={user.id}, target_date={target_date}, error={e}"
+        )
+
+
+async def _run_platform_steps_async(
+    user: UserContext,
+    target_date: date,
+    platform: PlatformEnum,
+    context: AsyncCollectContext,
+    summary_executor: ThreadPoolExecutor,
+    batch: WorkLogBatch,
+):
+    succeeded_stages = await asyncio.to_thread(get_succeeded_stages, user, target_date, platform)
+    if PipelineStageEnum.SUMMARIZE in succeeded_stages:
+        return
+
+    if PipelineStageEnum.COLLECT not in succeeded_stages:
+        stage = PipelineStageEnum.COLLECT
+        await asyncio.to_thread(mark_step_running, user, target_date, platform, stage)
+        try:
+            await collect_platform_events_async(user.id, target_date, platform, context)
+        except Exception as e:
+            await asyncio.to_thread(mark_steps_by_dates, user, [target_date], platform, stage, e)
+            raise
+        await asyncio.to_thread(mark_steps_by_dates, user, [target_date], platform, stage)
+
+    # run_in_executor는 contextvars를 전달하지 않으므로 계측 컨텍스트를 복사해서 실행
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(
+        summary_executor,
+        contextvars.copy_context().run,
+        summarize_stored_platform,
+        user,
+        target_date,
+        platform,
+        batch,
+    )
@@ -0,0 +1,126 @@
+"""
+기간 백필: 플랫폼별로 전체 기간을 한 번만 수집한 뒤 날짜별로 나누어 요약한다.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+
+from dev_blackbox.core.config import get_settings
+from dev_blackbox.core.database import get_db_session
+from dev_blackbox.core.enum import PipelineStageEnum, PlatformEnum
+from dev_blackbox.service.github_event_service import GitHubEventService
+from dev_blackbox.service.jira_event_service import JiraEventService
+from dev_blackbox.service.pipeline_run_service import PipelineRunService
+from dev_blackbox.service.slack_message_service import SlackMessageService
+from dev_blackbox.task.collect.db_slot import db_connection_slot
+from dev_blackbox.task.collect.metric import platform_metric_scope
+from dev_blackbox.task.collect.run_ledger import mark_steps_by_dates
+from dev_blackbox.task.collect.summarizer import summarize_stored_platform
+from dev_blackbox.task.collect.work_log import get_user_platforms, save_daily_work_log
+from dev_blackbox.task.context.user_context import UserContext
+from dev_blackbox.util.datetime_util import get_date_range
+
+logger = logging.getLogger(__name__)
+
+
+def backfill_events_and_summarize(user: UserContext, start_date: date, end_date: date):
+    """
+    1. 플랫폼별로 전체 기간을 한 번씩 수집하여 target_date별 row로 나누어 저장 (플랫폼 동시 실행)
+    2. 저장된 데이터로 날짜별 요약을 제한된 워커 풀에서 동시 실행
+    """
+    platforms = get_user_platforms(user)
+    target_dates = get_date_range(start_date, end_date)
+    with get_db_session() as session:
+        service = PipelineRunService(session)
+        for target_date in target_dates:
+            service.reset_steps(user.id, target_date)
+
+    collected_platforms: list[PlatformEnum] = []
+    if platforms:
+        with ThreadPoolExecutor(
+            max_workers=len(platforms), thread_name_prefix=f"backfill-user-{user.id}"
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _collect_platform_events_by_date_range, user, start_date, end_date, platform
+                ): platform
+                for platform in platforms
+            }
+            for future in as_completed(futures):
+                platform = futures[future]
+                try:
+                    future.result()
+                    collected_platforms.append(platform)
+                    mark_steps_by_dates(user, target_dates, platform, PipelineStageEnum.COLLECT)
+                except Exception as e:
+                    logger.exception(
+                        f"{platform} 기간 수집 실패: user_id={user.id}, target_date={start_date} ~ {end_date}, error={e}"
+                    )
+                    # 실패한 기간은 재시도 태스크가 날짜별로 다시 수집
+                    mark_steps_by_dates(
+                        user, target_dates, platform, PipelineStageEnum.COLLECT, error=e
+                    )
+
+    max_workers = max(1, get_settings().collect_task.max_workers)
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix=f"backfill-summarize-{user.id}"
+    ) as executor:
+        futures = {
+            executor.submit(_summarize_stored_events, user, target_date, collected_platforms): (
+                target_date
+            )
+            for target_date in target_dates
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                logger.exception(
+                    f"일일 업무 일지 요약 실패: user_id={user.id}, target_date={futures[future]}, error={e}"
+                )
+
+    logger.info(
+        f"백필 완료: user_id={user.id}, target_date={start_date} ~ {end_date}, platforms={collected_platforms}"
+    )
+
+
+def _collect_platform_events_by_date_range(
+    user: UserContext,
+    start_date: date,
+    end_date: date,
+    platform: PlatformEnum,
+):
+    with db_connection_slot(), get_db_session() as session:
+        match platform:
+            case PlatformEnum.GITHUB:
+                GitHubEventService(session).save_github_events_by_date_range(
+                    user.id, start_date, end_date
+                )
+            case PlatformEnum.JIRA:
+                JiraEventService(session).save_jira_events_by_date_range(
+                    user.id, start_date, end_date
+                )
+            case PlatformEnum.SLACK:
+                SlackMessageService(session).save_slack_messages_by_date_range(
+                    user.id, start_date, end_date
+                )
+            case _:
+                raise ValueError(f"Unsupported platform: {platform}")
+
+
+def _summarize_stored_events(
+    user: UserContext,
+    target_date: date,
+    platforms: list[PlatformEnum],
+):
+    for platform in platforms:
+        try:
+            with platform_metric_scope(user, target_date, platform):
+                summarize_stored_platform(user, target_date, platform)
+        except Exception as e:
+            logger.exception(
+                f"{platform} 요약 실패: user_id={user.id}, target_date={target_date}, error={e}"
+            )
+    save_daily_work_log(user, target_date)
+    logger.info(f"요약 완료: user_id={user.id}, target_date={target_date}")
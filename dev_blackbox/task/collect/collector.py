@@ -0,0 +1,269 @@
+"""
+플랫폼별 데이터 수집과 요약 입력(chunk) 생성.
+"""
+
+import logging
+from datetime import date
+
+from llama_index.core.prompts import PromptTemplate
+
+from dev_blackbox.agent.model.llm_model import SummaryOllamaConfig
+from dev_blackbox.agent.model.prompt import (
+    GITHUB_COMMIT_SUMMARY_PROMPT,
+    JIRA_ISSUE_SUMMARY_PROMPT,
+    SLACK_MESSAGE_SUMMARY_PROMPT,
+)
+from dev_blackbox.core.config import get_settings
+from dev_blackbox.core.const import LockKey
+from dev_blackbox.core.database import get_db_session
+from dev_blackbox.core.enum import PipelineMetricStageEnum, PlatformEnum
+from dev_blackbox.core.pipeline_metric import measure_stage
+from dev_blackbox.service.github_event_service import GitHubEventService
+from dev_blackbox.service.jira_event_service import JiraEventService
+from dev_blackbox.service.slack_message_service import SlackMessageService
+from dev_blackbox.storage.rds.entity.github_event import GitHubEvent
+from dev_blackbox.storage.rds.entity.jira_event import JiraEvent
+from dev_blackbox.storage.rds.entity.slack_message import SlackMessage
+from dev_blackbox.task.collect.db_slot import db_connection_slot
+from dev_blackbox.task.context.user_context import UserContext
+from dev_blackbox.util.distributed_lock import distributed_lock
+from dev_blackbox.util.llm_input_packer import (
+    PackItem,
+    get_input_token_budget,
+    pack_input,
+    split_into_chunks,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# 요약 입력 항목 하나가 차지할 수 있는 최대 토큰 수 (한 항목이 예산을 독차지하지 않도록)
+_ITEM_MAX_TOKENS = 2000
+
+
+def collect_platform_events(
+    user: UserContext, target_date: date, platform: PlatformEnum
+) -> list[str]:
+    with db_connection_slot():
+        match platform:
+            case PlatformEnum.GITHUB:
+                return _collect_github_events(user.id, target_date)
+            case PlatformEnum.JIRA:
+                return _collect_jira_events(user, target_date)
+            case PlatformEnum.SLACK:
+                return _collect_slack_events(user, target_date)
+            case _:
+                raise ValueError(f"Unsupported platform: {platform}")
+
+
+def _collect_github_events(user_id: int, target_date: date) -> list[str]:
+    with get_db_session() as session:
+        service = GitHubEventService(session)
+        # 모든 이벤트 저장
+        with measure_stage(PipelineMetricStageEnum.PERSIST):
+            events = service.save_github_events(user_id, target_date)
+
+        # 저장 결과(기존 저장분 포함)에서 요약 대상 이벤트만 골라 다시 조회하지 않는다
+        summary_events = [
+            e
+            for e in events
+            if e.event_type in GitHubEventService.SUMMARY_EVENT_TYPES
+            and e.target_date == target_date
+        ]
+        return _build_github_chunks(user_id, target_date, summary_events)
+
+
+def _collect_jira_events(user: UserContext, target_date: date) -> list[str]:
+    with get_db_session() as session:
+        service = JiraEventService(session)
+        with measure_stage(PipelineMetricStageEnum.PERSIST):
+            events = service.save_jira_events(user.id, target_date)
+        return _build_jira_chunks(user, target_date, events)
+
+
+def _collect_slack_events(user: UserContext, target_date: date) -> list[str]:
+    if get_settings().collect_task.slack_message_log_enabled:
+        _sync_slack_message_log(user)
+    with get_db_session() as session:
+        service = SlackMessageService(session)
+        with measure_stage(PipelineMetricStageEnum.PERSIST):
+            messages = service.save_slack_messages(user.id, target_date)
+        return _build_slack_chunks(user, target_date, messages)
+
+
+def _sync_slack_message_log(user: UserContext):
+    """
+    워크스페이스 채널 메시지 로그를 커서 이후로 갱신한다.
+    로그는 같은 워크스페이스 사용자들이 공유하므로 워크스페이스 단위 락 안에서 갱신하고 커밋한 뒤 락을 푼다.
+    갱신하지 못하면 로그가 target_date를 담지 못한 채널만 기존처럼 lookback 조회로 수집한다.
+    """
+    with get_db_session() as session:
+        slack_secret_id = SlackMessageService(session).get_slack_secret_id(user.id)
+
+    lock_key = LockKey.SYNC_SLACK_MESSAGE_LOG + f":slack_secret_id:{slack_secret_id}"
+    try:
+        with distributed_lock(
+            lock_key, timeout=300, blocking_timeout=600, auto_renewal=True
+        ) as acquired:
+            if not acquired:
+                logger.warning(f"Slack 메시지 로그 갱신 락 획득 실패: user_id={user.id}")
+                return
+            with get_db_session() as session:
+                SlackMessageService(session).sync_slack_message_log(user.id)
+    except Exception as e:
+        logger.exception(f"Slack 메시지 로그 갱신 실패: user_id={user.id}, error={e}")
+
+
+def get_stored_platform_chunks(
+    user: UserContext, target_date: date, platform: PlatformEnum
+) -> list[str]:
+    """이미 저장된 플랫폼 데이터로 요약 입력 생성"""
+    with get_db_session() as session:
+        match platform:
+            case PlatformEnum.GITHUB:
+                summary_events = GitHubEventService(session).get_github_events_by_event_types(
+                    user.id, target_date, GitHubEventService.SUMMARY_EVENT_TYPES
+                )
+                return _build_github_chunks(user.id, target_date, summary_events)
+            case PlatformEnum.JIRA:
+                events = JiraEventService(session).get_jira_events(user.id, target_date)
+                return _build_jira_chunks(user, target_date, events)
+            case PlatformEnum.SLACK:
+                messages = SlackMessageService(session).get_slack_messages(user.id, target_date)
+                return _build_slack_chunks(user, target_date, messages)
+            case _:
+                raise ValueError(f"Unsupported platform: {platform}")
+
+
+def _build_github_chunks(
+    user_id: int, target_date: date, summary_events: list[GitHubEvent]
+) -> list[str]:
+    with measure_stage(PipelineMetricStageEnum.TEXT) as measurement:
+        # 최신 이벤트부터, 커밋 메시지/통계와 PR 요약 → 파일별 변경 통계 → patch 순으로 예산을 채운다
+        items: list[PackItem] = []
+        for event in sorted(summary_events, key=lambda e: e.event_model.created_at, reverse=True):
+            repo_name = event.event_model.repo.name
+            commit = event.commit_model
+            if event.event_type == "PullRequestEvent":
+                # PR 이벤트의 commit은 PR 커밋을 합친 정보 (GraphQL 조회 시)
+                text = event.event_model.pull_request_summary_text
+                if commit is not None:
+                    text += f"\n{commit.commit_summary_text}"
+                items.append(PackItem(text, 0, len(items), _ITEM_MAX_TOKENS, repo_name))
+            elif commit is not None:
+                items.append(
+                    PackItem(commit.commit_summary_text, 0, len(items), _ITEM_MAX_TOKENS, repo_name)
+                )
+                items.append(
+                    PackItem(
+                        commit.commit_file_stats_text, 1, len(items), _ITEM_MAX_TOKENS, repo_name
+                    )
+                )
+                for f in commit.files:
+                    if f.truncated_patch:
+                        items.append(
+                            PackItem(
+                                f"{f.filename}\n{f.truncated_patch}",
+                                2,
+                                len(items),
+                                group=repo_name,
+                            )
+                        )
+        chunks = _build_summary_chunks(
+            PlatformEnum.GITHUB, user_id, target_date, items, separator="\n\n"
+        )
+        measurement.output_size = sum(len(c) for c in chunks)
+    return chunks
+
+
+def _build_jira_chunks(user: UserContext, target_date: date, events: list[JiraEvent]) -> list[str]:
+    with measure_stage(PipelineMetricStageEnum.TEXT) as measurement:
+        items = [
+            PackItem(
+                e.issue_model.issue_detail_text(target_date, user.tz_info),
+                position=i,
+                max_tokens=_ITEM_MAX_TOKENS,
+                group=e.issue_key,
+            )
+            for i, e in enumerate(events)
+        ]
+        chunks = _build_summary_chunks(
+            PlatformEnum.JIRA, user.id, target_date, items, separator="\n\n"
+        )
+        measurement.output_size = sum(len(c) for c in chunks)
+    return chunks
+
+
+def _build_slack_chunks(
+    user: UserContext, target_date: date, messages: list[SlackMessage]
+) -> list[str]:
+    with measure_stage(PipelineMetricStageEnum.TEXT) as measurement:
+        # 출력은 시간순, 예산은 최신 메시지부터 채운다 (map-reduce 분할은 채널 단위)
+        items = [
+            PackItem(
+                f"[#{m.channel_name}] {m.message_text}",
+                position=i,
+                max_tokens=_ITEM_MAX_TOKENS,
+                group=m.channel_id,
+            )
+            for i, m in enumerate(sorted(messages, key=lambda m: float(m.message_ts)))
+        ]
+        chunks = _build_summary_chunks(
+            PlatformEnum.SLACK, user.id, target_date, list(reversed(items)), separator="\n"
+        )
+        measurement.output_size = sum(len(c) for c in chunks)
+    return chunks
+
+
+def _build_summary_chunks(
+    platform: PlatformEnum,
+    user_id: int,
+    target_date: date,
+    items: list[PackItem],
+    separator: str,
+) -> list[str]:
+    """
+    요약 프롬프트와 응답(num_predict) 몫을 제외한 컨텍스트 윈도우를 입력 토큰 예산으로 삼는다.
+    map-reduce 요약이 켜져 있으면 항목을 버리지 않고 group(레포/이슈/채널) 경계에서 chunk로 나누고,
+    아니면 하나의 입력에 우선순위대로 채운다. 입력이 없으면 빈 리스트.
+    """
+    config = get_settings().collect_task
+    llm_config = SummaryOllamaConfig()
+    prompt, text_variable = get_summary_prompt(platform)
+    budget_tokens = get_input_token_budget(
+        context_window=llm_config.context_window,
+        num_predict=llm_config.num_predict,
+        prompt_text=prompt.format(**{text_variable: ""}),
+    )
+
+    if config.summary_map_reduce_enabled:
+        chunk_tokens = min(budget_tokens, config.summary_chunk_tokens)
+        chunks = split_into_chunks(items, chunk_tokens, separator=separator)
+        if len(chunks) > 1:
+            logger.info(
+                f"요약 입력 분할 ({platform}): user_id={user_id}, target_date={target_date}, "
+                f"chunk_tokens={chunk_tokens}, chunks={len(chunks)}"
+            )
+        return chunks
+
+    packed = pack_input(items, budget_tokens, separator=separator)
+    if packed.is_reduced:
+        logger.info(
+            f"요약 입력 토큰 예산 적용 ({platform}): user_id={user_id}, target_date={target_date}, "
+            f"budget={budget_tokens}, tokens={packed.estimated_tokens}, "
+            f"truncated={packed.truncated_count}, dropped={packed.dropped_count}"
+        )
+    return [packed.text] if packed.text else []
+
+
+def get_summary_prompt(platform: PlatformEnum) -> tuple[PromptTemplate, str]:
+    """플랫폼별 요약 프롬프트와 입력 텍스트 템플릿 변수명"""
+    match platform:
+        case PlatformEnum.GITHUB:
+            return GITHUB_COMMIT_SUMMARY_PROMPT, "commit_message"
+        case PlatformEnum.JIRA:
+            return JIRA_ISSUE_SUMMARY_PROMPT, "issue_details"
+        case PlatformEnum.SLACK:
+            return SLACK_MESSAGE_SUMMARY_PROMPT, "message_details"
+        case _:
+            raise ValueError(f"Unsupported platform: {platform}")
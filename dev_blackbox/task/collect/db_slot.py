@@ -0,0 +1,30 @@
+"""
+수집 구간의 DB 커넥션 사용량 제한.
+
+플랫폼 수집은 외부 API 응답을 기다리는 동안 DB 세션을 잡고 있으므로, 정기 수집/재시도/백필/수동 동기화가 동시에 실행되어도
+프로세스 전체의 동시 수집 수가 DB 커넥션 풀(pool_size + max_overflow)을 넘지 않도록 제한한다.
+실행 원장/계측/업무 일지 저장처럼 짧게 쓰는 세션을 위해 _RESERVED_CONNECTIONS개는 남겨 둔다.
+"""
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from dev_blackbox.core.config import get_settings
+
+_RESERVED_CONNECTIONS = 5
+
+
+def get_db_slot_count() -> int:
+    database = get_settings().database
+    return max(1, database.pool_size + database.max_overflow - _RESERVED_CONNECTIONS)
+
+
+_db_slots = threading.BoundedSemaphore(get_db_slot_count())
+
+
+@contextmanager
+def db_connection_slot() -> Iterator[None]:
+    """블록 안에서 DB 세션을 잡은 채 외부 API를 호출한다. 빈 슬롯이 생길 때까지 기다린다."""
+    with _db_slots:
+        yield
@@ -0,0 +1,53 @@
+"""
+GitHub org 모드: org 이벤트 피드를 한 번 조회하여 org 구성원의 GitHub 이벤트를 수집한다.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import date
+from zoneinfo import ZoneInfo
+
+from dev_blackbox.core.database import get_db_session
+from dev_blackbox.core.enum import PipelineStageEnum, PlatformEnum
+from dev_blackbox.service.github_event_service import GitHubEventService
+from dev_blackbox.task.collect.db_slot import db_connection_slot
+from dev_blackbox.task.collect.run_ledger import mark_steps_by_dates
+from dev_blackbox.task.context.user_context import UserContext
+from dev_blackbox.util.datetime_util import get_yesterday
+
+logger = logging.getLogger(__name__)
+
+
+def collect_github_org_events(org: str, collector: str, users: list[UserContext]):
+    """
+    org 모드: (target_date, 타임존) 그룹마다 org 이벤트 피드를 collector 토큰으로 한 번 조회하여 사용자별로 저장하고,
+    org 구성원의 GitHub 수집 단계를 완료로 기록한다. 완료로 기록된 사용자는 사용자별 조회 없이 저장된 이벤트로 요약하므로
+    org 밖(개인 레포, 다른 org)의 활동은 수집하지 않는다.
+    org 구성원이 아닌 사용자와, 조회에 실패하거나 누락 가능성이 있는 그룹은 기록하지 않으므로 기존처럼 사용자별로 수집한다.
+    """
+    groups: dict[tuple[date, str], list[UserContext]] = defaultdict(list)
+    for user in users:
+        if user.has_github_user_secret:
+            groups[(get_yesterday(user.tz_info), str(user.tz_info))].append(user)
+
+    for (target_date, timezone), group_users in groups.items():
+        try:
+            with db_connection_slot(), get_db_session() as session:
+                collected_user_ids = GitHubEventService(session).save_org_github_events(
+                    org, collector, [u.id for u in group_users], target_date, ZoneInfo(timezone)
+                )
+        except Exception as e:
+            logger.exception(
+                f"org 이벤트 수집 실패, 사용자별로 수집: org={org}, target_date={target_date}, error={e}"
+            )
+            continue
+
+        for user in group_users:
+            if user.id in collected_user_ids:
+                mark_steps_by_dates(
+                    user, [target_date], PlatformEnum.GITHUB, PipelineStageEnum.COLLECT
+                )
+        logger.info(
+            f"org 이벤트 수집 완료: org={org}, target_date={target_date}, "
+            f"users={len(collected_user_ids)}/{len(group_users)}"
+        )
@@ -0,0 +1,36 @@
+"""
+플랫폼 처리 단위 파이프라인 계측 저장.
+"""
+
+import logging
+from contextlib import contextmanager
+from datetime import date
+
+from dev_blackbox.core.database import get_db_session
+from dev_blackbox.core.enum import PlatformEnum
+from dev_blackbox.core.pipeline_metric import PipelineMetricCollector, metric_scope
+from dev_blackbox.service.pipeline_metric_service import PipelineMetricService
+from dev_blackbox.task.context.user_context import UserContext
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def platform_metric_scope(user: UserContext, target_date: date, platform: PlatformEnum):
+    """블록 안에서 측정된 단계별 소요 시간/API 호출 수/입출력 크기를 저장. 저장 실패는 무시한다."""
+    with metric_scope(user.id, target_date, platform) as collector:
+        try:
+            yield
+        finally:
+            save_metrics(collector)
+
+
+def save_metrics(collector: PipelineMetricCollector):
+    try:
+        with get_db_session() as session:
+            PipelineMetricService(session).save_metrics(collector)
+    except Exception as e:
+        logger.warning(
+            f"파이프라인 계측 저장 실패: user_id={collector.user_id}, target_date={collector.target_date}, "
+            f"platform={collector.platform}, error={e}"
+        )
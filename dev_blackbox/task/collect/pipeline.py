@@ -0,0 +1,245 @@
+"""
+2단계 파이프라인 실행 모드: 수집과 LLM 요약을 Redis 큐로 분리한다.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import date
+
+from dev_blackbox.core.config import get_settings
+from dev_blackbox.core.database import get_db_session
+from dev_blackbox.core.enum import PipelineStageEnum, PlatformEnum
+from dev_blackbox.service.pipeline_run_service import PipelineRunService
+from dev_blackbox.task.collect.collector import collect_platform_events, get_stored_platform_chunks
+from dev_blackbox.task.collect.metric import platform_metric_scope
+from dev_blackbox.task.collect.run_ledger import get_succeeded_stages, pipeline_step
+from dev_blackbox.task.collect.summarizer import summarize_platform
+from dev_blackbox.task.collect.work_log import (
+    create_work_log_batch,
+    get_user_lock_key,
+    get_user_platforms,
+    save_empty_work_log,
+    save_work_log_batch,
+)
+from dev_blackbox.task.context.summary_job import SummaryJob
+from dev_blackbox.task.context.user_context import UserContext
+from dev_blackbox.task.context.work_log_batch import WorkLogBatch
+from dev_blackbox.task.summary_job_queue import SummaryJobQueue, SummaryResult
+from dev_blackbox.util.datetime_util import get_yesterday
+from dev_blackbox.util.distributed_lock import distributed_lock
+
+logger = logging.getLogger(__name__)
+
+
+def collect_events_and_summarize_users_with_pipeline(users: list[UserContext]):
+    """
+    수집(I/O)과 LLM 요약(GPU)을 Redis 큐로 분리한 2단계 파이프라인.
+    수집 워커는 사용자 락을 잡고 수집한 뒤 요약 그룹을 열고 요약 작업을 공유 큐에 넣고, 요약을 기다리지 않고 락을 푼다.
+    요약 작업은 저장에 필요한 정보를 모두 담고 있어 어느 인스턴스의 요약 워커든 꺼내 처리하고,
+    그룹의 마지막 작업을 끝낸 요약 워커가 플랫폼/일일 업무 일지를 한 트랜잭션으로 저장(save_work_log_batch)한다.
+
+    이 인스턴스의 요약 워커는 수집이 끝나고 큐가 빌 때까지 함께 소비하고, 나머지는 각 인스턴스의 summarize_queued_jobs_task가 소비한다.
+    """
+    config = get_settings().collect_task
+    collect_workers = max(1, config.max_workers)
+    summary_workers = max(1, config.summary_workers)
+    target_dates = {user.id: get_yesterday(user.tz_info) for user in users}
+    collect_done = threading.Event()
+    started_at = time.perf_counter()
+
+    with ThreadPoolExecutor(
+        max_workers=summary_workers, thread_name_prefix="summarize"
+    ) as summary_executor:
+        summary_futures = [
+            summary_executor.submit(drain_summary_jobs, collect_done)
+            for _ in range(summary_workers)
+        ]
+        with ThreadPoolExecutor(
+            max_workers=collect_workers, thread_name_prefix="collect-user"
+        ) as collect_executor:
+            collect_futures = [
+                collect_executor.submit(_collect_and_enqueue, user, target_dates[user.id])
+                for user in users
+            ]
+            wait(collect_futures)
+        collect_done.set()
+        wait(summary_futures)
+
+    logger.info(
+        f"전체 사용자 요약 완료 (pipeline): users={len(users)}, collect_workers={collect_workers}, "
+        f"summary_workers={summary_workers}, wall_clock={time.perf_counter() - started_at:.1f}s"
+    )
+
+
+def _collect_and_enqueue(user: UserContext, target_date: date):
+    """
+    배치 실행과 재시도 태스크가 같은 사용자/날짜를 동시에 처리하지 않도록 사용자 락을 잡고 수집한 뒤 요약 그룹을 연다.
+    락은 적재까지만 잡고, 요약이 끝날 때까지는 열린 요약 그룹이 같은 사용자/날짜의 재처리를 막는다.
+    """
+    lock_key = get_user_lock_key(user.id, target_date)
+    with distributed_lock(lock_key, timeout=300, auto_renewal=True) as acquired:
+        if not acquired:
+            logger.info(f"다른 작업이 처리 중: user_id={user.id}, target_date={target_date}")
+            return
+        summary_job_queue = SummaryJobQueue()
+        if summary_job_queue.is_open(user.id, target_date):
+            logger.info(f"요약 대기 중: user_id={user.id}, target_date={target_date}")
+            return
+
+        group_id = uuid.uuid4().hex
+        batch = create_work_log_batch(user, target_date)
+        jobs: list[SummaryJob] = []
+        for platform in get_user_platforms(user):
+            try:
+                with platform_metric_scope(user, target_date, platform):
+                    job = _collect_summary_job(user, target_date, platform, batch, group_id)
+            except Exception as e:
+                logger.exception(
+                    f"{platform} 데이터 수집 실패: user_id={user.id}, target_date={target_date}, error={e}"
+                )
+                continue
+            if job is not None:
+                jobs.append(job)
+
+        if not jobs:
+            try:
+                save_work_log_batch(user, target_date, batch)
+            except Exception as e:
+                logger.exception(f"업무 일지 저장 실패: user_id={user.id}, error={e}")
+            return
+
+        # 요약 워커가 작업을 꺼내기 전에 그룹을 열어야 완료 기록을 놓치지 않는다
+        if not summary_job_queue.open_group(
+            user.id,
+            target_date,
+            group_id,
+            remaining=len(jobs),
+            results=batch.get_results(),
+            ttl_seconds=get_settings().collect_task.summary_group_ttl_seconds,
+        ):
+            # 요약 스텝은 PENDING으로 남아 재시도 태스크가 다시 요약한다
+            logger.warning(
+                f"요약 그룹이 이미 열려 있음: user_id={user.id}, target_date={target_date}"
+            )
+            return
+        for job in jobs:
+            try:
+                summary_job_queue.push(job)
+            except Exception as e:
+                # 요약 스텝은 PENDING으로 남아 재시도 태스크가 다시 요약한다
+                logger.exception(
+                    f"{job.platform} 요약 작업 적재 실패: user_id={user.id}, target_date={target_date}, error={e}"
+                )
+                _complete_summary_job(summary_job_queue, job, None)
+
+
+def _collect_summary_job(
+    user: UserContext,
+    target_date: date,
+    platform: PlatformEnum,
+    batch: WorkLogBatch,
+    group_id: str,
+) -> SummaryJob | None:
+    """플랫폼 데이터를 수집하고 요약할 입력이 있으면 요약 작업을 반환한다. 수집 결과가 없으면 batch에 빈 업무 일지를 추가한다."""
+    succeeded_stages = get_succeeded_stages(user, target_date, platform)
+    if PipelineStageEnum.SUMMARIZE in succeeded_stages:
+        return None
+    if PipelineStageEnum.COLLECT in succeeded_stages:
+        chunks = get_stored_platform_chunks(user, target_date, platform)
+    else:
+        with pipeline_step(user, target_date, platform, PipelineStageEnum.COLLECT):
+            chunks = collect_platform_events(user, target_date, platform)
+
+    if not chunks:
+        # 요약 성공은 업무 일지와 같은 트랜잭션에서 기록 (save_work_log_batch)
+        with pipeline_step(
+            user, target_date, platform, PipelineStageEnum.SUMMARIZE, mark_succeeded=False
+        ):
+            save_empty_work_log(user, target_date, platform, batch=batch)
+        return None
+
+    # 큐 적재 후 중단되어도 재시도 태스크가 찾을 수 있도록 PENDING 기록
+    with get_db_session() as session:
+        PipelineRunService(session).mark_pending(
+            user.id, target_date, platform, PipelineStageEnum.SUMMARIZE
+        )
+    return SummaryJob(
+        group_id=group_id,
+        user=user,
+        target_date=target_date,
+        platform=platform,
+        chunks=chunks,
+        input_fingerprints=batch.input_fingerprints,
+    )
+
+
+def drain_summary_jobs(collect_done: threading.Event | None = None):
+    """
+    공유 큐의 요약 작업을 소비한다.
+    collect_done이 있으면 수집이 끝나고 큐가 빌 때까지, 없으면 큐가 빌 때까지 소비한다.
+    """
+    summary_job_queue = SummaryJobQueue()
+    while True:
+        # collect_done 확인 후 pop 해야 마지막으로 적재된 작업을 놓치지 않는다
+        is_collect_done = collect_done is None or collect_done.is_set()
+        job = summary_job_queue.pop(timeout=1)
+        if job is None:
+            if is_collect_done:
+                return
+            continue
+        _summarize_job(summary_job_queue, job)
+
+
+def _summarize_job(summary_job_queue: SummaryJobQueue, job: SummaryJob):
+    if not summary_job_queue.is_current(job):
+        # 그룹이 만료되어 재시도 태스크가 다시 처리하는 작업
+        logger.info(
+            f"만료된 요약 작업 건너뜀: user_id={job.user.id}, target_date={job.target_date}, platform={job.platform}"
+        )
+        return
+
+    result = None
+    try:
+        batch = WorkLogBatch(input_fingerprints=job.input_fingerprints)
+        with (
+            platform_metric_scope(job.user, job.target_date, job.platform),
+            pipeline_step(
+                job.user,
+                job.target_date,
+                job.platform,
+                PipelineStageEnum.SUMMARIZE,
+                mark_succeeded=False,
+            ),
+        ):
+            summarize_platform(job.user, job.target_date, job.platform, job.chunks, batch)
+        result = batch.get_results()[0]
+    except Exception as e:
+        logger.exception(
+            f"{job.platform} 요약 실패: user_id={job.user.id}, target_date={job.target_date}, error={e}"
+        )
+    _complete_summary_job(summary_job_queue, job, result)
+
+
+def _complete_summary_job(
+    summary_job_queue: SummaryJobQueue,
+    job: SummaryJob,
+    result: SummaryResult | None,
+):
+    """그룹의 마지막 작업이면 모인 결과로 업무 일지를 저장하고 그룹을 닫는다."""
+    results = summary_job_queue.complete(job, result)
+    if results is None:
+        return
+
+    try:
+        batch = WorkLogBatch(input_fingerprints=job.input_fingerprints)
+        for platform, work_log in results:
+            batch.add(platform, work_log)
+        save_work_log_batch(job.user, job.target_date, batch)
+        logger.info(f"요약 완료: user_id={job.user.id}, target_date={job.target_date}")
+    except Exception as e:
+        logger.exception(f"업무 일지 저장 실패: user_id={job.user.id}, error={e}")
+    finally:
+        summary_job_queue.close(job.user.id, job.target_date)
@@ -0,0 +1,83 @@
+"""
+실행 원장(pipeline_run_step) 기록.
+
+(user, target_date, platform, stage) 단위로 실행 상태를 기록하고, 실패는 재시도 태스크가 지수 백오프로 다시 실행한다.
+"""
+
+from contextlib import contextmanager
+from datetime import date
+
+from dev_blackbox.core.config import get_settings
+from dev_blackbox.core.database import get_db_session
+from dev_blackbox.core.enum import PipelineStageEnum, PlatformEnum
+from dev_blackbox.service.pipeline_run_service import PipelineRunService
+from dev_blackbox.task.context.user_context import UserContext
+from dev_blackbox.util.datetime_util import get_datetime_utc_now
+
+
+def get_succeeded_stages(
+    user: UserContext,
+    target_date: date,
+    platform: PlatformEnum,
+) -> set[PipelineStageEnum]:
+    with get_db_session() as session:
+        return PipelineRunService(session).get_succeeded_stages(user.id, target_date, platform)
+
+
+@contextmanager
+def pipeline_step(
+    user: UserContext,
+    target_date: date,
+    platform: PlatformEnum,
+    stage: PipelineStageEnum,
+    mark_succeeded: bool = True,
+):
+    """
+    블록 실행 결과를 실행 원장에 기록. 예외는 실패로 기록한 뒤 다시 던진다.
+    mark_succeeded=False이면 성공 기록은 호출자가 결과 저장과 같은 트랜잭션에서 한다.
+    """
+    mark_step_running(user, target_date, platform, stage)
+    try:
+        yield
+    except Exception as e:
+        mark_steps_by_dates(user, [target_date], platform, stage, error=e)
+        raise
+    if mark_succeeded:
+        mark_steps_by_dates(user, [target_date], platform, stage)
+
+
+def mark_step_running(
+    user: UserContext,
+    target_date: date,
+    platform: PlatformEnum,
+    stage: PipelineStageEnum,
+):
+    with get_db_session() as session:
+        PipelineRunService(session).mark_running(user.id, target_date, platform, stage)
+
+
+def mark_steps_by_dates(
+    user: UserContext,
+    target_dates: list[date],
+    platform: PlatformEnum,
+    stage: PipelineStageEnum,
+    error: Exception | None = None,
+):
+    config = get_settings().collect_task
+    with get_db_session() as session:
+        service = PipelineRunService(session)
+        for target_date in target_dates:
+            if error is None:
+                service.mark_succeeded(user.id, target_date, platform, stage)
+            else:
+                service.mark_failed(
+                    user.id,
+                    target_date,
+                    platform,
+                    stage,
+                    error=f"{type(error).__name__}: {error}",
+                    now=get_datetime_utc_now(),
+                    max_attempts=config.retry_max_attempts,
+                    base_delay_seconds=config.retry_base_delay_seconds,
+                    max_delay_seconds=config.retry_max_delay_seconds,
+                )
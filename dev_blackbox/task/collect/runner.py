@@ -0,0 +1,31 @@
+"""
+설정에 따라 수집/요약 실행 모드를 고른다.
+"""
+
+import logging
+
+from dev_blackbox.core.config import get_settings
+from dev_blackbox.task.collect.async_mode import collect_events_and_summarize_users_async
+from dev_blackbox.task.collect.github_org import collect_github_org_events
+from dev_blackbox.task.collect.pipeline import collect_events_and_summarize_users_with_pipeline
+from dev_blackbox.task.collect.threaded import collect_events_and_summarize_users
+from dev_blackbox.task.context.user_context import UserContext
+
+logger = logging.getLogger(__name__)
+
+
+def run_collect_events_and_summarize_users(users: list[UserContext]):
+    """실행 원장은 호출하는 쪽에서 먼저 기록한다."""
+    config = get_settings().collect_task
+    if config.github_org and config.github_org_collector:
+        collect_github_org_events(config.github_org, config.github_org_collector, users)
+    elif config.github_org:
+        logger.warning(
+            f"github_org_collector가 없어 org 모드를 사용하지 않음: org={config.github_org}"
+        )
+    if config.async_collect_enabled:
+        collect_events_and_summarize_users_async(users)
+    elif config.pipeline_enabled:
+        collect_events_and_summarize_users_with_pipeline(users)
+    else:
+        collect_events_and_summarize_users(users)
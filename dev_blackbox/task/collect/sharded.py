@@ -0,0 +1,77 @@
+"""
+샤딩 실행 모드: 살아있는 인스턴스들에 사용자를 나누어 실행한다.
+"""
+
+import logging
+
+from dev_blackbox.core.cache import CacheService
+from dev_blackbox.core.cluster import InstanceRegistry, get_instance_id
+from dev_blackbox.core.config import get_settings
+from dev_blackbox.core.const import CacheTTL, ClusterKey, LockKey
+from dev_blackbox.task.collect.runner import run_collect_events_and_summarize_users
+from dev_blackbox.task.context.user_context import UserContext
+from dev_blackbox.util.consistent_hash import ConsistentHashRing
+from dev_blackbox.util.distributed_lock import distributed_lock
+
+logger = logging.getLogger(__name__)
+
+
+def collect_events_and_summarize_users_by_shard(run_key: str, users: list[UserContext]):
+    """
+    살아있는 인스턴스들에 사용자를 Consistent Hashing으로 나누어 실행한다.
+
+    1. 실행 단위(run_key)별 멤버십 스냅샷을 먼저 기록한 인스턴스의 값을 모든 인스턴스가 공유
+    2. 각 인스턴스는 자기 샤드만 샤드 락(자동 갱신)을 잡고 처리 후 완료 마킹하고 바로 반환
+    3. 처리되지 못한 샤드(죽은 인스턴스의 샤드)는 기다리지 않는다. 실행 원장을 미리 기록했으므로 재시도 태스크가 이어서 처리
+    """
+    config = get_settings().collect_task
+    instance_id = get_instance_id()
+    members = _get_collect_run_members(run_key, instance_id, config.instance_ttl_seconds)
+
+    ring = ConsistentHashRing(members)
+    shard_users: dict[str, list[UserContext]] = {member: [] for member in members}
+    for user in users:
+        shard_users[ring.get_node(str(user.id))].append(user)
+
+    if instance_id not in shard_users:
+        # 멤버십 스냅샷 이후 기동한 인스턴스는 이번 실행에서 맡은 샤드가 없음
+        logger.info(f"맡은 샤드 없음: run_key={run_key}, instance_id={instance_id}")
+        return
+
+    _run_shard(run_key, instance_id, shard_users[instance_id])
+    logger.info(f"샤드 실행 완료: run_key={run_key}, instance_id={instance_id}")
+
+
+def _get_collect_run_members(run_key: str, instance_id: str, ttl_seconds: int) -> list[str]:
+    registry = InstanceRegistry()
+    registry.heartbeat(instance_id)
+    live_instances = registry.get_live_instances(ttl_seconds)
+
+    cache_service = CacheService()
+    members_key = ClusterKey.COLLECT_RUN_MEMBERS.format(run_key=run_key)
+    cache_service.set(members_key, live_instances, nx=True, ex=CacheTTL.HOURS_24)
+    return cache_service.get(members_key) or live_instances
+
+
+def _run_shard(run_key: str, shard: str, users: list[UserContext]) -> bool:
+    """샤드가 완료되었으면 True, 다른 실행이 처리 중이면 False (늦게 실행된 같은 예약 시각의 실행 등)"""
+    config = get_settings().collect_task
+    cache_service = CacheService()
+    done_key = ClusterKey.COLLECT_RUN_SHARD_DONE.format(run_key=run_key, shard=shard)
+    if cache_service.exists(done_key):
+        return True
+
+    lock_key = LockKey.COLLECT_EVENTS_AND_SUMMARIZE_WORK_LOG_TASK + f":run:{run_key}:shard:{shard}"
+    with distributed_lock(
+        lock_key, timeout=config.shard_lock_timeout, auto_renewal=True
+    ) as acquired:
+        if not acquired:
+            return False
+        # 락 대기 중 다른 인스턴스가 완료했을 수 있음
+        if cache_service.exists(done_key):
+            return True
+
+        logger.info(f"샤드 실행: run_key={run_key}, shard={shard}, users={len(users)}")
+        run_collect_events_and_summarize_users(users)
+        cache_service.set(done_key, True, ex=CacheTTL.HOURS_24)
+        return True
@@ -0,0 +1,148 @@
+"""
+플랫폼 데이터 LLM 요약.
+"""
+
+import logging
+from datetime import date
+
+from dev_blackbox.agent.llm_agent import LLMAgent
+from dev_blackbox.agent.model.llm_model import SummaryOllamaConfig
+from dev_blackbox.agent.model.prompt import PARTIAL_SUMMARY_REDUCE_PROMPT
+from dev_blackbox.core.config import get_settings
+from dev_blackbox.core.database import get_db_session
+from dev_blackbox.core.enum import PipelineMetricStageEnum, PipelineStageEnum, PlatformEnum
+from dev_blackbox.core.pipeline_metric import measure_stage
+from dev_blackbox.service.model.platform_work_log_model import PlatformWorkLogDraft
+from dev_blackbox.service.work_log_service import WorkLogService
+from dev_blackbox.task.collect.collector import get_stored_platform_chunks, get_summary_prompt
+from dev_blackbox.task.collect.run_ledger import pipeline_step
+from dev_blackbox.task.collect.work_log import save_empty_work_log, save_platform_work_log
+from dev_blackbox.task.context.user_context import UserContext
+from dev_blackbox.task.context.work_log_batch import WorkLogBatch
+from dev_blackbox.util.fingerprint_util import build_fingerprint
+from dev_blackbox.util.llm_input_packer import PackItem, get_input_token_budget, pack_input
+
+logger = logging.getLogger(__name__)
+
+
+def summarize_stored_platform(
+    user: UserContext,
+    target_date: date,
+    platform: PlatformEnum,
+    batch: WorkLogBatch | None = None,
+):
+    with pipeline_step(
+        user, target_date, platform, PipelineStageEnum.SUMMARIZE, mark_succeeded=batch is None
+    ):
+        chunks = get_stored_platform_chunks(user, target_date, platform)
+        summarize_or_save_empty(user, target_date, platform, chunks, batch)
+
+
+def summarize_or_save_empty(
+    user: UserContext,
+    target_date: date,
+    platform: PlatformEnum,
+    chunks: list[str],
+    batch: WorkLogBatch | None = None,
+):
+    if chunks:
+        summarize_platform(user, target_date, platform, chunks, batch)
+    else:
+        save_empty_work_log(user, target_date, platform, batch=batch)
+
+
+def summarize_platform(
+    user: UserContext,
+    target_date: date,
+    platform: PlatformEnum,
+    chunks: list[str],
+    batch: WorkLogBatch | None = None,
+):
+    """batch가 있으면 요약 결과를 batch에 모으고, 없으면 바로 저장한다."""
+    llm_config = SummaryOllamaConfig()
+    prompt, text_variable = get_summary_prompt(platform)
+
+    # 모델/프롬프트/입력이 모두 같으면 기존 요약을 그대로 사용
+    fingerprint_parts = [llm_config.model, prompt.template, *chunks]
+    if len(chunks) > 1:
+        fingerprint_parts.append(PARTIAL_SUMMARY_REDUCE_PROMPT.template)
+    input_fingerprint = build_fingerprint(*fingerprint_parts)
+    if batch is not None:
+        is_up_to_date = batch.is_up_to_date(platform, input_fingerprint)
+    else:
+        with get_db_session() as session:
+            service = WorkLogService(session)
+            is_up_to_date = service.is_platform_work_log_up_to_date(
+                user_id=user.id,
+                target_date=target_date,
+                platform=platform,
+                input_fingerprint=input_fingerprint,
+            )
+    if is_up_to_date:
+        logger.info(
+            f"입력 변경 없음, LLM 요약 생략 ({platform}): user_id={user.id}, target_date={target_date}"
+        )
+        if batch is not None:
+            batch.add(platform, None)
+        return
+
+    try:
+        llm_agent = LLMAgent.create_with_ollama(llm_config)
+        with measure_stage(PipelineMetricStageEnum.LLM) as measurement:
+            measurement.input_size = sum(len(c) for c in chunks)
+            # 재시도는 실행 원장의 백오프에 맡기고 워커를 대기시키지 않는다
+            if len(chunks) == 1:
+                summary_text = llm_agent.query_once(prompt, **{text_variable: chunks[0]})
+            else:
+                summary_text = _map_reduce_summary(llm_agent, llm_config, platform, chunks)
+            measurement.output_size = len(summary_text)
+    except Exception:
+        logger.exception(
+            f"LLM 요약 실패 ({platform}): user_id={user.id}, target_date={target_date}"
+        )
+        raise
+
+    work_log = PlatformWorkLogDraft(
+        platform=platform,
+        content=summary_text,
+        model_name=llm_config.model,
+        prompt=prompt.template,
+        input_fingerprint=input_fingerprint,
+    )
+    if batch is not None:
+        batch.add(platform, work_log)
+        return
+    save_platform_work_log(user, target_date, work_log)
+
+
+def _map_reduce_summary(
+    llm_agent: LLMAgent,
+    llm_config: SummaryOllamaConfig,
+    platform: PlatformEnum,
+    chunks: list[str],
+) -> str:
+    """chunk별 부분 요약(map)을 동시에 실행하고, 부분 요약들을 하나의 업무 일지로 합친다(reduce)."""
+    prompt, text_variable = get_summary_prompt(platform)
+    partial_summaries = llm_agent.query_many_once(
+        prompt,
+        text_variable,
+        chunks,
+        max_workers=get_settings().collect_task.summary_map_workers,
+    )
+
+    # 부분 요약이 많아도 reduce 입력이 컨텍스트 윈도우를 넘지 않도록 예산 안에 채운다
+    budget_tokens = get_input_token_budget(
+        context_window=llm_config.context_window,
+        num_predict=llm_config.num_predict,
+        prompt_text=PARTIAL_SUMMARY_REDUCE_PROMPT.format(platform=platform, partial_summaries=""),
+    )
+    packed = pack_input(
+        [PackItem(summary, position=i) for i, summary in enumerate(partial_summaries)],
+        budget_tokens,
+        separator="\n\n",
+    )
+    return llm_agent.query_once(
+        PARTIAL_SUMMARY_REDUCE_PROMPT,
+        platform=platform,
+        partial_summaries=packed.text,
+    )
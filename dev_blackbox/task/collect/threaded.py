@@ -0,0 +1,162 @@
+"""
+기본 실행 모드: 사용자별 수집/요약을 스레드 풀에서 병렬 실행한다.
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from datetime import date
+
+from dev_blackbox.core.config import get_settings
+from dev_blackbox.core.enum import PipelineStageEnum, PlatformEnum
+from dev_blackbox.task.collect.collector import collect_platform_events, get_stored_platform_chunks
+from dev_blackbox.task.collect.metric import platform_metric_scope
+from dev_blackbox.task.collect.run_ledger import get_succeeded_stages, pipeline_step
+from dev_blackbox.task.collect.summarizer import summarize_or_save_empty
+from dev_blackbox.task.collect.work_log import (
+    create_work_log_batch,
+    get_user_lock_key,
+    get_user_platforms,
+    save_work_log_batch,
+)
+from dev_blackbox.task.context.user_context import UserContext
+from dev_blackbox.task.context.work_log_batch import WorkLogBatch
+from dev_blackbox.task.summary_job_queue import SummaryJobQueue
+from dev_blackbox.util.datetime_util import get_yesterday
+from dev_blackbox.util.distributed_lock import distributed_lock
+
+logger = logging.getLogger(__name__)
+
+
+def collect_events_and_summarize_users(users: list[UserContext]):
+    """
+    사용자별 수집/요약을 제한된 워커 풀에서 병렬 실행한다.
+    한 사용자의 실패는 다른 사용자에게 영향을 주지 않는다.
+    """
+    max_workers = max(1, get_settings().collect_task.max_workers)
+    started_at = time.perf_counter()
+    total_user_elapsed = 0.0
+    failed_user_ids: list[int] = []
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="collect-user") as executor:
+        futures = {executor.submit(_run_user_collect_and_summarize, user): user for user in users}
+        for future in as_completed(futures):
+            user = futures[future]
+            elapsed, succeeded = future.result()
+            total_user_elapsed += elapsed
+            if not succeeded:
+                failed_user_ids.append(user.id)
+
+    wall_clock_elapsed = time.perf_counter() - started_at
+    logger.info(
+        f"전체 사용자 요약 완료: users={len(users)}, workers={max_workers}, "
+        f"failed_user_ids={failed_user_ids}, wall_clock={wall_clock_elapsed:.1f}s, "
+        f"total_user_time={total_user_elapsed:.1f}s"
+    )
+
+
+def _run_user_collect_and_summarize(user: UserContext) -> tuple[float, bool]:
+    started_at = time.perf_counter()
+    try:
+        collect_events_and_summarize_with_lock(user, get_yesterday(user.tz_info))
+        succeeded = True
+    except Exception as e:
+        logger.exception(f"사용자 수집/요약 실패: user_id={user.id}, error={e}")
+        succeeded = False
+    return time.perf_counter() - started_at, succeeded
+
+
+def collect_events_and_summarize_with_lock(
+    user: UserContext,
+    target_date: date,
+    platforms: list[PlatformEnum] | None = None,
+):
+    """배치 실행과 재시도 태스크가 같은 사용자/날짜를 동시에 처리하지 않도록 사용자 락을 잡고 실행"""
+    lock_key = get_user_lock_key(user.id, target_date)
+    with distributed_lock(lock_key, timeout=300, auto_renewal=True) as acquired:
+        if not acquired:
+            logger.info(f"다른 작업이 처리 중: user_id={user.id}, target_date={target_date}")
+            return
+        if SummaryJobQueue().is_open(user.id, target_date):
+            # 파이프라인 모드에서 요약 워커가 아직 처리 중 (그룹이 만료되면 다음 재시도에서 처리)
+            logger.info(f"요약 대기 중: user_id={user.id}, target_date={target_date}")
+            return
+        collect_events_and_summarize(user, target_date, platforms)
+
+
+def collect_events_and_summarize(
+    user: UserContext,
+    target_date: date | None = None,
+    platforms: list[PlatformEnum] | None = None,
+):
+    target_date = target_date or get_yesterday(user.tz_info)
+    batch = create_work_log_batch(user, target_date)
+    _collect_and_summarize(user, target_date, batch, platforms)
+    save_work_log_batch(user, target_date, batch)
+    logger.info(f"요약 완료: user_id={user.id}, target_date={target_date}")
+
+
+def _collect_and_summarize(
+    user: UserContext,
+    target_date: date,
+    batch: WorkLogBatch,
+    platforms: list[PlatformEnum] | None = None,
+):
+    """
+    플랫폼별 수집/요약을 동시에 실행하고 모두 끝날 때까지 기다린다.
+    각 플랫폼은 서로 다른 외부 API를 사용하며 상태를 공유하지 않는다.
+    """
+    target_platforms = [
+        platform
+        for platform in get_user_platforms(user)
+        if platforms is None or platform in platforms  # 재시도 시 실패한 플랫폼만
+    ]
+    if not target_platforms:
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=len(target_platforms), thread_name_prefix=f"collect-user-{user.id}"
+    ) as executor:
+        futures = [
+            executor.submit(_collect_and_summarize_platform, user, target_date, platform, batch)
+            for platform in target_platforms
+        ]
+        wait(futures)
+
+
+def _collect_and_summarize_platform(
+    user: UserContext,
+    target_date: date,
+    platform: PlatformEnum,
+    batch: WorkLogBatch,
+):
+    # 플랫폼 데이터셋 수집 + 요약 (실행 원장에서 완료된 단계는 건너뜀)
+    try:
+        with platform_metric_scope(user, target_date, platform):
+            _run_platform_steps(user, target_date, platform, batch)
+    except Exception as e:
+        logger.exception(
+            f"{platform} 데이터 수집/요약 실패: user_id={user.id}, target_date={target_date}, error={e}"
+        )
+
+
+def _run_platform_steps(
+    user: UserContext,
+    target_date: date,
+    platform: PlatformEnum,
+    batch: WorkLogBatch,
+):
+    succeeded_stages = get_succeeded_stages(user, target_date, platform)
+    if PipelineStageEnum.COLLECT in succeeded_stages:
+        if PipelineStageEnum.SUMMARIZE in succeeded_stages:
+            return
+        chunks = get_stored_platform_chunks(user, target_date, platform)
+    else:
+        with pipeline_step(user, target_date, platform, PipelineStageEnum.COLLECT):
+            chunks = collect_platform_events(user, target_date, platform)
+
+    # 요약 성공은 업무 일지와 같은 트랜잭션에서 기록 (save_work_log_batch)
+    with pipeline_step(
+        user, target_date, platform, PipelineStageEnum.SUMMARIZE, mark_succeeded=False
+    ):
+        summarize_or_save_empty(user, target_date, platform, chunks, batch)
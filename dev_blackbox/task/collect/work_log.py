@@ -0,0 +1,98 @@
+"""
+사용자/날짜 단위 업무 일지 저장과 수집 실행 모드가 공유하는 사용자 정보.
+"""
+
+from datetime import date
+
+from dev_blackbox.core.const import EMPTY_ACTIVITY_MESSAGE, LockKey
+from dev_blackbox.core.database import get_db_session
+from dev_blackbox.core.enum import PipelineMetricStageEnum, PipelineStageEnum, PlatformEnum
+from dev_blackbox.core.pipeline_metric import measure_stage
+from dev_blackbox.service.model.platform_work_log_model import PlatformWorkLogDraft
+from dev_blackbox.service.pipeline_run_service import PipelineRunService
+from dev_blackbox.service.work_log_service import WorkLogService
+from dev_blackbox.task.collect.run_ledger import mark_steps_by_dates
+from dev_blackbox.task.context.user_context import UserContext
+from dev_blackbox.task.context.work_log_batch import WorkLogBatch
+
+
+def get_user_lock_key(user_id: int, target_date: date) -> str:
+    return (
+        LockKey.COLLECT_EVENTS_AND_SUMMARIZE_WORK_LOG_TASK
+        + f":user_id:{user_id}:target_date:{target_date}"
+    )
+
+
+def get_user_platforms(user: UserContext) -> list[PlatformEnum]:
+    platforms = []
+    if user.has_github_user_secret:
+        platforms.append(PlatformEnum.GITHUB)
+    if user.has_jira_user:
+        platforms.append(PlatformEnum.JIRA)
+    if user.has_slack_user:
+        platforms.append(PlatformEnum.SLACK)
+    return platforms
+
+
+def create_work_log_batch(user: UserContext, target_date: date) -> WorkLogBatch:
+    with get_db_session() as session:
+        input_fingerprints = WorkLogService(session).get_input_fingerprints(
+            user.id, target_date, get_user_platforms(user)
+        )
+    return WorkLogBatch(input_fingerprints=input_fingerprints)
+
+
+def save_work_log_batch(user: UserContext, target_date: date, batch: WorkLogBatch):
+    """
+    사용자 단위로 모은 플랫폼 업무 일지, 일일 업무 일지, 요약 스텝 성공 기록을 한 트랜잭션으로 저장.
+    저장에 실패하면 요약 스텝을 실패로 기록해 재시도 태스크가 다시 요약하도록 한다.
+    """
+    try:
+        with get_db_session() as session:
+            WorkLogService(session).save_work_logs(user.id, target_date, batch.work_logs)
+            run_service = PipelineRunService(session)
+            for platform in batch.summarized_platforms:
+                run_service.mark_succeeded(
+                    user.id, target_date, platform, PipelineStageEnum.SUMMARIZE
+                )
+    except Exception as e:
+        for platform in batch.summarized_platforms:
+            mark_steps_by_dates(user, [target_date], platform, PipelineStageEnum.SUMMARIZE, e)
+        raise
+
+
+def save_daily_work_log(
+    user: UserContext,
+    target_date: date,
+):
+    with get_db_session() as session:
+        service = WorkLogService(session)
+        service.save_daily_work_log(user_id=user.id, target_date=target_date)
+
+
+def save_empty_work_log(
+    user: UserContext,
+    target_date: date,
+    platform: PlatformEnum,
+    message: str = EMPTY_ACTIVITY_MESSAGE,
+    batch: WorkLogBatch | None = None,
+):
+    work_log = PlatformWorkLogDraft(platform=platform, content=message, model_name="", prompt="")
+    if batch is not None:
+        batch.add(platform, work_log)
+        return
+    save_platform_work_log(user, target_date, work_log)
+
+
+def save_platform_work_log(user: UserContext, target_date: date, work_log: PlatformWorkLogDraft):
+    with measure_stage(PipelineMetricStageEnum.SAVE), get_db_session() as session:
+        service = WorkLogService(session)
+        service.save_platform_work_log(
+            user_id=user.id,
+            target_date=target_date,
+            platform=work_log.platform,
+            content=work_log.content,
+            model_name=work_log.model_name,
+            prompt=work_log.prompt,
+            input_fingerprint=work_log.input_fingerprint,
+        )
@@ -1,51 +1,77 @@
 import logging
-from datetime import date
-
-from dev_blackbox.agent.llm_agent import LLMAgent
-from dev_blackbox.agent.model.llm_model import SummaryOllamaConfig
-from dev_blackbox.agent.model.prompt import (
-    GITHUB_COMMIT_SUMMARY_PROMPT,
-    JIRA_ISSUE_SUMMARY_PROMPT,
-    SLACK_MESSAGE_SUMMARY_PROMPT,
-)
-from dev_blackbox.core.const import EMPTY_ACTIVITY_MESSAGE, LockKey
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+from dev_blackbox.core.cache import CacheService
+from dev_blackbox.core.config import get_settings
+from dev_blackbox.core.const import CacheTTL, ClusterKey, LockKey
 from dev_blackbox.core.database import get_db_session
 from dev_blackbox.core.enum import PlatformEnum
-from dev_blackbox.service.github_event_service import GitHubEventService
-from dev_blackbox.service.jira_event_service import JiraEventService
-from dev_blackbox.service.slack_message_service import SlackMessageService
+from dev_blackbox.core.exception import UserNotFoundException
+from dev_blackbox.service.pipeline_run_service import PipelineRunService
 from dev_blackbox.service.user_service import UserService
-from dev_blackbox.service.work_log_service import WorkLogService
+from dev_blackbox.task.collect.backfill import backfill_events_and_summarize
+from dev_blackbox.task.collect.pipeline import drain_summary_jobs
+from dev_blackbox.task.collect.runner import run_collect_events_and_summarize_users
+from dev_blackbox.task.collect.sharded import collect_events_and_summarize_users_by_shard
+from dev_blackbox.task.collect.threaded import (
+    collect_events_and_summarize,
+    collect_events_and_summarize_with_lock,
+)
+from dev_blackbox.task.collect.work_log import get_user_lock_key, get_user_platforms
 from dev_blackbox.task.context.user_context import UserContext
-from dev_blackbox.util.datetime_util import get_yesterday
+from dev_blackbox.util.datetime_util import (
+    get_datetime_utc_now,
+    get_latest_hourly_run_time,
+    get_yesterday,
+    has_local_hour_passed,
+)
 from dev_blackbox.util.distributed_lock import distributed_lock
 
 logger = logging.getLogger(__name__)
 
+# collect_events_and_summarize_work_log_task 실행 시각 (매시 n분, background_scheduler에서 사용)
+COLLECT_TRIGGER_MINUTE = 10
+
 
 def collect_events_and_summarize_work_log_task():
-    with distributed_lock(
-        LockKey.COLLECT_EVENTS_AND_SUMMARIZE_WORK_LOG_TASK, timeout=300
-    ) as acquired:
+    """
+    매시 실행되어, 현지 시각이 local_trigger_hour(기본 자정)를 지난 타임존 그룹 중 어제 날짜를 아직 처리하지 않은 그룹의 사용자만 수집/요약한다.
+    타임존마다 현지 날짜가 끝난 직후 수집되고, 전체 부하가 하루에 걸쳐 분산된다.
+
+    실행 단위(run_key)는 실제 실행 시각이 아니라 예약 시각 기준이므로, misfire_grace_time 안에서 늦게 실행되어도 같은 실행으로 본다.
+    처리할 그룹은 (타임존, target_date) 완료 표시로 고르므로, 늦게 실행되거나 건너뛴 실행의 그룹도 다음 실행이 이어서 처리한다.
+    그룹의 실행 원장을 먼저 기록한 뒤 완료 표시를 하므로, 이후의 실패/중단은 재시도 태스크가 이어서 처리한다.
+    """
+    utc_now = get_datetime_utc_now()
+    run_key = get_latest_hourly_run_time(utc_now, COLLECT_TRIGGER_MINUTE).strftime("%Y-%m-%dT%H")
+    due_buckets = _get_due_buckets(utc_now)
+    if not due_buckets:
+        logger.info(f"수집 대상 타임존 그룹 없음: run_key={run_key}")
+        return
+
+    user_contexts = [user for users in due_buckets.values() for user in users]
+    _plan_steps(user_contexts)
+    _mark_buckets_done(list(due_buckets))
+
+    if get_settings().collect_task.sharding_enabled:
+        collect_events_and_summarize_users_by_shard(run_key, user_contexts)
+        return
+
+    lock_key = LockKey.COLLECT_EVENTS_AND_SUMMARIZE_WORK_LOG_TASK + f":run:{run_key}"
+    with distributed_lock(lock_key, timeout=300) as acquired:
         if not acquired:
             logger.warning("collect_platform_task is already running, skipping...")
             return
 
-        with get_db_session() as session:
-            user_service = UserService(session)
-            users = user_service.get_users()  # fixme n+1
-            user_contexts = [UserContext.from_entity(user) for user in users]
-
-        for user in user_contexts:
-            _collect_events_and_summarize(user)
+        run_collect_events_and_summarize_users(user_contexts)
 
 
 def collect_events_and_summarize_work_log_by_user_task(user_id: int, target_date: date):
-    lock_key = (
-        LockKey.COLLECT_EVENTS_AND_SUMMARIZE_WORK_LOG_TASK
-        + f":user_id:{user_id}:target_date:{target_date}"
-    )
-    with distributed_lock(lock_key, timeout=300) as acquired:
+    lock_key = get_user_lock_key(user_id, target_date)
+    with distributed_lock(lock_key, timeout=300, auto_renewal=True) as acquired:
         if not acquired:
             logger.warning("collect_platform_task is already running, skipping...")
             return
@@ -54,206 +80,155 @@ def collect_events_and_summarize_work_log_by_user_task(user_id: int, target_date
             user_service = UserService(session)
             user = user_service.get_user_by_id_or_throw(user_id)
             user_context = UserContext.from_entity(user)
-        _collect_events_and_summarize(user_context, target_date)
-
+            # 수동 동기화는 완료된 단계도 처음부터 다시 실행
+            PipelineRunService(session).reset_steps(user_id, target_date)
+        collect_events_and_summarize(user_context, target_date)
 
-def _collect_events_and_summarize(user: UserContext, target_date: date | None = None):
-    target_date = target_date or get_yesterday(user.tz_info)
-    _collect_and_summarize(user, target_date)
-    _save_daily_work_log(user, target_date)
-    logger.info(f"요약 완료: user_id={user.id}, target_date={target_date}")
 
+def retry_pipeline_steps_task():
+    """
+    실행 원장에서 재시도 시각이 도래한 실패 스텝과, 프로세스 중단으로 남은 스텝을 찾아 해당 플랫폼만 다시 실행한다.
+    완료된 단계는 건너뛰므로 수집이 끝난 스텝은 요약만 다시 실행된다.
+    """
+    with distributed_lock(
+        LockKey.RETRY_PIPELINE_STEPS_TASK, timeout=300, auto_renewal=True
+    ) as acquired:
+        if not acquired:
+            logger.warning("retry_pipeline_steps_task is already running, skipping...")
+            return
 
-def _save_daily_work_log(
-    user: UserContext,
-    target_date: date,
-):
-    with get_db_session() as session:
-        service = WorkLogService(session)
-        service.save_daily_work_log(user_id=user.id, target_date=target_date)
-
+        config = get_settings().collect_task
+        retry_targets: dict[tuple[int, date], set[PlatformEnum]] = defaultdict(set)
+        with get_db_session() as session:
+            steps = PipelineRunService(session).get_retryable_steps(
+                now=get_datetime_utc_now(),
+                stale_seconds=config.step_stale_seconds,
+                limit=config.retry_batch_size,
+            )
+            for step in steps:
+                retry_targets[(step.user_id, step.target_date)].add(step.platform)
+        if not retry_targets:
+            return
 
-def _save_empty_work_log(
-    user: UserContext,
-    target_date: date,
-    platform: PlatformEnum,
-    message: str = EMPTY_ACTIVITY_MESSAGE,
+        user_contexts: dict[int, UserContext] = {}
+        with get_db_session() as session:
+            user_service = UserService(session)
+            for user_id in {user_id for user_id, _ in retry_targets}:
+                try:
+                    user_contexts[user_id] = UserContext.from_entity(
+                        user_service.get_user_by_id_or_throw(user_id)
+                    )
+                except UserNotFoundException:
+                    logger.warning(f"재시도 대상 사용자 없음: user_id={user_id}")
+
+        logger.info(f"실행 원장 재시도: targets={len(retry_targets)}")
+        with ThreadPoolExecutor(
+            max_workers=max(1, config.max_workers), thread_name_prefix="retry-user"
+        ) as executor:
+            futures = {
+                executor.submit(
+                    collect_events_and_summarize_with_lock,
+                    user_contexts[user_id],
+                    target_date,
+                    sorted(platforms),
+                ): (user_id, target_date)
+                for (user_id, target_date), platforms in retry_targets.items()
+                if user_id in user_contexts
+            }
+            for future in as_completed(futures):
+                user_id, target_date = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.exception(
+                        f"실행 원장 재시도 실패: user_id={user_id}, target_date={target_date}, error={e}"
+                    )
+
+
+def summarize_queued_jobs_task():
+    """
+    파이프라인 모드에서 다른 인스턴스의 수집 워커가 적재한 요약 작업을 큐가 빌 때까지 소비한다.
+    모든 인스턴스에서 실행되어 요약(LLM) 부하를 나누고, 그룹의 마지막 작업을 끝낸 워커가 업무 일지를 저장한다.
+    """
+    config = get_settings().collect_task
+    if not config.pipeline_enabled:
+        return
+
+    summary_workers = max(1, config.summary_workers)
+    with ThreadPoolExecutor(
+        max_workers=summary_workers, thread_name_prefix="summarize"
+    ) as summary_executor:
+        futures = [summary_executor.submit(drain_summary_jobs) for _ in range(summary_workers)]
+        wait(futures)
+
+
+def backfill_events_and_summarize_work_log_by_user_task(
+    user_id: int,
+    start_date: date,
+    end_date: date,
 ):
-    with get_db_session() as session:
-        service = WorkLogService(session)
-        service.save_platform_work_log(
-            user_id=user.id,
-            target_date=target_date,
-            platform=platform,
-            content=message,
-            model_name="",
-            prompt="",
-        )
-
-
-def _collect_and_summarize(user: UserContext, target_date: date):
-    # GitHub 데이터셋 수집 + 요약
-    try:
-        if user.has_github_user_secret:
-            commit_message = _collect_github_events(user.id, target_date)
-            if commit_message:
-                _summarize_github(user, target_date, commit_message)
-            else:
-                _save_empty_work_log(user, target_date, PlatformEnum.GITHUB)
-    except Exception as e:
-        logger.exception(
-            f"GitHub 데이터 수집/요약 실패: user_id={user.id}, target_date={target_date}, error={e}"
-        )
-
-    # Jira 데이터셋 수집 + 요약
-    try:
-        if user.has_jira_user:
-            issue_details = _collect_jira_events(user, target_date)
-            if issue_details:
-                _summarize_jira(user, target_date, issue_details)
-            else:
-                _save_empty_work_log(user, target_date, PlatformEnum.JIRA)
-    except Exception as e:
-        logger.exception(
-            f"Jira 데이터 수집/요약 실패: user_id={user.id}, target_date={target_date}, error={e}"
-        )
-
-    # Slack 데이터셋 수집 + 요약
-    try:
-        if user.has_slack_user:
-            message_details = _collect_slack_events(user, target_date)
-            if message_details:
-                _summarize_slack(user, target_date, message_details)
-            else:
-                _save_empty_work_log(user, target_date, PlatformEnum.SLACK)
-    except Exception as e:
-        logger.exception(
-            f"Slack 데이터 수집/요약 실패: user_id={user.id}, target_date={target_date}, error={e}"
-        )
-
-
-def _collect_github_events(user_id: int, target_date: date) -> str:
-    # 모든 이벤트 저장
-    with get_db_session() as session:
-        service = GitHubEventService(session)
-        service.save_github_events(user_id, target_date)
-
-    # 요약 대상 이벤트만 조회
-    with get_db_session() as session:
-        service = GitHubEventService(session)
-        summary_events = service.get_github_events_by_event_types(
-            user_id, target_date, GitHubEventService.SUMMARY_EVENT_TYPES
-        )
-        texts = []
-        for event in summary_events:
-            if event.commit_model is not None:
-                texts.append(event.commit_model.commit_detail_text)
-            elif event.event_type == "PullRequestEvent":
-                texts.append(event.event_model.pull_request_summary_text)
-        summary_text = "\n".join(texts)
-
-    if len(summary_text) > 50000:
-        summary_text = summary_text[:50000]
-        logger.info(
-            f"GitHub 요약 텍스트 길이 제한: user_id={user_id}, target_date={target_date}, text_length={len(summary_text)}"
-        )
-    return summary_text
-
-
-def _collect_jira_events(user: UserContext, target_date: date) -> str:
-    with get_db_session() as session:
-        service = JiraEventService(session)
-        events = service.save_jira_events(user.id, target_date)
-        issue_details = "\n\n".join(
-            e.issue_model.issue_detail_text(target_date, user.tz_info) for e in events
-        )
+    """
+    start_date ~ end_date 기간을 백필한다.
+    날짜마다 수집하지 않고 플랫폼별로 전체 기간을 한 번만 수집한 뒤, 날짜별로 나누어 요약한다.
+    """
+    lock_key = LockKey.COLLECT_EVENTS_AND_SUMMARIZE_WORK_LOG_TASK + f":user_id:{user_id}:backfill"
+    with distributed_lock(lock_key, timeout=300, auto_renewal=True) as acquired:
+        if not acquired:
+            logger.warning("backfill task is already running, skipping...")
+            return
 
-    if len(issue_details) > 50000:
-        issue_details = issue_details[:50000]
-        logger.info(
-            f"Jira 이슈 상세 정보 길이 제한: user_id={user.id}, target_date={target_date}, details_length={len(issue_details)}"
-        )
-    return issue_details
+        with get_db_session() as session:
+            user_service = UserService(session)
+            user = user_service.get_user_by_id_or_throw(user_id)
+            user_context = UserContext.from_entity(user)
+        backfill_events_and_summarize(user_context, start_date, end_date)
 
 
-def _collect_slack_events(user: UserContext, target_date: date) -> str:
+def _get_user_contexts() -> list[UserContext]:
     with get_db_session() as session:
-        service = SlackMessageService(session)
-        messages = service.save_slack_messages(user.id, target_date)
-        message_details = "\n".join(f"[#{m.channel_name}] {m.message_text}" for m in messages)
-
-    if len(message_details) > 50000:
-        message_details = message_details[:50000]
+        user_service = UserService(session)
+        users = user_service.get_users()  # fixme n+1
+        return [UserContext.from_entity(user) for user in users]
+
+
+def _get_due_buckets(utc_now: datetime) -> dict[tuple[str, date], list[UserContext]]:
+    """
+    타임존별로 사용자를 묶고, 현지 시각이 local_trigger_hour를 지났는데 어제 날짜를 아직 처리하지 않은
+    (타임존, target_date) 그룹의 사용자를 반환
+    """
+    trigger_hour = get_settings().collect_task.local_trigger_hour
+    users_by_timezone: dict[str, list[UserContext]] = defaultdict(list)
+    for user in _get_user_contexts():
+        users_by_timezone[str(user.tz_info)].append(user)
+
+    cache_service = CacheService()
+    due_buckets: dict[tuple[str, date], list[UserContext]] = {}
+    for timezone, users in users_by_timezone.items():
+        tz_info = ZoneInfo(timezone)
+        if not has_local_hour_passed(utc_now, tz_info, trigger_hour):
+            continue
+        target_date = get_yesterday(tz_info)
+        if cache_service.exists(_get_bucket_done_key(timezone, target_date)):
+            continue
         logger.info(
-            f"Slack 메시지 길이 제한: user_id={user.id}, target_date={target_date}, message_length={len(message_details)}"
-        )
-    return message_details
-
-
-def _summarize_github(user: UserContext, target_date: date, commit_message: str):
-    llm_config = SummaryOllamaConfig()
-    prompt = GITHUB_COMMIT_SUMMARY_PROMPT
-
-    try:
-        llm_agent = LLMAgent.create_with_ollama(llm_config)
-        summary_text = llm_agent.query(prompt, commit_message=commit_message)
-    except Exception:
-        logger.exception(f"LLM 요약 실패 (GitHub): user_id={user.id}, target_date={target_date}")
-        raise
-
-    with get_db_session() as session:
-        service = WorkLogService(session)
-        service.save_platform_work_log(
-            user_id=user.id,
-            target_date=target_date,
-            platform=PlatformEnum.GITHUB,
-            content=summary_text,
-            model_name=llm_config.model,
-            prompt=prompt.template,
+            f"수집 대상 타임존 그룹: timezone={timezone}, target_date={target_date}, users={len(users)}"
         )
+        due_buckets[(timezone, target_date)] = users
+    return due_buckets
 
 
-def _summarize_jira(user: UserContext, target_date: date, issue_details: str):
-    llm_config = SummaryOllamaConfig()
-    prompt = JIRA_ISSUE_SUMMARY_PROMPT
-
-    try:
-        llm_agent = LLMAgent.create_with_ollama(llm_config)
-        summary_text = llm_agent.query(prompt, issue_details=issue_details)
-    except Exception:
-        logger.exception(f"LLM 요약 실패 (Jira): user_id={user.id}, target_date={target_date}")
-        raise
+def _mark_buckets_done(buckets: list[tuple[str, date]]):
+    cache_service = CacheService()
+    for timezone, target_date in buckets:
+        cache_service.set(_get_bucket_done_key(timezone, target_date), True, ex=CacheTTL.HOURS_24)
 
-    with get_db_session() as session:
-        service = WorkLogService(session)
-        service.save_platform_work_log(
-            user_id=user.id,
-            target_date=target_date,
-            platform=PlatformEnum.JIRA,
-            content=summary_text,
-            model_name=llm_config.model,
-            prompt=prompt.template,
-        )
 
+def _get_bucket_done_key(timezone: str, target_date: date) -> str:
+    return ClusterKey.COLLECT_BUCKET_DONE.format(timezone=timezone, target_date=target_date)
 
-def _summarize_slack(user: UserContext, target_date: date, message_details: str):
-    llm_config = SummaryOllamaConfig()
-    prompt = SLACK_MESSAGE_SUMMARY_PROMPT
-
-    try:
-        llm_agent = LLMAgent.create_with_ollama(llm_config)
-        summary_text = llm_agent.query(prompt, message_details=message_details)
-    except Exception:
-        logger.exception(f"LLM 요약 실패 (Slack): user_id={user.id}, target_date={target_date}")
-        raise
 
+def _plan_steps(users: list[UserContext]):
     with get_db_session() as session:
-        service = WorkLogService(session)
-        service.save_platform_work_log(
-            user_id=user.id,
-            target_date=target_date,
-            platform=PlatformEnum.SLACK,
-            content=summary_text,
-            model_name=llm_config.model,
-            prompt=prompt.template,
-        )
+        service = PipelineRunService(session)
+        for user in users:
+            service.plan_steps(user.id, get_yesterday(user.tz_info), get_user_platforms(user))
@@ -0,0 +1,23 @@
+from datetime import date
+
+from pydantic import BaseModel
+
+from dev_blackbox.core.enum import PlatformEnum
+from dev_blackbox.task.context.user_context import UserContext
+
+
+class SummaryJob(BaseModel):
+    """
+    수집 단계에서 요약 단계로 전달되는 작업 단위.
+    어느 인스턴스의 요약 워커든 꺼내서 요약하고 업무 일지를 저장할 수 있도록 필요한 정보를 모두 담는다.
+    """
+
+    # 같은 (사용자, 날짜) 수집에서 만들어진 작업 묶음 (SummaryJobQueue의 요약 그룹)
+    group_id: str
+    user: UserContext
+    target_date: date
+    platform: PlatformEnum
+    # 요약 입력 (map-reduce 요약 시 여러 chunk)
+    chunks: list[str]
+    # 수집 시작 시 조회한 플랫폼별 저장된 요약의 입력 지문 (입력 변경이 없으면 LLM 요약 생략)
+    input_fingerprints: dict[PlatformEnum, str | None]
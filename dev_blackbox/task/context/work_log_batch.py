@@ -0,0 +1,36 @@
+import threading
+from dataclasses import dataclass, field
+
+from dev_blackbox.core.enum import PlatformEnum
+from dev_blackbox.service.model.platform_work_log_model import PlatformWorkLogDraft
+
+
+@dataclass
+class WorkLogBatch:
+    """
+    사용자 1명의 실행 단위(unit of work).
+    플랫폼별 요약 결과를 메모리에 모았다가 마지막에 일일 업무 일지와 함께 한 트랜잭션으로 저장한다.
+    플랫폼 요약은 서로 다른 스레드에서 실행되므로 add()는 lock으로 보호한다.
+    """
+
+    # 실행 시작 시 한 번에 조회한 플랫폼별 저장된 요약의 입력 지문
+    input_fingerprints: dict[PlatformEnum, str | None]
+    work_logs: list[PlatformWorkLogDraft] = field(default_factory=list)
+    # 요약 단계가 끝난 플랫폼 (입력 지문이 같아 저장할 업무 일지가 없는 플랫폼 포함)
+    summarized_platforms: list[PlatformEnum] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def is_up_to_date(self, platform: PlatformEnum, input_fingerprint: str) -> bool:
+        return self.input_fingerprints.get(platform) == input_fingerprint
+
+    def add(self, platform: PlatformEnum, work_log: PlatformWorkLogDraft | None):
+        with self._lock:
+            if work_log is not None:
+                self.work_logs.append(work_log)
+            self.summarized_platforms.append(platform)
+
+    def get_results(self) -> list[tuple[PlatformEnum, PlatformWorkLogDraft | None]]:
+        """요약 단계가 끝난 플랫폼별 (플랫폼, 업무 일지) 목록. 다른 batch에 add()로 다시 모을 때 사용"""
+        with self._lock:
+            work_logs = {work_log.platform: work_log for work_log in self.work_logs}
+            return [(platform, work_logs.get(platform)) for platform in self.summarized_platforms]
@@ -0,0 +1,125 @@
+"""
+파이프라인 모드의 요약 작업 큐와 (사용자, 날짜) 단위 요약 그룹 기록.
+
+수집 워커는 요약 그룹을 열고 요약 작업(SummaryJob)을 공유 큐에 넣은 뒤 기다리지 않고 다음 사용자로 넘어간다.
+어느 인스턴스의 요약 워커든 작업을 꺼내 요약하고 complete()로 결과를 그룹에 기록하며,
+그룹의 마지막 작업을 끝낸 요약 워커가 모인 결과로 업무 일지를 저장한 뒤 close()로 그룹을 닫는다.
+그룹 기록은 ttl_seconds 뒤 만료되므로, 요약 워커가 중단되어 그룹이 닫히지 않아도 재시도 태스크가 다시 처리할 수 있다.
+"""
+
+import pickle
+from datetime import date
+
+from redis import Redis
+from redis.client import Pipeline
+
+from dev_blackbox.core.cache import QueueService, get_redis_client
+from dev_blackbox.core.const import CacheTTL, QueueKey
+from dev_blackbox.core.enum import PlatformEnum
+from dev_blackbox.service.model.platform_work_log_model import PlatformWorkLogDraft
+from dev_blackbox.task.context.summary_job import SummaryJob
+
+SummaryResult = tuple[PlatformEnum, PlatformWorkLogDraft | None]
+
+
+class SummaryJobQueue:
+
+    def __init__(
+        self,
+        cache_client: Redis | None = None,
+    ):
+        self.cache_client = cache_client or get_redis_client()
+        self.queue_service = QueueService(self.cache_client)
+
+    def open_group(
+        self,
+        user_id: int,
+        target_date: date,
+        group_id: str,
+        remaining: int,
+        results: list[SummaryResult],
+        ttl_seconds: int,
+    ) -> bool:
+        """
+        요약 작업 remaining개를 기다리는 그룹을 연다. results는 수집 단계에서 이미 끝난 플랫폼의 결과(빈 업무 일지 등).
+        같은 (사용자, 날짜)의 그룹이 이미 열려 있으면 열지 않고 False.
+        """
+        group_key, results_key = self._get_keys(user_id, target_date)
+
+        def open_(pipeline: Pipeline) -> bool:
+            if pipeline.exists(group_key):
+                return False
+            pipeline.multi()
+            pipeline.hset(group_key, mapping={"group_id": group_id, "remaining": remaining})
+            pipeline.expire(group_key, ttl_seconds)
+            # 만료된 이전 그룹의 결과가 섞이지 않도록
+            pipeline.delete(results_key)
+            if results:
+                pipeline.rpush(results_key, *(pickle.dumps(result) for result in results))
+                pipeline.expire(results_key, ttl_seconds)
+            return True
+
+        return self.cache_client.transaction(open_, group_key, value_from_callable=True)
+
+    def is_open(self, user_id: int, target_date: date) -> bool:
+        group_key, _ = self._get_keys(user_id, target_date)
+        return bool(self.cache_client.exists(group_key))
+
+    def is_current(self, job: SummaryJob) -> bool:
+        """작업의 그룹이 아직 열려 있는지. 그룹이 만료되어 재시도 태스크가 다시 처리하는 작업이면 False"""
+        group_key, _ = self._get_keys(job.user.id, job.target_date)
+        group_id = self.cache_client.hget(group_key, "group_id")
+        return _decode(group_id) == job.group_id
+
+    def push(self, job: SummaryJob):
+        self.queue_service.push(QueueKey.SUMMARY_JOB, job, ex=CacheTTL.HOURS_24)
+
+    def pop(self, timeout: int = 1) -> SummaryJob | None:
+        return self.queue_service.pop(QueueKey.SUMMARY_JOB, timeout=timeout)
+
+    def complete(self, job: SummaryJob, result: SummaryResult | None) -> list[SummaryResult] | None:
+        """
+        작업 완료를 그룹에 기록한다. 요약에 실패한 작업은 result 없이 완료한다.
+        그룹의 마지막 작업이면 모인 결과를 반환하고, 아니거나 그룹이 만료(또는 다른 그룹으로 교체)되었으면 None.
+        """
+        group_key, results_key = self._get_keys(job.user.id, job.target_date)
+
+        def complete_(pipeline: Pipeline) -> int | None:
+            group_id, remaining = pipeline.hmget(  # pyright: ignore [reportGeneralTypeIssues]
+                group_key, ["group_id", "remaining"]
+            )
+            if _decode(group_id) != job.group_id or remaining is None:
+                return None
+            remaining = int(remaining) - 1
+            ttl = pipeline.ttl(group_key)
+            pipeline.multi()
+            pipeline.hset(group_key, "remaining", remaining)
+            if result is not None:
+                pipeline.rpush(results_key, pickle.dumps(result))
+                if int(ttl) > 0:  # pyright: ignore [reportArgumentType]
+                    pipeline.expire(results_key, ttl)
+            return remaining
+
+        remaining = self.cache_client.transaction(complete_, group_key, value_from_callable=True)
+        if remaining != 0:
+            return None
+        items: list[bytes] = self.cache_client.lrange(  # pyright: ignore [reportAssignmentType]
+            results_key, 0, -1
+        )
+        return [pickle.loads(item) for item in items]
+
+    def close(self, user_id: int, target_date: date):
+        self.cache_client.delete(*self._get_keys(user_id, target_date))
+
+    @staticmethod
+    def _get_keys(user_id: int, target_date: date) -> tuple[str, str]:
+        return (
+            QueueKey.SUMMARY_JOB_GROUP.format(user_id=user_id, target_date=target_date),
+            QueueKey.SUMMARY_JOB_GROUP_RESULTS.format(user_id=user_id, target_date=target_date),
+        )
+
+
+def _decode(value: bytes | str | None) -> str | None:
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return value
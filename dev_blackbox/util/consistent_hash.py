@@ -0,0 +1,32 @@
+import bisect
+import hashlib
+
+
+class ConsistentHashRing:
+    """
+    가상 노드 기반 Consistent Hashing 링.
+    노드가 추가/제거되어도 대부분의 키는 기존 노드에 그대로 매핑된다.
+
+    ring = ConsistentHashRing(["instance-a", "instance-b"])
+    ring.get_node("user:1")  # "instance-a" or "instance-b"
+    """
+
+    def __init__(self, nodes: list[str], virtual_nodes: int = 100):
+        self._ring: list[tuple[int, str]] = sorted(
+            (self._hash(f"{node}#{i}"), node) for node in set(nodes) for i in range(virtual_nodes)
+        )
+        self._hashes = [h for h, _ in self._ring]
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        return int(hashlib.md5(key.encode("utf-8")).hexdigest(), 16)
+
+    @property
+    def nodes(self) -> list[str]:
+        return sorted({node for _, node in self._ring})
+
+    def get_node(self, key: str) -> str:
+        if not self._ring:
+            raise ValueError("ConsistentHashRing has no nodes.")
+        index = bisect.bisect(self._hashes, self._hash(key)) % len(self._ring)
+        return self._ring[index][1]
@@ -14,6 +14,34 @@ def get_yesterday(tz_info: ZoneInfo) -> date:
     return datetime.now(tz_info).date() - timedelta(days=1)
 
 
+def get_date_range(start_date: date, end_date: date) -> list[date]:
+    """start_date ~ end_date (양 끝 포함) 날짜 목록"""
+    return [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+
+
+def get_date_from_timestamp(timestamp: str | float, tz_info: ZoneInfo) -> date:
+    """Unix timestamp(Slack ts 등)를 tz_info 기준 날짜로 변환"""
+    return datetime.fromtimestamp(float(timestamp), tz=tz_info).date()
+
+
+def is_local_hour(utc_now: datetime, tz_info: ZoneInfo, hour: int) -> bool:
+    """utc_now 시점에 tz_info 기준 현지 시각이 hour 시대인지 여부"""
+    return utc_now.astimezone(tz_info).hour == hour
+
+
+def has_local_hour_passed(utc_now: datetime, tz_info: ZoneInfo, hour: int) -> bool:
+    """utc_now 시점에 tz_info 기준 오늘 현지 시각 hour시가 되었는지(지났는지) 여부"""
+    return utc_now.astimezone(tz_info).hour >= hour
+
+
+def get_latest_hourly_run_time(utc_now: datetime, minute: int) -> datetime:
+    """매시 minute분에 실행되는 작업의 utc_now 이전(포함) 가장 최근 예약 시각"""
+    run_time = utc_now.replace(minute=minute, second=0, microsecond=0)
+    if run_time > utc_now:
+        run_time -= timedelta(hours=1)
+    return run_time
+
+
 def get_daily_timestamp_range(target_date: date, tz_info: ZoneInfo) -> tuple[float, float]:
     """
     target_date를 날짜 기준 시작/종료 Unix timestamp 문자열로 변환
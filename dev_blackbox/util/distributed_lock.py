@@ -1,7 +1,10 @@
 import logging
+import threading
 from contextlib import contextmanager
 from typing import Generator
 
+from redis.lock import Lock
+
 from dev_blackbox.core.cache import LockService
 
 logger = logging.getLogger(__name__)
@@ -12,6 +15,7 @@ def distributed_lock(
     lock_key: str,
     timeout: int = 60,
     blocking_timeout: int = 0,
+    auto_renewal: bool = False,
 ) -> Generator[bool, None, None]:
     """
     Args:
@@ -21,6 +25,8 @@ def distributed_lock(
         blocking_timeout: 락 획득 대기 시간 (초).
                          0이면 즉시 반환 (non-blocking),
                          양수면 해당 시간만큼 락 획득을 기다림.
+        auto_renewal: True면 블록 실행 중 timeout/3 주기로 락 만료 시간을 timeout으로 갱신.
+                      프로세스가 죽으면 갱신이 멈춰 timeout 이후 다른 인스턴스가 락을 획득할 수 있다.
 
     Yields:
         bool: 락 획득 성공 여부
@@ -50,9 +56,19 @@ def distributed_lock(
     else:
         logger.info(f"Failed to acquire lock (already held): {lock_key}")
 
+    renewal_stop = threading.Event()
+    if acquired and auto_renewal:
+        threading.Thread(
+            target=_renew_lock,
+            args=(lock, lock_key, timeout, renewal_stop),
+            name=f"lock-renewal:{lock_key}",
+            daemon=True,
+        ).start()
+
     try:
         yield acquired
     finally:
+        renewal_stop.set()
         if acquired:
             try:
                 lock.release()
@@ -60,3 +76,14 @@ def distributed_lock(
             except Exception as e:
                 # 이미 만료되었거나 다른 이유로 해제 실패
                 logger.warning(f"Failed to release lock {lock_key}: {e}")
+
+
+def _renew_lock(lock: Lock, lock_key: str, timeout: int, stop_event: threading.Event) -> None:
+    interval = max(1, timeout // 3)
+    while not stop_event.wait(interval):
+        try:
+            lock.extend(timeout, replace_ttl=True)
+            logger.debug(f"Lock renewed: {lock_key}")
+        except Exception as e:
+            logger.warning(f"Failed to renew lock {lock_key}: {e}")
+            return
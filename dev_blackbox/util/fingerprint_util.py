@@ -0,0 +1,15 @@
+import hashlib
+
+_SEPARATOR = "\x00"
+
+
+def build_fingerprint(*parts: str) -> str:
+    """
+    입력 값들을 순서대로 이어 붙인 SHA-256 hex digest.
+    구분자를 넣어 ("ab", "c")와 ("a", "bc")가 같은 값이 되지 않도록 한다.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(_SEPARATOR.encode("utf-8"))
+    return digest.hexdigest()
@@ -0,0 +1,137 @@
+"""
+LLM 입력 텍스트를 토큰 예산 안에 채워 넣는다.
+
+pack_input(): 항목은 우선순위(priority 오름차순) → 전달 순서대로 예산을 채우고, 출력은 position 순서로 이어 붙인다.
+예산보다 큰 항목은 항목 단위로 잘라 넣고, 남은 예산이 너무 작으면 나머지 항목은 버린다.
+
+split_into_chunks(): 항목을 버리지 않고 group(레포/이슈/채널) 경계에서 예산 크기의 chunk로 나눈다. (map-reduce 요약용)
+"""
+
+import math
+from typing import NamedTuple
+
+# 토큰 수 추정: UTF-8 3바이트당 1토큰 (영문/코드 약 3자, 한글 1자 = 1토큰)
+_BYTES_PER_TOKEN = 3
+# 추정 오차 대비 여유분
+_BUDGET_SAFETY_RATIO = 0.9
+# 남은 예산이 이보다 작으면 잘라 넣지 않고 버린다
+_MIN_TRUNCATED_TOKENS = 16
+TRUNCATED_MARKER = "\n... (truncated)"
+
+
+class PackItem(NamedTuple):
+    text: str
+    # 작을수록 먼저 예산을 채운다
+    priority: int = 0
+    # 출력 순서
+    position: int = 0
+    # 항목 하나가 차지할 수 있는 최대 토큰 수
+    max_tokens: int | None = None
+    # chunk 분할 경계 (같은 group은 가능하면 같은 chunk에 담는다)
+    group: str = ""
+
+
+class PackedInput(NamedTuple):
+    text: str
+    estimated_tokens: int
+    included_count: int
+    truncated_count: int
+    dropped_count: int
+
+    @property
+    def is_reduced(self) -> bool:
+        return self.truncated_count > 0 or self.dropped_count > 0
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text.encode("utf-8")) / _BYTES_PER_TOKEN)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """추정 토큰 수가 max_tokens 이하가 되도록 뒤를 잘라내고 표시를 붙인다."""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    max_bytes = max_tokens * _BYTES_PER_TOKEN - len(TRUNCATED_MARKER.encode("utf-8"))
+    if max_bytes <= 0:
+        return ""
+    truncated = text.encode("utf-8")[:max_bytes].decode("utf-8", errors="ignore")
+    return truncated.rstrip() + TRUNCATED_MARKER
+
+
+def get_input_token_budget(context_window: int, num_predict: int, prompt_text: str) -> int:
+    """컨텍스트 윈도우에서 프롬프트(입력 제외)와 응답(num_predict) 몫을 뺀 입력 토큰 예산"""
+    available = context_window - num_predict - estimate_tokens(prompt_text)
+    return max(0, int(available * _BUDGET_SAFETY_RATIO))
+
+
+def pack_input(items: list[PackItem], budget_tokens: int, separator: str = "\n") -> PackedInput:
+    separator_tokens = estimate_tokens(separator)
+    remaining = budget_tokens
+    packed: list[tuple[int, str]] = []
+    truncated_count = 0
+
+    # sorted()는 안정 정렬이므로 같은 우선순위 안에서는 전달 순서(최신순 등)를 유지
+    for item in sorted(items, key=lambda i: i.priority):
+        if not item.text:
+            continue
+        cost = separator_tokens if packed else 0
+        limit = remaining - cost
+        if item.max_tokens is not None:
+            limit = min(limit, item.max_tokens)
+        if limit < _MIN_TRUNCATED_TOKENS:
+            continue
+
+        text = truncate_to_tokens(item.text, limit)
+        if not text:
+            continue
+        if text != item.text:
+            truncated_count += 1
+        packed.append((item.position, text))
+        remaining -= cost + estimate_tokens(text)
+
+    packed.sort(key=lambda p: p[0])
+    non_empty_count = sum(1 for i in items if i.text)
+    return PackedInput(
+        text=separator.join(text for _, text in packed),
+        estimated_tokens=budget_tokens - remaining,
+        included_count=len(packed),
+        truncated_count=truncated_count,
+        dropped_count=non_empty_count - len(packed),
+    )
+
+
+def split_into_chunks(
+    items: list[PackItem], budget_tokens: int, separator: str = "\n"
+) -> list[str]:
+    """
+    position 순서로 항목을 group 단위로 모아 chunk당 budget_tokens 이하가 되도록 나눈다.
+    한 group이 예산보다 크면 항목 경계에서, 한 항목이 예산보다 크면 잘라서 담는다.
+    """
+    separator_tokens = estimate_tokens(separator)
+    groups: dict[str, list[str]] = {}
+    for item in sorted(items, key=lambda i: i.position):
+        if not item.text:
+            continue
+        limit = budget_tokens if item.max_tokens is None else min(budget_tokens, item.max_tokens)
+        groups.setdefault(item.group, []).append(truncate_to_tokens(item.text, limit))
+
+    chunks: list[list[str]] = []
+    current: list[str] = []
+    current_tokens = 0
+    for texts in groups.values():
+        group_tokens = sum(estimate_tokens(t) for t in texts) + separator_tokens * (len(texts) - 1)
+        # group이 현재 chunk에 다 들어가지 않으면 새 chunk에서 시작
+        if current and current_tokens + separator_tokens + group_tokens > budget_tokens:
+            chunks.append(current)
+            current, current_tokens = [], 0
+        for text in texts:
+            cost = estimate_tokens(text) + (separator_tokens if current else 0)
+            if current and current_tokens + cost > budget_tokens:
+                chunks.append(current)
+                current, current_tokens = [], 0
+                cost = estimate_tokens(text)
+            current.append(text)
+            current_tokens += cost
+    if current:
+        chunks.append(current)
+    return [separator.join(chunk) for chunk in chunks]
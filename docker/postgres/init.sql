@@ -88,6 +88,7 @@ CREATE TABLE IF NOT EXISTS github_event
     target_date           DATE         NOT NULL,
     event                 JSONB        NOT NULL,
     commit                JSONB        NULL,
+    commit_fetch_attempts INT          NOT NULL DEFAULT 0,
 
     created_at            TIMESTAMPTZ  NOT NULL DEFAULT NOW(),
     updated_at            TIMESTAMPTZ  NOT NULL DEFAULT NOW(),
@@ -116,6 +117,7 @@ COMMENT ON COLUMN github_event.event_type IS 'GitHub 이벤트 타입 (PushEvent
 COMMENT ON COLUMN github_event.target_date IS '수집 대상 날짜';
 COMMENT ON COLUMN github_event.event IS '이벤트 원본 데이터 (JSONB)';
 COMMENT ON COLUMN github_event.commit IS '커밋 상세 데이터 (JSONB)';
+COMMENT ON COLUMN github_event.commit_fetch_attempts IS '커밋 조회 실패 횟수 (최대 횟수에 도달하면 다시 조회하지 않음)';
 
 
 -- platform_work_log 테이블 (플랫폼별 업무 일지 LLM 요약)
@@ -129,6 +131,7 @@ CREATE TABLE IF NOT EXISTS platform_work_log
     embedding   vector(1024) NULL,
     model_name  VARCHAR(100) NOT NULL,
     prompt      TEXT         NOT NULL,
+    input_fingerprint VARCHAR(64) NULL,
 
     created_at  TIMESTAMPTZ  NOT NULL DEFAULT NOW(),
     updated_at  TIMESTAMPTZ  NOT NULL DEFAULT NOW(),
@@ -156,6 +159,87 @@ COMMENT ON COLUMN platform_work_log.content IS 'LLM 생성 요약 텍스트';
 COMMENT ON COLUMN platform_work_log.embedding IS '요약 임베딩 벡터 (1024차원)';
 COMMENT ON COLUMN platform_work_log.model_name IS '사용 LLM 모델명';
 COMMENT ON COLUMN platform_work_log.prompt IS '요약 생성에 사용된 프롬프트';
+COMMENT ON COLUMN platform_work_log.input_fingerprint IS 'LLM 입력 지문 (모델명 + 프롬프트 템플릿 + 입력 텍스트 SHA-256)';
+
+
+-- pipeline_run_step 테이블 (수집/요약 실행 원장)
+CREATE TABLE IF NOT EXISTS pipeline_run_step
+(
+    id            BIGSERIAL PRIMARY KEY,
+    user_id       BIGINT      NOT NULL,
+    target_date   DATE        NOT NULL,
+    platform      VARCHAR(20) NOT NULL,
+    stage         VARCHAR(20) NOT NULL,
+    status        VARCHAR(20) NOT NULL,
+    attempts      INTEGER     NOT NULL DEFAULT 0,
+    error         TEXT        NULL,
+    next_retry_at TIMESTAMPTZ NULL,
+
+    created_at    TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at    TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    CONSTRAINT fk_pipeline_run_step_user FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE RESTRICT,
+
+    CONSTRAINT uq_pipeline_run_step_user_date_platform_stage UNIQUE (user_id, target_date, platform, stage)
+);
+
+CREATE TRIGGER tr_pipeline_run_step_updated_at
+    BEFORE UPDATE
+    ON pipeline_run_step
+    FOR EACH ROW
+EXECUTE FUNCTION update_updated_at_column();
+
+CREATE INDEX idx_pipeline_run_step_001 ON pipeline_run_step (status, next_retry_at);
+CREATE INDEX idx_pipeline_run_step_002 ON pipeline_run_step (status, updated_at);
+
+COMMENT ON TABLE pipeline_run_step IS '수집/요약 실행 원장 (사용자/날짜/플랫폼/단계별 상태)';
+COMMENT ON COLUMN pipeline_run_step.user_id IS '사용자 FK';
+COMMENT ON COLUMN pipeline_run_step.target_date IS '수집/요약 대상 날짜';
+COMMENT ON COLUMN pipeline_run_step.platform IS '플랫폼 구분 (GITHUB, JIRA, SLACK 등)';
+COMMENT ON COLUMN pipeline_run_step.stage IS '실행 단계 (COLLECT, SUMMARIZE)';
+COMMENT ON COLUMN pipeline_run_step.status IS '실행 상태 (PENDING, RUNNING, SUCCEEDED, FAILED)';
+COMMENT ON COLUMN pipeline_run_step.attempts IS '실패 횟수';
+COMMENT ON COLUMN pipeline_run_step.error IS '마지막 실패 에러 메시지';
+COMMENT ON COLUMN pipeline_run_step.next_retry_at IS '다음 재시도 시각 (재시도 횟수 소진 시 NULL)';
+
+
+-- pipeline_metric 테이블 (수집/요약 단계별 계측)
+CREATE TABLE IF NOT EXISTS pipeline_metric
+(
+    id             BIGSERIAL PRIMARY KEY,
+    user_id        BIGINT      NOT NULL,
+    target_date    DATE        NOT NULL,
+    platform       VARCHAR(20) NOT NULL,
+    stage          VARCHAR(20) NOT NULL,
+    duration_ms    INTEGER     NOT NULL,
+    api_call_count INTEGER     NOT NULL DEFAULT 0,
+    input_size     INTEGER     NULL,
+    output_size    INTEGER     NULL,
+
+    created_at     TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at     TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    CONSTRAINT fk_pipeline_metric_user FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE RESTRICT
+);
+
+CREATE TRIGGER tr_pipeline_metric_updated_at
+    BEFORE UPDATE
+    ON pipeline_metric
+    FOR EACH ROW
+EXECUTE FUNCTION update_updated_at_column();
+
+CREATE INDEX idx_pipeline_metric_001 ON pipeline_metric (target_date, platform, stage);
+CREATE INDEX idx_pipeline_metric_002 ON pipeline_metric (user_id, target_date);
+
+COMMENT ON TABLE pipeline_metric IS '수집/요약 단계별 계측 (실행 1회의 사용자/날짜/플랫폼/단계별 합계)';
+COMMENT ON COLUMN pipeline_metric.user_id IS '사용자 FK';
+COMMENT ON COLUMN pipeline_metric.target_date IS '수집/요약 대상 날짜';
+COMMENT ON COLUMN pipeline_metric.platform IS '플랫폼 구분 (GITHUB, JIRA, SLACK 등)';
+COMMENT ON COLUMN pipeline_metric.stage IS '계측 단계 (FETCH, WAIT, PERSIST, TEXT, LLM, SAVE)';
+COMMENT ON COLUMN pipeline_metric.duration_ms IS '소요 시간 (ms)';
+COMMENT ON COLUMN pipeline_metric.api_call_count IS '외부 API 호출 수 (FETCH 단계)';
+COMMENT ON COLUMN pipeline_metric.input_size IS '입력 크기 (문자 수, LLM 단계)';
+COMMENT ON COLUMN pipeline_metric.output_size IS '출력 크기 (문자 수, TEXT/LLM 단계)';
 
 
 -- daily_work_log 테이블 (통합 일일 요약)
@@ -413,3 +497,74 @@ COMMENT ON COLUMN slack_message.message_ts IS 'Slack 메시지 타임스탬프 (
 COMMENT ON COLUMN slack_message.message_text IS '메시지 본문 (평문)';
 COMMENT ON COLUMN slack_message.message IS '메시지 원본 데이터 (JSONB)';
 COMMENT ON COLUMN slack_message.thread_ts IS '스레드 부모 타임스탬프';
+
+
+-- slack_message_log 테이블 (워크스페이스 단위 Slack 채널 메시지 로그)
+CREATE TABLE IF NOT EXISTS slack_message_log
+(
+    id              BIGSERIAL PRIMARY KEY,
+    slack_secret_id BIGINT       NOT NULL,
+    channel_id      VARCHAR(100) NOT NULL,
+    message_ts      VARCHAR(100) NOT NULL,
+    thread_ts       VARCHAR(100) NULL,
+    latest_reply    VARCHAR(100) NULL,
+    member_id       VARCHAR(128) NOT NULL,
+    message_text    TEXT         NOT NULL DEFAULT '',
+
+    created_at      TIMESTAMPTZ  NOT NULL DEFAULT NOW(),
+    updated_at      TIMESTAMPTZ  NOT NULL DEFAULT NOW(),
+
+    CONSTRAINT fk_slack_message_log_slack_secret FOREIGN KEY (slack_secret_id) REFERENCES slack_secret (id) ON DELETE RESTRICT,
+
+    CONSTRAINT uq_slack_message_log_secret_channel_ts UNIQUE (slack_secret_id, channel_id, message_ts)
+);
+
+CREATE TRIGGER tr_slack_message_log_updated_at
+    BEFORE UPDATE
+    ON slack_message_log
+    FOR EACH ROW
+EXECUTE FUNCTION update_updated_at_column();
+
+CREATE INDEX idx_slack_message_log_001 ON slack_message_log (slack_secret_id, channel_id, latest_reply);
+CREATE INDEX idx_slack_message_log_002 ON slack_message_log (created_at DESC);
+
+COMMENT ON TABLE slack_message_log IS '워크스페이스 단위 Slack 채널 메시지 로그 (채널 히스토리 증분 조회용)';
+COMMENT ON COLUMN slack_message_log.slack_secret_id IS 'Slack 인증 정보 FK (워크스페이스)';
+COMMENT ON COLUMN slack_message_log.channel_id IS 'Slack 채널 ID';
+COMMENT ON COLUMN slack_message_log.message_ts IS 'Slack 메시지 타임스탬프 (slack_secret_id, channel_id와 복합 UNIQUE)';
+COMMENT ON COLUMN slack_message_log.thread_ts IS '스레드 부모 타임스탬프 (부모 메시지는 message_ts와 같음)';
+COMMENT ON COLUMN slack_message_log.latest_reply IS '스레드 마지막 답글 타임스탬프 (동기화 시점 기준)';
+COMMENT ON COLUMN slack_message_log.member_id IS '작성자 Slack 멤버 ID';
+COMMENT ON COLUMN slack_message_log.message_text IS '메시지 본문 (평문)';
+
+
+-- slack_channel_cursor 테이블 (채널별 메시지 로그 동기화 커서)
+CREATE TABLE IF NOT EXISTS slack_channel_cursor
+(
+    id              BIGSERIAL PRIMARY KEY,
+    slack_secret_id BIGINT       NOT NULL,
+    channel_id      VARCHAR(100) NOT NULL,
+    oldest_ts       VARCHAR(100) NOT NULL,
+    latest_ts       VARCHAR(100) NOT NULL,
+
+    created_at      TIMESTAMPTZ  NOT NULL DEFAULT NOW(),
+    updated_at      TIMESTAMPTZ  NOT NULL DEFAULT NOW(),
+
+    CONSTRAINT fk_slack_channel_cursor_slack_secret FOREIGN KEY (slack_secret_id) REFERENCES slack_secret (id) ON DELETE RESTRICT,
+
+    CONSTRAINT uq_slack_channel_cursor_secret_channel UNIQUE (slack_secret_id, channel_id)
+);
+
+CREATE TRIGGER tr_slack_channel_cursor_updated_at
+    BEFORE UPDATE
+    ON slack_channel_cursor
+    FOR EACH ROW
+EXECUTE FUNCTION update_updated_at_column();
+
+CREATE INDEX idx_slack_channel_cursor_001 ON slack_channel_cursor (created_at DESC);
+
+COMMENT ON TABLE slack_channel_cursor IS '채널별 메시지 로그 동기화 커서';
+COMMENT ON COLUMN slack_channel_cursor.slack_secret_id IS 'Slack 인증 정보 FK (워크스페이스)';
+COMMENT ON COLUMN slack_channel_cursor.channel_id IS 'Slack 채널 ID (slack_secret_id와 복합 UNIQUE)';
+COMMENT ON COLUMN slack_channel_cursor.oldest_ts IS '로그 수집 시작 타임스탬프 (이전 날짜는 로그로 수집 불가)';
+COMMENT ON COLUMN slack_channel_cursor.latest_ts IS '마지막 동기화 타임스탬프 (high-water mark, 다음 동기화는 이후 메시지만 조회)';
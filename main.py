@@ -27,10 +27,15 @@ from dev_blackbox.controller.admin.admin_slack_secret_controller import (
     router as admin_slack_secret_router,
 )
 from dev_blackbox.controller.admin.admin_user_controller import router as admin_user_router
+from dev_blackbox.controller.admin.admin_pipeline_metric_controller import (
+    router as admin_pipeline_metric_router,
+)
 from dev_blackbox.core.config import get_settings
 from dev_blackbox.core.database import engine
+from dev_blackbox.core.http_client import close_http_client
 from dev_blackbox.core.middleware import RequestIdMiddleware
 from dev_blackbox.core.background_scheduler import scheduler
+from dev_blackbox.task.cluster_task import unregister_instance_task
 
 
 @asynccontextmanager
@@ -38,6 +43,8 @@ async def lifespan(_app: FastAPI):
     scheduler.start()
     yield
     scheduler.shutdown(wait=True)
+    close_http_client()
+    unregister_instance_task()
     engine.dispose()
 
 
@@ -80,6 +87,7 @@ app.include_router(work_log_router)
 app.include_router(admin_user_router)
 app.include_router(admin_jira_secret_router)
 app.include_router(admin_slack_secret_router)
+app.include_router(admin_pipeline_metric_router)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,499 @@
+import asyncio
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+from zoneinfo import ZoneInfo
+
+import httpx
+from redis import Redis
+
+from dev_blackbox.client.github_client import AsyncGitHubClient, GitHubClient
+from dev_blackbox.client.github_rate_limiter import GitHubRateLimiter
+from dev_blackbox.client.model.github_api_model import (
+    GithubCommitRef,
+    GithubEventModelList,
+    GithubPullRequestRef,
+)
+from tests.fixtures.github_fixture import (
+    create_github_commit_file_response,
+    create_github_commit_response,
+    create_github_compare_commit_response,
+    create_github_compare_response,
+    create_github_event_model,
+    create_github_graphql_commit_node,
+    create_github_search_commit_response,
+)
+
+
+class GitHubClientTest:
+
+    def test_fetch_events_by_date_since_event_id에_도달하면_조회를_중단한다(self, mocker):
+        # given
+        client = GitHubClient.create(token="token")
+        mock_fetch_events = mocker.patch.object(
+            client,
+            "fetch_events",
+            return_value=GithubEventModelList(
+                events=[
+                    create_github_event_model("103"),
+                    create_github_event_model("102"),
+                    create_github_event_model("101"),
+                    create_github_event_model("100"),
+                ]
+            ),
+        )
+
+        # when
+        result = client.fetch_events_by_date(
+            username="test",
+            target_date=date(2025, 1, 1),
+            tz_info=ZoneInfo("Asia/Seoul"),
+            since_event_id="101",
+        )
+
+        # then
+        assert [e.id for e in result.events] == ["103", "102"]
+        mock_fetch_events.assert_called_once()
+
+    def test_fetch_events_by_date_since_event_id가_없으면_다음_페이지를_조회한다(self, mocker):
+        # given
+        client = GitHubClient.create(token="token")
+        mock_fetch_events = mocker.patch.object(
+            client,
+            "fetch_events",
+            side_effect=[
+                GithubEventModelList(events=[create_github_event_model("101")]),
+                GithubEventModelList(events=[]),
+            ],
+        )
+
+        # when
+        result = client.fetch_events_by_date(
+            username="test",
+            target_date=date(2025, 1, 1),
+            tz_info=ZoneInfo("Asia/Seoul"),
+        )
+
+        # then
+        assert [e.id for e in result.events] == ["101"]
+        assert mock_fetch_events.call_count == 2
+
+    def test_fetch_events_by_date_range_기간_내_이벤트만_조회한다(self, mocker):
+        # given
+        client = GitHubClient.create(token="token")
+        mocker.patch.object(
+            client,
+            "fetch_events",
+            side_effect=[
+                GithubEventModelList(
+                    events=[
+                        create_github_event_model("104", created_at="2025-01-04T03:00:00Z"),
+                        create_github_event_model("103", created_at="2025-01-03T03:00:00Z"),
+                        create_github_event_model("102", created_at="2025-01-02T03:00:00Z"),
+                        create_github_event_model("101", created_at="2024-12-31T03:00:00Z"),
+                    ]
+                ),
+                GithubEventModelList(events=[]),
+            ],
+        )
+
+        # when
+        result = client.fetch_events_by_date_range(
+            username="test",
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 1, 3),
+            tz_info=ZoneInfo("Asia/Seoul"),
+        )
+
+        # then
+        assert [e.id for e in result.events] == ["103", "102"]
+
+    def test_fetch_events_ETag가_같으면_캐시한_응답을_사용한다(self, fake_redis: Redis):
+        # given
+        endpoint = "https://api.github.com/users/test/events"
+        events = [create_github_event_model("101").model_dump(mode="json")]
+        http_client = MagicMock()
+        http_client.get.side_effect = [
+            httpx.Response(
+                200,
+                json=events,
+                headers={"ETag": '"etag-1"'},
+                request=httpx.Request("GET", endpoint),
+            ),
+            httpx.Response(304, request=httpx.Request("GET", endpoint)),
+        ]
+        client = _create_client("token", http_client, fake_redis)
+
+        # when
+        first = client.fetch_events("test")
+        second = client.fetch_events("test")
+
+        # then
+        assert [e.id for e in first.events] == ["101"]
+        assert [e.id for e in second.events] == ["101"]
+        second_headers = http_client.get.call_args_list[1].kwargs["headers"]
+        assert second_headers["If-None-Match"] == '"etag-1"'
+
+    def test_fetch_events_토큰이_다르면_ETag_캐시를_공유하지_않는다(self, fake_redis: Redis):
+        # given
+        endpoint = "https://api.github.com/users/test/events"
+        http_client = MagicMock()
+        http_client.get.return_value = httpx.Response(
+            200,
+            json=[],
+            headers={"ETag": '"etag-1"'},
+            request=httpx.Request("GET", endpoint),
+        )
+        _create_client("token-a", http_client, fake_redis).fetch_events("test")
+
+        # when
+        _create_client("token-b", http_client, fake_redis).fetch_events("test")
+
+        # then
+        second_headers = http_client.get.call_args_list[1].kwargs["headers"]
+        assert "If-None-Match" not in second_headers
+
+    def test_fetch_org_member_logins_구성원이_많으면_다음_페이지를_조회한다(
+        self, fake_redis: Redis
+    ):
+        # given
+        request = httpx.Request("GET", "https://api.github.com/orgs/org/members")
+        http_client = MagicMock()
+        http_client.get.side_effect = [
+            httpx.Response(200, json=[{"login": f"User{i}"} for i in range(100)], request=request),
+            httpx.Response(200, json=[{"login": "Alice"}], request=request),
+        ]
+        client = _create_client("token", http_client, fake_redis)
+
+        # when
+        logins = client.fetch_org_member_logins("org")
+
+        # then
+        assert len(logins) == 101
+        assert "alice" in logins
+        assert http_client.get.call_args_list[1].kwargs["params"]["page"] == 2
+
+    def test_fetch_commit_캐시된_커밋은_API를_호출하지_않는다(self, fake_redis: Redis):
+        # given
+        repository_url = "https://api.github.com/repos/test/repo"
+        http_client = MagicMock()
+        http_client.get.return_value = httpx.Response(
+            200,
+            json=create_github_commit_response("abc123"),
+            request=httpx.Request("GET", f"{repository_url}/commits/abc123"),
+        )
+        _create_client("token-a", http_client, fake_redis).fetch_commit(repository_url, "abc123")
+
+        # when
+        commit = _create_client("token-b", http_client, fake_redis).fetch_commit(
+            repository_url, "abc123"
+        )
+
+        # then
+        assert commit.sha == "abc123"
+        http_client.get.assert_called_once()
+
+    def test_fetch_compare_커밋이_많으면_다음_페이지를_이어서_조회한다(self, fake_redis: Redis):
+        # given
+        repository_url = "https://api.github.com/repos/test/repo"
+        request = httpx.Request("GET", f"{repository_url}/compare/before...head")
+        http_client = MagicMock()
+        http_client.get.side_effect = [
+            httpx.Response(
+                200,
+                json=create_github_compare_response(
+                    commits=[
+                        create_github_compare_commit_response("sha-1"),
+                        create_github_compare_commit_response("sha-2"),
+                    ],
+                    total_commits=3,
+                    files=[create_github_commit_file_response("a.py")],
+                ),
+                request=request,
+            ),
+            httpx.Response(
+                200,
+                json=create_github_compare_response(
+                    commits=[create_github_compare_commit_response("head")],
+                    total_commits=3,
+                ),
+                request=request,
+            ),
+        ]
+        client = _create_client("token", http_client, fake_redis)
+
+        # when
+        compare = client.fetch_compare(repository_url, base="before", head="head")
+        cached_compare = client.fetch_compare(repository_url, base="before", head="head")
+
+        # then
+        assert [c.sha for c in compare.commits] == ["sha-1", "sha-2", "head"]
+        assert [f.filename for f in compare.files] == ["a.py"]
+        assert http_client.get.call_count == 2
+        assert http_client.get.call_args_list[1].kwargs["params"]["page"] == 2
+        assert cached_compare == compare
+
+    def test_fetch_commit_rate_limit에_걸리면_대기_후_재시도한다(self, mocker, fake_redis: Redis):
+        # given
+        repository_url = "https://api.github.com/repos/test/repo"
+        request = httpx.Request("GET", f"{repository_url}/commits/abc123")
+        http_client = MagicMock()
+        http_client.get.side_effect = [
+            httpx.Response(429, headers={"Retry-After": "30"}, request=request),
+            httpx.Response(200, json=create_github_commit_response("abc123"), request=request),
+        ]
+        mock_sleep = mocker.patch("dev_blackbox.client.github_rate_limiter.time.sleep")
+        client = _create_client("token", http_client, fake_redis)
+
+        # when
+        commit = client.fetch_commit(repository_url, "abc123")
+
+        # then
+        assert commit.sha == "abc123"
+        assert http_client.get.call_count == 2
+        mock_sleep.assert_called_once()
+        assert 0 < mock_sleep.call_args.args[0] <= 30
+
+    def test_search_commits_by_date_작성일로_검색하고_fork의_중복_커밋은_제외한다(
+        self, fake_redis: Redis
+    ):
+        # given
+        request = httpx.Request("GET", "https://api.github.com/search/commits")
+        http_client = MagicMock()
+        http_client.get.side_effect = [
+            httpx.Response(
+                200,
+                json={
+                    "total_count": 3,
+                    "incomplete_results": False,
+                    "items": [
+                        create_github_search_commit_response("sha-2"),
+                        create_github_search_commit_response("sha-1"),
+                    ],
+                },
+                request=request,
+            ),
+            httpx.Response(
+                200,
+                json={
+                    "total_count": 3,
+                    "incomplete_results": False,
+                    "items": [create_github_search_commit_response("sha-1", "fork/repo")],
+                },
+                request=request,
+            ),
+        ]
+        client = _create_client("token", http_client, fake_redis)
+        client.SEARCH_PER_PAGE = 2
+
+        # when
+        commits = client.search_commits_by_date("test", date(2025, 1, 1), ZoneInfo("Asia/Seoul"))
+
+        # then
+        assert [c.sha for c in commits] == ["sha-2", "sha-1"]
+        assert commits[1].repository.full_name == "test/repo"
+        params = http_client.get.call_args_list[0].kwargs["params"]
+        assert params["q"] == (
+            "author:test author-date:2025-01-01T00:00:00+09:00..2025-01-01T23:59:59+09:00"
+        )
+        assert http_client.get.call_args_list[1].kwargs["params"]["page"] == 2
+
+    def test_fetch_commits_by_graphql_여러_커밋을_한_번에_조회한다(self, fake_redis: Redis):
+        # given
+        http_client = MagicMock()
+        http_client.post.return_value = _create_graphql_response(
+            {
+                "c0": {"object": create_github_graphql_commit_node("sha-1")},
+                "c1": {"object": None},
+            }
+        )
+        client = _create_client("token", http_client, fake_redis)
+        found = GithubCommitRef("test/repo", "sha-1")
+        not_found = GithubCommitRef("test/other", "sha-2")
+
+        # when
+        result = client.fetch_commits_by_graphql([found, not_found])
+
+        # then
+        assert list(result) == [found]
+        assert result[found].stats.additions == 3
+        assert result[found].files == []
+        variables = http_client.post.call_args.kwargs["json"]["variables"]
+        assert variables == {
+            "o0": "test",
+            "n0": "repo",
+            "s0": "sha-1",
+            "o1": "test",
+            "n1": "other",
+            "s1": "sha-2",
+        }
+        http_client.post.assert_called_once()
+
+    def test_fetch_pull_requests_by_graphql_커밋이_많으면_cursor로_이어서_조회한다(
+        self, fake_redis: Redis
+    ):
+        # given
+        pull_request = {
+            "number": 7,
+            "title": "feat: new feature",
+            "body": "body",
+            "url": "https://github.com/test/repo/pull/7",
+            "state": "OPEN",
+            "merged": False,
+            "baseRefName": "main",
+            "headRefName": "feature",
+        }
+        http_client = MagicMock()
+        http_client.post.side_effect = [
+            _create_graphql_response(
+                {
+                    "p0": {
+                        "pullRequest": {
+                            **pull_request,
+                            "commits": {
+                                "pageInfo": {"hasNextPage": True, "endCursor": "cursor-1"},
+                                "nodes": [{"commit": create_github_graphql_commit_node("sha-1")}],
+                            },
+                        }
+                    }
+                }
+            ),
+            _create_graphql_response(
+                {
+                    "repository": {
+                        "pullRequest": {
+                            **pull_request,
+                            "commits": {
+                                "pageInfo": {"hasNextPage": False, "endCursor": None},
+                                "nodes": [{"commit": create_github_graphql_commit_node("sha-2")}],
+                            },
+                        }
+                    }
+                }
+            ),
+        ]
+        client = _create_client("token", http_client, fake_redis)
+        ref = GithubPullRequestRef("test/repo", 7)
+
+        # when
+        result = client.fetch_pull_requests_by_graphql([ref])
+
+        # then
+        detail = result[ref]
+        assert (detail.title, detail.base_ref, detail.head_ref) == (
+            "feat: new feature",
+            "main",
+            "feature",
+        )
+        assert [c.sha for c in detail.commits] == ["sha-1", "sha-2"]
+        second_variables = http_client.post.call_args_list[1].kwargs["json"]["variables"]
+        assert second_variables["after"] == "cursor-1"
+
+    def test_async_fetch_events_by_date_since_event_id에_도달하면_조회를_중단한다(self, mocker):
+        # given
+        client = AsyncGitHubClient.create(
+            token="token",
+            http_client=httpx.AsyncClient(),
+            semaphore=asyncio.Semaphore(1),
+        )
+        mock_fetch_events = mocker.patch.object(
+            client,
+            "fetch_events",
+            new=AsyncMock(
+                return_value=GithubEventModelList(
+                    events=[
+                        create_github_event_model("103"),
+                        create_github_event_model("102"),
+                        create_github_event_model("101"),
+                    ]
+                )
+            ),
+        )
+
+        # when
+        result = asyncio.run(
+            client.fetch_events_by_date(
+                username="test",
+                target_date=date(2025, 1, 1),
+                tz_info=ZoneInfo("Asia/Seoul"),
+                since_event_id="102",
+            )
+        )
+
+        # then
+        assert [e.id for e in result.events] == ["103"]
+        mock_fetch_events.assert_awaited_once()
+
+    def test_async_fetch_events_GitHubClient와_ETag_캐시를_공유한다(self, fake_redis: Redis):
+        # given
+        endpoint = "https://api.github.com/users/test/events"
+        events = [create_github_event_model("101").model_dump(mode="json")]
+        http_client = MagicMock()
+        http_client.get.return_value = httpx.Response(
+            200,
+            json=events,
+            headers={"ETag": '"etag-1"'},
+            request=httpx.Request("GET", endpoint),
+        )
+        _create_client("token", http_client, fake_redis).fetch_events("test")
+
+        async_http_client = MagicMock()
+        async_http_client.get = AsyncMock(
+            return_value=httpx.Response(304, request=httpx.Request("GET", endpoint))
+        )
+        client = AsyncGitHubClient.create(
+            token="token",
+            http_client=async_http_client,
+            semaphore=asyncio.Semaphore(1),
+            rate_limiter=GitHubRateLimiter(scope="token", cache_client=fake_redis),
+        )
+
+        # when
+        result = asyncio.run(client.fetch_events("test"))
+
+        # then
+        assert [e.id for e in result.events] == ["101"]
+        headers = async_http_client.get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"etag-1"'
+
+    def test_async_fetch_commit_캐시된_커밋은_API를_호출하지_않는다(self, fake_redis: Redis):
+        # given
+        repository_url = "https://api.github.com/repos/test/repo"
+        http_client = MagicMock()
+        http_client.get.return_value = httpx.Response(
+            200,
+            json=create_github_commit_response("abc123"),
+            request=httpx.Request("GET", f"{repository_url}/commits/abc123"),
+        )
+        _create_client("token", http_client, fake_redis).fetch_commit(repository_url, "abc123")
+
+        async_http_client = MagicMock()
+        async_http_client.get = AsyncMock()
+        client = AsyncGitHubClient.create(
+            token="token",
+            http_client=async_http_client,
+            semaphore=asyncio.Semaphore(1),
+            rate_limiter=GitHubRateLimiter(scope="token", cache_client=fake_redis),
+        )
+
+        # when
+        commit = asyncio.run(client.fetch_commit(repository_url, "abc123"))
+
+        # then
+        assert commit.sha == "abc123"
+        async_http_client.get.assert_not_called()
+
+
+def _create_client(token: str, http_client: MagicMock, fake_redis: Redis) -> GitHubClient:
+    return GitHubClient.create(
+        token=token,
+        http_client=http_client,
+        rate_limiter=GitHubRateLimiter(scope=token, cache_client=fake_redis),
+    )
+
+
+def _create_graphql_response(data: dict) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={"data": data},
+        request=httpx.Request("POST", "https://api.github.com/graphql"),
+    )
@@ -0,0 +1,168 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from redis import Redis
+
+from dev_blackbox.client.github_rate_limiter import GitHubRateLimiter
+from dev_blackbox.core.exception import GitHubRateLimitExceededException
+
+
+def _create_response(status_code: int = 200, headers: dict | None = None) -> httpx.Response:
+    return httpx.Response(
+        status_code,
+        headers=headers,
+        request=httpx.Request("GET", "https://api.github.com/users/test/events"),
+    )
+
+
+class GitHubRateLimiterTest:
+
+    def test_reserve_남은_요청이_충분하면_대기하지_않고_차감한다(self, fake_redis: Redis):
+        # given
+        limiter = GitHubRateLimiter(scope="token", cache_client=fake_redis)
+        reset_at = int(time.time()) + 3600
+        limiter.update(
+            _create_response(
+                headers={"X-RateLimit-Remaining": "4000", "X-RateLimit-Reset": str(reset_at)}
+            )
+        )
+
+        # when
+        wait_seconds = limiter.reserve()
+
+        # then
+        assert wait_seconds == 0
+        assert int(fake_redis.hget(limiter.key, "remaining")) == 3999  # type: ignore[arg-type]
+
+    def test_reserve_남은_요청이_reserve_이하면_예약마다_reset까지_간격을_둔다(
+        self, fake_redis: Redis
+    ):
+        # given
+        limiter = GitHubRateLimiter(scope="token", cache_client=fake_redis)
+        other_worker_limiter = GitHubRateLimiter(scope="token", cache_client=fake_redis)
+        reset_at = int(time.time()) + 100
+        limiter.update(
+            _create_response(
+                headers={"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": str(reset_at)}
+            )
+        )
+
+        # when
+        first_wait_seconds = limiter.reserve()
+        second_wait_seconds = other_worker_limiter.reserve()
+
+        # then
+        assert first_wait_seconds == 0
+        assert 9 < second_wait_seconds <= 10
+        assert int(fake_redis.hget(limiter.key, "remaining")) == 8  # type: ignore[arg-type]
+
+    def test_update_secondary_rate_limit이면_Retry_After만큼_모든_요청을_멈춘다(
+        self, fake_redis: Redis
+    ):
+        # given
+        limiter = GitHubRateLimiter(scope="token", cache_client=fake_redis)
+        other_worker_limiter = GitHubRateLimiter(scope="token", cache_client=fake_redis)
+
+        # when
+        retry_after = limiter.update(_create_response(403, headers={"Retry-After": "60"}))
+
+        # then
+        assert retry_after == 60
+        assert 50 < other_worker_limiter.reserve() <= 60
+
+    def test_update_rate_limit이_아닌_403은_재시도하지_않는다(self, fake_redis: Redis):
+        # given
+        limiter = GitHubRateLimiter(scope="token", cache_client=fake_redis)
+
+        # when
+        retry_after = limiter.update(_create_response(403))
+
+        # then
+        assert retry_after is None
+        assert limiter.reserve() == 0
+
+    def test_reserve_대기_시간이_최대_대기_시간을_넘으면_차감하지_않고_예외(
+        self, fake_redis: Redis
+    ):
+        # given
+        limiter = GitHubRateLimiter(scope="token", cache_client=fake_redis)
+        reset_at = int(time.time()) + 3600
+        limiter.update(
+            _create_response(
+                headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset_at)}
+            )
+        )
+
+        # when
+        with pytest.raises(GitHubRateLimitExceededException) as exc_info:
+            limiter.reserve()
+
+        # then
+        assert exc_info.value.wait_seconds > limiter.max_wait_seconds
+        assert int(fake_redis.hget(limiter.key, "remaining")) == 0  # type: ignore[arg-type]
+
+    def test_reserve_남은_요청이_있으면_최대_대기_시간을_넘어도_예외를_던지지_않는다(
+        self, fake_redis: Redis
+    ):
+        # given
+        limiter = GitHubRateLimiter(scope="token", cache_client=fake_redis)
+        reset_at = int(time.time()) + 3600
+        limiter.update(
+            _create_response(
+                headers={"X-RateLimit-Remaining": "2", "X-RateLimit-Reset": str(reset_at)}
+            )
+        )
+        limiter.reserve()
+
+        # when
+        wait_seconds = limiter.reserve()
+
+        # then
+        assert wait_seconds > limiter.max_wait_seconds
+        assert int(fake_redis.hget(limiter.key, "remaining")) == 0  # type: ignore[arg-type]
+
+    def test_reserve_여러_인스턴스가_동시에_예약하면_서로_다른_시각으로_분산된다(
+        self, fake_redis: Redis
+    ):
+        # given
+        limiters = [GitHubRateLimiter(scope="token", cache_client=fake_redis) for _ in range(4)]
+        reset_at = int(time.time()) + 100
+        limiters[0].update(
+            _create_response(
+                headers={"X-RateLimit-Remaining": "20", "X-RateLimit-Reset": str(reset_at)}
+            )
+        )
+
+        # when
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            wait_seconds = sorted(
+                executor.map(lambda i: limiters[i % len(limiters)].reserve(), range(20))
+            )
+
+        # then
+        assert wait_seconds[0] == 0
+        assert all(4 < b - a <= 5 for a, b in zip(wait_seconds, wait_seconds[1:]))
+        assert wait_seconds[-1] < 100
+        assert int(fake_redis.hget(limiters[0].key, "remaining")) == 0  # type: ignore[arg-type]
+
+    def test_reserve_여러_인스턴스가_동시에_예약해도_요청_수만큼_차감한다(self, fake_redis: Redis):
+        # given
+        limiters = [GitHubRateLimiter(scope="token", cache_client=fake_redis) for _ in range(4)]
+        reset_at = int(time.time()) + 3600
+        limiters[0].update(
+            _create_response(
+                headers={"X-RateLimit-Remaining": "4000", "X-RateLimit-Reset": str(reset_at)}
+            )
+        )
+
+        # when
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            wait_seconds = list(
+                executor.map(lambda i: limiters[i % len(limiters)].reserve(), range(200))
+            )
+
+        # then
+        assert wait_seconds == [0] * 200
+        assert int(fake_redis.hget(limiters[0].key, "remaining")) == 3800  # type: ignore[arg-type]
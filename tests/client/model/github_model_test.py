@@ -0,0 +1,96 @@
+from dev_blackbox.client.model.github_api_model import (
+    GithubCommitModel,
+    GithubCompareModel,
+    GithubPullRequestDetailModel,
+    GithubPushEventPayloadModel,
+    GithubSearchCommitModel,
+)
+from tests.fixtures.github_fixture import (
+    create_github_commit_file_response,
+    create_github_commit_response,
+    create_github_compare_commit_response,
+    create_github_compare_response,
+    create_github_search_commit_response,
+)
+
+
+def test_github_compare_to_push_commit_model_push의_모든_커밋을_합친다():
+    # given
+    compare = GithubCompareModel.model_validate(
+        create_github_compare_response(
+            commits=[
+                create_github_compare_commit_response("sha-1", "feat: first"),
+                create_github_compare_commit_response("sha-2", "fix: second"),
+            ],
+            files=[
+                create_github_commit_file_response("a.py", additions=3, deletions=1),
+                create_github_commit_file_response("b.py", additions=2, deletions=0),
+            ],
+        )
+    )
+
+    # when
+    commit = compare.to_push_commit_model("sha-2")
+
+    # then
+    assert commit.sha == "sha-2"
+    assert commit.commit.message == "- feat: first\n- fix: second"
+    assert (commit.stats.additions, commit.stats.deletions, commit.stats.total) == (5, 1, 6)
+    assert [f.filename for f in commit.files] == ["a.py", "b.py"]
+
+
+def test_github_push_event_payload_is_new_ref():
+    # given
+    payload = {"repository_id": 1, "push_id": 1, "ref": "refs/heads/main", "head": "abc"}
+
+    # when & then
+    assert GithubPushEventPayloadModel(**payload, before="0" * 40).is_new_ref
+    assert not GithubPushEventPayloadModel(**payload, before="def456").is_new_ref
+
+
+def test_github_pull_request_detail_to_commit_model_PR_커밋을_합친다():
+    # given
+    commits = [
+        GithubCommitModel.model_validate(create_github_commit_response(sha))
+        for sha in ["sha-1", "sha-2"]
+    ]
+    detail = GithubPullRequestDetailModel(
+        number=7,
+        title="feat: new feature",
+        url="https://github.com/test/repo/pull/7",
+        state="OPEN",
+        merged=False,
+        base_ref="main",
+        head_ref="feature",
+        commits=commits,
+    )
+
+    # when
+    commit = detail.to_commit_model()
+
+    # then
+    assert commit is not None
+    assert commit.sha == "sha-2"
+    assert commit.commit.message == "- fix: bug\n- fix: bug"
+    assert (commit.stats.additions, commit.stats.deletions) == (2, 2)
+    assert commit.html_url == "https://github.com/test/repo/pull/7"
+
+
+def test_github_search_commit_to_event_model_커밋_작성_시각의_CommitEvent로_변환한다():
+    # given
+    search_commit = GithubSearchCommitModel.model_validate(
+        create_github_search_commit_response(
+            "sha-1", repository="org/repo", authored_at="2025-01-02T08:30:00.000+09:00"
+        )
+    )
+
+    # when
+    event = search_commit.to_event_model()
+
+    # then
+    assert event.id == "commit-sha-1"
+    assert event.type == "CommitEvent"
+    assert event.typed_payload.sha == "sha-1"
+    assert event.repo.name == "org/repo"
+    assert event.created_at == "2025-01-01T23:30:00Z"
+    assert event.public is False
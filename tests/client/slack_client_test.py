@@ -0,0 +1,149 @@
+from datetime import date
+from unittest.mock import MagicMock
+from zoneinfo import ZoneInfo
+
+import pytest
+from redis import Redis
+from slack_sdk.errors import SlackApiError
+
+from dev_blackbox.client.slack_client import SlackClient
+from dev_blackbox.client.slack_rate_limiter import SlackRateLimiter
+from dev_blackbox.core.cache import CacheService
+
+
+def _create_slack_api_error(status_code: int, headers: dict | None = None) -> SlackApiError:
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return SlackApiError("error", response)
+
+
+class SlackClientTest:
+
+    def test_fetch_channels_429면_Retry_After만큼_대기_후_재시도한다(
+        self, mocker, fake_redis: Redis
+    ):
+        # given
+        client = _create_client("bot-token", fake_redis)
+        client.client.conversations_list.side_effect = [
+            _create_slack_api_error(429, {"retry-after": "20"}),
+            {"channels": [{"id": "C001", "name": "general", "is_member": True}]},
+        ]
+        mock_sleep = mocker.patch("dev_blackbox.client.slack_rate_limiter.time.sleep")
+
+        # when
+        channels = client.fetch_channels()
+
+        # then
+        assert [c.id for c in channels] == ["C001"]
+        assert client.client.conversations_list.call_count == 2
+        mock_sleep.assert_called_once()
+        assert 15 < mock_sleep.call_args.args[0] <= 20
+
+    def test_fetch_channels_rate_limit이_아닌_에러는_재시도하지_않는다(self, fake_redis: Redis):
+        # given
+        client = _create_client("bot-token", fake_redis)
+        client.client.conversations_list.side_effect = _create_slack_api_error(403)
+
+        # when & then
+        with pytest.raises(SlackApiError):
+            client.fetch_channels()
+        client.client.conversations_list.assert_called_once()
+
+    def test_fetch_messages_by_date_같은_봇_토큰의_사용자는_히스토리를_한_번만_조회한다(
+        self, fake_redis: Redis
+    ):
+        # given
+        history = {
+            "messages": [{"ts": "1735693200.000100", "user": "U001", "text": "Hello"}],
+            "has_more": False,
+        }
+        clients = [_create_client("bot-token", fake_redis) for _ in range(2)]
+        for client in clients:
+            client.client.conversations_history.return_value = history
+        other_bot_client = _create_client("other-bot-token", fake_redis)
+        other_bot_client.client.conversations_history.return_value = history
+        tz_info = ZoneInfo("Asia/Seoul")
+
+        # when
+        results = [
+            c.fetch_messages_by_date("C001", date(2025, 1, 1), tz_info, lookback_days=15)
+            for c in [*clients, other_bot_client]
+        ]
+
+        # then
+        assert all([m.ts for m in r] == ["1735693200.000100"] for r in results)
+        clients[0].client.conversations_history.assert_called_once()
+        clients[1].client.conversations_history.assert_not_called()
+        other_bot_client.client.conversations_history.assert_called_once()
+
+    def test_fetch_thread_replies_캐시된_답글에서도_부모_메시지는_제외한다(self, fake_redis: Redis):
+        # given
+        client = _create_client("bot-token", fake_redis)
+        client.client.conversations_replies.return_value = {
+            "messages": [
+                {"ts": "1735693200.000200", "user": "U002", "text": "Parent"},
+                {"ts": "1735693200.000300", "user": "U001", "text": "Reply"},
+            ],
+            "has_more": False,
+        }
+        tz_info = ZoneInfo("Asia/Seoul")
+
+        # when
+        replies = client.fetch_thread_replies(
+            "C001", "1735693200.000200", date(2025, 1, 1), tz_info
+        )
+        cached_replies = client.fetch_thread_replies(
+            "C001", "1735693200.000200", date(2025, 1, 1), tz_info, include_parent=True
+        )
+
+        # then
+        assert [r.ts for r in replies] == ["1735693200.000300"]
+        assert [r.ts for r in cached_replies] == ["1735693200.000200", "1735693200.000300"]
+        client.client.conversations_replies.assert_called_once()
+
+    def test_fetch_thread_parent_부모_메시지의_latest_reply를_반환한다(self, fake_redis: Redis):
+        # given
+        client = _create_client("bot-token", fake_redis)
+        client.client.conversations_replies.return_value = {
+            "messages": [
+                {
+                    "ts": "1735693200.000200",
+                    "user": "U002",
+                    "text": "Parent",
+                    "thread_ts": "1735693200.000200",
+                    "latest_reply": "1735790400.000100",
+                },
+            ],
+            "has_more": True,
+        }
+
+        # when
+        parent = client.fetch_thread_parent("C001", "1735693200.000200")
+
+        # then
+        assert parent is not None
+        assert parent.latest_reply == "1735790400.000100"
+        client.client.conversations_replies.assert_called_once_with(
+            channel="C001", ts="1735693200.000200", limit=1
+        )
+
+    def test_fetch_thread_parent_삭제된_스레드면_None(self, fake_redis: Redis):
+        # given
+        client = _create_client("bot-token", fake_redis)
+        error = _create_slack_api_error(200)
+        error.response.get.return_value = "thread_not_found"
+        client.client.conversations_replies.side_effect = error
+
+        # when & then
+        assert client.fetch_thread_parent("C001", "1735693200.000200") is None
+
+
+def _create_client(bot_token: str, fake_redis: Redis) -> SlackClient:
+    client = SlackClient.create(
+        bot_token,
+        rate_limiter=SlackRateLimiter(scope=bot_token, cache_client=fake_redis),
+        cache_service=CacheService(fake_redis),
+    )
+    client.client = MagicMock()
+    return client
@@ -0,0 +1,64 @@
+import pytest
+from redis import Redis
+
+from dev_blackbox.client.slack_rate_limiter import SlackRateLimiter
+from dev_blackbox.core.exception import SlackRateLimitExceededException
+
+
+class SlackRateLimiterTest:
+
+    def test_reserve_burst까지는_대기하지_않고_이후에는_tier_간격을_둔다(self, fake_redis: Redis):
+        # given
+        limiter = SlackRateLimiter(scope="token", cache_client=fake_redis)
+
+        # when
+        wait_seconds = [limiter.reserve("conversations.history") for _ in range(limiter.burst + 2)]
+
+        # then
+        # Tier 3: 분당 50회 → 1.2초 간격
+        assert wait_seconds[: limiter.burst] == [0] * limiter.burst
+        assert 0 < wait_seconds[-2] <= 1.2
+        assert 1.2 < wait_seconds[-1] <= 2.4
+
+    def test_reserve_같은_봇_토큰의_워커는_속도를_공유하고_메서드별로_나눈다(
+        self, fake_redis: Redis
+    ):
+        # given
+        limiter = SlackRateLimiter(scope="token", cache_client=fake_redis)
+        other_worker_limiter = SlackRateLimiter(scope="token", cache_client=fake_redis)
+        other_token_limiter = SlackRateLimiter(scope="other-token", cache_client=fake_redis)
+        for _ in range(limiter.burst):
+            limiter.reserve("conversations.replies")
+
+        # when & then
+        assert other_worker_limiter.reserve("conversations.replies") > 0
+        assert other_worker_limiter.reserve("conversations.history") == 0
+        assert other_token_limiter.reserve("conversations.replies") == 0
+
+    def test_block_Retry_After_동안_같은_메서드의_모든_요청을_멈춘다(self, fake_redis: Redis):
+        # given
+        limiter = SlackRateLimiter(scope="token", cache_client=fake_redis)
+        other_worker_limiter = SlackRateLimiter(scope="token", cache_client=fake_redis)
+
+        # when
+        limiter.block("conversations.history", 30)
+
+        # then
+        assert 25 < other_worker_limiter.reserve("conversations.history") <= 30
+        assert other_worker_limiter.reserve("conversations.replies") == 0
+
+    def test_reserve_대기_시간이_최대_대기_시간을_넘으면_예약하지_않고_예외(
+        self, fake_redis: Redis
+    ):
+        # given
+        limiter = SlackRateLimiter(scope="token", cache_client=fake_redis)
+        limiter.block("conversations.history", limiter.max_wait_seconds + 60)
+        tat_before = fake_redis.hget(limiter._get_key("conversations.history"), "tat")
+
+        # when
+        with pytest.raises(SlackRateLimitExceededException) as exc_info:
+            limiter.reserve("conversations.history")
+
+        # then
+        assert exc_info.value.wait_seconds > limiter.max_wait_seconds
+        assert fake_redis.hget(limiter._get_key("conversations.history"), "tat") == tat_before
@@ -10,6 +10,7 @@ from sqlalchemy import create_engine, text, Engine
 from sqlalchemy.orm import sessionmaker, Session
 from testcontainers.postgres import PostgresContainer
 
+from dev_blackbox.client.model.github_api_model import GithubCommitModel
 from dev_blackbox.core.cache import get_redis_client
 from dev_blackbox.core.encrypt import get_encrypt_service
 from dev_blackbox.core.enum import PlatformEnum
@@ -170,6 +171,7 @@ def github_event_fixture(
         target_date: date = date(2025, 1, 1),
         event_id: str | None = None,
         event_type: str = "PushEvent",
+        commit: GithubCommitModel | None = None,
     ) -> GitHubEvent:
         event = GitHubEvent.create(
             user_id=user_id,
@@ -179,7 +181,7 @@ def github_event_fixture(
                 event_id or str(uuid.uuid4()),
                 event_type,
             ),
-            commit=None,
+            commit=commit,
         )
         db_session.add(event)
         db_session.flush()
@@ -321,6 +323,7 @@ def platform_work_log_fixture(
         content: str = "Test content",
         model_name: str = "test-model",
         prompt: str = "test-prompt",
+        input_fingerprint: str | None = None,
     ) -> PlatformWorkLog:
         work_log = PlatformWorkLog.create(
             user_id=user_id,
@@ -329,6 +332,7 @@ def platform_work_log_fixture(
             content=content,
             model_name=model_name,
             prompt=prompt,
+            input_fingerprint=input_fingerprint,
         )
         db_session.add(work_log)
         db_session.flush()
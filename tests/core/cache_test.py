@@ -4,6 +4,7 @@ from redis import Redis
 
 from dev_blackbox.core.cache import (
     CacheService,
+    QueueService,
     resolve_cache_key,
     cacheable,
     cache_put,
@@ -187,3 +188,41 @@ class CacheEvictTest:
         assert result is None
         mock_fn.assert_called_once_with(user_id, target_date)
         assert not fake_redis.exists(expected_key)
+
+
+class QueueServiceTest:
+
+    def test_push_pop_먼저_넣은_값을_먼저_꺼낸다(self, fake_redis: Redis):
+        # given
+        queue_service = QueueService(fake_redis)
+        queue_service.push("queue:test", {"order": 1})
+        queue_service.push("queue:test", {"order": 2})
+
+        # when
+        first = queue_service.pop("queue:test")
+        second = queue_service.pop("queue:test")
+
+        # then
+        assert first == {"order": 1}
+        assert second == {"order": 2}
+        assert queue_service.size("queue:test") == 0
+
+    def test_push_큐에_TTL을_설정한다(self, fake_redis: Redis):
+        # given
+        queue_service = QueueService(fake_redis)
+
+        # when
+        queue_service.push("queue:test", "job", ex=CacheTTL.HOURS_24)
+
+        # then
+        assert 0 < fake_redis.ttl("queue:test") <= CacheTTL.HOURS_24
+
+    def test_pop_큐가_비어있으면_None(self, fake_redis: Redis):
+        # given
+        queue_service = QueueService(fake_redis)
+
+        # when
+        result = queue_service.pop("queue:empty", timeout=1)
+
+        # then
+        assert result is None
@@ -0,0 +1,44 @@
+import time
+
+from redis import Redis
+
+from dev_blackbox.core.cluster import InstanceRegistry
+from dev_blackbox.core.const import ClusterKey
+
+
+class InstanceRegistryTest:
+
+    def test_get_live_instances_heartbeat한_인스턴스를_반환한다(self, fake_redis: Redis):
+        # given
+        registry = InstanceRegistry(fake_redis)
+        registry.heartbeat("instance-b")
+        registry.heartbeat("instance-a")
+
+        # when
+        result = registry.get_live_instances(ttl_seconds=60)
+
+        # then
+        assert result == ["instance-a", "instance-b"]
+
+    def test_get_live_instances_만료된_인스턴스는_제외한다(self, fake_redis: Redis):
+        # given
+        registry = InstanceRegistry(fake_redis)
+        registry.heartbeat("instance-a")
+        fake_redis.zadd(ClusterKey.INSTANCES, {"instance-dead": time.time() - 120})
+
+        # when
+        result = registry.get_live_instances(ttl_seconds=60)
+
+        # then
+        assert result == ["instance-a"]
+
+    def test_unregister_인스턴스를_제거한다(self, fake_redis: Redis):
+        # given
+        registry = InstanceRegistry(fake_redis)
+        registry.heartbeat("instance-a")
+
+        # when
+        registry.unregister("instance-a")
+
+        # then
+        assert registry.get_live_instances(ttl_seconds=60) == []
@@ -0,0 +1,40 @@
+from dev_blackbox.core.config import HttpClientConfig
+from dev_blackbox.core.http_client import close_http_client, get_http_client, get_http_limits
+
+
+def test_get_http_client_같은_클라이언트를_공유한다():
+    # when
+    client = get_http_client()
+
+    # then
+    assert get_http_client() is client
+    close_http_client()
+
+
+def test_close_http_client_닫은_뒤에는_새_클라이언트를_만든다():
+    # given
+    client = get_http_client()
+
+    # when
+    close_http_client()
+
+    # then
+    assert client.is_closed
+    new_client = get_http_client()
+    assert new_client is not client
+    close_http_client()
+
+
+def test_get_http_limits_동시_요청_수가_주어지면_커넥션을_모두_유지한다():
+    # given
+    config = HttpClientConfig(max_connections=100, max_keepalive_connections=20)
+
+    # when
+    default_limits = get_http_limits(config)
+    concurrency_limits = get_http_limits(config, max_connections=50)
+
+    # then
+    assert default_limits.max_connections == 100
+    assert default_limits.max_keepalive_connections == 20
+    assert concurrency_limits.max_connections == 50
+    assert concurrency_limits.max_keepalive_connections == 50
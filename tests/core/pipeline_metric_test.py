@@ -0,0 +1,58 @@
+from datetime import date
+
+from dev_blackbox.core.enum import PipelineMetricStageEnum, PlatformEnum
+from dev_blackbox.core.pipeline_metric import (
+    measure_stage,
+    metric_scope,
+    record_wait,
+    track_api_call,
+)
+
+
+class PipelineMetricTest:
+
+    def test_measure_stage_API_호출과_대기는_별도_단계로_분리(self):
+        # given
+        with metric_scope(1, date(2025, 1, 1), PlatformEnum.SLACK) as collector:
+            # when
+            with measure_stage(PipelineMetricStageEnum.PERSIST):
+                with track_api_call():
+                    pass
+                with track_api_call():
+                    pass
+                record_wait(2)
+
+        # then
+        assert set(collector.metrics) == {
+            PipelineMetricStageEnum.FETCH,
+            PipelineMetricStageEnum.WAIT,
+            PipelineMetricStageEnum.PERSIST,
+        }
+        assert collector.metrics[PipelineMetricStageEnum.FETCH].api_call_count == 2
+        assert collector.metrics[PipelineMetricStageEnum.WAIT].duration_seconds == 2
+        assert collector.metrics[PipelineMetricStageEnum.PERSIST].duration_seconds >= 0
+
+    def test_measure_stage_입출력_크기_누적(self):
+        # given
+        with metric_scope(1, date(2025, 1, 1), PlatformEnum.GITHUB) as collector:
+            # when
+            for text in ["abc", "de"]:
+                with measure_stage(PipelineMetricStageEnum.LLM) as measurement:
+                    measurement.input_size = len(text)
+                    measurement.output_size = 1
+
+        # then
+        metric = collector.metrics[PipelineMetricStageEnum.LLM]
+        assert metric.input_size == 5
+        assert metric.output_size == 2
+
+    def test_measure_stage_계측_범위_밖에서는_기록하지_않음(self):
+        # when
+        with measure_stage(PipelineMetricStageEnum.TEXT) as measurement:
+            with track_api_call():
+                pass
+            record_wait(1)
+            measurement.output_size = 10
+
+        # then
+        assert measurement.output_size == 10
@@ -10,6 +10,9 @@ from dev_blackbox.client.model.github_api_model import (
 def create_github_event_model(
     event_id: str,
     event_type: str = "PushEvent",
+    created_at: str = "2025-01-01T00:00:00Z",
+    head: str = "abc123",
+    actor_login: str = "test",
 ) -> GithubEventModel:
     return GithubEventModel(
         id=event_id,
@@ -17,7 +20,7 @@ def create_github_event_model(
         actor=GitHubActorModel(
             id=1,
             url="https://api.github.com/users/test",
-            login="test",
+            login=actor_login,
             avatar_url="https://avatars.githubusercontent.com/u/12345678?v=4",
             gravatar_id="abc123",
             display_login="Test",
@@ -29,9 +32,106 @@ def create_github_event_model(
             "repository_id": 1,
             "push_id": 1,
             "ref": "refs/heads/main",
-            "head": "abc123",
+            "head": head,
             "before": "def456",
         },
         public=True,
-        created_at="2025-01-01T00:00:00Z",
+        created_at=created_at,
     )
+
+
+def create_github_commit_response(sha: str) -> dict:
+    return {
+        "sha": sha,
+        "node_id": "node",
+        "commit": {
+            "author": {"name": "test"},
+            "committer": {"name": "test"},
+            "message": "fix: bug",
+            "url": f"https://api.github.com/repos/test/repo/git/commits/{sha}",
+        },
+        "url": f"https://api.github.com/repos/test/repo/commits/{sha}",
+        "html_url": f"https://github.com/test/repo/commit/{sha}",
+        "comments_url": f"https://api.github.com/repos/test/repo/commits/{sha}/comments",
+        "stats": {"total": 2, "additions": 1, "deletions": 1},
+        "files": [],
+    }
+
+
+def create_github_compare_commit_response(sha: str, message: str = "fix: bug") -> dict:
+    commit = create_github_commit_response(sha)
+    commit["commit"]["message"] = message
+    del commit["stats"], commit["files"]
+    return commit
+
+
+def create_github_compare_response(
+    commits: list[dict],
+    total_commits: int | None = None,
+    files: list[dict] | None = None,
+) -> dict:
+    return {
+        "html_url": "https://github.com/test/repo/compare/before...head",
+        "status": "ahead",
+        "total_commits": len(commits) if total_commits is None else total_commits,
+        "commits": commits,
+        "files": files or [],
+    }
+
+
+def create_github_commit_file_response(
+    filename: str, additions: int = 1, deletions: int = 1
+) -> dict:
+    return {
+        "sha": "file-sha",
+        "status": "modified",
+        "filename": filename,
+        "additions": additions,
+        "deletions": deletions,
+        "changes": additions + deletions,
+        "blob_url": f"https://github.com/test/repo/blob/head/{filename}",
+        "raw_url": f"https://github.com/test/repo/raw/head/{filename}",
+        "patch": "@@ -1 +1 @@",
+    }
+
+
+def create_github_graphql_commit_node(oid: str, message: str = "fix: bug") -> dict:
+    return {
+        "oid": oid,
+        "id": f"node-{oid}",
+        "message": message,
+        "additions": 3,
+        "deletions": 1,
+        "url": f"https://github.com/test/repo/commit/{oid}",
+        "author": {"name": "test", "email": "test@example.com", "date": "2025-01-01T00:00:00Z"},
+        "committer": {"name": "test", "email": "test@example.com", "date": "2025-01-01T00:00:00Z"},
+    }
+
+
+def create_github_search_commit_response(
+    sha: str,
+    repository: str = "test/repo",
+    authored_at: str = "2025-01-01T09:00:00.000+09:00",
+) -> dict:
+    return {
+        "sha": sha,
+        "commit": {
+            "author": {"name": "test", "email": "test@example.com", "date": authored_at},
+            "committer": {"name": "test", "email": "test@example.com", "date": authored_at},
+            "message": "fix: bug",
+            "url": f"https://api.github.com/repos/{repository}/git/commits/{sha}",
+        },
+        "author": {
+            "id": 1,
+            "login": "test",
+            "url": "https://api.github.com/users/test",
+            "avatar_url": "https://avatars.githubusercontent.com/u/12345678?v=4",
+            "gravatar_id": "",
+        },
+        "repository": {
+            "id": 1,
+            "full_name": repository,
+            "url": f"https://api.github.com/repos/{repository}",
+            "private": True,
+        },
+    }
@@ -6,6 +6,7 @@ def create_jira_issue_raw(
     issue_type: str = "Task",
     priority: str = "Medium",
     changelog_histories: list[dict] | None = None,
+    updated: str | None = None,
 ) -> dict:
     """Jira REST API의 Issue.raw 형태를 생성한다."""
     return {
@@ -18,6 +19,7 @@ def create_jira_issue_raw(
             "priority": {"name": priority},
             "assignee": {"displayName": "Test User"},
             "comment": {"comments": []},
+            "updated": updated,
         },
         "changelog": {
             "histories": changelog_histories or [],
@@ -1,20 +1,29 @@
 from datetime import date
 from unittest.mock import MagicMock
+from zoneinfo import ZoneInfo
 
+import httpx
 import pytest
 
 from dev_blackbox.client.github_client import GitHubClient
 from dev_blackbox.client.model.github_api_model import (
     GithubCommitModel,
+    GithubCommitRef,
     GithubEventModelList,
+    GithubSearchCommitModel,
 )
+from dev_blackbox.core.config import get_settings
 from dev_blackbox.core.exception import (
+    GitHubUserSecretNotFoundException,
     GitHubUserSecretNotSetException,
     UserNotFoundException,
 )
 from dev_blackbox.service.github_event_service import GitHubEventService
 from dev_blackbox.storage.rds.entity import GitHubEvent
-from tests.fixtures.github_fixture import create_github_event_model
+from tests.fixtures.github_fixture import (
+    create_github_event_model,
+    create_github_search_commit_response,
+)
 
 
 class GitHubEventServiceTest:
@@ -238,5 +247,586 @@ class GitHubEventServiceTest:
             username=secret.username,
             target_date=target_date,
             tz_info=user.tz_info,
+            since_event_id=None,
+        )
+        mock_client.fetch_commit.assert_called_once()
+
+    def test_fetch_github_commits_by_events_이벤트_순서를_유지하고_실패한_커밋은_None(
+        self,
+        db_session,
+    ):
+        # given
+        service = GitHubEventService(db_session)
+        github_events = [
+            create_github_event_model(event_id=str(i), head=f"sha-{i}") for i in range(1, 6)
+        ] + [create_github_event_model(event_id="6", event_type="WatchEvent")]
+
+        def fetch_commit(repository_url: str, sha: str) -> GithubCommitModel:
+            if sha == "sha-3":
+                raise httpx.HTTPError("Server Error")
+            mock_commit = MagicMock(spec=GithubCommitModel)
+            mock_commit.sha = sha
+            return mock_commit
+
+        mock_client = MagicMock(spec=GitHubClient)
+        mock_client.fetch_commit.side_effect = fetch_commit
+
+        # when
+        result = service.fetch_github_commits_by_events(mock_client, github_events)
+
+        # then
+        assert [c.sha if c else None for c in result] == [
+            "sha-1",
+            "sha-2",
+            None,
+            "sha-4",
+            "sha-5",
+            None,
+        ]
+        assert mock_client.fetch_commit.call_count == 5
+
+    def test_fetch_github_commits_by_graphql_PushEvent_커밋을_한_번에_조회한다(
+        self,
+        db_session,
+    ):
+        # given
+        service = GitHubEventService(db_session)
+        github_events = [
+            create_github_event_model(event_id="1", head="sha-1"),
+            create_github_event_model(event_id="2", event_type="WatchEvent"),
+            create_github_event_model(event_id="3", head="sha-3"),
+        ]
+        mock_commit = MagicMock(spec=GithubCommitModel)
+
+        mock_client = MagicMock(spec=GitHubClient)
+        mock_client.fetch_commits_by_graphql.return_value = {
+            GithubCommitRef("test/repo", "sha-3"): mock_commit
+        }
+
+        # when
+        result = service.fetch_github_commits_by_graphql(mock_client, github_events)
+
+        # then
+        assert result == [None, None, mock_commit]
+        mock_client.fetch_commits_by_graphql.assert_called_once_with(
+            [GithubCommitRef("test/repo", "sha-1"), GithubCommitRef("test/repo", "sha-3")]
+        )
+        mock_client.fetch_pull_requests_by_graphql.assert_not_called()
+        mock_client.fetch_commit.assert_not_called()
+
+    def test_save_github_events_search_전략이면_PushEvent_대신_검색한_커밋을_저장한다(
+        self,
+        mocker,
+        db_session,
+        user_fixture,
+        github_user_secret_fixture,
+    ):
+        # given
+        user = user_fixture()
+        github_user_secret_fixture(user_id=user.id)
+        target_date = date(2025, 1, 1)
+
+        service = GitHubEventService(db_session)
+
+        # mock
+        mocker.patch.object(get_settings().collect_task, "github_collect_strategy", "search")
+        mock_client = MagicMock(spec=GitHubClient)
+        mock_client.fetch_events_by_date.return_value = GithubEventModelList(
+            events=[
+                create_github_event_model("102", event_type="CreateEvent"),
+                create_github_event_model("101", event_type="PushEvent"),
+            ]
+        )
+        mock_client.search_commits_by_date.return_value = [
+            GithubSearchCommitModel.model_validate(
+                create_github_search_commit_response(
+                    "sha-1", authored_at="2025-01-01T09:00:00.000+00:00"
+                )
+            )
+        ]
+        mock_commit = MagicMock(spec=GithubCommitModel)
+        mock_commit.model_dump.return_value = {"sha": "sha-1"}
+        mock_client.fetch_commit.return_value = mock_commit
+        mocker.patch(
+            "dev_blackbox.service.github_event_service.GitHubClient.create",
+            return_value=mock_client,
+        )
+
+        # when
+        result = service.save_github_events(user.id, target_date)
+
+        # then
+        assert sorted(e.event_id for e in result) == ["102", "commit-sha-1"]
+        commit_event = next(e for e in result if e.event_type == "CommitEvent")
+        assert commit_event.commit == {"sha": "sha-1"}
+        mock_client.fetch_commit.assert_called_once_with(
+            repository_url="https://api.github.com/repos/test/repo", sha="sha-1"
+        )
+
+    def test_save_org_github_events_org_이벤트를_actor로_나누어_저장한다(
+        self,
+        mocker,
+        db_session,
+        user_fixture,
+        github_user_secret_fixture,
+    ):
+        # given
+        user_a = user_fixture()
+        user_b = user_fixture()
+        user_c = user_fixture()
+        secret_a = github_user_secret_fixture(user_id=user_a.id, username="alice")
+        secret_b = github_user_secret_fixture(user_id=user_b.id, username="Bob")
+        github_user_secret_fixture(user_id=user_c.id, username="dave")
+        target_date = date(2025, 1, 1)
+
+        service = GitHubEventService(db_session)
+
+        # mock: dave는 org 구성원이 아니다
+        mock_client = MagicMock(spec=GitHubClient)
+        mock_client.fetch_org_member_logins.return_value = {"alice", "bob", "carol"}
+        mock_client.fetch_org_events_by_date.return_value = (
+            GithubEventModelList(
+                events=[
+                    create_github_event_model("103", event_type="WatchEvent", actor_login="bob"),
+                    create_github_event_model("102", event_type="WatchEvent", actor_login="carol"),
+                    create_github_event_model("101", event_type="WatchEvent", actor_login="alice"),
+                ]
+            ),
+            True,
+        )
+        mocker.patch(
+            "dev_blackbox.service.github_event_service.GitHubClient.create",
+            return_value=mock_client,
+        )
+
+        # when
+        result = service.save_org_github_events(
+            "org", "alice", [user_a.id, user_b.id, user_c.id], target_date, ZoneInfo("UTC")
+        )
+
+        # then
+        assert sorted(result) == sorted([user_a.id, user_b.id])
+        assert [e.event_id for e in service.get_github_events(user_a.id, target_date)] == ["101"]
+        assert [e.event_id for e in service.get_github_events(user_b.id, target_date)] == ["103"]
+        assert service.get_github_events(user_b.id, target_date)[0].github_user_secret_id == (
+            secret_b.id
+        )
+        mock_client.fetch_org_events_by_date.assert_called_once_with(
+            username=secret_a.username, org="org", target_date=target_date, tz_info=ZoneInfo("UTC")
+        )
+
+    def test_save_org_github_events_피드가_target_date에_도달하지_못하면_저장하지_않는다(
+        self,
+        mocker,
+        db_session,
+        user_fixture,
+        github_user_secret_fixture,
+    ):
+        # given
+        user = user_fixture()
+        github_user_secret_fixture(user_id=user.id, username="alice")
+        target_date = date(2025, 1, 1)
+
+        service = GitHubEventService(db_session)
+
+        # mock
+        mock_client = MagicMock(spec=GitHubClient)
+        mock_client.fetch_org_member_logins.return_value = {"alice"}
+        mock_client.fetch_org_events_by_date.return_value = (
+            GithubEventModelList(
+                events=[
+                    create_github_event_model("101", event_type="WatchEvent", actor_login="alice")
+                ]
+            ),
+            False,
+        )
+        mocker.patch(
+            "dev_blackbox.service.github_event_service.GitHubClient.create",
+            return_value=mock_client,
+        )
+
+        # when
+        result = service.save_org_github_events(
+            "org", "alice", [user.id], target_date, ZoneInfo("UTC")
+        )
+
+        # then
+        assert result == []
+        assert service.get_github_events(user.id, target_date) == []
+
+    def test_save_org_github_events_collector가_등록되지_않았으면_예외(
+        self,
+        db_session,
+        user_fixture,
+        github_user_secret_fixture,
+    ):
+        # given
+        user = user_fixture()
+        github_user_secret_fixture(user_id=user.id, username="alice")
+
+        service = GitHubEventService(db_session)
+
+        # when & then
+        with pytest.raises(GitHubUserSecretNotFoundException):
+            service.save_org_github_events(
+                "org", "unknown", [user.id], date(2025, 1, 1), ZoneInfo("UTC")
+            )
+
+    def test_save_github_events_저장된_이벤트_이후만_수집한다(
+        self,
+        mocker,
+        db_session,
+        user_fixture,
+        github_user_secret_fixture,
+        github_event_fixture,
+    ):
+        # given
+        user = user_fixture()
+        secret = github_user_secret_fixture(user_id=user.id)
+        target_date = date(2025, 1, 1)
+        mock_commit = MagicMock(spec=GithubCommitModel)
+        mock_commit.model_dump.return_value = {"sha": "abc123"}
+        stored_event = github_event_fixture(
+            user_id=user.id,
+            github_user_secret_id=secret.id,
+            target_date=target_date,
+            event_id="100",
+            commit=mock_commit,
+        )
+
+        service = GitHubEventService(db_session)
+
+        # mock
+        new_event_model = create_github_event_model(event_id="101")
+        stored_event_model = create_github_event_model(event_id="100")
+
+        mock_client = MagicMock(spec=GitHubClient)
+        mock_client.fetch_events_by_date.return_value = GithubEventModelList(
+            events=[new_event_model, stored_event_model],
+        )
+        mock_client.fetch_commit.return_value = mock_commit
+
+        mocker.patch(
+            "dev_blackbox.service.github_event_service.GitHubClient.create",
+            return_value=mock_client,
+        )
+
+        # when
+        result = service.save_github_events(user.id, target_date)
+
+        # then
+        assert [e.event_id for e in result] == ["100", "101"]
+        assert result[0] is stored_event
+        mock_client.fetch_events_by_date.assert_called_once_with(
+            username=secret.username,
+            target_date=target_date,
+            tz_info=user.tz_info,
+            since_event_id="100",
+        )
+        mock_client.fetch_commit.assert_called_once()
+
+    def test_save_github_events_커밋_정보_없이_저장된_이벤트는_다시_조회하여_채운다(
+        self,
+        mocker,
+        db_session,
+        user_fixture,
+        github_user_secret_fixture,
+        github_event_fixture,
+    ):
+        # given
+        user = user_fixture()
+        secret = github_user_secret_fixture(user_id=user.id)
+        target_date = date(2025, 1, 1)
+        mock_commit = MagicMock(spec=GithubCommitModel)
+        mock_commit.model_dump.return_value = {"sha": "abc123"}
+        github_event_fixture(
+            user_id=user.id,
+            github_user_secret_id=secret.id,
+            target_date=target_date,
+            event_id="99",
+            commit=mock_commit,
+        )
+        missing_event = github_event_fixture(
+            user_id=user.id,
+            github_user_secret_id=secret.id,
+            target_date=target_date,
+            event_id="100",
+        )
+        github_event_fixture(
+            user_id=user.id,
+            github_user_secret_id=secret.id,
+            target_date=target_date,
+            event_id="101",
+            commit=mock_commit,
+        )
+
+        service = GitHubEventService(db_session)
+
+        # mock
+        mock_client = MagicMock(spec=GitHubClient)
+        mock_client.fetch_events_by_date.return_value = GithubEventModelList(
+            events=[
+                create_github_event_model(event_id="101"),
+                create_github_event_model(event_id="100"),
+            ],
+        )
+        mock_client.fetch_commit.return_value = mock_commit
+
+        mocker.patch(
+            "dev_blackbox.service.github_event_service.GitHubClient.create",
+            return_value=mock_client,
+        )
+
+        # when
+        result = service.save_github_events(user.id, target_date)
+
+        # then
+        assert [e.event_id for e in result] == ["99", "100", "101"]
+        assert missing_event.commit == {"sha": "abc123"}
+        # 커밋 정보가 없는 이벤트 이전까지만 워터마크로 삼는다
+        mock_client.fetch_events_by_date.assert_called_once_with(
+            username=secret.username,
+            target_date=target_date,
+            tz_info=user.tz_info,
+            since_event_id="99",
+        )
+        mock_client.fetch_commit.assert_called_once()
+
+    def test_get_collect_target_커밋_정보_없이_저장된_이벤트는_워터마크와_저장_목록에서_제외한다(
+        self,
+        db_session,
+        user_fixture,
+        github_user_secret_fixture,
+        github_event_fixture,
+    ):
+        # given
+        user = user_fixture()
+        secret = github_user_secret_fixture(user_id=user.id)
+        target_date = date(2025, 1, 1)
+        missing_event = github_event_fixture(
+            user_id=user.id,
+            github_user_secret_id=secret.id,
+            target_date=target_date,
+            event_id="100",
+        )
+        github_event_fixture(
+            user_id=user.id,
+            github_user_secret_id=secret.id,
+            target_date=target_date,
+            event_id="101",
+            event_type="IssueCommentEvent",
+        )
+
+        service = GitHubEventService(db_session)
+
+        mock_commit = MagicMock(spec=GithubCommitModel)
+        mock_commit.model_dump.return_value = {"sha": "abc123"}
+
+        # when
+        target = service.get_collect_target(user.id, target_date)
+        result = service.save_fetched_github_events(
+            target,
+            github_events=[create_github_event_model(event_id="100")],
+            commits={"100": mock_commit},
+        )
+
+        # then
+        assert target.since_event_id is None
+        assert target.stored_event_ids == {"101"}
+        assert result == []
+        assert missing_event.commit == {"sha": "abc123"}
+
+    def test_save_github_events_커밋_조회가_최대_횟수만큼_실패하면_워터마크에서_제외한다(
+        self,
+        mocker,
+        db_session,
+        user_fixture,
+        github_user_secret_fixture,
+        github_event_fixture,
+    ):
+        # given
+        user = user_fixture()
+        secret = github_user_secret_fixture(user_id=user.id)
+        target_date = date(2025, 1, 1)
+        missing_event = github_event_fixture(
+            user_id=user.id,
+            github_user_secret_id=secret.id,
+            target_date=target_date,
+            event_id="100",
+        )
+        missing_event.commit_fetch_attempts = GitHubEvent.COMMIT_FETCH_MAX_ATTEMPTS - 1
+        db_session.flush()
+
+        service = GitHubEventService(db_session)
+
+        # mock: 삭제된 커밋 (404)
+        mock_client = MagicMock(spec=GitHubClient)
+        mock_client.fetch_events_by_date.return_value = GithubEventModelList(
+            events=[create_github_event_model(event_id="100")],
+        )
+        mock_client.fetch_commit.side_effect = httpx.HTTPStatusError(
+            "Not Found",
+            request=httpx.Request("GET", "https://api.github.com/repos/test/commits/abc"),
+            response=httpx.Response(404),
+        )
+        mocker.patch(
+            "dev_blackbox.service.github_event_service.GitHubClient.create",
+            return_value=mock_client,
+        )
+
+        # when
+        service.save_github_events(user.id, target_date)
+        target = service.get_collect_target(user.id, target_date)
+
+        # then
+        mock_client.fetch_events_by_date.assert_called_once_with(
+            username=secret.username,
+            target_date=target_date,
+            tz_info=user.tz_info,
+            since_event_id=None,
+        )
+        assert missing_event.commit is None
+        assert missing_event.commit_fetch_attempts == GitHubEvent.COMMIT_FETCH_MAX_ATTEMPTS
+        assert not missing_event.is_commit_missing
+        assert target.since_event_id == "100"
+        assert target.stored_event_ids == {"100"}
+
+    def test_save_github_events_full_refresh면_기존_이벤트를_삭제하고_다시_수집한다(
+        self,
+        mocker,
+        db_session,
+        user_fixture,
+        github_user_secret_fixture,
+        github_event_fixture,
+    ):
+        # given
+        user = user_fixture()
+        secret = github_user_secret_fixture(user_id=user.id)
+        target_date = date(2025, 1, 1)
+        github_event_fixture(
+            user_id=user.id,
+            github_user_secret_id=secret.id,
+            target_date=target_date,
+            event_id="200",
+        )
+
+        service = GitHubEventService(db_session)
+
+        # mock
+        mock_client = MagicMock(spec=GitHubClient)
+        mock_client.fetch_events_by_date.return_value = GithubEventModelList(events=[])
+
+        mocker.patch(
+            "dev_blackbox.service.github_event_service.GitHubClient.create",
+            return_value=mock_client,
+        )
+
+        # when
+        result = service.save_github_events(user.id, target_date, full_refresh=True)
+
+        # then
+        assert result == []
+        assert service.get_github_events(user.id, target_date) == []
+        mock_client.fetch_events_by_date.assert_called_once_with(
+            username=secret.username,
+            target_date=target_date,
+            tz_info=user.tz_info,
+            since_event_id=None,
+        )
+
+    def test_save_fetched_github_events_이미_저장된_이벤트는_건너뛴다(
+        self,
+        db_session,
+        user_fixture,
+        github_user_secret_fixture,
+        github_event_fixture,
+    ):
+        # given
+        user = user_fixture()
+        secret = github_user_secret_fixture(user_id=user.id)
+        target_date = date(2025, 1, 1)
+        mock_commit = MagicMock(spec=GithubCommitModel)
+        mock_commit.model_dump.return_value = {"sha": "abc123"}
+        github_event_fixture(
+            user_id=user.id,
+            github_user_secret_id=secret.id,
+            target_date=target_date,
+            event_id="100",
+            commit=mock_commit,
+        )
+
+        service = GitHubEventService(db_session)
+        target = service.get_collect_target(user.id, target_date)
+
+        # when
+        result = service.save_fetched_github_events(
+            target,
+            github_events=[
+                create_github_event_model(event_id="101", created_at="2025-01-01T03:00:00Z"),
+                create_github_event_model(event_id="100", created_at="2025-01-01T02:00:00Z"),
+            ],
+            commits={"101": mock_commit},
+        )
+
+        # then
+        assert target.since_event_id == "100"
+        assert target.stored_event_ids == {"100"}
+        assert [e.event_id for e in result] == ["101"]
+        assert result[0].target_date == target_date
+        assert result[0].commit == {"sha": "abc123"}
+
+    def test_save_github_events_by_date_range_이벤트_생성일_기준으로_날짜를_나눈다(
+        self,
+        mocker,
+        db_session,
+        user_fixture,
+        github_user_secret_fixture,
+        github_event_fixture,
+    ):
+        # given
+        user = user_fixture()
+        secret = github_user_secret_fixture(user_id=user.id)
+        stored_commit = MagicMock(spec=GithubCommitModel)
+        stored_commit.model_dump.return_value = {"sha": "abc123"}
+        stored_event = github_event_fixture(
+            user_id=user.id,
+            github_user_secret_id=secret.id,
+            target_date=date(2025, 1, 1),
+            event_id="100",
+            commit=stored_commit,
+        )
+
+        service = GitHubEventService(db_session)
+
+        # mock
+        mock_client = MagicMock(spec=GitHubClient)
+        mock_client.fetch_events_by_date_range.return_value = GithubEventModelList(
+            events=[
+                create_github_event_model("102", created_at="2025-01-03T03:00:00Z"),
+                create_github_event_model("100", created_at="2025-01-01T03:00:00Z"),
+            ],
+        )
+        mock_client.fetch_commit.return_value = None
+
+        mocker.patch(
+            "dev_blackbox.service.github_event_service.GitHubClient.create",
+            return_value=mock_client,
+        )
+
+        # when
+        result = service.save_github_events_by_date_range(
+            user.id, date(2025, 1, 1), date(2025, 1, 3)
+        )
+
+        # then
+        assert [e.event_id for e in result[date(2025, 1, 1)]] == [stored_event.event_id]
+        assert result[date(2025, 1, 2)] == []
+        assert [e.event_id for e in result[date(2025, 1, 3)]] == ["102"]
+        mock_client.fetch_events_by_date_range.assert_called_once_with(
+            username=secret.username,
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 1, 3),
+            tz_info=user.tz_info,
         )
+        # 이미 저장된 이벤트는 커밋을 다시 조회하지 않는다
         mock_client.fetch_commit.assert_called_once()
@@ -284,6 +284,182 @@ class JiraEventServiceTest:
         assert len(result) == 1
         assert result[0].issue_key == "PROJ-NEW"
 
+    # ── save_jira_events_by_date_range ──
+
+    def test_save_jira_events_by_date_range_changelog_발생일_기준으로_날짜를_나눈다(
+        self,
+        mocker,
+        db_session: Session,
+        user_fixture: Callable[..., User],
+        jira_secret_fixture: Callable[..., JiraSecret],
+        jira_user_fixture: Callable[..., JiraUser],
+    ):
+        # given
+        user = user_fixture()
+        secret = jira_secret_fixture()
+        jira_user_fixture(
+            jira_secret_id=secret.id,
+            user_id=user.id,
+            project="PROJ",
+            account_id="account-range",
+        )
+        start_date = date(2025, 1, 1)
+        end_date = date(2025, 1, 3)
+
+        # mock
+        mock_issue = MagicMock()
+        mock_issue.raw = create_jira_issue_raw(
+            issue_id="10001",
+            key="PROJ-1",
+            changelog_histories=[
+                {
+                    "id": "1",
+                    "created": "2025-01-01T10:00:00.000+0900",
+                    "items": [{"field": "status", "fromString": "To Do", "toString": "Doing"}],
+                },
+                {
+                    "id": "2",
+                    "created": "2025-01-03T10:00:00.000+0900",
+                    "items": [{"field": "status", "fromString": "Doing", "toString": "Done"}],
+                },
+            ],
+        )
+
+        mock_client = MagicMock(spec=JiraClient)
+        mock_client.fetch_search_issues.return_value = [mock_issue]
+
+        mocker.patch.object(
+            JiraEventService,
+            "_get_user_or_throw",
+            return_value=user,
+        )
+        mocker.patch(
+            "dev_blackbox.service.jira_event_service.JiraSecretService.get_jira_client",
+            return_value=mock_client,
+        )
+
+        service = JiraEventService(db_session)
+
+        # when
+        result = service.save_jira_events_by_date_range(user.id, start_date, end_date)
+
+        # then
+        assert [e.issue_key for e in result[date(2025, 1, 1)]] == ["PROJ-1"]
+        assert result[date(2025, 1, 2)] == []
+        assert [e.issue_key for e in result[date(2025, 1, 3)]] == ["PROJ-1"]
+        assert [h["id"] for h in result[date(2025, 1, 3)][0].changelog] == ["2"]
+        # 기간 전체를 한 번의 JQL로 조회
+        mock_client.fetch_search_issues.assert_called_once()
+
+    def test_save_jira_events_by_date_range_changelog가_없는_이슈는_업데이트_날짜에_저장한다(
+        self,
+        mocker,
+        db_session: Session,
+        user_fixture: Callable[..., User],
+        jira_secret_fixture: Callable[..., JiraSecret],
+        jira_user_fixture: Callable[..., JiraUser],
+    ):
+        # given
+        user = user_fixture()
+        secret = jira_secret_fixture()
+        jira_user_fixture(
+            jira_secret_id=secret.id,
+            user_id=user.id,
+            project="PROJ",
+            account_id="account-range-updated",
+        )
+
+        # mock
+        mock_issue = MagicMock()
+        mock_issue.raw = create_jira_issue_raw(
+            issue_id="10002",
+            key="PROJ-2",
+            updated="2025-01-02T10:00:00.000+0900",
+        )
+
+        mock_client = MagicMock(spec=JiraClient)
+        mock_client.fetch_search_issues.return_value = [mock_issue]
+
+        mocker.patch.object(
+            JiraEventService,
+            "_get_user_or_throw",
+            return_value=user,
+        )
+        mocker.patch(
+            "dev_blackbox.service.jira_event_service.JiraSecretService.get_jira_client",
+            return_value=mock_client,
+        )
+
+        service = JiraEventService(db_session)
+
+        # when
+        result = service.save_jira_events_by_date_range(user.id, date(2025, 1, 1), date(2025, 1, 3))
+
+        # then
+        assert result[date(2025, 1, 1)] == []
+        assert [e.issue_key for e in result[date(2025, 1, 2)]] == ["PROJ-2"]
+        assert result[date(2025, 1, 3)] == []
+
+    def test_save_jira_events_기간_수집과_같은_기준으로_changelog_발생일에_저장한다(
+        self,
+        mocker,
+        db_session: Session,
+        user_fixture: Callable[..., User],
+        jira_secret_fixture: Callable[..., JiraSecret],
+        jira_user_fixture: Callable[..., JiraUser],
+    ):
+        # given
+        user = user_fixture()
+        secret = jira_secret_fixture()
+        jira_user_fixture(
+            jira_secret_id=secret.id,
+            user_id=user.id,
+            project="PROJ",
+            account_id="account-daily-changelog",
+        )
+
+        # mock
+        mock_issue = MagicMock()
+        mock_issue.raw = create_jira_issue_raw(
+            issue_id="10001",
+            key="PROJ-1",
+            changelog_histories=[
+                {
+                    "id": "1",
+                    "created": "2025-01-01T10:00:00.000+0900",
+                    "items": [{"field": "status", "fromString": "To Do", "toString": "Doing"}],
+                },
+                {
+                    "id": "2",
+                    "created": "2025-01-03T10:00:00.000+0900",
+                    "items": [{"field": "status", "fromString": "Doing", "toString": "Done"}],
+                },
+            ],
+            updated="2025-01-03T10:00:00.000+0900",
+        )
+
+        mock_client = MagicMock(spec=JiraClient)
+        mock_client.fetch_search_issues.return_value = [mock_issue]
+
+        mocker.patch.object(
+            JiraEventService,
+            "_get_user_or_throw",
+            return_value=user,
+        )
+        mocker.patch(
+            "dev_blackbox.service.jira_event_service.JiraSecretService.get_jira_client",
+            return_value=mock_client,
+        )
+
+        service = JiraEventService(db_session)
+
+        # when
+        result = service.save_jira_events(user.id, date(2025, 1, 3))
+
+        # then
+        assert [e.target_date for e in result] == [date(2025, 1, 3)]
+        assert [h["id"] for h in result[0].changelog] == ["2"]
+
     # ── save_jira_events 예외 케이스 ──
 
     def test_save_jira_events_사용자가_없으면_예외(
@@ -0,0 +1,70 @@
+from datetime import date
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from dev_blackbox.core.enum import PipelineMetricStageEnum, PlatformEnum
+from dev_blackbox.core.pipeline_metric import PipelineMetricCollector
+from dev_blackbox.service.pipeline_metric_service import PipelineMetricService
+from dev_blackbox.storage.rds.entity.user import User
+
+
+def _create_collector(user_id: int, target_date: date, duration_seconds: float):
+    collector = PipelineMetricCollector(
+        user_id=user_id, target_date=target_date, platform=PlatformEnum.GITHUB
+    )
+    collector.add(PipelineMetricStageEnum.FETCH, duration_seconds, api_call_count=3)
+    collector.add(PipelineMetricStageEnum.LLM, duration_seconds, input_size=100, output_size=10)
+    return collector
+
+
+class PipelineMetricServiceTest:
+
+    # ── save_metrics ──
+
+    def test_save_metrics_단계별_row_저장(
+        self,
+        db_session: Session,
+        user_fixture: Callable[..., User],
+    ):
+        # given
+        user = user_fixture()
+        collector = _create_collector(user.id, date(2025, 1, 1), 1.5)
+        service = PipelineMetricService(db_session)
+
+        # when
+        metrics = service.save_metrics(collector)
+
+        # then
+        assert [(m.stage, m.duration_ms, m.api_call_count) for m in metrics] == [
+            (PipelineMetricStageEnum.FETCH, 1500, 3),
+            (PipelineMetricStageEnum.LLM, 1500, 0),
+        ]
+        assert metrics[1].input_size == 100
+        assert metrics[1].output_size == 10
+
+    # ── get_stage_aggregates ──
+
+    def test_get_stage_aggregates_최근_N개_날짜의_p50_p95(
+        self,
+        db_session: Session,
+        user_fixture: Callable[..., User],
+    ):
+        # given
+        user = user_fixture()
+        service = PipelineMetricService(db_session)
+        service.save_metrics(_create_collector(user.id, date(2024, 12, 1), 100.0))  # 집계 제외
+        for day, seconds in enumerate([1.0, 2.0, 3.0, 4.0, 5.0], start=1):
+            service.save_metrics(_create_collector(user.id, date(2025, 1, day), seconds))
+
+        # when
+        aggregates = service.get_stage_aggregates(last_runs=5)
+
+        # then
+        fetch = next(a for a in aggregates if a.stage == PipelineMetricStageEnum.FETCH)
+        assert fetch.platform == PlatformEnum.GITHUB
+        assert fetch.sample_count == 5
+        assert fetch.p50_ms == 3000
+        assert fetch.p95_ms == 4800
+        assert fetch.avg_api_call_count == 3
+        assert fetch.avg_input_size is None
@@ -0,0 +1,167 @@
+from datetime import UTC, date, datetime, timedelta
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from dev_blackbox.core.enum import PipelineStageEnum, PipelineStepStatusEnum, PlatformEnum
+from dev_blackbox.service.pipeline_run_service import PipelineRunService
+from dev_blackbox.storage.rds.entity.user import User
+
+
+class PipelineRunServiceTest:
+
+    # ── plan_steps ──
+
+    def test_plan_steps_플랫폼별_수집_스텝을_PENDING으로_기록(
+        self,
+        db_session: Session,
+        user_fixture: Callable[..., User],
+    ):
+        # given
+        user = user_fixture()
+        target_date = date(2025, 1, 1)
+        service = PipelineRunService(db_session)
+
+        # when
+        service.plan_steps(user.id, target_date, [PlatformEnum.GITHUB, PlatformEnum.SLACK])
+
+        # then
+        steps = service.get_steps(user.id, target_date)
+        assert [(s.platform, s.stage, s.status) for s in steps] == [
+            (PlatformEnum.GITHUB, PipelineStageEnum.COLLECT, PipelineStepStatusEnum.PENDING),
+            (PlatformEnum.SLACK, PipelineStageEnum.COLLECT, PipelineStepStatusEnum.PENDING),
+        ]
+
+    def test_plan_steps_완료된_스텝은_유지(
+        self,
+        db_session: Session,
+        user_fixture: Callable[..., User],
+    ):
+        # given
+        user = user_fixture()
+        target_date = date(2025, 1, 1)
+        service = PipelineRunService(db_session)
+        service.mark_succeeded(user.id, target_date, PlatformEnum.GITHUB, PipelineStageEnum.COLLECT)
+
+        # when
+        service.plan_steps(user.id, target_date, [PlatformEnum.GITHUB])
+
+        # then
+        assert service.get_succeeded_stages(user.id, target_date, PlatformEnum.GITHUB) == {
+            PipelineStageEnum.COLLECT
+        }
+
+    # ── mark_failed ──
+
+    def test_mark_failed_지수_백오프로_재시도_시각_설정(
+        self,
+        db_session: Session,
+        user_fixture: Callable[..., User],
+    ):
+        # given
+        user = user_fixture()
+        target_date = date(2025, 1, 1)
+        now = datetime(2025, 1, 2, 0, 0, tzinfo=UTC)
+        service = PipelineRunService(db_session)
+
+        # when
+        for _ in range(3):
+            step = service.mark_failed(
+                user.id,
+                target_date,
+                PlatformEnum.JIRA,
+                PipelineStageEnum.SUMMARIZE,
+                error="TimeoutException: timed out",
+                now=now,
+                max_attempts=5,
+                base_delay_seconds=60,
+                max_delay_seconds=3600,
+            )
+
+        # then
+        assert step.status == PipelineStepStatusEnum.FAILED
+        assert step.attempts == 3
+        assert step.error == "TimeoutException: timed out"
+        assert step.next_retry_at == now + timedelta(seconds=240)
+
+    def test_mark_failed_재시도_횟수를_소진하면_재시도하지_않음(
+        self,
+        db_session: Session,
+        user_fixture: Callable[..., User],
+    ):
+        # given
+        user = user_fixture()
+        target_date = date(2025, 1, 1)
+        now = datetime(2025, 1, 2, 0, 0, tzinfo=UTC)
+        service = PipelineRunService(db_session)
+
+        # when
+        for _ in range(2):
+            step = service.mark_failed(
+                user.id,
+                target_date,
+                PlatformEnum.JIRA,
+                PipelineStageEnum.COLLECT,
+                error="error",
+                now=now,
+                max_attempts=2,
+                base_delay_seconds=60,
+                max_delay_seconds=3600,
+            )
+
+        # then
+        assert step.attempts == 2
+        assert step.next_retry_at is None
+        assert service.get_retryable_steps(now + timedelta(days=1), stale_seconds=3600) == []
+
+    # ── get_retryable_steps ──
+
+    def test_get_retryable_steps_재시도_시각이_도래한_실패_스텝만_조회(
+        self,
+        db_session: Session,
+        user_fixture: Callable[..., User],
+    ):
+        # given
+        user = user_fixture()
+        target_date = date(2025, 1, 1)
+        now = datetime(2025, 1, 2, 0, 0, tzinfo=UTC)
+        service = PipelineRunService(db_session)
+        failed_step = service.mark_failed(
+            user.id,
+            target_date,
+            PlatformEnum.GITHUB,
+            PipelineStageEnum.COLLECT,
+            error="error",
+            now=now,
+            max_attempts=5,
+            base_delay_seconds=60,
+            max_delay_seconds=3600,
+        )
+        service.mark_succeeded(user.id, target_date, PlatformEnum.SLACK, PipelineStageEnum.COLLECT)
+
+        # when
+        not_yet = service.get_retryable_steps(now, stale_seconds=86400)
+        due = service.get_retryable_steps(now + timedelta(seconds=60), stale_seconds=86400)
+
+        # then
+        assert not_yet == []
+        assert due == [failed_step]
+
+    # ── reset_steps ──
+
+    def test_reset_steps(
+        self,
+        db_session: Session,
+        user_fixture: Callable[..., User],
+    ):
+        # given
+        user = user_fixture()
+        target_date = date(2025, 1, 1)
+        service = PipelineRunService(db_session)
+        service.mark_succeeded(user.id, target_date, PlatformEnum.GITHUB, PipelineStageEnum.COLLECT)
+
+        # when
+        service.reset_steps(user.id, target_date)
+
+        # then
+        assert service.get_steps(user.id, target_date) == []
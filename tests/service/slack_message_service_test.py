@@ -7,13 +7,16 @@ from sqlalchemy.orm import Session
 
 from dev_blackbox.client.model.slack_api_model import SlackChannelModel, SlackMessageModel
 from dev_blackbox.client.slack_client import SlackClient
+from dev_blackbox.core.config import get_settings
 from dev_blackbox.core.exception import (
     NoSlackChannelsFound,
     SlackUserNotAssignedException,
     UserNotFoundException,
 )
 from dev_blackbox.service.slack_message_service import SlackMessageService
+from dev_blackbox.storage.rds.entity.slack_channel_cursor import SlackChannelCursor
 from dev_blackbox.storage.rds.entity.slack_message import SlackMessage
+from dev_blackbox.storage.rds.entity.slack_message_log import SlackMessageLog
 from dev_blackbox.storage.rds.entity.slack_secret import SlackSecret
 from dev_blackbox.storage.rds.entity.slack_user import SlackUser
 from dev_blackbox.storage.rds.entity.user import User
@@ -135,7 +138,6 @@ class SlackMessageServiceTest:
             "dev_blackbox.service.slack_message_service.SlackSecretService.get_slack_client",
             return_value=mock_client,
         )
-        mocker.patch("dev_blackbox.service.slack_message_service.time.sleep")
 
         service = SlackMessageService(db_session)
 
@@ -199,7 +201,6 @@ class SlackMessageServiceTest:
             "dev_blackbox.service.slack_message_service.SlackSecretService.get_slack_client",
             return_value=mock_client,
         )
-        mocker.patch("dev_blackbox.service.slack_message_service.time.sleep")
 
         service = SlackMessageService(db_session)
 
@@ -284,7 +285,6 @@ class SlackMessageServiceTest:
             "dev_blackbox.service.slack_message_service.SlackSecretService.get_slack_client",
             return_value=mock_client,
         )
-        mocker.patch("dev_blackbox.service.slack_message_service.time.sleep")
 
         service = SlackMessageService(db_session)
 
@@ -294,6 +294,409 @@ class SlackMessageServiceTest:
         # then
         assert result == []
 
+    # ── save_slack_messages_by_date_range ──
+
+    def test_save_slack_messages_by_date_range_메시지_ts_기준으로_날짜를_나눈다(
+        self,
+        mocker,
+        db_session: Session,
+        user_fixture: Callable[..., User],
+        slack_secret_fixture: Callable[..., SlackSecret],
+        slack_user_fixture: Callable[..., SlackUser],
+    ):
+        # given
+        user = user_fixture()
+        secret = slack_secret_fixture()
+        slack_user_fixture(
+            slack_secret_id=secret.id,
+            user_id=user.id,
+            member_id="U_RANGE_TEST",
+        )
+        start_date = date(2025, 1, 1)
+        end_date = date(2025, 1, 3)
+
+        # mock
+        mock_channel = SlackChannelModel(id="C001", name="dev", is_private=False)
+        # 2025-01-01 10:00 KST 일반 메시지
+        mock_message = SlackMessageModel(
+            ts="1735693200.000100",
+            user="U_RANGE_TEST",
+            text="Day 1 message",
+            thread_ts=None,
+            latest_reply=None,
+        )
+        # 2024-12-25 스레드 부모, 2025-01-03 10:00 KST 답글
+        mock_thread_message = SlackMessageModel(
+            ts="1735088400.000100",
+            user="U_OTHER",
+            text="Old thread parent",
+            thread_ts="1735088400.000100",
+            latest_reply="1735866000.000100",
+        )
+        mock_reply = SlackMessageModel(
+            ts="1735866000.000100",
+            user="U_RANGE_TEST",
+            text="Day 3 reply",
+            thread_ts="1735088400.000100",
+        )
+
+        mock_client = MagicMock(spec=SlackClient)
+        mock_client.fetch_channels.return_value = [mock_channel]
+        mock_client.fetch_messages_by_date.return_value = [mock_message, mock_thread_message]
+        mock_client.fetch_thread_replies_by_range.return_value = [mock_reply]
+
+        mocker.patch.object(
+            SlackMessageService,
+            "_get_user_or_throw",
+            return_value=user,
+        )
+        mocker.patch(
+            "dev_blackbox.service.slack_message_service.SlackSecretService.get_slack_client",
+            return_value=mock_client,
+        )
+
+        service = SlackMessageService(db_session)
+
+        # when
+        result = service.save_slack_messages_by_date_range(user.id, start_date, end_date)
+
+        # then
+        assert [m.message_text for m in result[date(2025, 1, 1)]] == ["Day 1 message"]
+        assert result[date(2025, 1, 2)] == []
+        assert [m.message_text for m in result[date(2025, 1, 3)]] == ["Day 3 reply"]
+        # 채널 히스토리/스레드 답글은 기간 전체를 한 번씩만 조회
+        mock_client.fetch_messages_by_date.assert_called_once_with(
+            channel_id="C001",
+            target_date=end_date,
+            tz_info=user.tz_info,
+            lookback_days=17,
+        )
+        mock_client.fetch_thread_replies_by_range.assert_called_once()
+
+    # ── split_target_messages ──
+
+    def test_split_target_messages_사용자_메시지와_답글을_조회할_스레드를_나눈다(self):
+        # given
+        target_oldest, target_latest = 1735657200.0, 1735743600.0
+        messages = [
+            # 사용자의 스레드 없는 메시지
+            SlackMessageModel(ts="1735693200.000100", user="U_ME", text="Mine"),
+            # 다른 사용자의 스레드 없는 메시지
+            SlackMessageModel(ts="1735693200.000150", user="U_OTHER", text="Other"),
+            # 과거 부모 메시지지만 target_date에 답글이 달린 스레드
+            SlackMessageModel(
+                ts="1735000000.000100",
+                user="U_OTHER",
+                text="Old thread",
+                thread_ts="1735000000.000100",
+                latest_reply="1735693200.000300",
+            ),
+            # 범위 밖 스레드
+            SlackMessageModel(
+                ts="1735000000.000200",
+                user="U_OTHER",
+                text="Stale thread",
+                thread_ts="1735000000.000200",
+                latest_reply="1735000000.000300",
+            ),
+        ]
+
+        # when
+        messages_no_thread, thread_ts_set = SlackMessageService.split_target_messages(
+            messages, "U_ME", target_oldest, target_latest
+        )
+
+        # then
+        assert [m.text for m in messages_no_thread] == ["Mine"]
+        assert thread_ts_set == {"1735000000.000100"}
+
+    # ── Slack 메시지 로그 ──
+
+    def test_sync_slack_message_log_커서_이후_메시지만_조회하고_히스토리의_latest_reply를_저장한다(
+        self,
+        mocker,
+        db_session: Session,
+        user_fixture: Callable[..., User],
+        slack_secret_fixture: Callable[..., SlackSecret],
+        slack_user_fixture: Callable[..., SlackUser],
+    ):
+        # given
+        user = user_fixture()
+        secret = slack_secret_fixture()
+        slack_user_fixture(slack_secret_id=secret.id, user_id=user.id, member_id="U_LOG_TEST")
+        first_synced_at = 1735747200.0  # 2025-01-02 01:00 (KST)
+        second_synced_at = first_synced_at + 24 * 60 * 60
+
+        # mock
+        thread_parent = SlackMessageModel(
+            ts="1735693200.000200",
+            user="U_OTHER",
+            text="Thread parent",
+            thread_ts="1735693200.000200",
+            latest_reply="1735693200.000300",
+        )
+        mock_client = MagicMock(spec=SlackClient)
+        mock_client.fetch_channels.return_value = [
+            SlackChannelModel(id="C001", name="dev", is_private=False)
+        ]
+        mock_client.fetch_messages_by_range.side_effect = [
+            [
+                thread_parent,
+                SlackMessageModel(ts="1735693200.000100", user="U_LOG_TEST", text="Hello"),
+            ],
+            [
+                SlackMessageModel(
+                    ts="1735783200.000100",
+                    user="U_OTHER",
+                    text="New thread parent",
+                    thread_ts="1735783200.000100",
+                    latest_reply="1735790400.000100",
+                ),
+            ],
+        ]
+
+        mocker.patch(
+            "dev_blackbox.service.slack_message_service.SlackSecretService.get_slack_client",
+            return_value=mock_client,
+        )
+        mock_time = mocker.patch("dev_blackbox.service.slack_message_service.time.time")
+
+        service = SlackMessageService(db_session)
+
+        # when
+        mock_time.return_value = first_synced_at
+        service.sync_slack_message_log(user.id)
+        mock_time.return_value = second_synced_at
+        service.sync_slack_message_log(user.id)
+
+        # then
+        lookback_seconds = SlackMessageService.THREAD_LOOKBACK_DAYS * 24 * 60 * 60
+        assert [c.args for c in mock_client.fetch_messages_by_range.call_args_list] == [
+            ("C001", first_synced_at - lookback_seconds, first_synced_at),
+            ("C001", first_synced_at, second_synced_at),
+        ]
+        mock_client.fetch_thread_parent.assert_not_called()
+
+        cursor = db_session.query(SlackChannelCursor).one()
+        assert cursor.oldest_ts == f"{first_synced_at - lookback_seconds:.6f}"
+        assert cursor.latest_ts == f"{second_synced_at:.6f}"
+        logs = {log.message_ts: log for log in db_session.query(SlackMessageLog).all()}
+        assert len(logs) == 3
+        assert logs["1735693200.000200"].latest_reply == "1735693200.000300"
+        assert logs["1735783200.000100"].latest_reply == "1735790400.000100"
+
+    def test_sync_slack_message_log_latest_reply가_커서보다_최신인_스레드만_부모를_다시_조회한다(
+        self,
+        mocker,
+        db_session: Session,
+        user_fixture: Callable[..., User],
+        slack_secret_fixture: Callable[..., SlackSecret],
+        slack_user_fixture: Callable[..., SlackUser],
+    ):
+        # given
+        user = user_fixture()
+        secret = slack_secret_fixture()
+        slack_user_fixture(slack_secret_id=secret.id, user_id=user.id)
+        synced_at = 1735747200.0  # 2025-01-02 01:00 (KST)
+        day_seconds = 24 * 60 * 60
+        db_session.add_all(
+            [
+                SlackChannelCursor.create(
+                    slack_secret_id=secret.id,
+                    channel_id="C001",
+                    oldest_ts="1734451200.000000",
+                    latest_ts=f"{synced_at - day_seconds:.6f}",
+                ),
+                # 10일 전 작성, 저장된 마지막 답글이 커서(1일 전) 이후
+                SlackMessageLog.create(
+                    slack_secret_id=secret.id,
+                    channel_id="C001",
+                    message_ts=f"{synced_at - 10 * day_seconds:.6f}",
+                    member_id="U_OTHER",
+                    message_text="Updated thread",
+                    thread_ts=f"{synced_at - 10 * day_seconds:.6f}",
+                    latest_reply=f"{synced_at - 3600:.6f}",
+                ),
+                # 마지막 답글이 커서 이전인 스레드
+                SlackMessageLog.create(
+                    slack_secret_id=secret.id,
+                    channel_id="C001",
+                    message_ts=f"{synced_at - 5 * day_seconds:.6f}",
+                    member_id="U_OTHER",
+                    message_text="Quiet thread",
+                    thread_ts=f"{synced_at - 5 * day_seconds:.6f}",
+                    latest_reply=f"{synced_at - 2 * day_seconds:.6f}",
+                ),
+            ]
+        )
+        db_session.flush()
+
+        # mock
+        late_reply_ts = f"{synced_at - 60:.6f}"
+        mock_client = MagicMock(spec=SlackClient)
+        mock_client.fetch_channels.return_value = [
+            SlackChannelModel(id="C001", name="dev", is_private=False)
+        ]
+        mock_client.fetch_messages_by_range.return_value = []
+        mock_client.fetch_thread_parent.return_value = SlackMessageModel(
+            ts=f"{synced_at - 10 * day_seconds:.6f}",
+            user="U_OTHER",
+            text="Updated thread",
+            thread_ts=f"{synced_at - 10 * day_seconds:.6f}",
+            latest_reply=late_reply_ts,
+        )
+        mocker.patch(
+            "dev_blackbox.service.slack_message_service.SlackSecretService.get_slack_client",
+            return_value=mock_client,
+        )
+        mocker.patch(
+            "dev_blackbox.service.slack_message_service.time.time",
+            return_value=synced_at,
+        )
+
+        service = SlackMessageService(db_session)
+
+        # when
+        service.sync_slack_message_log(user.id)
+
+        # then
+        mock_client.fetch_thread_parent.assert_called_once_with(
+            "C001", f"{synced_at - 10 * day_seconds:.6f}"
+        )
+        logs = {log.message_text: log for log in db_session.query(SlackMessageLog).all()}
+        assert logs["Updated thread"].latest_reply == late_reply_ts
+        assert logs["Quiet thread"].latest_reply == f"{synced_at - 2 * day_seconds:.6f}"
+
+    def test_sync_slack_message_log_최근에_동기화한_채널은_건너뛴다(
+        self,
+        mocker,
+        db_session: Session,
+        user_fixture: Callable[..., User],
+        slack_secret_fixture: Callable[..., SlackSecret],
+        slack_user_fixture: Callable[..., SlackUser],
+    ):
+        # given
+        user = user_fixture()
+        secret = slack_secret_fixture()
+        slack_user_fixture(slack_secret_id=secret.id, user_id=user.id)
+        synced_at = 1735747200.0
+        db_session.add(
+            SlackChannelCursor.create(
+                slack_secret_id=secret.id,
+                channel_id="C001",
+                oldest_ts="1734451200.000000",
+                latest_ts=f"{synced_at:.6f}",
+            )
+        )
+        db_session.flush()
+
+        # mock
+        mock_client = MagicMock(spec=SlackClient)
+        mock_client.fetch_channels.return_value = [
+            SlackChannelModel(id="C001", name="dev", is_private=False)
+        ]
+        mocker.patch(
+            "dev_blackbox.service.slack_message_service.SlackSecretService.get_slack_client",
+            return_value=mock_client,
+        )
+        mocker.patch(
+            "dev_blackbox.service.slack_message_service.time.time",
+            return_value=synced_at + 60,
+        )
+
+        service = SlackMessageService(db_session)
+
+        # when
+        service.sync_slack_message_log(user.id)
+
+        # then
+        mock_client.fetch_messages_by_range.assert_not_called()
+
+    def test_save_slack_messages_로그가_target_date를_담으면_히스토리를_조회하지_않는다(
+        self,
+        mocker,
+        db_session: Session,
+        user_fixture: Callable[..., User],
+        slack_secret_fixture: Callable[..., SlackSecret],
+        slack_user_fixture: Callable[..., SlackUser],
+    ):
+        # given
+        user = user_fixture()
+        secret = slack_secret_fixture()
+        slack_user_fixture(slack_secret_id=secret.id, user_id=user.id, member_id="U_LOG_TEST")
+        target_date = date(2025, 1, 1)
+        db_session.add_all(
+            [
+                SlackChannelCursor.create(
+                    slack_secret_id=secret.id,
+                    channel_id="C001",
+                    oldest_ts="1734451200.000000",
+                    latest_ts="1735747200.000000",
+                ),
+                # target_date에 작성한 사용자 메시지
+                SlackMessageLog.create(
+                    slack_secret_id=secret.id,
+                    channel_id="C001",
+                    message_ts="1735693200.000100",
+                    member_id="U_LOG_TEST",
+                    message_text="Hello",
+                ),
+                # 과거 스레드 부모 (저장된 latest_reply가 target_date)
+                SlackMessageLog.create(
+                    slack_secret_id=secret.id,
+                    channel_id="C001",
+                    message_ts="1735000000.000100",
+                    member_id="U_OTHER",
+                    message_text="Old thread",
+                    thread_ts="1735000000.000100",
+                    latest_reply="1735693200.000300",
+                ),
+                # target_date 이전 메시지
+                SlackMessageLog.create(
+                    slack_secret_id=secret.id,
+                    channel_id="C001",
+                    message_ts="1735000000.000200",
+                    member_id="U_LOG_TEST",
+                    message_text="Old message",
+                ),
+            ]
+        )
+        db_session.flush()
+
+        # mock
+        mock_client = MagicMock(spec=SlackClient)
+        mock_client.fetch_channels.return_value = [
+            SlackChannelModel(id="C001", name="dev", is_private=False)
+        ]
+        mock_client.fetch_thread_replies.return_value = [
+            SlackMessageModel(
+                ts="1735693200.000300",
+                user="U_LOG_TEST",
+                text="My reply",
+                thread_ts="1735000000.000100",
+            )
+        ]
+        mocker.patch(
+            "dev_blackbox.service.slack_message_service.SlackSecretService.get_slack_client",
+            return_value=mock_client,
+        )
+        mocker.patch.object(get_settings().collect_task, "slack_message_log_enabled", True)
+
+        service = SlackMessageService(db_session)
+
+        # when
+        result = service.save_slack_messages(user.id, target_date)
+
+        # then
+        assert sorted(m.message_text for m in result) == ["Hello", "My reply"]
+        mock_client.fetch_messages_by_date.assert_not_called()
+        mock_client.fetch_thread_replies.assert_called_once_with(
+            channel_id="C001",
+            thread_ts="1735000000.000100",
+            target_date=target_date,
+            tz_info=user.tz_info,
+        )
+
     # ── save_slack_messages 예외 케이스 ──
 
     def test_save_slack_messages_사용자가_없으면_예외(
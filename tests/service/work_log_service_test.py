@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 
 from dev_blackbox.core.enum import PlatformEnum
 from dev_blackbox.core.exception import UserContentNotFoundException
+from dev_blackbox.service.model.platform_work_log_model import PlatformWorkLogDraft
 from dev_blackbox.service.work_log_service import WorkLogService
 from dev_blackbox.storage.rds.entity.daily_work_log import DailyWorkLog
 from dev_blackbox.storage.rds.entity.platform_work_log import PlatformWorkLog
@@ -134,6 +135,161 @@ class WorkLogServiceTest:
         all_logs = service.get_platform_work_logs(user.id, target_date, [PlatformEnum.GITHUB])
         assert len(all_logs) == 1
 
+    # ── is_platform_work_log_up_to_date ──
+
+    def test_is_platform_work_log_up_to_date_지문이_같으면_True(
+        self,
+        db_session: Session,
+        user_fixture: Callable[..., User],
+        platform_work_log_fixture: Callable[..., PlatformWorkLog],
+    ):
+        # given
+        user = user_fixture()
+        target_date = date(2025, 1, 1)
+        platform_work_log_fixture(
+            user_id=user.id,
+            target_date=target_date,
+            platform=PlatformEnum.GITHUB,
+            input_fingerprint="fingerprint",
+        )
+        service = WorkLogService(db_session)
+
+        # when
+        result = service.is_platform_work_log_up_to_date(
+            user.id, target_date, PlatformEnum.GITHUB, "fingerprint"
+        )
+
+        # then
+        assert result is True
+
+    def test_is_platform_work_log_up_to_date_지문이_다르면_False(
+        self,
+        db_session: Session,
+        user_fixture: Callable[..., User],
+        platform_work_log_fixture: Callable[..., PlatformWorkLog],
+    ):
+        # given
+        user = user_fixture()
+        target_date = date(2025, 1, 1)
+        platform_work_log_fixture(
+            user_id=user.id,
+            target_date=target_date,
+            platform=PlatformEnum.GITHUB,
+            input_fingerprint="old-fingerprint",
+        )
+        service = WorkLogService(db_session)
+
+        # when
+        result = service.is_platform_work_log_up_to_date(
+            user.id, target_date, PlatformEnum.GITHUB, "new-fingerprint"
+        )
+
+        # then
+        assert result is False
+
+    def test_is_platform_work_log_up_to_date_요약이_없으면_False(
+        self,
+        db_session: Session,
+        user_fixture: Callable[..., User],
+    ):
+        # given
+        user = user_fixture()
+        service = WorkLogService(db_session)
+
+        # when
+        result = service.is_platform_work_log_up_to_date(
+            user.id, date(2025, 1, 1), PlatformEnum.GITHUB, "fingerprint"
+        )
+
+        # then
+        assert result is False
+
+    # ── get_input_fingerprints ──
+
+    def test_get_input_fingerprints_플랫폼별_저장된_지문(
+        self,
+        db_session: Session,
+        user_fixture: Callable[..., User],
+        platform_work_log_fixture: Callable[..., PlatformWorkLog],
+    ):
+        # given
+        user = user_fixture()
+        target_date = date(2025, 1, 1)
+        platform_work_log_fixture(
+            user_id=user.id,
+            target_date=target_date,
+            platform=PlatformEnum.GITHUB,
+            input_fingerprint="abc",
+        )
+        service = WorkLogService(db_session)
+
+        # when
+        result = service.get_input_fingerprints(
+            user.id, target_date, [PlatformEnum.GITHUB, PlatformEnum.SLACK]
+        )
+
+        # then
+        assert result == {PlatformEnum.GITHUB: "abc"}
+
+    # ── save_work_logs ──
+
+    def test_save_work_logs_플랫폼_업무_일지를_교체하고_일일_업무_일지를_저장(
+        self,
+        db_session: Session,
+        user_fixture: Callable[..., User],
+        platform_work_log_fixture: Callable[..., PlatformWorkLog],
+    ):
+        # given
+        user = user_fixture()
+        target_date = date(2025, 1, 1)
+        platform_work_log_fixture(
+            user_id=user.id,
+            target_date=target_date,
+            platform=PlatformEnum.GITHUB,
+            content="Old GitHub summary",
+        )
+        # 이번 실행에서 요약하지 않은 플랫폼은 유지
+        platform_work_log_fixture(
+            user_id=user.id,
+            target_date=target_date,
+            platform=PlatformEnum.JIRA,
+            content="Jira summary",
+        )
+        service = WorkLogService(db_session)
+
+        # when
+        result = service.save_work_logs(
+            user.id,
+            target_date,
+            [
+                PlatformWorkLogDraft(
+                    platform=PlatformEnum.GITHUB,
+                    content="New GitHub summary",
+                    model_name="llama3",
+                    prompt="Summarize commits",
+                    input_fingerprint="abc",
+                ),
+                PlatformWorkLogDraft(
+                    platform=PlatformEnum.SLACK,
+                    content="Slack summary",
+                    model_name="",
+                    prompt="",
+                ),
+            ],
+        )
+
+        # then
+        work_logs = service.get_platform_work_logs(user.id, target_date, PlatformEnum.platforms())
+        assert {w.platform: w.content for w in work_logs} == {
+            PlatformEnum.GITHUB: "New GitHub summary",
+            PlatformEnum.JIRA: "Jira summary",
+            PlatformEnum.SLACK: "Slack summary",
+        }
+        assert "New GitHub summary" in result.content
+        assert "Old GitHub summary" not in result.content
+        assert "Jira summary" in result.content
+        assert "Slack summary" in result.content
+
     # ── get_daily_work_log ──
 
     def test_get_daily_work_log(
@@ -0,0 +1,171 @@
+from contextlib import nullcontext
+from datetime import date
+from zoneinfo import ZoneInfo
+
+from redis import Redis
+
+from dev_blackbox.core.config import get_settings
+from dev_blackbox.core.const import QueueKey
+from dev_blackbox.core.enum import PlatformEnum
+from dev_blackbox.service.model.platform_work_log_model import PlatformWorkLogDraft
+from dev_blackbox.task.collect.pipeline import _collect_and_enqueue, drain_summary_jobs
+from dev_blackbox.task.collect.work_log import get_user_lock_key
+from dev_blackbox.task.context.summary_job import SummaryJob
+from dev_blackbox.task.context.user_context import UserContext
+from dev_blackbox.task.context.work_log_batch import WorkLogBatch
+from dev_blackbox.task.summary_job_queue import SummaryJobQueue
+
+TARGET_DATE = date(2026, 10, 17)
+USER = UserContext(
+    id=1,
+    tz_info=ZoneInfo("Asia/Seoul"),
+    has_github_user_secret=True,
+    has_jira_user=False,
+    has_slack_user=True,
+)
+PIPELINE_MODULE = "dev_blackbox.task.collect.pipeline"
+
+
+def _create_work_log(platform: PlatformEnum) -> PlatformWorkLogDraft:
+    return PlatformWorkLogDraft(
+        platform=platform, content=f"{platform} 요약", model_name="model", prompt="prompt"
+    )
+
+
+def _summarize(user, target_date, platform, chunks, batch: WorkLogBatch):
+    batch.add(platform, _create_work_log(platform))
+
+
+def _mock_pipeline(mocker, fake_redis: Redis):
+    """DB/LLM을 쓰는 단계를 대체하고, 저장 호출을 기록하는 mock을 반환"""
+    mocker.patch("dev_blackbox.task.summary_job_queue.get_redis_client", return_value=fake_redis)
+    mocker.patch(f"{PIPELINE_MODULE}.platform_metric_scope", return_value=nullcontext())
+    mocker.patch(f"{PIPELINE_MODULE}.pipeline_step", return_value=nullcontext())
+    mocker.patch(
+        f"{PIPELINE_MODULE}.create_work_log_batch",
+        side_effect=lambda user, target_date: WorkLogBatch(input_fingerprints={}),
+    )
+    mocker.patch(
+        f"{PIPELINE_MODULE}.get_user_platforms",
+        return_value=[PlatformEnum.GITHUB, PlatformEnum.SLACK],
+    )
+    mocker.patch(
+        f"{PIPELINE_MODULE}._collect_summary_job",
+        side_effect=lambda user, target_date, platform, batch, group_id: SummaryJob(
+            group_id=group_id,
+            user=user,
+            target_date=target_date,
+            platform=platform,
+            chunks=[f"{platform} 활동"],
+            input_fingerprints=batch.input_fingerprints,
+        ),
+    )
+    return mocker.patch(f"{PIPELINE_MODULE}.save_work_log_batch")
+
+
+class PipelineTest:
+
+    def test_collect_and_enqueue_요약_작업을_적재하고_기다리지_않고_사용자_락을_푼다(
+        self, mocker, fake_redis: Redis
+    ):
+        # given
+        mock_save = _mock_pipeline(mocker, fake_redis)
+
+        # when
+        _collect_and_enqueue(USER, TARGET_DATE)
+
+        # then
+        assert fake_redis.llen(QueueKey.SUMMARY_JOB) == 2
+        assert SummaryJobQueue(fake_redis).is_open(USER.id, TARGET_DATE)
+        assert not fake_redis.exists(f"lock:{get_user_lock_key(USER.id, TARGET_DATE)}")
+        mock_save.assert_not_called()
+
+    def test_collect_and_enqueue_요약_그룹이_열려있으면_수집하지_않는다(
+        self, mocker, fake_redis: Redis
+    ):
+        # given
+        mock_save = _mock_pipeline(mocker, fake_redis)
+        _collect_and_enqueue(USER, TARGET_DATE)
+
+        # when
+        _collect_and_enqueue(USER, TARGET_DATE)
+
+        # then
+        assert fake_redis.llen(QueueKey.SUMMARY_JOB) == 2
+        mock_save.assert_not_called()
+
+    def test_drain_summary_jobs_마지막_작업을_끝낸_워커가_업무_일지를_저장하고_그룹을_닫는다(
+        self, mocker, fake_redis: Redis
+    ):
+        # given
+        mock_save = _mock_pipeline(mocker, fake_redis)
+        mocker.patch(f"{PIPELINE_MODULE}.summarize_platform", side_effect=_summarize)
+        _collect_and_enqueue(USER, TARGET_DATE)
+
+        # when
+        drain_summary_jobs()
+
+        # then
+        mock_save.assert_called_once()
+        user, target_date, batch = mock_save.call_args.args
+        assert (user, target_date) == (USER, TARGET_DATE)
+        assert sorted(batch.summarized_platforms) == [PlatformEnum.GITHUB, PlatformEnum.SLACK]
+        assert len(batch.work_logs) == 2
+        assert not SummaryJobQueue(fake_redis).is_open(USER.id, TARGET_DATE)
+        assert fake_redis.llen(QueueKey.SUMMARY_JOB) == 0
+
+    def test_drain_summary_jobs_요약에_실패한_플랫폼을_제외하고_저장한다(
+        self, mocker, fake_redis: Redis
+    ):
+        # given
+        mock_save = _mock_pipeline(mocker, fake_redis)
+
+        def summarize(user, target_date, platform, chunks, batch):
+            if platform == PlatformEnum.SLACK:
+                raise RuntimeError("LLM 요약 실패")
+            _summarize(user, target_date, platform, chunks, batch)
+
+        mocker.patch(f"{PIPELINE_MODULE}.summarize_platform", side_effect=summarize)
+        _collect_and_enqueue(USER, TARGET_DATE)
+
+        # when
+        drain_summary_jobs()
+
+        # then
+        mock_save.assert_called_once()
+        batch = mock_save.call_args.args[2]
+        assert batch.summarized_platforms == [PlatformEnum.GITHUB]
+        assert not SummaryJobQueue(fake_redis).is_open(USER.id, TARGET_DATE)
+
+    def test_drain_summary_jobs_저장에_실패해도_그룹을_닫는다(self, mocker, fake_redis: Redis):
+        # given
+        mock_save = _mock_pipeline(mocker, fake_redis)
+        mock_save.side_effect = RuntimeError("DB 저장 실패")
+        mocker.patch(f"{PIPELINE_MODULE}.summarize_platform", side_effect=_summarize)
+        _collect_and_enqueue(USER, TARGET_DATE)
+
+        # when
+        drain_summary_jobs()
+
+        # then
+        mock_save.assert_called_once()
+        assert not SummaryJobQueue(fake_redis).is_open(USER.id, TARGET_DATE)
+
+    def test_drain_summary_jobs_만료된_그룹의_작업은_요약하지_않는다(
+        self, mocker, fake_redis: Redis
+    ):
+        # given
+        mock_save = _mock_pipeline(mocker, fake_redis)
+        mock_summarize = mocker.patch(f"{PIPELINE_MODULE}.summarize_platform")
+        mocker.patch.object(get_settings().collect_task, "summary_group_ttl_seconds", 60)
+        _collect_and_enqueue(USER, TARGET_DATE)
+        # 요약 워커가 중단되어 그룹이 TTL로 만료된 상황
+        SummaryJobQueue(fake_redis).close(USER.id, TARGET_DATE)
+
+        # when
+        drain_summary_jobs()
+
+        # then
+        mock_summarize.assert_not_called()
+        mock_save.assert_not_called()
+        assert fake_redis.llen(QueueKey.SUMMARY_JOB) == 0
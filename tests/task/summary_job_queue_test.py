@@ -0,0 +1,149 @@
+import time
+from datetime import date
+from zoneinfo import ZoneInfo
+
+from redis import Redis
+
+from dev_blackbox.core.const import QueueKey
+from dev_blackbox.core.enum import PlatformEnum
+from dev_blackbox.service.model.platform_work_log_model import PlatformWorkLogDraft
+from dev_blackbox.task.context.summary_job import SummaryJob
+from dev_blackbox.task.context.user_context import UserContext
+from dev_blackbox.task.summary_job_queue import SummaryJobQueue
+
+TARGET_DATE = date(2026, 10, 17)
+
+
+def _create_job(platform: PlatformEnum, group_id: str = "group-1") -> SummaryJob:
+    return SummaryJob(
+        group_id=group_id,
+        user=UserContext(
+            id=1,
+            tz_info=ZoneInfo("Asia/Seoul"),
+            has_github_user_secret=True,
+            has_jira_user=False,
+            has_slack_user=True,
+        ),
+        target_date=TARGET_DATE,
+        platform=platform,
+        chunks=[f"{platform} 활동"],
+        input_fingerprints={platform: None},
+    )
+
+
+def _create_work_log(platform: PlatformEnum) -> PlatformWorkLogDraft:
+    return PlatformWorkLogDraft(
+        platform=platform, content=f"{platform} 요약", model_name="model", prompt="prompt"
+    )
+
+
+class SummaryJobQueueTest:
+
+    def test_push_pop_모든_인스턴스가_공유하는_큐로_작업을_전달한다(self, fake_redis: Redis):
+        # given
+        producer = SummaryJobQueue(fake_redis)
+        consumer = SummaryJobQueue(fake_redis)
+        job = _create_job(PlatformEnum.GITHUB)
+
+        # when
+        producer.push(job)
+        result = consumer.pop(timeout=1)
+
+        # then
+        assert result == job
+        assert fake_redis.llen(QueueKey.SUMMARY_JOB) == 0
+
+    def test_open_group_같은_사용자_날짜의_그룹이_열려있으면_열지_않는다(self, fake_redis: Redis):
+        # given
+        queue = SummaryJobQueue(fake_redis)
+        queue.open_group(1, TARGET_DATE, "group-1", remaining=1, results=[], ttl_seconds=60)
+
+        # when
+        opened = queue.open_group(
+            1, TARGET_DATE, "group-2", remaining=1, results=[], ttl_seconds=60
+        )
+
+        # then
+        assert opened is False
+        assert queue.is_current(_create_job(PlatformEnum.GITHUB, group_id="group-1"))
+
+    def test_complete_마지막_작업이면_수집_단계_결과와_요약_결과를_모두_반환한다(
+        self, fake_redis: Redis
+    ):
+        # given
+        queue = SummaryJobQueue(fake_redis)
+        empty_jira = (PlatformEnum.JIRA, _create_work_log(PlatformEnum.JIRA))
+        queue.open_group(
+            1, TARGET_DATE, "group-1", remaining=2, results=[empty_jira], ttl_seconds=60
+        )
+        github_job = _create_job(PlatformEnum.GITHUB)
+        slack_job = _create_job(PlatformEnum.SLACK)
+        github_result = (PlatformEnum.GITHUB, _create_work_log(PlatformEnum.GITHUB))
+        slack_result = (PlatformEnum.SLACK, None)
+
+        # when
+        first = queue.complete(github_job, github_result)
+        last = queue.complete(slack_job, slack_result)
+
+        # then
+        assert first is None
+        assert last == [empty_jira, github_result, slack_result]
+
+    def test_complete_요약에_실패한_작업은_결과_없이_완료한다(self, fake_redis: Redis):
+        # given
+        queue = SummaryJobQueue(fake_redis)
+        queue.open_group(1, TARGET_DATE, "group-1", remaining=2, results=[], ttl_seconds=60)
+        github_result = (PlatformEnum.GITHUB, _create_work_log(PlatformEnum.GITHUB))
+
+        # when
+        queue.complete(_create_job(PlatformEnum.GITHUB), github_result)
+        last = queue.complete(_create_job(PlatformEnum.SLACK), None)
+
+        # then
+        assert last == [github_result]
+
+    def test_complete_다른_그룹의_작업은_기록하지_않는다(self, fake_redis: Redis):
+        # given
+        queue = SummaryJobQueue(fake_redis)
+        queue.open_group(1, TARGET_DATE, "group-new", remaining=1, results=[], ttl_seconds=60)
+        stale_job = _create_job(PlatformEnum.GITHUB, group_id="group-old")
+
+        # when
+        result = queue.complete(stale_job, (PlatformEnum.GITHUB, None))
+
+        # then
+        assert result is None
+        assert queue.complete(_create_job(PlatformEnum.GITHUB, group_id="group-new"), None) == []
+
+    def test_close_그룹을_닫으면_같은_사용자_날짜를_다시_처리할_수_있다(self, fake_redis: Redis):
+        # given
+        queue = SummaryJobQueue(fake_redis)
+        queue.open_group(
+            1,
+            TARGET_DATE,
+            "group-1",
+            remaining=1,
+            results=[(PlatformEnum.JIRA, None)],
+            ttl_seconds=60,
+        )
+
+        # when
+        queue.close(1, TARGET_DATE)
+
+        # then
+        assert not queue.is_open(1, TARGET_DATE)
+        assert queue.open_group(1, TARGET_DATE, "group-2", remaining=1, results=[], ttl_seconds=60)
+
+    def test_open_group_닫히지_않은_그룹은_TTL이_지나면_만료된다(self, fake_redis: Redis):
+        # given
+        queue = SummaryJobQueue(fake_redis)
+        queue.open_group(1, TARGET_DATE, "group-1", remaining=1, results=[], ttl_seconds=1)
+        job = _create_job(PlatformEnum.GITHUB)
+
+        # when
+        time.sleep(1.1)
+
+        # then
+        assert not queue.is_open(1, TARGET_DATE)
+        assert not queue.is_current(job)
+        assert queue.complete(job, None) is None
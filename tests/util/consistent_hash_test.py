@@ -0,0 +1,49 @@
+import pytest
+
+from dev_blackbox.util.consistent_hash import ConsistentHashRing
+
+
+def test_get_node_같은_키는_항상_같은_노드():
+    # given
+    ring = ConsistentHashRing(["instance-a", "instance-b", "instance-c"])
+
+    # when
+    first = ring.get_node("1")
+    second = ring.get_node("1")
+
+    # then
+    assert first == second
+    assert first in ring.nodes
+
+
+def test_get_node_노드가_제거되면_해당_노드의_키만_재배치된다():
+    # given
+    keys = [str(i) for i in range(1000)]
+    before = ConsistentHashRing(["instance-a", "instance-b", "instance-c"])
+    after = ConsistentHashRing(["instance-a", "instance-b"])
+
+    # when
+    moved = [key for key in keys if before.get_node(key) != after.get_node(key)]
+
+    # then
+    assert all(before.get_node(key) == "instance-c" for key in moved)
+
+
+def test_get_node_키가_노드에_고르게_분산된다():
+    # given
+    ring = ConsistentHashRing(["instance-a", "instance-b"])
+
+    # when
+    assigned = [ring.get_node(str(i)) for i in range(1000)]
+
+    # then
+    assert 300 < assigned.count("instance-a") < 700
+
+
+def test_get_node_노드가_없으면_예외():
+    # given
+    ring = ConsistentHashRing([])
+
+    # when & then
+    with pytest.raises(ValueError):
+        ring.get_node("1")
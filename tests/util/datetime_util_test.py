@@ -4,8 +4,13 @@ from zoneinfo import ZoneInfo
 from dev_blackbox.util.datetime_util import (
     get_daily_timestamp_range,
     get_date_from_iso_format,
+    get_date_from_timestamp,
+    get_date_range,
     get_datetime_utc_now,
+    get_latest_hourly_run_time,
     get_yesterday,
+    has_local_hour_passed,
+    is_local_hour,
     is_timestamp_in_range,
 )
 
@@ -76,3 +81,69 @@ def test_is_timestamp_in_range():
 
     # then
     assert result
+
+
+def test_is_local_hour():
+    # given
+    utc_now = datetime(2026, 2, 14, 15, 10, tzinfo=UTC)  # 2026-02-15 00:10 KST
+
+    # when & then
+    assert is_local_hour(utc_now, ZoneInfo("Asia/Seoul"), 0) is True
+    assert is_local_hour(utc_now, ZoneInfo("UTC"), 0) is False
+    assert is_local_hour(utc_now, ZoneInfo("UTC"), 15) is True
+
+
+def test_is_local_hour_30분_단위_타임존():
+    # given
+    utc_now = datetime(2026, 2, 14, 18, 40, tzinfo=UTC)  # 2026-02-15 00:10 IST (+05:30)
+
+    # when
+    result = is_local_hour(utc_now, ZoneInfo("Asia/Kolkata"), 0)
+
+    # then
+    assert result is True
+
+
+def test_has_local_hour_passed():
+    # given
+    utc_now = datetime(2026, 2, 14, 17, 10, tzinfo=UTC)  # 2026-02-15 02:10 KST
+
+    # when & then
+    assert has_local_hour_passed(utc_now, ZoneInfo("Asia/Seoul"), 0) is True
+    assert has_local_hour_passed(utc_now, ZoneInfo("Asia/Seoul"), 2) is True
+    assert has_local_hour_passed(utc_now, ZoneInfo("Asia/Seoul"), 3) is False
+
+
+def test_get_latest_hourly_run_time_늦게_실행되어도_예약_시각을_반환한다():
+    # when & then
+    assert get_latest_hourly_run_time(datetime(2026, 2, 14, 11, 5, tzinfo=UTC), 10) == datetime(
+        2026, 2, 14, 10, 10, tzinfo=UTC
+    )
+    assert get_latest_hourly_run_time(datetime(2026, 2, 14, 11, 10, tzinfo=UTC), 10) == datetime(
+        2026, 2, 14, 11, 10, tzinfo=UTC
+    )
+
+
+def test_get_date_range():
+    # when
+    result = get_date_range(date(2026, 2, 27), date(2026, 3, 2))
+
+    # then
+    assert result == [date(2026, 2, 27), date(2026, 2, 28), date(2026, 3, 1), date(2026, 3, 2)]
+
+
+def test_get_date_range_같은_날짜():
+    # when
+    result = get_date_range(date(2026, 2, 15), date(2026, 2, 15))
+
+    # then
+    assert result == [date(2026, 2, 15)]
+
+
+def test_get_date_from_timestamp():
+    # given
+    timestamp = str(datetime(2026, 2, 14, 16, 0, tzinfo=UTC).timestamp())  # 2026-02-15 01:00 KST
+
+    # when & then
+    assert get_date_from_timestamp(timestamp, ZoneInfo("Asia/Seoul")) == date(2026, 2, 15)
+    assert get_date_from_timestamp(timestamp, ZoneInfo("UTC")) == date(2026, 2, 14)
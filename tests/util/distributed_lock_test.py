@@ -1,3 +1,4 @@
+import time
 from unittest.mock import patch, MagicMock
 
 from dev_blackbox.util.distributed_lock import distributed_lock
@@ -153,3 +154,21 @@ class DistributedLockTest:
 
             # then — blocking=False로 호출되어야 한다
             mock_lock.acquire.assert_called_once_with(blocking=False)
+
+    def test_auto_renewal이면_블록_실행_중_락을_갱신한다(self):
+        # given
+        lock_key = "test:lock:auto-renewal"
+        mock_lock = MagicMock()
+        mock_lock.acquire.return_value = True
+
+        with patch("dev_blackbox.util.distributed_lock.LockService") as mock_lock_service:
+            mock_lock_service.return_value.lock.return_value = mock_lock
+
+            # when
+            with distributed_lock(lock_key, timeout=3, auto_renewal=True) as acquired:
+                assert acquired is True
+                time.sleep(1.5)
+
+        # then
+        mock_lock.extend.assert_called_with(3, replace_ttl=True)
+        mock_lock.release.assert_called_once()
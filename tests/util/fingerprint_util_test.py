@@ -0,0 +1,32 @@
+from dev_blackbox.util.fingerprint_util import build_fingerprint
+
+
+def test_build_fingerprint_같은_입력이면_같은_값():
+    # given
+    parts = ("model", "prompt", "text")
+
+    # when
+    first = build_fingerprint(*parts)
+    second = build_fingerprint(*parts)
+
+    # then
+    assert first == second
+    assert len(first) == 64
+
+
+def test_build_fingerprint_입력이_다르면_다른_값():
+    # when
+    first = build_fingerprint("model", "prompt", "text")
+    second = build_fingerprint("model", "prompt", "text2")
+
+    # then
+    assert first != second
+
+
+def test_build_fingerprint_구분자로_경계를_구분한다():
+    # when
+    first = build_fingerprint("ab", "c")
+    second = build_fingerprint("a", "bc")
+
+    # then
+    assert first != second
@@ -0,0 +1,152 @@
+from dev_blackbox.util.llm_input_packer import (
+    TRUNCATED_MARKER,
+    PackItem,
+    estimate_tokens,
+    get_input_token_budget,
+    pack_input,
+    split_into_chunks,
+    truncate_to_tokens,
+)
+
+
+def test_estimate_tokens_한글은_영문보다_토큰이_많다():
+    # when & then
+    assert estimate_tokens("abc") == 1
+    assert estimate_tokens("가나다") == 3
+    assert estimate_tokens("") == 0
+
+
+def test_truncate_to_tokens_예산을_넘으면_잘라내고_표시를_붙인다():
+    # given
+    text = "a" * 300
+
+    # when
+    result = truncate_to_tokens(text, 50)
+
+    # then
+    assert result.endswith(TRUNCATED_MARKER)
+    assert estimate_tokens(result) <= 50
+
+
+def test_truncate_to_tokens_멀티바이트_문자를_깨뜨리지_않는다():
+    # when
+    result = truncate_to_tokens("가" * 100, 20)
+
+    # then
+    assert result.startswith("가")
+    assert "�" not in result
+    assert estimate_tokens(result) <= 20
+
+
+def test_get_input_token_budget_프롬프트와_응답_몫을_제외한다():
+    # when
+    budget = get_input_token_budget(context_window=1000, num_predict=200, prompt_text="a" * 300)
+
+    # then
+    assert budget == int((1000 - 200 - 100) * 0.9)
+
+
+def test_pack_input_우선순위가_높은_항목부터_채우고_출력은_position_순서():
+    # given
+    items = [
+        PackItem("message-1", priority=0, position=0),
+        PackItem("p" * 300, priority=1, position=1),
+        PackItem("message-2", priority=0, position=2),
+    ]
+
+    # when
+    result = pack_input(items, budget_tokens=50)
+
+    # then
+    lines = result.text.split("\n")
+    assert lines[0] == "message-1"
+    assert lines[-1] == "message-2"
+    assert result.included_count == 3
+    assert result.truncated_count == 1
+    assert result.dropped_count == 0
+    assert result.estimated_tokens <= 50
+
+
+def test_pack_input_예산이_부족하면_나머지_항목은_버린다():
+    # given
+    items = [PackItem("a" * 90, position=i) for i in range(5)]
+
+    # when
+    result = pack_input(items, budget_tokens=70)
+
+    # then
+    assert result.included_count == 2
+    assert result.dropped_count == 3
+    assert result.is_reduced
+
+
+def test_pack_input_항목별_최대_토큰을_넘으면_항목만_잘라낸다():
+    # given
+    items = [
+        PackItem("x" * 3000, position=0, max_tokens=100),
+        PackItem("short", position=1),
+    ]
+
+    # when
+    result = pack_input(items, budget_tokens=10000)
+
+    # then
+    assert result.included_count == 2
+    assert result.truncated_count == 1
+    assert result.text.endswith("short")
+
+
+def test_pack_input_예산_안이면_그대로_이어_붙인다():
+    # given
+    items = [PackItem("first", position=0), PackItem("second", position=1)]
+
+    # when
+    result = pack_input(items, budget_tokens=1000, separator="\n\n")
+
+    # then
+    assert result.text == "first\n\nsecond"
+    assert not result.is_reduced
+
+
+def test_split_into_chunks_group_경계에서_나누고_항목을_버리지_않는다():
+    # given
+    items = [
+        PackItem("a" * 60, position=0, group="repo-a"),
+        PackItem("b" * 60, position=1, group="repo-b"),
+        PackItem("a" * 60, position=2, group="repo-a"),
+    ]
+
+    # when
+    chunks = split_into_chunks(items, budget_tokens=50)
+
+    # then
+    assert chunks == ["a" * 60 + "\n" + "a" * 60, "b" * 60]
+
+
+def test_split_into_chunks_group이_예산보다_크면_항목_경계에서_나눈다():
+    # given
+    items = [PackItem("x" * 90, position=i, group="channel") for i in range(3)]
+
+    # when
+    chunks = split_into_chunks(items, budget_tokens=50)
+
+    # then
+    assert chunks == ["x" * 90, "x" * 90, "x" * 90]
+
+
+def test_split_into_chunks_항목이_예산보다_크면_잘라서_담는다():
+    # given
+    items = [PackItem("y" * 600, position=0)]
+
+    # when
+    chunks = split_into_chunks(items, budget_tokens=100)
+
+    # then
+    assert len(chunks) == 1
+    assert chunks[0].endswith(TRUNCATED_MARKER)
+    assert estimate_tokens(chunks[0]) <= 100
+
+
+def test_split_into_chunks_입력이_없으면_빈_리스트():
+    # when & then
+    assert split_into_chunks([], budget_tokens=100) == []